@@ -6,7 +6,6 @@ DataPage FastAPI 서버 - Vercel 서버리스 환경 최적화
 import sys
 import os
 from pathlib import Path
-import urllib.request
 import shutil
 import threading
 
@@ -25,6 +24,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any, Tuple, Union
+import csv
+import io
 import json
 import asyncio
 import logging
@@ -155,10 +156,19 @@ def get_prefetched_blob_path(category: str, subcategory: str, result_type: Optio
     with PREFETCH_LOCK:
         local_path = PREFETCHED_BLOB_FILES.get(key)
     if local_path and os.path.exists(local_path):
+        tmp_quota.touch(local_path)
         return local_path
     return None
 
 
+def _on_prefetched_blob_evicted(path: Path) -> None:
+    """tmp_quota가 프리페치 파일을 제거하면 메모리상의 경로 매핑도 정리"""
+    with PREFETCH_LOCK:
+        stale_keys = [key for key, local_path in PREFETCHED_BLOB_FILES.items() if local_path == str(path)]
+        for key in stale_keys:
+            del PREFETCHED_BLOB_FILES[key]
+
+
 def _derive_blob_filename(url: str, fallback: str) -> str:
     parsed = urlparse(url)
     candidate = Path(parsed.path).name if parsed.path else ""
@@ -177,28 +187,15 @@ def _prefetch_single_blob(category: str, subcategory: str, result_type: Optional
     filename = _derive_blob_filename(url, fallback_name)
     dest_path = BLOB_PREFETCH_ROOT / filename
 
-    if dest_path.exists() and dest_path.stat().st_size > 0:
-        logger.info(f"Blob 사전 다운로드 재사용: {filename}")
-        _store_prefetched_blob(category, subcategory, result_type, str(dest_path))
-        return str(dest_path)
-
-    temp_path = dest_path.with_suffix(dest_path.suffix + ".download")
-
     try:
+        # 원격과 크기가 같은 기존 파일은 재사용, 중단된 `.download`는 이어받기 (download_manager)
         logger.info(f"Blob 사전 다운로드 시작: {url} → {dest_path}")
-        with urllib.request.urlopen(url) as response, open(temp_path, "wb") as out_file:
-            shutil.copyfileobj(response, out_file)
-        os.replace(temp_path, dest_path)
-        _store_prefetched_blob(category, subcategory, result_type, str(dest_path))
-        logger.info(f"Blob 사전 다운로드 완료: {dest_path}")
-        return str(dest_path)
+        local_path = download_manager.fetch(url, dest_path, quota_owner="prefetch")
+        _store_prefetched_blob(category, subcategory, result_type, str(local_path))
+        logger.info(f"Blob 사전 다운로드 완료: {local_path}")
+        return str(local_path)
     except Exception as download_error:
         logger.warning(f"Blob 사전 다운로드 실패 ({url}): {download_error}")
-        if temp_path.exists():
-            try:
-                temp_path.unlink()
-            except Exception:
-                pass
         return None
 
 
@@ -267,7 +264,26 @@ async def prefetch_blob_files() -> None:
 from config.search_config import search_config_manager
 from config.display_config import display_config_manager, CategoryDisplayConfig, DisplayField, SearchField
 from core.large_file_processor import get_processor, stream_search_large_file, SearchContext
-from core.duckdb_processor import duckdb_search_large_file
+from core.duckdb_processor import (
+    DUCKDB_CACHE_ROOT,
+    FACET_TOP_N,
+    LOOKUP_MAX_IDENTIFIERS,
+    MATCH_MODES,
+    duckdb_get_facets,
+    duckdb_search_large_file,
+    get_connection_pool_stats,
+    get_dataset_handle_stats,
+    load_field_settings
+)
+from core.download_manager import download_manager
+from core.export_jobs import EXPORT_JOB_FORMATS, export_job_queue
+from core.query_cache import inflight_searches, query_result_cache
+from core.temp_file_manager import temp_file_manager
+from core.tmp_quota import TmpQuotaExceeded, tmp_quota
+from core.suggest_index import suggest_indexes
+from core.value_dictionary import FieldValueDictionary, value_dictionaries
+
+tmp_quota.register_owner("prefetch", _on_prefetched_blob_evicted)
 
 
 app = FastAPI(title="DataPage API", version="1.0.0")
@@ -293,10 +309,9 @@ async def startup_warming():
     try:
         logger.info("🔥 Startup Warming 시작...")
 
-        # 🧹 모든 모드에서 startup 시 /tmp 정리 수행
-        clear_success = clear_tmp_cache()
-        if clear_success:
-            logger.info("🧹 Startup /tmp 캐시 정리 완료")
+        # ♻️ 웜 인스턴스에 남은 /tmp 파일은 지우지 않고 공용 예산에 편입 (초과분만 제거)
+        tmp_quota.adopt(BLOB_PREFETCH_ROOT, "prefetch")
+        tmp_quota.adopt(DUCKDB_CACHE_ROOT, "duckdb_cache")
 
         prefetch_config = get_prefetch_config()
         if prefetch_config["enabled"]:
@@ -354,6 +369,8 @@ class SearchRequest(BaseModel):
     # 서버사이드 페이지네이션 파라미터
     page: Optional[int] = 1  # 페이지 번호 (1부터 시작)
     limit: Optional[int] = 20  # 페이지당 항목 수 (기본 20개)
+    cursor: Optional[str] = None  # keyset 페이지네이션 커서 (이전 응답의 pagination.next_cursor)
+    match_mode: Optional[str] = "exact"  # exact: 부분 문자열 일치, fuzzy: 오타/띄어쓰기 허용 (유사도순)
     # offset은 page와 limit으로 계산되므로 제거
     # offset: Optional[int] = 0
 
@@ -365,6 +382,7 @@ class PaginationInfo(BaseModel):
     items_per_page: int     # 페이지당 항목 수
     has_next: bool          # 다음 페이지 존재 여부
     has_prev: bool          # 이전 페이지 존재 여부
+    next_cursor: Optional[str] = None  # 다음 페이지 keyset 커서 (깊은 페이지도 첫 페이지와 동일 비용)
 
 # 검색 응답 모델 (서버사이드 페이지네이션용)
 class SearchResponse(BaseModel):
@@ -374,6 +392,57 @@ class SearchResponse(BaseModel):
     available_categories: List[str]         # 사용 가능한 카테고리 (호환성용)
 
 
+# 통합(다중 데이터셋) 검색 요청 모델
+class FederatedSearchRequest(BaseModel):
+    keyword: Optional[str] = None
+    search_field: Optional[str] = "company_name"  # company_name, model_name, product_name 등
+    category: Optional[str] = "dataA"
+    datasets: Optional[List[str]] = None  # 검색할 서브카테고리 목록 (없으면 카테고리 전체, dataC는 "success/safetykorea" 형식 허용)
+    result_type: Optional[str] = None  # dataC 결과 유형 (success/failed, 없으면 모두)
+    filters: Optional[Dict[str, Any]] = None
+    limit: Optional[int] = 20  # 통합 첫 페이지 항목 수
+    timeout_seconds: Optional[float] = None  # 데이터셋별 제한 시간 (서버 최대값 이내)
+
+
+# 스트리밍 내보내기 요청 모델
+class ExportRequest(BaseModel):
+    keyword: Optional[str] = None
+    search_field: Optional[str] = "product_name"
+    filters: Optional[Dict[str, Any]] = None
+    format: Optional[str] = "csv"  # csv | ndjson
+    limit: Optional[int] = None  # 최대 행 수 (없으면 검색 결과 전체)
+
+
+# facet 집계 요청 모델 (검색 API와 같은 조건)
+class FacetRequest(BaseModel):
+    keyword: Optional[str] = None
+    search_field: Optional[str] = "product_name"
+    filters: Optional[Dict[str, Any]] = None
+    top_n: Optional[int] = None  # facet별 상위 값 개수 (기본 FACET_TOP_N)
+
+
+# 백그라운드 내보내기 작업 요청 모델
+class ExportJobRequest(BaseModel):
+    keyword: Optional[str] = None
+    search_field: Optional[str] = "product_name"
+    filters: Optional[Dict[str, Any]] = None
+    format: Optional[str] = "xlsx"  # xlsx | csv | parquet
+    limit: Optional[int] = None  # 최대 행 수 (없으면 검색 결과 전체)
+
+
+# 통합 검색 동시 실행 수 / 데이터셋별 제한 시간 (환경변수로 조정)
+FEDERATED_SEARCH_MAX_CONCURRENCY = max(1, int(os.getenv("FEDERATED_SEARCH_MAX_CONCURRENCY", "4") or 4))
+FEDERATED_SEARCH_TIMEOUT_SECONDS = float(os.getenv("FEDERATED_SEARCH_TIMEOUT_SECONDS", "8") or 8)
+
+# 스트리밍 내보내기 배치 크기 / 전송 대기 배치 수 (메모리 사용량 = 배치 크기 x 대기 배치 수로 고정)
+EXPORT_STREAM_CHUNK_SIZE = max(100, int(os.getenv("EXPORT_STREAM_CHUNK_SIZE", "2000") or 2000))
+EXPORT_STREAM_QUEUE_CHUNKS = 4
+EXPORT_STREAM_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson; charset=utf-8", "ndjson"),
+}
+
+
 @app.get("/")
 async def root():
     """메인 페이지 - search.html로 리다이렉트"""
@@ -396,7 +465,16 @@ async def get_system_status():
             "duckdb": "환경변수 USE_DUCKDB=true로 설정",
             "github_releases": "1.6GB+ 파일은 GitHub Releases 업로드 권장"
         },
-        "prefetch": get_prefetch_config()
+        "prefetch": get_prefetch_config(),
+        "duckdb_pools": get_connection_pool_stats(),
+        "dataset_handles": get_dataset_handle_stats(),
+        "query_cache": query_result_cache.stats(),
+        "inflight_searches": inflight_searches.stats(),
+        "downloads": download_manager.stats(),
+        "tmp_quota": tmp_quota.stats(),
+        "export_jobs": export_job_queue.stats(),
+        "value_dictionaries": value_dictionaries.stats(),
+        "suggest_indexes": suggest_indexes.stats()
     }
 
 
@@ -448,24 +526,6 @@ async def get_cold_start_info():
             "stats": None
         }
 
-def clear_tmp_cache():
-    """2025 모드용 /tmp 캐시 폴더 정리"""
-    try:
-        if BLOB_PREFETCH_ROOT.exists():
-            import shutil
-            shutil.rmtree(BLOB_PREFETCH_ROOT)
-            logger.info(f"🧹 /tmp 캐시 폴더 정리 완료: {BLOB_PREFETCH_ROOT}")
-
-        # 메모리 상의 캐시도 정리
-        global PREFETCHED_BLOB_FILES
-        with PREFETCH_LOCK:
-            PREFETCHED_BLOB_FILES.clear()
-
-        return True
-    except Exception as e:
-        logger.warning(f"⚠️ /tmp 캐시 정리 실패: {e}")
-        return False
-
 class SinglePrefetchRequest(BaseModel):
     category: str
     subcategory: str
@@ -481,11 +541,9 @@ async def prefetch_single_file(request: SinglePrefetchRequest):
         raise HTTPException(status_code=400, detail="2025 모드에서만 사용 가능합니다")
 
     start_time = time.time()
+    evictions_before = tmp_quota.stats()["evictions"]
 
-    # 1. /tmp 폴더 정리
-    clear_success = clear_tmp_cache()
-
-    # 2. 환경변수에서 URL 찾기 (슬러그 정규화)
+    # 1. 환경변수에서 URL 찾기 (슬러그 정규화)
     normalized_subcategory = normalize_subcategory(request.subcategory)
     key = (request.category, request.result_type, normalized_subcategory)
     env_var = BLOB_ENV_PREFETCH_MAPPING.get(key)
@@ -521,7 +579,7 @@ async def prefetch_single_file(request: SinglePrefetchRequest):
             detail=f"프리페치 가능한 원격 URL을 찾을 수 없습니다: {request.category}/{request.subcategory}"
         )
 
-    # 3. 개별 파일 다운로드
+    # 2. 개별 파일 다운로드 (/tmp가 부족하면 tmp_quota가 덜 쓰인 파일부터 제거)
     try:
         logger.info(f"🎯 개별 파일 다운로드 시작: {request.category}/{request.subcategory}")
         result = await asyncio.to_thread(_prefetch_single_blob, request.category, request.subcategory, request.result_type, url)
@@ -530,6 +588,7 @@ async def prefetch_single_file(request: SinglePrefetchRequest):
         duration = end_time - start_time
 
         if result:
+            quota_stats = tmp_quota.stats()
             return {
                 "success": True,
                 "message": f"✅ 파일 다운로드 완료: {request.subcategory}",
@@ -539,7 +598,8 @@ async def prefetch_single_file(request: SinglePrefetchRequest):
                     "result_type": request.result_type,
                     "local_path": result,
                     "duration_seconds": round(duration, 2),
-                    "cache_cleared": clear_success,
+                    "evicted_files": quota_stats["evictions"] - evictions_before,
+                    "tmp_usage_percent": quota_stats["usage_percent"],
                     "timestamp": datetime.now().isoformat()
                 }
             }
@@ -566,6 +626,10 @@ async def search_category_data(category: str, subcategory: str, request: SearchR
         if not request.keyword or not request.keyword.strip():
             raise HTTPException(status_code=400, detail="검색어를 입력해주세요")
 
+        match_mode = (request.match_mode or "exact").lower()
+        if match_mode not in MATCH_MODES:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 match_mode입니다: {request.match_mode} ({', '.join(MATCH_MODES)})")
+
         # Parquet 데이터 파일 URL 가져오기
         data_file_path = get_data_file_path(category, subcategory)
         if not data_file_path:
@@ -595,10 +659,14 @@ async def search_category_data(category: str, subcategory: str, request: SearchR
             page=request.page,
             filters=request.filters,
             category=category,
-            subcategory=effective_subcategory
+            subcategory=effective_subcategory,
+            cursor=request.cursor,
+            match_mode=match_mode
         )
         
         # 오류 발생 시 예외 처리
+        if search_result.get("error") == "invalid_fuzzy_search":
+            raise HTTPException(status_code=400, detail=search_result.get("message"))
         if "error" in search_result:
             raise HTTPException(status_code=500, detail=f"검색 처리 실패: {search_result.get('message')}")
         
@@ -608,6 +676,7 @@ async def search_category_data(category: str, subcategory: str, request: SearchR
             "file_size_mb": round(file_size_mb, 2),
             "processing_stats": search_result.get("stats", {}),
             "duckdb_enabled": True,
+            "match_mode": match_mode,
             "performance_note": "서버사이드 페이지네이션으로 최적화된 처리"
         }
 
@@ -623,7 +692,8 @@ async def search_category_data(category: str, subcategory: str, request: SearchR
             current_page=pagination_data.get("current_page", 1),
             items_per_page=pagination_data.get("items_per_page", 20),
             has_next=pagination_data.get("has_next", False),
-            has_prev=pagination_data.get("has_prev", False)
+            has_prev=pagination_data.get("has_prev", False),
+            next_cursor=pagination_data.get("next_cursor")
         )
 
         return SearchResponse(
@@ -653,6 +723,475 @@ async def search_data(request: SearchRequest):
     """
     return await search_category_data("dataA", "safetykorea", request)
 
+def _category_result_types(category: str) -> List[str]:
+    """결과 유형(success/failed)으로 나뉘는 카테고리(dataC)의 result_type 목록 (없으면 빈 목록)"""
+    return list(dict.fromkeys(
+        result_type for (mapped_category, result_type, _) in BLOB_ENV_PREFETCH_MAPPING
+        if mapped_category == category and result_type
+    ))
+
+
+def _category_subcategories(category: str, result_type: Optional[str]) -> List[str]:
+    """카테고리(/결과 유형)의 서브카테고리 목록 - field_settings 우선, 없으면 Blob 매핑 기준"""
+    category_settings = load_field_settings().get(category, {})
+    if result_type:
+        # dataC field_settings는 최상위 키가 success/failed이고 그 아래에 서브카테고리가 있음
+        category_settings = category_settings.get(result_type) or {}
+    names = list(category_settings) or [
+        subcategory for (mapped_category, mapped_type, subcategory) in BLOB_ENV_PREFETCH_MAPPING
+        if mapped_category == category and mapped_type == result_type
+    ]
+    return [normalize_subcategory(name) for name in names]
+
+
+def _resolve_federated_datasets(
+    category: str, requested: Optional[List[str]], result_type: Optional[str]
+) -> List[Tuple[Optional[str], str]]:
+    """통합 검색 대상 (result_type, 서브카테고리) 목록 - 중복 제거, 순서 유지"""
+    result_types = _category_result_types(category)
+    if result_type and result_type not in result_types:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 result_type입니다: {category}/{result_type}")
+    selected_types: List[Optional[str]] = [result_type] if result_type else (result_types or [None])
+
+    if not requested:
+        targets = [
+            (selected_type, subcategory)
+            for selected_type in selected_types
+            for subcategory in _category_subcategories(category, selected_type)
+        ]
+        return list(dict.fromkeys(targets))
+
+    targets = []
+    for name in requested:
+        if not name:
+            continue
+        prefix, _, subcategory = name.rpartition("/")
+        subcategory = normalize_subcategory(subcategory)
+        if not result_types:
+            targets.append((None, subcategory))
+        elif prefix:
+            if prefix not in result_types:
+                raise HTTPException(status_code=400, detail=f"지원하지 않는 result_type입니다: {category}/{prefix}")
+            targets.append((prefix, subcategory))
+        else:
+            targets.extend((selected_type, subcategory) for selected_type in selected_types)
+    return list(dict.fromkeys(targets))
+
+
+def _get_federated_data_path(category: str, subcategory: str, result_type: Optional[str]) -> Optional[str]:
+    """데이터셋 파일 경로 - 결과 유형이 있으면 사전 다운로드 파일, 없으면 Blob URL"""
+    if not result_type:
+        return get_data_file_path(category, subcategory)
+    local_path = get_prefetched_blob_path(category, subcategory, result_type)
+    if local_path:
+        return local_path
+    env_var = BLOB_ENV_PREFETCH_MAPPING.get((category, result_type, subcategory))
+    return os.getenv(env_var) if env_var else None
+
+
+@app.post("/api/search/federated")
+async def search_federated(request: FederatedSearchRequest):
+    """
+    여러 데이터셋 통합 검색 - 데이터셋별 건수 + 통합 첫 페이지
+
+    데이터셋들을 동시 실행 수 제한 안에서 병렬로 검색하고, 데이터셋마다 제한 시간을 두어
+    느린 데이터셋 하나가 전체 응답을 지연시키지 않도록 한다.
+    """
+    import time
+
+    if not request.keyword or not request.keyword.strip():
+        raise HTTPException(status_code=400, detail="검색어를 입력해주세요")
+
+    category = request.category or "dataA"
+    # dataC는 결과 유형(success/failed)별로 서브카테고리를 펼쳐서 각각 검색
+    datasets = _resolve_federated_datasets(category, request.datasets, request.result_type)
+    if not datasets:
+        raise HTTPException(status_code=400, detail=f"검색할 데이터셋이 없습니다: {category}")
+
+    page_limit = max(1, min(request.limit or 20, 100))
+    timeout_seconds = FEDERATED_SEARCH_TIMEOUT_SECONDS
+    if request.timeout_seconds and request.timeout_seconds > 0:
+        timeout_seconds = min(request.timeout_seconds, FEDERATED_SEARCH_TIMEOUT_SECONDS)
+
+    semaphore = asyncio.Semaphore(FEDERATED_SEARCH_MAX_CONCURRENCY)
+    start_time = time.time()
+
+    async def _search_dataset(result_type: Optional[str], subcategory: str) -> Dict[str, Any]:
+        async with semaphore:
+            dataset_start = time.time()
+            dataset_name = f"{result_type}/{subcategory}" if result_type else subcategory
+            status: Dict[str, Any] = {
+                "dataset": dataset_name,
+                "subcategory": subcategory,
+                "result_type": result_type,
+                "total_count": 0,
+                "results": []
+            }
+
+            data_file_path = _get_federated_data_path(category, subcategory, result_type)
+            if not data_file_path:
+                status.update(status="unavailable", message="데이터 파일 URL을 찾을 수 없습니다")
+                return status
+
+            try:
+                search_result = await asyncio.wait_for(
+                    duckdb_search_large_file(
+                        file_path=str(data_file_path),
+                        keyword=request.keyword,
+                        search_field=request.search_field,
+                        limit=page_limit,
+                        page=1,
+                        filters=request.filters,
+                        category=category,
+                        subcategory=subcategory,
+                        result_type=result_type
+                    ),
+                    timeout=timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"⏱️ 통합 검색 시간 초과: {category}/{dataset_name} ({timeout_seconds}s)")
+                status.update(status="timeout", message=f"{timeout_seconds}초 내에 완료되지 않았습니다")
+                return status
+            except Exception as e:
+                logger.warning(f"통합 검색 실패: {category}/{dataset_name} ({e})")
+                status.update(status="error", message=str(e))
+                return status
+            finally:
+                status["elapsed_ms"] = round((time.time() - dataset_start) * 1000, 1)
+
+            if "error" in search_result:
+                status.update(status="error", message=search_result.get("message"))
+                return status
+
+            status.update(
+                status="ok",
+                total_count=search_result.get("pagination", {}).get("total_count", 0),
+                results=search_result.get("results", [])
+            )
+            return status
+
+    dataset_results = await asyncio.gather(*[
+        _search_dataset(result_type, subcategory) for result_type, subcategory in datasets
+    ])
+
+    # 통합 첫 페이지: 데이터셋 순서대로 한 건씩 번갈아 채워 모든 데이터셋이 노출되도록 구성
+    merged: List[Dict[str, Any]] = []
+    queues = [
+        (entry["dataset"], list(entry.pop("results")))
+        for entry in dataset_results
+    ]
+    while len(merged) < page_limit and any(rows for _, rows in queues):
+        for dataset_name, rows in queues:
+            if rows and len(merged) < page_limit:
+                merged.append({**rows.pop(0), "_dataset": dataset_name})
+
+    succeeded = [entry for entry in dataset_results if entry["status"] == "ok"]
+    return {
+        "keyword": request.keyword,
+        "search_field": request.search_field,
+        "category": category,
+        "datasets": dataset_results,
+        "results": merged,
+        "summary": {
+            "total_count": sum(entry["total_count"] for entry in succeeded),
+            "datasets_requested": len(datasets),
+            "datasets_succeeded": len(succeeded),
+            "datasets_failed": len(datasets) - len(succeeded),
+            "max_concurrency": FEDERATED_SEARCH_MAX_CONCURRENCY,
+            "timeout_seconds": timeout_seconds,
+            "processing_time": round(time.time() - start_time, 2)
+        }
+    }
+
+class _ExportCancelled(Exception):
+    """클라이언트 연결 종료로 스트리밍 내보내기 중단"""
+
+
+class _ExportEncoder:
+    """검색 결과 청크를 CSV(UTF-8 BOM, 한글 헤더) 또는 NDJSON 바이트로 변환
+
+    CSV 컬럼은 첫 청크에서 확정한다 (download_fields 순서, 없으면 결과 컬럼 순서).
+    """
+
+    def __init__(self, export_format: str, download_fields: List[str], korean_mapping: Dict[str, str]):
+        self.export_format = export_format
+        self.download_fields = download_fields
+        self.korean_mapping = korean_mapping
+        self.columns: Optional[List[str]] = None
+
+    def _header(self) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow([self.korean_mapping.get(column, column) for column in self.columns])
+        return ("\ufeff" + buffer.getvalue()).encode("utf-8")
+
+    def encode(self, records: List[Dict[str, Any]]) -> bytes:
+        if self.export_format == "ndjson":
+            return "".join(
+                json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in records
+            ).encode("utf-8")
+
+        prefix = b""
+        if self.columns is None:
+            first = records[0] if records else {}
+            self.columns = [field for field in self.download_fields if field in first] or list(first.keys())
+            prefix = self._header()
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for record in records:
+            writer.writerow([_normalize_excel_value(record.get(column)) for column in self.columns])
+        return prefix + buffer.getvalue().encode("utf-8")
+
+    def finish(self) -> bytes:
+        """결과가 없을 때도 CSV 헤더는 출력"""
+        if self.export_format == "csv" and self.columns is None:
+            self.columns = list(self.download_fields)
+            return self._header()
+        return b""
+
+
+@app.post("/api/export/{category}/{subcategory}/stream")
+async def stream_export(category: str, subcategory: str, request: ExportRequest):
+    """
+    검색 결과 스트리밍 내보내기 (CSV / NDJSON)
+    DuckDB 배치를 받는 즉시 인코딩해 전송하므로 결과 크기와 무관하게 메모리 사용량 일정
+    """
+    export_format = (request.format or "csv").lower()
+    if export_format not in EXPORT_STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 내보내기 형식입니다: {request.format} (csv, ndjson)")
+
+    data_file_path = get_data_file_path(category, subcategory)
+    if not data_file_path:
+        raise HTTPException(status_code=404, detail=f"데이터 파일 URL을 찾을 수 없습니다: {category}/{subcategory}")
+
+    data_file_str, _, is_tabular, _ = _inspect_data_source(data_file_path)
+    if not is_tabular:
+        raise HTTPException(status_code=400, detail="스트리밍 내보내기는 Parquet/DuckDB 데이터셋에서만 지원됩니다")
+
+    effective_subcategory = normalize_subcategory(subcategory)
+    download_fields = (
+        load_field_settings().get(category, {}).get(effective_subcategory, {}).get("download_fields", [])
+    )
+    encoder = _ExportEncoder(export_format, download_fields, get_korean_field_mapping(category, subcategory))
+
+    loop = asyncio.get_running_loop()
+    # 대기 배치 수를 제한하여 클라이언트가 느리면 DuckDB 읽기도 함께 대기 (backpressure)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=EXPORT_STREAM_QUEUE_CHUNKS)
+    cancelled = threading.Event()
+    done = object()
+
+    def on_chunk(records: List[Dict[str, Any]], total_processed: int) -> None:
+        # 검색 워커 스레드에서 호출 - 인코딩도 이벤트 루프 밖에서 수행
+        if cancelled.is_set():
+            raise _ExportCancelled("클라이언트 연결 종료로 내보내기 중단")
+        payload = encoder.encode(records)
+        asyncio.run_coroutine_threadsafe(queue.put(payload), loop).result()
+
+    async def produce() -> Dict[str, Any]:
+        try:
+            return await duckdb_search_large_file(
+                file_path=data_file_str,
+                keyword=request.keyword,
+                search_field=request.search_field or "product_name",
+                limit=request.limit if request.limit and request.limit > 0 else None,
+                filters=request.filters,
+                category=category,
+                subcategory=effective_subcategory,
+                collect_results=False,
+                chunk_callback=on_chunk,
+                chunk_size=EXPORT_STREAM_CHUNK_SIZE,
+                required_fields=download_fields or None
+            )
+        finally:
+            await queue.put(done)
+
+    producer = asyncio.create_task(produce())
+
+    # 첫 배치(또는 완료)까지 기다려 쿼리 오류는 응답 시작 전에 HTTP 오류로 반환
+    first = await queue.get()
+    if first is done:
+        try:
+            search_result = producer.result()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"내보내기 실패: {str(e)}")
+        if search_result.get("error"):
+            raise HTTPException(status_code=500, detail=f"내보내기 실패: {search_result.get('message')}")
+
+    async def body():
+        item = first
+        try:
+            while item is not done:
+                yield item
+                item = await queue.get()
+            try:
+                result = producer.result()
+            except Exception as e:
+                result = {"error": "export_failed", "message": str(e)}
+            if result.get("error"):
+                # 마지막 정상 청크 이후 예외로 연결을 끊어 클라이언트가 잘린 파일을 완료로 받지 않게 함
+                logger.error(f"❌ 스트리밍 내보내기 중단: {category}/{subcategory} - {result.get('message')}")
+                raise RuntimeError(f"스트리밍 내보내기 중단: {result.get('message')}")
+            tail = encoder.finish()
+            if tail:
+                yield tail
+            logger.info(f"📤 스트리밍 내보내기 완료: {category}/{subcategory} ({result.get('stats', {}).get('processed_records', 0):,}행)")
+        finally:
+            if not producer.done():
+                # 클라이언트 연결 종료 - 대기 중인 배치를 비워 워커 스레드가 다음 청크에서 중단하도록 함
+                cancelled.set()
+                while not queue.empty():
+                    queue.get_nowait()
+
+    media_type, extension = EXPORT_STREAM_FORMATS[export_format]
+    filename = f"{category}_{effective_subcategory}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+    )
+
+
+@app.post("/api/facets/{category}/{subcategory}")
+async def get_search_facets(category: str, subcategory: str, request: FacetRequest):
+    """
+    검색 조건에 해당하는 전체 결과의 facet별 건수 (제조사, 인증구분, 연도, 제조/수입)
+    DuckDB GROUPING SETS 한 번의 스캔으로 계산하며 데이터셋 버전별로 캐시
+    """
+    data_file_path = get_data_file_path(category, subcategory)
+    if not data_file_path:
+        raise HTTPException(status_code=404, detail=f"데이터 파일 URL을 찾을 수 없습니다: {category}/{subcategory}")
+
+    data_file_str, _, is_tabular, _ = _inspect_data_source(data_file_path)
+    if not is_tabular:
+        raise HTTPException(status_code=400, detail="facet 집계는 Parquet/DuckDB 데이터셋에서만 지원됩니다")
+
+    effective_subcategory = normalize_subcategory(subcategory)
+    facet_fields = (
+        load_field_settings().get(category, {}).get(effective_subcategory, {}).get("facet_fields") or None
+    )
+    top_n = min(max(request.top_n, 1), 100) if request.top_n else FACET_TOP_N
+
+    try:
+        return await duckdb_get_facets(
+            data_file_str,
+            keyword=request.keyword,
+            search_field=request.search_field or "product_name",
+            filters=request.filters,
+            category=category,
+            subcategory=effective_subcategory,
+            facet_fields=facet_fields,
+            top_n=top_n
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"facet 집계 실패: {str(e)}")
+
+
+EXPORT_JOB_MEDIA_TYPES = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+@app.post("/api/export/{category}/{subcategory}/jobs")
+async def submit_export_job(category: str, subcategory: str, request: ExportJobRequest):
+    """
+    백그라운드 내보내기 작업 접수 (XLSX / CSV / Parquet)
+    파일은 워커 풀에서 생성되며 상태 조회 API로 진행률을 확인한 뒤 다운로드
+    """
+    export_format = (request.format or "xlsx").lower()
+    if export_format not in EXPORT_JOB_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 내보내기 형식입니다: {request.format} ({', '.join(EXPORT_JOB_FORMATS)})"
+        )
+
+    data_file_path = get_data_file_path(category, subcategory)
+    if not data_file_path:
+        raise HTTPException(status_code=404, detail=f"데이터 파일 URL을 찾을 수 없습니다: {category}/{subcategory}")
+
+    data_file_str, _, is_tabular, _ = _inspect_data_source(data_file_path)
+    if not is_tabular:
+        raise HTTPException(status_code=400, detail="백그라운드 내보내기는 Parquet/DuckDB 데이터셋에서만 지원됩니다")
+
+    effective_subcategory = normalize_subcategory(subcategory)
+    download_fields = (
+        load_field_settings().get(category, {}).get(effective_subcategory, {}).get("download_fields", [])
+    )
+    conditions = {
+        "category": category,
+        "subcategory": effective_subcategory,
+        "keyword": request.keyword,
+        "search_field": request.search_field or "product_name",
+        "filters": request.filters,
+        "limit": request.limit if request.limit and request.limit > 0 else None
+    }
+    metadata = {
+        "korean_field_mapping": get_korean_field_mapping(category, subcategory),
+        "download_fields": download_fields,
+        "search_conditions": {
+            "keyword": request.keyword,
+            "search_field": request.search_field,
+            "filters": request.filters
+        }
+    }
+
+    try:
+        job = await export_job_queue.submit(data_file_str, export_format, conditions, metadata)
+    except TmpQuotaExceeded as e:
+        raise HTTPException(status_code=507, detail=f"임시 저장 공간이 부족합니다: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"내보내기 작업 접수 실패: {str(e)}")
+
+    return export_job_queue.describe(job)
+
+
+def _get_export_job(job_id: str):
+    job = export_job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"내보내기 작업을 찾을 수 없습니다: {job_id}")
+    return job
+
+
+@app.get("/api/export/jobs/{job_id}")
+async def get_export_job_status(job_id: str):
+    """내보내기 작업 상태/진행률 조회"""
+    return export_job_queue.describe(_get_export_job(job_id))
+
+
+@app.get("/api/export/jobs/{job_id}/download")
+async def download_export_job(job_id: str):
+    """완료된 내보내기 작업 파일 다운로드"""
+    job = _get_export_job(job_id)
+    if job.status != "completed":
+        raise HTTPException(status_code=409, detail=f"아직 다운로드할 수 없는 작업입니다 (상태: {job.status})")
+
+    file_path = temp_file_manager.get_file_path(job_id)
+    if file_path is None:
+        raise HTTPException(status_code=410, detail="보관 기간이 지나 파일이 삭제되었습니다")
+    tmp_quota.touch(file_path)
+
+    category = job.conditions.get("category")
+    subcategory = job.conditions.get("subcategory")
+    filename = f"{category}_{subcategory}_{datetime.fromtimestamp(job.submitted_at).strftime('%Y%m%d_%H%M%S')}.{job.file_type}"
+    return FileResponse(
+        file_path,
+        media_type=EXPORT_JOB_MEDIA_TYPES[job.file_type],
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+    )
+
+
+@app.delete("/api/export/jobs/{job_id}")
+async def cancel_export_job(job_id: str):
+    """내보내기 작업 취소 (실행 중이면 다음 배치/쿼리 중단 시점에 종료)"""
+    job = export_job_queue.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"내보내기 작업을 찾을 수 없습니다: {job_id}")
+    return export_job_queue.describe(job)
+
+
 @app.get("/api/categories")
 async def get_categories():
     """
@@ -692,6 +1231,60 @@ async def get_categories():
 
 
 
+@app.get("/api/lookup/{category}/{subcategory}")
+async def lookup_identifiers(
+    category: str,
+    subcategory: str,
+    ids: List[str] = Query(..., description="조회할 인증번호/신고번호/사업자등록번호 (반복 또는 쉼표 구분)"),
+    field: Optional[str] = Query(None, description="식별자 필드 (생략 시 데이터셋의 첫 번째 식별자 필드)")
+):
+    """
+    식별자 단건/소량 조회 - 변환 시 생성된 ART 인덱스로 전체 스캔 없이 point query 처리
+    """
+    try:
+        identifiers = [value.strip() for raw in ids for value in raw.split(",") if value.strip()]
+        if not identifiers:
+            raise HTTPException(status_code=400, detail="조회할 식별자를 입력해주세요")
+        if len(identifiers) > LOOKUP_MAX_IDENTIFIERS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 번에 최대 {LOOKUP_MAX_IDENTIFIERS}개까지 조회할 수 있습니다"
+            )
+
+        data_file_path = get_data_file_path(category, subcategory)
+        if not data_file_path:
+            raise HTTPException(status_code=404, detail=f"데이터 파일 URL을 찾을 수 없습니다: {category}/{subcategory}")
+
+        data_file_str, _, is_tabular, _ = _inspect_data_source(data_file_path)
+        if not is_tabular:
+            raise HTTPException(status_code=400, detail="식별자 조회는 Parquet/DuckDB 데이터셋에서만 지원됩니다")
+
+        from core.duckdb_processor import DuckDBProcessor
+
+        start_time = datetime.now()
+        processor = DuckDBProcessor(
+            data_file_str,
+            category=category,
+            subcategory=normalize_subcategory(subcategory)
+        )
+        try:
+            lookup_result = await asyncio.to_thread(processor.lookup_identifiers, identifiers, field)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        finally:
+            processor.close()
+
+        return {
+            **lookup_result,
+            "requested_count": len(identifiers),
+            "processing_time_ms": round((datetime.now() - start_time).total_seconds() * 1000, 2)
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"식별자 조회 실패: {str(e)}")
+
 @app.get("/api/file-info/{category}/{subcategory}")
 async def get_file_info(category: str, subcategory: str):
     """
@@ -770,10 +1363,22 @@ async def get_file_info(category: str, subcategory: str):
         raise HTTPException(status_code=500, detail=f"파일 정보 조회 실패: {str(e)}")
 
 @app.get("/api/field-samples/{category}/{subcategory}/{field_name}")
-async def get_field_samples(category: str, subcategory: str, field_name: str, limit: int = 100):
+async def get_field_samples(
+    category: str,
+    subcategory: str,
+    field_name: str,
+    limit: int = 100,
+    order: str = Query("value", description="value: 값 순서, frequency: 건수 많은 순"),
+    with_counts: bool = Query(False, description="값별 건수 포함 여부")
+):
     """
     특정 필드의 샘플 값들 조회 (필터 옵션 생성용)
+    데이터셋 버전별 필드 값 사전(값 + 건수)을 한 번 만들어 두고 메모리에서 응답
     """
+    if order not in ("value", "frequency"):
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 정렬입니다: {order} (value, frequency)")
+    limit = max(1, limit)
+
     try:
         data_file_path = get_data_file_path(category, subcategory)
         if not data_file_path:
@@ -781,6 +1386,9 @@ async def get_field_samples(category: str, subcategory: str, field_name: str, li
         
         data_file_str, is_r2_url, is_tabular, file_size_mb = _inspect_data_source(data_file_path)
 
+        dictionary = None
+        cache_hit = False
+        samples: List[Any] = []
         if is_tabular:
             from core.duckdb_processor import DuckDBProcessor
 
@@ -791,37 +1399,101 @@ async def get_field_samples(category: str, subcategory: str, field_name: str, li
                 subcategory=effective_subcategory
             )
             try:
-                samples = processor.get_distinct_values(field_name, limit)
+                dictionary, cache_hit = await asyncio.to_thread(processor.get_value_dictionary, field_name)
             except Exception as e:
                 logger.warning(f"DuckDB 필드 샘플 조회 실패: {e}")
-                samples = []
             finally:
                 processor.close()
         elif file_size_mb > 50:
             processor = get_processor(data_file_path)
             samples = await processor.get_field_samples(field_name, limit)
         else:
-            with open(data_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            samples = set()
-            for item in data.get("data", []):
-                if field_name in item and item[field_name] is not None:
-                    samples.add(item[field_name])
-                    if len(samples) >= limit:
-                        break
-            samples = sorted(list(samples))
-        
-        return {
+            def build_from_json() -> FieldValueDictionary:
+                with open(data_file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                return FieldValueDictionary.from_records(field_name, data.get("data", []))
+
+            stat = os.stat(data_file_path)
+            dictionary, cache_hit = await asyncio.to_thread(
+                value_dictionaries.get_or_build,
+                str(data_file_path), f"{stat.st_size}:{stat.st_mtime_ns}", field_name, build_from_json
+            )
+
+        if dictionary is None:
+            # 대용량 JSON 스트리밍 샘플 또는 사전 생성 실패
+            return {
+                "field_name": field_name,
+                "sample_count": len(samples[:limit]),
+                "samples": samples[:limit]
+            }
+
+        response = {
             "field_name": field_name,
-            "sample_count": len(samples),
-            "samples": samples[:limit]
+            "samples": dictionary.samples(limit, order),
+            "distinct_count": dictionary.distinct_count,
+            "total_count": dictionary.total_count,
+            "truncated": dictionary.truncated,
+            "cache_hit": cache_hit
         }
+        response["sample_count"] = len(response["samples"])
+        if with_counts:
+            response["values"] = dictionary.entries(limit, order)
+        return response
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"필드 샘플 조회 실패: {str(e)}")
 
+@app.get("/api/suggest/{category}/{subcategory}")
+async def suggest_keywords(
+    category: str,
+    subcategory: str,
+    q: str = Query(..., description="입력 중인 검색어 (접두어)"),
+    search_field: str = Query("company_name", description="company_name, model_name, product_name"),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """
+    검색어 자동완성 - 정규화된 distinct 값의 정렬 인덱스(mmap)에서 접두어 범위를 이진 탐색하고 빈도순 반환
+    """
+    prefix = q.strip()
+    if not prefix:
+        return {"query": q, "search_field": search_field, "suggestions": []}
+
+    data_file_path = get_data_file_path(category, subcategory)
+    if not data_file_path:
+        raise HTTPException(status_code=404, detail=f"데이터 파일 URL을 찾을 수 없습니다: {category}/{subcategory}")
+
+    data_file_str, _, is_tabular, _ = _inspect_data_source(data_file_path)
+    if not is_tabular:
+        raise HTTPException(status_code=400, detail="자동완성은 Parquet/DuckDB 데이터셋에서만 지원됩니다")
+
+    from core.duckdb_processor import DuckDBProcessor
+
+    start_time = datetime.now()
+    processor = DuckDBProcessor(
+        data_file_str,
+        category=category,
+        subcategory=normalize_subcategory(subcategory)
+    )
+    try:
+        index = await asyncio.to_thread(processor.get_suggest_index, search_field)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"자동완성 인덱스 생성 실패: {str(e)}")
+    finally:
+        processor.close()
+
+    suggestions, matched_keys = index.suggest(prefix, limit)
+    return {
+        "query": q,
+        "search_field": search_field,
+        "suggestions": suggestions,
+        "matched_keys": matched_keys,
+        "processing_time_ms": round((datetime.now() - start_time).total_seconds() * 1000, 2)
+    }
+
 @app.post("/api/clear-cache")
 async def clear_processor_cache():
     """
@@ -830,6 +1502,9 @@ async def clear_processor_cache():
     try:
         from core.large_file_processor import clear_all_processors
         clear_all_processors()
+        query_result_cache.invalidate()
+        value_dictionaries.invalidate()
+        suggest_indexes.invalidate()
         return {"message": "캐시가 성공적으로 클리어되었습니다"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"캐시 클리어 실패: {str(e)}")
@@ -0,0 +1,522 @@
+"""
+원격 데이터셋 파일 다운로드 관리자
+R2 등 원격 DuckDB/Parquet 파일을 로컬 /tmp로 내려받는 단일 경로
+
+- URL별 single-flight: 같은 URL 동시 요청은 하나의 다운로드 결과를 공유
+- HTTP Range 구간 병렬 다운로드 (서버가 Accept-Ranges: bytes를 지원할 때)
+- `.download` 부분 파일 + 진행 상태 파일로 중단된 다운로드 이어받기
+- 크기 검증 + 체크섬 검증 (sha256 지정 시, 또는 MD5 형식 ETag)
+- 완료 후 `.download.json`에 ETag/sha256 기록 - 재시작 후에도 같은 원격 버전일 때만 로컬 사본 재사용
+- 스레드별 HTTP keep-alive 연결 재사용
+- quota_owner 지정 시 /tmp 공용 예산(tmp_quota)에서 공간을 예약한 뒤 다운로드
+"""
+
+import hashlib
+import http.client
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse
+
+from .tmp_quota import tmp_quota
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_SUFFIX = ".download"
+PROGRESS_SUFFIX = ".download.json"
+MAX_REDIRECTS = 5
+READ_BLOCK_SIZE = 1024 * 1024
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+class DownloadError(RuntimeError):
+    """원격 파일 다운로드 또는 검증 실패"""
+
+
+@dataclass
+class RemoteFileInfo:
+    """원격 파일 메타데이터 (리다이렉트 해석 후 최종 URL 기준)"""
+    url: str
+    size: Optional[int]
+    accept_ranges: bool
+    etag: Optional[str]
+
+    @property
+    def strong_etag(self) -> bool:
+        return bool(self.etag) and not self.etag.strip().startswith("W/")
+
+    @property
+    def md5(self) -> Optional[str]:
+        """단일 업로드 객체의 ETag(MD5 hex)만 체크섬으로 사용 (multipart ETag는 'hash-N' 형식)"""
+        if not self.strong_etag:
+            return None
+        value = self.etag.strip().strip('"')
+        if len(value) == 32 and all(ch in "0123456789abcdefABCDEF" for ch in value):
+            return value.lower()
+        return None
+
+
+class _Flight:
+    """진행 중인 다운로드 (같은 URL 후속 요청은 완료를 기다려 결과 공유)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Path] = None
+        self.error: Optional[BaseException] = None
+
+
+class DownloadManager:
+    """원격 파일 다운로드 관리자 (single-flight + Range 병렬 + 이어받기 + 검증)"""
+
+    def __init__(self,
+                 max_segments: int = 4,
+                 segment_size: int = 8 * 1024 * 1024,
+                 timeout: float = 60.0,
+                 verify_etag: bool = True):
+        self.max_segments = max(1, max_segments)
+        self.segment_size = max(READ_BLOCK_SIZE, segment_size)
+        self.timeout = timeout
+        self.verify_etag = verify_etag
+        # 구간 다운로드 워커는 재사용하여 스레드별 keep-alive 연결이 다운로드 간에도 유지되도록 함
+        self._executor = ThreadPoolExecutor(max_workers=self.max_segments, thread_name_prefix="download")
+        self._local = threading.local()
+        self._flights: Dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._downloads = 0
+        self._bytes = 0
+        self._resumed = 0
+        self._reused = 0
+        self._coalesced = 0
+        self._failures = 0
+
+    # ------------------------------------------------------------------
+    # HTTP 연결 (스레드별 keep-alive 재사용)
+    # ------------------------------------------------------------------
+    def _get_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+
+        connection = connections.get((scheme, netloc))
+        if connection is None:
+            connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            connection = connection_class(netloc, timeout=self.timeout)
+            connections[(scheme, netloc)] = connection
+        return connection
+
+    def _drop_connection(self, scheme: str, netloc: str) -> None:
+        connections = getattr(self._local, "connections", {})
+        connection = connections.pop((scheme, netloc), None)
+        if connection is not None:
+            connection.close()
+
+    def _request(self, method: str, url: str,
+                 headers: Optional[Dict[str, str]] = None) -> Tuple[http.client.HTTPResponse, str]:
+        """요청 전송 - 끊긴 keep-alive 연결은 1회 재연결, 리다이렉트는 최종 URL까지 추적
+
+        반환된 응답 본문은 호출자가 끝까지 읽거나 _discard로 연결을 정리해야 한다.
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            parsed = urlparse(url)
+            if parsed.scheme not in ("http", "https"):
+                raise DownloadError(f"지원하지 않는 URL 스킴입니다: {url}")
+            target = (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+
+            for attempt in range(2):
+                connection = self._get_connection(parsed.scheme, parsed.netloc)
+                try:
+                    connection.request(method, target, headers=headers or {})
+                    response = connection.getresponse()
+                    break
+                except (http.client.HTTPException, OSError):
+                    self._drop_connection(parsed.scheme, parsed.netloc)
+                    if attempt:
+                        raise
+
+            if response.status in REDIRECT_STATUSES:
+                location = response.getheader("Location")
+                response.read()
+                if not location:
+                    raise DownloadError(f"리다이렉트 위치가 없습니다: {url}")
+                url = urljoin(url, location)
+                continue
+            return response, url
+
+        raise DownloadError(f"리다이렉트 횟수 초과: {url}")
+
+    def _discard(self, response: http.client.HTTPResponse, url: str) -> None:
+        """본문을 읽지 않을 응답 - 연결을 닫아 다음 요청이 새 연결을 사용하도록 함"""
+        parsed = urlparse(url)
+        response.close()
+        self._drop_connection(parsed.scheme, parsed.netloc)
+
+    # ------------------------------------------------------------------
+    # 원격 파일 확인
+    # ------------------------------------------------------------------
+    def probe(self, url: str) -> RemoteFileInfo:
+        """원격 파일 크기/Range 지원/ETag 확인 (HEAD 거부 시 1바이트 Range GET으로 대체)"""
+        response, final_url = self._request("HEAD", url)
+        response.read()
+        if response.status < 400:
+            length = response.getheader("Content-Length")
+            return RemoteFileInfo(
+                url=final_url,
+                size=int(length) if length and length.isdigit() else None,
+                accept_ranges=(response.getheader("Accept-Ranges") or "").lower() == "bytes",
+                etag=response.getheader("ETag")
+            )
+
+        # 서명된 GET 전용 URL 등 HEAD를 허용하지 않는 서버
+        response, final_url = self._request("GET", url, {"Range": "bytes=0-0"})
+        if response.status == 206:
+            response.read()
+            content_range = response.getheader("Content-Range") or ""
+            total = content_range.rsplit("/", 1)[-1]
+            return RemoteFileInfo(
+                url=final_url,
+                size=int(total) if total.isdigit() else None,
+                accept_ranges=True,
+                etag=response.getheader("ETag")
+            )
+        if response.status == 200:
+            length = response.getheader("Content-Length")
+            self._discard(response, final_url)
+            return RemoteFileInfo(
+                url=final_url,
+                size=int(length) if length and length.isdigit() else None,
+                accept_ranges=False,
+                etag=response.getheader("ETag")
+            )
+
+        self._discard(response, final_url)
+        raise DownloadError(f"원격 파일 확인 실패 (HTTP {response.status}): {url}")
+
+    # ------------------------------------------------------------------
+    # 다운로드
+    # ------------------------------------------------------------------
+    def fetch(self, url: str, dest_path: Path,
+              expected_size: Optional[int] = None,
+              expected_sha256: Optional[str] = None,
+              quota_owner: Optional[str] = None) -> Path:
+        """원격 파일을 dest_path로 내려받아 경로 반환
+
+        같은 URL에 대한 동시 요청은 먼저 시작한 다운로드 하나만 수행하고 그 결과(경로)를 공유한다.
+        quota_owner를 지정하면 받은 파일이 tmp_quota에 해당 소유자 항목으로 기록된다.
+        """
+        with self._flights_lock:
+            flight = self._flights.get(url)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[url] = flight
+
+        if not leader:
+            with self._stats_lock:
+                self._coalesced += 1
+            logger.info(f"⏳ 진행 중인 다운로드 대기 (single-flight): {url}")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._download(url, Path(dest_path), expected_size, expected_sha256, quota_owner)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            with self._stats_lock:
+                self._failures += 1
+            raise
+        finally:
+            with self._flights_lock:
+                self._flights.pop(url, None)
+            flight.done.set()
+
+    def _download(self, url: str, dest: Path,
+                  expected_size: Optional[int], expected_sha256: Optional[str],
+                  quota_owner: Optional[str]) -> Path:
+        try:
+            info = self.probe(url)
+        except Exception as e:
+            if dest.exists() and dest.stat().st_size > 0:
+                logger.warning(f"원격 파일 확인 실패, 기존 로컬 사본 사용: {dest} ({e})")
+                if quota_owner:
+                    tmp_quota.commit(dest, owner=quota_owner)
+                return dest
+            raise DownloadError(f"원격 파일 확인 실패: {url} ({e})") from e
+
+        if expected_size is not None and info.size is not None and expected_size != info.size:
+            raise DownloadError(f"원격 파일 크기 불일치: 예상 {expected_size}, 실제 {info.size} ({url})")
+        size = info.size if info.size is not None else expected_size
+
+        temp_path = dest.with_name(dest.name + DOWNLOAD_SUFFIX)
+        progress_path = dest.with_name(dest.name + PROGRESS_SUFFIX)
+
+        # 이미 받은 파일이 같은 원격 버전이면 재사용 (크기만 같은 다른 파일은 다시 받음)
+        if self._is_current(dest, progress_path, info, size, expected_sha256):
+            with self._stats_lock:
+                self._reused += 1
+            logger.info(f"다운로드 재사용: {dest.name} ({size:,} bytes)")
+            if quota_owner:
+                tmp_quota.commit(dest, owner=quota_owner)
+            return dest
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        if quota_owner:
+            # 부분 파일/진행 상태 파일도 같은 항목으로 묶어 제거 시 함께 정리
+            tmp_quota.reserve(dest, size or 0, quota_owner, companions=(temp_path, progress_path))
+
+        logger.info(f"📥 다운로드 시작: {url} → {dest} ({size if size is not None else '크기 미확인'} bytes)")
+        try:
+            if size and info.accept_ranges:
+                self._download_ranged(info, size, temp_path, progress_path)
+            else:
+                self._download_stream(info, temp_path)
+        except BaseException:
+            if quota_owner:
+                # 이어받기용 부분 파일이 차지하는 만큼만 계속 기록
+                tmp_quota.commit(dest, size=temp_path.stat().st_size if temp_path.exists() else 0)
+            raise
+
+        try:
+            sha256 = self._verify(temp_path, size, info, expected_sha256)
+        except DownloadError:
+            # 손상된 부분 파일은 이어받지 않도록 제거
+            for path in (temp_path, progress_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            if quota_owner:
+                tmp_quota.discard(dest)
+            raise
+
+        os.replace(temp_path, dest)
+        # 진행 상태 파일을 완료 기록으로 교체 (재사용 판단 + 데이터셋 fingerprint)
+        self._save_completed(progress_path, info, dest, sha256)
+        if quota_owner:
+            tmp_quota.commit(dest)
+
+        with self._stats_lock:
+            self._downloads += 1
+        logger.info(f"✅ 다운로드 완료: {dest.name}")
+        return dest
+
+    def _download_ranged(self, info: RemoteFileInfo, size: int, temp_path: Path, progress_path: Path) -> None:
+        """고정 크기 구간을 워커들이 나눠 받아 부분 파일의 해당 위치에 기록"""
+        segments = [
+            (start, min(start + self.segment_size, size) - 1)
+            for start in range(0, size, self.segment_size)
+        ]
+        completed = self._load_progress(progress_path, info, size, temp_path)
+        if completed:
+            with self._stats_lock:
+                self._resumed += 1
+            logger.info(f"↩️ 이어받기: {len(completed)}/{len(segments)}개 구간 완료 상태에서 재개 ({temp_path.name})")
+        else:
+            with open(temp_path, "wb") as out_file:
+                out_file.truncate(size)
+
+        pending = [segment for segment in segments if segment[0] not in completed]
+        progress_lock = threading.Lock()
+
+        def fetch_segment(segment: Tuple[int, int]) -> None:
+            start, end = segment
+            headers = {"Range": f"bytes={start}-{end}"}
+            if info.strong_etag:
+                # 다운로드 도중 원격 파일이 바뀌면 206 대신 200 전체 응답이 오므로 감지 가능
+                headers["If-Range"] = info.etag
+            response, final_url = self._request("GET", info.url, headers)
+            if response.status != 206:
+                self._discard(response, final_url)
+                raise DownloadError(f"구간 응답 오류 (HTTP {response.status}, 원격 파일 변경 가능성)")
+
+            written = 0
+            with open(temp_path, "r+b") as out_file:
+                out_file.seek(start)
+                while True:
+                    block = response.read(READ_BLOCK_SIZE)
+                    if not block:
+                        break
+                    out_file.write(block)
+                    written += len(block)
+            if written != end - start + 1:
+                raise DownloadError(f"구간 길이 불일치: {start}-{end} ({written} bytes)")
+
+            with self._stats_lock:
+                self._bytes += written
+            with progress_lock:
+                completed.add(start)
+                self._save_progress(progress_path, info, size, completed)
+
+        futures = [self._executor.submit(fetch_segment, segment) for segment in pending]
+        errors = []
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            # 완료된 구간은 진행 상태 파일에 남아 다음 요청에서 이어받음
+            raise DownloadError(f"구간 다운로드 실패 ({len(errors)}/{len(pending)}): {errors[0]}") from errors[0]
+
+    def _download_stream(self, info: RemoteFileInfo, temp_path: Path) -> None:
+        """Range 미지원 서버 - 단일 스트림으로 처음부터 다운로드"""
+        response, final_url = self._request("GET", info.url)
+        if response.status != 200:
+            self._discard(response, final_url)
+            raise DownloadError(f"다운로드 실패 (HTTP {response.status}): {info.url}")
+
+        written = 0
+        with open(temp_path, "wb") as out_file:
+            while True:
+                block = response.read(READ_BLOCK_SIZE)
+                if not block:
+                    break
+                out_file.write(block)
+                written += len(block)
+        with self._stats_lock:
+            self._bytes += written
+
+    # ------------------------------------------------------------------
+    # 진행 상태 / 검증
+    # ------------------------------------------------------------------
+    def _load_progress(self, progress_path: Path, info: RemoteFileInfo, size: int, temp_path: Path) -> Set[int]:
+        """같은 원격 파일(크기/ETag/구간 크기)의 진행 상태일 때만 완료 구간 반환"""
+        if not progress_path.exists() or not temp_path.exists() or temp_path.stat().st_size != size:
+            return set()
+        try:
+            with open(progress_path, "r", encoding="utf-8") as f:
+                progress = json.load(f)
+        except (OSError, ValueError):
+            return set()
+
+        if (progress.get("state") == "complete" or progress.get("size") != size
+                or progress.get("etag") != info.etag or progress.get("segment_size") != self.segment_size):
+            return set()
+        return set(progress.get("completed", []))
+
+    def _save_progress(self, progress_path: Path, info: RemoteFileInfo, size: int, completed: Set[int]) -> None:
+        temp_progress = progress_path.with_name(progress_path.name + ".tmp")
+        with open(temp_progress, "w", encoding="utf-8") as f:
+            json.dump({
+                "url": info.url,
+                "size": size,
+                "etag": info.etag,
+                "segment_size": self.segment_size,
+                "completed": sorted(completed)
+            }, f)
+        os.replace(temp_progress, progress_path)
+
+    def _save_completed(self, progress_path: Path, info: RemoteFileInfo, dest: Path, sha256: str) -> None:
+        """받은 파일의 원격 버전(ETag)과 내용 sha256 기록 - 파일 크기/수정 시각으로 기록 시점의 파일인지 확인"""
+        stat = dest.stat()
+        temp_progress = progress_path.with_name(progress_path.name + ".tmp")
+        with open(temp_progress, "w", encoding="utf-8") as f:
+            json.dump({
+                "state": "complete",
+                "url": info.url,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "etag": info.etag,
+                "sha256": sha256
+            }, f)
+        os.replace(temp_progress, progress_path)
+
+    def _load_completed(self, dest: Path, progress_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+        """dest의 완료 기록 (없거나 기록 후 파일이 바뀌었으면 None)"""
+        progress_path = progress_path or dest.with_name(dest.name + PROGRESS_SUFFIX)
+        try:
+            stat = dest.stat()
+            with open(progress_path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(record, dict) or record.get("state") != "complete"
+                or record.get("size") != stat.st_size or record.get("mtime_ns") != stat.st_mtime_ns):
+            return None
+        return record
+
+    def _is_current(self, dest: Path, progress_path: Path, info: RemoteFileInfo,
+                    size: Optional[int], expected_sha256: Optional[str]) -> bool:
+        """로컬 사본이 현재 원격 파일과 같은지 판단
+
+        sha256이 지정되면 내용으로 확인하고, 아니면 완료 기록의 ETag가 원격 ETag와 같을 때만 재사용한다.
+        (크기만으로는 판단하지 않음 - DuckDB 파일은 블록 단위로 커져 다른 버전도 크기가 같을 수 있음)
+        """
+        if not dest.exists() or size is None or dest.stat().st_size != size:
+            return False
+
+        record = self._load_completed(dest, progress_path)
+        if expected_sha256:
+            digest = record.get("sha256") if record else None
+            return (digest or self._file_digest(dest, "sha256")) == expected_sha256.lower()
+        return bool(record and info.etag and record.get("etag") == info.etag)
+
+    def get_fingerprint(self, path: Path) -> Optional[str]:
+        """받은 파일의 내용 sha256 (다운로드 시 검증하며 계산한 값, 기록이 없거나 파일이 바뀌었으면 None)"""
+        record = self._load_completed(Path(path))
+        return record.get("sha256") if record else None
+
+    @staticmethod
+    def _file_digest(path: Path, algorithm: str) -> str:
+        digest = hashlib.new(algorithm)
+        with open(path, "rb") as source:
+            for block in iter(lambda: source.read(READ_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _verify(self, temp_path: Path, size: Optional[int], info: RemoteFileInfo,
+                expected_sha256: Optional[str]) -> str:
+        """크기/체크섬 검증 후 내용 sha256 반환 (MD5 ETag 검증과 같은 한 번의 읽기로 계산)"""
+        actual_size = temp_path.stat().st_size
+        if size is not None and actual_size != size:
+            raise DownloadError(f"다운로드 크기 불일치: 예상 {size}, 실제 {actual_size}")
+
+        sha256 = hashlib.sha256()
+        md5 = hashlib.md5() if self.verify_etag and info.md5 and not expected_sha256 else None
+        with open(temp_path, "rb") as source:
+            for block in iter(lambda: source.read(READ_BLOCK_SIZE), b""):
+                sha256.update(block)
+                if md5 is not None:
+                    md5.update(block)
+
+        actual = sha256.hexdigest()
+        if expected_sha256 and actual != expected_sha256.lower():
+            raise DownloadError(f"sha256 불일치: 예상 {expected_sha256}, 실제 {actual}")
+        if md5 is not None and md5.hexdigest() != info.md5:
+            raise DownloadError(f"ETag(MD5) 불일치: 예상 {info.md5}, 실제 {md5.hexdigest()}")
+        return actual
+
+    def stats(self) -> Dict[str, Any]:
+        """다운로드 통계 (시스템 상태 API용)"""
+        with self._flights_lock:
+            active = len(self._flights)
+        with self._stats_lock:
+            return {
+                "active": active,
+                "downloads": self._downloads,
+                "bytes_downloaded": self._bytes,
+                "resumed": self._resumed,
+                "reused": self._reused,
+                "coalesced": self._coalesced,
+                "failures": self._failures,
+                "max_segments": self.max_segments,
+                "segment_size": self.segment_size
+            }
+
+
+# 전역 다운로드 관리자 (환경변수로 병렬 구간 수/구간 크기/타임아웃 조정)
+download_manager = DownloadManager(
+    max_segments=int(os.getenv("DOWNLOAD_MAX_SEGMENTS", "4") or 4),
+    segment_size=int(os.getenv("DOWNLOAD_SEGMENT_MB", "8") or 8) * 1024 * 1024,
+    timeout=float(os.getenv("DOWNLOAD_TIMEOUT_SECONDS", "60") or 60),
+    verify_etag=os.getenv("DOWNLOAD_VERIFY_ETAG", "true").lower() != "false"
+)
@@ -14,29 +14,63 @@ import asyncio
 import time
 import os
 import hashlib
-import urllib.request
-import shutil
-from typing import Dict, List, Any, Optional, Callable
+import base64
+import unicodedata
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from pathlib import Path
 import json
 import logging
+import re
+import shutil
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from functools import lru_cache
 from urllib.parse import urlparse
-from threading import Lock
+from threading import Condition, Event, Lock, Thread
+
+from .download_manager import download_manager
+from .query_cache import inflight_searches, query_result_cache
+from .suggest_index import SuggestIndex, suggest_indexes
+from .tmp_quota import tmp_quota
+from .value_dictionary import VALUE_DICTIONARY_MAX_VALUES, FieldValueDictionary, value_dictionaries
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    PYARROW_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 # DuckDB httpfs 설치 여부 캐시
 HTTPFS_INSTALLED = False
 
-# 스키마 캐시 (URL 및 파일명 기준) - Blob/R2 도메인 변경 대응
-SCHEMA_CACHE_BY_URL: Dict[str, List[str]] = {}
-SCHEMA_CACHE_BY_FILENAME: Dict[str, List[str]] = {}
+# 스키마 캐시 (데이터셋 fingerprint 기준) - 파일명 추측 없이 내용 기준으로 식별
+SCHEMA_CACHE_BY_FINGERPRINT: Dict[str, List[str]] = {}
+SCHEMA_CACHE_LOCK = Lock()
+
+# 변환 스크립트가 생성한 스키마/통계 manifest (fingerprint → 데이터셋 정보)
+SCHEMA_MANIFEST_FILENAME = "manifest.json"
+SCHEMA_MANIFEST_DEFAULT_PATH = Path(__file__).parent.parent / "duckdb" / SCHEMA_MANIFEST_FILENAME
+SCHEMA_MANIFEST: Dict[str, Dict[str, Any]] = {}
+SCHEMA_MANIFEST_LOADED_PATHS: set = set()
+SCHEMA_MANIFEST_LOCK = Lock()
 
-# DuckDB 연결 캐시 (파일 경로/URL 기준)
-CONNECTION_CACHE: Dict[str, duckdb.DuckDBPyConnection] = {}
-CONNECTION_LOCKS: Dict[str, Lock] = {}
+# 파일 내용 fingerprint 캐시 (경로 → (크기, 수정 시각, sha256))
+FILE_FINGERPRINT_CACHE: Dict[str, tuple] = {}
+FILE_FINGERPRINT_LOCK = Lock()
+
+# DuckDB 읽기 커서 풀 캐시 (파일 경로/URL 기준)
+CONNECTION_POOLS: Dict[str, "DuckDBCursorPool"] = {}
 CONNECTION_CACHE_LOCK = Lock()
+CURSOR_POOL_SIZE = max(1, int(os.getenv("DUCKDB_CURSOR_POOL_SIZE", "4") or 4))
+CURSOR_POOL_TIMEOUT = float(os.getenv("DUCKDB_CURSOR_POOL_TIMEOUT", "30") or 30)
+
+# 데이터셋 핸들 캐시 (데이터셋 + 설정 조합별 검색 메타데이터/SQL 템플릿)
+DATASET_HANDLES: Dict[str, "DatasetHandle"] = {}
+DATASET_HANDLES_LOCK = Lock()
+DATASET_HANDLE_MAX_TEMPLATES = 128
 
 # 원격 DuckDB 파일 로컬 캐시
 DUCKDB_REMOTE_CACHE: Dict[str, Path] = {}
@@ -44,6 +78,74 @@ DUCKDB_REMOTE_CACHE_LOCK = Lock()
 DUCKDB_CACHE_ROOT = Path("/tmp/datapage_duckdb_cache")
 DUCKDB_CACHE_ROOT.mkdir(parents=True, exist_ok=True)
 
+# Keyset 페이지네이션용 행 식별자 컬럼 (DuckDB rowid / Parquet file_row_number)
+ROW_ID_COLUMN = "__row_id"
+
+# 변환 스크립트가 생성하는 n-gram postings 테이블 (automation/convert_parquet_to_duckdb.py)
+NGRAM_TABLE_SUFFIX = "__ngram"
+NGRAM_MAX_LOOKUP_GRAMS = 4
+NGRAM_INDEX_CACHE: Dict[str, frozenset] = {}
+NGRAM_INDEX_CACHE_LOCK = Lock()
+
+# 변환 시점에 생성되는 정규화 shadow 컬럼 접미사 (검색 전용, 결과에는 노출하지 않음)
+NORMALIZED_COLUMN_SUFFIX = "__norm"
+# 변환 시점에 날짜 문자열을 한 번만 파싱해 저장하는 DATE 타입 shadow 컬럼 접미사
+DATE_COLUMN_SUFFIX = "__date"
+# 변환 시점에 이름 필드를 한글 초성으로 분해해 저장하는 shadow 컬럼 접미사 (n-gram postings에도 색인)
+CHOSEONG_COLUMN_SUFFIX = "__choseong"
+INTERNAL_COLUMN_SUFFIXES = (NORMALIZED_COLUMN_SUFFIX, DATE_COLUMN_SUFFIX, CHOSEONG_COLUMN_SUFFIX)
+# 한글 호환 자모 자음 (ㄱ~ㅎ) - 초성 컬럼에 저장되는 문자
+CHOSEONG_LETTERS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+# 첫가끝 초성 자모(U+1100~U+1112) → 호환 자모 (NFKC 정규화된 입력 대비)
+CONJOINING_CHOSEONG_MAP = {chr(0x1100 + index): letter for index, letter in enumerate(CHOSEONG_LETTERS)}
+
+# 정확 매칭(=)하는 번호 필드 - 변환 시 ART 인덱스가 생성되어 point query로 처리됨
+# (대소문자 구분 안함 필드는 `__norm` 컬럼에 인덱스가 생성되고 정규화한 검색어로 비교)
+EXACT_MATCH_FIELDS = ('cert_no', 'cert_num', 'declare_no', '신고번호', '승인번호')
+# 하이픈/공백을 제거한 정규화 값으로 정확 매칭하는 식별자 필드 (`__norm` 컬럼에 ART 인덱스)
+IDENTIFIER_FIELDS = ("business_number", "사업자등록번호", "ftc_business_number")
+# /api/lookup 한 번에 조회 가능한 식별자 수
+LOOKUP_MAX_IDENTIFIERS = int(os.getenv("LOOKUP_MAX_IDENTIFIERS", "50") or 50)
+
+# 검색 필드 매핑: 업체명, 모델명, 제품명 → 데이터셋별 실제 컬럼 (존재하는 컬럼 모두 검색)
+SEARCH_FIELD_MAPPINGS: Dict[str, Tuple[str, ...]] = {
+    "company_name": ("업체명", "maker_name", "entrprsNm", "상호/법인명", "사업자명"),
+    "model_name": ("모델명", "model_name"),
+    "product_name": ("제품명", "product_name", "prductNm", "품목명"),
+}
+
+# 검색 결과 facet - 데이터셋마다 컬럼명이 달라 후보 중 처음 존재하는 컬럼 사용
+# (field_settings.json의 facet_fields로 데이터셋별 지정 가능)
+FACET_DEFINITIONS: Dict[str, Dict[str, Any]] = {
+    "maker": {
+        "label": "제조사",
+        "columns": ("maker_name", "manufacturer", "제조원", "업체명", "entrprsNm", "사업자명", "business_name"),
+    },
+    "cert_div": {
+        "label": "인증구분",
+        "columns": ("cert_div", "jdgmnSe", "안전관리대상구분", "조치구분", "site_type"),
+    },
+    "year": {
+        "label": "연도",
+        "columns": ("cert_date", "인증일자", "승인일자", "crtfcDe", "인증/신고일자", "완료일", "완료일자"),
+        "kind": "year",
+    },
+    "import_div": {
+        "label": "제조/수입",
+        "columns": ("import_div", "국산/수입", "구분(제조/수입)"),
+    },
+}
+FACET_TOP_N = max(1, int(os.getenv("FACET_TOP_N", "20") or 20))
+
+# 오타/띄어쓰기 허용 검색 (match_mode=fuzzy)
+# n-gram postings로 겹치는 gram이 많은 행을 최대 FUZZY_MAX_CANDIDATES개만 후보로 뽑아 유사도 계산
+FUZZY_MAX_CANDIDATES = max(1, int(os.getenv("FUZZY_MAX_CANDIDATES", "2000") or 2000))
+FUZZY_MAX_LOOKUP_GRAMS = 16
+FUZZY_MIN_SCORE = float(os.getenv("FUZZY_MIN_SCORE", "0.6") or 0.6)
+# 유사도 비교 전에 제거하는 부분 (괄호 안 표기, 법인 표기, 공백) - Python re와 DuckDB(RE2) 공용
+FUZZY_NOISE_PATTERN = r"\([^)]*\)|주식회사|유한회사|사단법인|\s"
+MATCH_MODES = ("exact", "fuzzy")
+
 
 def _get_search_pattern_and_operator(keyword: str, field: str) -> tuple[str, str]:
     """
@@ -56,19 +158,147 @@ def _get_search_pattern_and_operator(keyword: str, field: str) -> tuple[str, str
         - search_pattern: 검색 패턴 (LIKE용 '%keyword%' 또는 정확매칭용 'keyword')
     """
     # 인증번호/신고번호 필드는 정확 매칭
-    if field in ['cert_no', 'cert_num', 'declare_no', '신고번호', '승인번호']:
+    if field in EXACT_MATCH_FIELDS:
         return keyword, '='  # 정확 매칭
 
     # 기본: 부분 매칭 (LIKE '%keyword%')
     return f"%{keyword}%", 'LIKE'
 
 
+def _normalize_search_text(value: str) -> str:
+    """검색어 정규화 - NFKC(NFC 결합 + 전각 문자 폴딩) 후 소문자화
+
+    변환 스크립트의 normalize_text와 동일해야 shadow 컬럼/n-gram과 일치한다.
+    """
+    return unicodedata.normalize('NFKC', value).lower()
+
+
+def _normalize_identifier(value: str) -> str:
+    """사업자등록번호 등 식별자 정규화 - 텍스트 정규화 후 하이픈/공백 제거"""
+    return ''.join(ch for ch in _normalize_search_text(value) if ch != '-' and not ch.isspace())
+
+
+def _to_choseong_keyword(keyword: str) -> Optional[str]:
+    """초성으로만 된 검색어(예: "ㅅㅅ ㅈㅈ")를 초성 컬럼 검색용 문자열로 변환 (초성 검색어가 아니면 None)
+
+    공백은 제거하며, 변환 스크립트의 to_choseong과 같은 호환 자모로 맞춘다.
+    NFKC는 호환 자모를 첫가끝 자모로 바꾸므로 _normalize_search_text를 거치지 않는다.
+    """
+    if not keyword:
+        return None
+    letters = []
+    for char in keyword:
+        if char.isspace():
+            continue
+        char = CONJOINING_CHOSEONG_MAP.get(char, char)
+        if char not in CHOSEONG_LETTERS:
+            return None
+        letters.append(char)
+    return "".join(letters) or None
+
+
+def _build_ngram_lookup_grams(keyword: str, normalize: bool = True) -> List[str]:
+    """부분 문자열 검색어를 postings 조회용 n-gram 목록으로 변환
+
+    변환 스크립트와 동일하게 _normalize_search_text 기준으로 자른다.
+    3자 이상은 trigram, 2자는 bigram을 사용하며 1자 이하나 LIKE 와일드카드가
+    포함된 검색어는 인덱스를 사용할 수 없으므로 빈 목록을 반환한다.
+    조회 비용을 제한하기 위해 최대 NGRAM_MAX_LOOKUP_GRAMS개만 고르며,
+    후보가 상위 집합이 될 뿐 LIKE 재검증으로 결과는 동일하다.
+    초성 검색어처럼 이미 색인 값과 같은 형태인 경우 normalize=False로 정규화를 생략한다.
+    """
+    if not keyword or '%' in keyword or '_' in keyword:
+        return []
+
+    normalized = _normalize_search_text(keyword) if normalize else keyword
+    if len(normalized) < 2:
+        return []
+
+    size = 3 if len(normalized) >= 3 else 2
+    grams = list(dict.fromkeys(normalized[i:i + size] for i in range(len(normalized) - size + 1)))
+
+    if len(grams) > NGRAM_MAX_LOOKUP_GRAMS:
+        step = (len(grams) - 1) / (NGRAM_MAX_LOOKUP_GRAMS - 1)
+        grams = [grams[round(i * step)] for i in range(NGRAM_MAX_LOOKUP_GRAMS)]
+
+    return grams
+
+
+def _build_fuzzy_lookup_grams(keyword: str) -> Tuple[str, List[str], List[str]]:
+    """퍼지 검색어를 (공백 제거 정규화 문자열, postings 조회 gram, 유사도 계산용 bigram)으로 변환
+
+    오타가 있으면 trigram은 대부분 어긋나므로 bigram도 함께 조회하고,
+    "삼성 전자"/"삼성전자"처럼 띄어쓰기만 다른 값도 찾도록 공백을 뺀 형태와 원래 형태의 gram을 모두 사용한다.
+    조회 gram은 FUZZY_MAX_LOOKUP_GRAMS개까지 고르게 고른다.
+    """
+    normalized = _normalize_search_text(keyword or "").strip()
+    compact = re.sub(FUZZY_NOISE_PATTERN, "", normalized) or "".join(normalized.split())
+    if len(compact) < 2:
+        return compact, [], []
+
+    def _grams(text: str, size: int) -> List[str]:
+        return [text[i:i + size] for i in range(len(text) - size + 1)]
+
+    bigrams = list(dict.fromkeys(_grams(compact, 2)))
+    grams = list(dict.fromkeys(
+        _grams(compact, 3) + bigrams + (_grams(normalized, 3) + _grams(normalized, 2) if normalized != compact else [])
+    ))
+    if len(grams) > FUZZY_MAX_LOOKUP_GRAMS:
+        step = (len(grams) - 1) / (FUZZY_MAX_LOOKUP_GRAMS - 1)
+        grams = [grams[round(i * step)] for i in range(FUZZY_MAX_LOOKUP_GRAMS)]
+    return compact, grams, bigrams
+
+
+def _build_fuzzy_score_expression(value_expression: str) -> str:
+    """정규화 값과 검색어의 유사도 SQL (0~1, DuckDB 내장 벡터화 함수 사용)
+
+    - 검색어를 포함하면 0.9 이상 (길이가 비슷할수록 높음)
+    - 그 외에는 Jaro-Winkler 0.4 + bigram Jaccard 0.3 + 편집 거리 유사도 0.3
+      (한글은 한 글자 오타로 bigram 대부분이 어긋나므로 Jaccard만으로는 구분이 약함,
+      DuckDB levenshtein은 UTF-8 바이트 단위이므로 바이트 길이로 나눔)
+    value_expression은 FUZZY_NOISE_PATTERN을 제거한 값이어야 하며,
+    검색어는 fuzzy_keyword CTE의 __fuzzy_keyword / __fuzzy_grams 컬럼을 참조한다.
+    """
+    value_grams = f"list_distinct(list_transform(range(1, length({value_expression})), i -> substr({value_expression}, i, 2)))"
+    return (
+        f"CASE WHEN {value_expression} IS NULL OR {value_expression} = '' THEN 0.0 "
+        f"WHEN contains({value_expression}, __fuzzy_keyword) "
+        f"THEN 0.9 + 0.1 * jaro_winkler_similarity({value_expression}, __fuzzy_keyword) "
+        f"ELSE 0.4 * jaro_winkler_similarity({value_expression}, __fuzzy_keyword) "
+        f"+ 0.3 * len(list_intersect({value_grams}, __fuzzy_grams)) / len(list_distinct({value_grams} || __fuzzy_grams)) "
+        f"+ 0.3 * (1 - levenshtein({value_expression}, __fuzzy_keyword) "
+        f"/ GREATEST(strlen({value_expression}), strlen(__fuzzy_keyword))) END"
+    )
+
+
 def _get_search_pattern(keyword: str, field: str) -> str:
     """하위 호환성을 위한 래퍼 함수"""
     pattern, _ = _get_search_pattern_and_operator(keyword, field)
     return pattern
 
 
+def _encode_cursor(payload: Dict[str, Any]) -> str:
+    """Keyset 페이지네이션 커서를 URL-safe 불투명 토큰으로 인코딩"""
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(token: Optional[str]) -> Optional[Dict[str, Any]]:
+    """커서 토큰 디코딩 (형식이 잘못된 경우 None 반환)"""
+    if not token:
+        return None
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except Exception:
+        return None
+
+    if not isinstance(payload, dict) or not isinstance(payload.get("r"), int):
+        return None
+    return payload
+
+
 def _extract_file_name(path_like: Any) -> Optional[str]:
     """URL/경로 문자열에서 파일명만 안전하게 추출"""
     if not path_like:
@@ -83,6 +313,87 @@ def _extract_file_name(path_like: Any) -> Optional[str]:
     except Exception:
         return None
 
+
+def _compute_file_fingerprint(path: str) -> Optional[str]:
+    """파일 내용 sha256 fingerprint (크기/수정 시각이 같으면 재계산하지 않음)
+
+    변환 스크립트(automation/convert_parquet_to_duckdb.py)의 compute_fingerprint와 동일해야 한다.
+    원격에서 받은 사본은 download_manager가 검증하며 기록한 sha256을 사용해 요청 경로에서 다시 읽지 않는다.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    with FILE_FINGERPRINT_LOCK:
+        cached = FILE_FINGERPRINT_CACHE.get(path)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+
+    fingerprint = download_manager.get_fingerprint(Path(path))
+    if fingerprint is None:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as source:
+            for block in iter(lambda: source.read(1024 * 1024), b''):
+                digest.update(block)
+        fingerprint = digest.hexdigest()
+
+    with FILE_FINGERPRINT_LOCK:
+        FILE_FINGERPRINT_CACHE[path] = (stat.st_size, stat.st_mtime_ns, fingerprint)
+    return fingerprint
+
+
+def _load_schema_manifest(manifest_path: Path) -> int:
+    """manifest.json을 읽어 fingerprint 기준 스키마 정보 등록 (경로당 1회)"""
+    manifest_key = str(manifest_path)
+    with SCHEMA_MANIFEST_LOCK:
+        if manifest_key in SCHEMA_MANIFEST_LOADED_PATHS:
+            return 0
+        SCHEMA_MANIFEST_LOADED_PATHS.add(manifest_key)
+
+    if not manifest_path.exists():
+        return 0
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except Exception as e:
+        logger.warning(f"스키마 manifest 로드 실패: {manifest_path} ({e})")
+        return 0
+
+    datasets = manifest.get("datasets", {})
+    loaded = 0
+    with SCHEMA_MANIFEST_LOCK:
+        for relative_path, entry in datasets.items():
+            fingerprint = entry.get("fingerprint")
+            if fingerprint and entry.get("columns"):
+                SCHEMA_MANIFEST[fingerprint] = {**entry, "path": relative_path}
+                loaded += 1
+
+    logger.info(f"📘 스키마 manifest 로드: {manifest_path} ({loaded}개 데이터셋)")
+    return loaded
+
+
+def _find_manifest_entry(tabular_path: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+    """fingerprint로 manifest 항목 조회 (데이터 파일 상위 디렉토리의 manifest도 필요 시 로드)"""
+    with SCHEMA_MANIFEST_LOCK:
+        entry = SCHEMA_MANIFEST.get(fingerprint)
+    if entry is not None:
+        return entry
+
+    # 기본 경로 외 데이터 루트(enhanced/success 등 하위 디렉토리 포함)의 manifest 탐색
+    for directory in list(Path(tabular_path).parents)[:3]:
+        if _load_schema_manifest(directory / SCHEMA_MANIFEST_FILENAME):
+            with SCHEMA_MANIFEST_LOCK:
+                entry = SCHEMA_MANIFEST.get(fingerprint)
+            if entry is not None:
+                return entry
+    return None
+
+
+# 서버 시작 시 기본 manifest 로드 (환경변수로 경로 변경 가능)
+_load_schema_manifest(Path(os.getenv("DUCKDB_MANIFEST_PATH", str(SCHEMA_MANIFEST_DEFAULT_PATH))))
+
 def _normalize_memory_setting(value: str, default: str) -> str:
     """Return DuckDB-friendly memory setting (accept plain numbers as MB)."""
     if not value:
@@ -120,6 +431,8 @@ def _configure_connection(conn: duckdb.DuckDBPyConnection) -> duckdb.DuckDBPyCon
         conn.execute(f"SET memory_limit = '{memory_limit}'")
         conn.execute(f"SET max_memory = '{max_memory}'")
         conn.execute("SET temp_directory = '/tmp'")          # 임시 파일 경로 지정
+        # spill 크기를 /tmp 공용 예산에서 떼어 둔 여유분으로 제한 (core/tmp_quota.py)
+        conn.execute(f"SET max_temp_directory_size = '{tmp_quota.spill_reserve_bytes // (1024 * 1024)}MB'")
 
         # 처리 성능 최적화
         conn.execute("SET threads = 2")                      # 서버리스에서 병렬 처리 활성화
@@ -172,21 +485,250 @@ def _create_optimized_connection() -> duckdb.DuckDBPyConnection:
     return _configure_connection(conn)
 
 
-def _get_or_create_connection(connection_key: str) -> tuple[duckdb.DuckDBPyConnection, Lock]:
-    """파일별 DuckDB 연결을 생성 또는 재사용"""
+def _write_with_utf8_bom(source_path: str, dest_path: str) -> None:
+    """UTF-8 BOM + source_path 내용으로 dest_path 작성 (엑셀 한글 CSV 호환, 블록 단위 복사)"""
+    with open(source_path, 'rb') as source, open(dest_path, 'wb') as dest:
+        dest.write(b'\xef\xbb\xbf')
+        shutil.copyfileobj(source, dest, 1024 * 1024)
+
+
+@contextmanager
+def _interrupt_on_cancel(conn: duckdb.DuckDBPyConnection, cancel_event: Optional[Event]):
+    """블록 실행 동안 cancel_event가 설정되면 conn에서 실행 중인 쿼리를 interrupt
+
+    스레드 워커의 쿼리는 asyncio 취소로 멈추지 않으므로 감시 스레드가 대신 중단시킨다.
+    (한 블록에서 여러 쿼리를 실행할 수 있어 블록이 끝날 때까지 반복해서 interrupt)
+    """
+    if cancel_event is None:
+        yield conn
+        return
+
+    finished = Event()
+
+    def _watch_cancel() -> None:
+        while not finished.wait(0.2):
+            if cancel_event.is_set():
+                conn.interrupt()
+
+    Thread(target=_watch_cancel, name="query-cancel-watch", daemon=True).start()
+    try:
+        yield conn
+    finally:
+        finished.set()
+
+
+class DuckDBCursorPool:
+    """데이터셋별 DuckDB 읽기 커서 풀
+
+    하나의 루트 연결(ATTACH/VIEW 카탈로그 공유)에서 conn.cursor()로 만든
+    커서를 최대 size개까지 재사용하여 같은 데이터셋에 대한 동시 읽기를 병렬로 처리한다.
+    대기자는 도착 순서(FIFO)대로 커서를 받으며, 대기 시간 통계를 함께 기록한다.
+    """
+
+    def __init__(self, connection_key: str, size: int = CURSOR_POOL_SIZE):
+        self.connection_key = connection_key
+        self.size = max(1, size)
+        self.root = _create_optimized_connection()
+        # ATTACH / CREATE VIEW 등 카탈로그 변경은 커서 간 충돌을 막기 위해 직렬화
+        self.setup_lock = Lock()
+        # 이미 ATTACH + VIEW 준비가 끝난 alias (이후 요청은 카탈로그 조회 생략)
+        self.prepared_aliases: set = set()
+        # 저장 순서를 결과 순서로 쓰는 데이터셋이면 preserve_insertion_order 활성화 (DB 인스턴스 전역 설정)
+        self.insertion_order_preserved = False
+        self._cond = Condition(Lock())
+        self._idle: deque = deque()
+        self._waiters: deque = deque()
+        self._created = 0
+        self._in_use = 0
+        self._acquisitions = 0
+        self._waited = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _checkout(self, timeout: Optional[float]) -> duckdb.DuckDBPyConnection:
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        ticket = object()
+
+        with self._cond:
+            self._waiters.append(ticket)
+            try:
+                while True:
+                    # 공정성: 대기열 맨 앞의 요청만 커서를 가져갈 수 있음
+                    if self._waiters[0] is ticket:
+                        if self._idle:
+                            cursor = self._idle.popleft()
+                            break
+                        if self._created < self.size:
+                            cursor = self.root.cursor()
+                            self._created += 1
+                            break
+
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self._timeouts += 1
+                        raise TimeoutError(
+                            f"DuckDB 커서 대기 시간 초과 ({timeout:.1f}s): {self.connection_key}"
+                        )
+                    self._cond.wait(remaining)
+            finally:
+                self._waiters.remove(ticket)
+                # 다음 대기자가 맨 앞이 되었음을 알림
+                self._cond.notify_all()
+
+            waited = time.monotonic() - start
+            self._in_use += 1
+            self._acquisitions += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            if waited >= 0.001:
+                self._waited += 1
+
+        if waited >= 1.0:
+            logger.info(f"⏳ DuckDB 커서 대기 {waited:.2f}s ({self.connection_key})")
+        return cursor
+
+    def _checkin(self, cursor: duckdb.DuckDBPyConnection, healthy: bool = True) -> None:
+        with self._cond:
+            self._in_use -= 1
+            if healthy:
+                self._idle.append(cursor)
+            else:
+                self._created -= 1
+            self._cond.notify_all()
+
+        if not healthy:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+    def preserve_insertion_order(self) -> None:
+        """ORDER BY 없이 저장(rowid) 순서를 그대로 반환하도록 풀 전체 설정 변경 (최초 1회)"""
+        if self.insertion_order_preserved:
+            return
+        with self.setup_lock:
+            if not self.insertion_order_preserved:
+                self.root.execute("SET preserve_insertion_order = true")
+                self.insertion_order_preserved = True
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = CURSOR_POOL_TIMEOUT):
+        """커서를 빌려 with 블록 동안 사용하고 반환"""
+        cursor = self._checkout(timeout)
+        healthy = True
+        try:
+            yield cursor
+        except duckdb.ConnectionException:
+            healthy = False
+            raise
+        finally:
+            self._checkin(cursor, healthy)
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 사용량 및 대기 시간 통계"""
+        with self._cond:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "waiting": len(self._waiters),
+                "acquisitions": self._acquisitions,
+                "waited_acquisitions": self._waited,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": round(self._total_wait / self._acquisitions * 1000, 2) if self._acquisitions else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 2)
+            }
+
+
+def _get_or_create_pool(connection_key: str) -> DuckDBCursorPool:
+    """파일별 DuckDB 커서 풀을 생성 또는 재사용"""
     with CONNECTION_CACHE_LOCK:
-        conn = CONNECTION_CACHE.get(connection_key)
-        if conn is None:
-            conn = _create_optimized_connection()
-            CONNECTION_CACHE[connection_key] = conn
-            CONNECTION_LOCKS[connection_key] = Lock()
-            logger.info(f"DuckDB 연결 캐시 생성: {connection_key}")
+        pool = CONNECTION_POOLS.get(connection_key)
+        if pool is None:
+            pool = DuckDBCursorPool(connection_key)
+            CONNECTION_POOLS[connection_key] = pool
+            logger.info(f"DuckDB 커서 풀 생성: {connection_key} (size={pool.size})")
 
-        conn_lock = CONNECTION_LOCKS[connection_key]
+    return pool
 
-    return conn, conn_lock
 
-    return conn
+def get_connection_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """데이터셋별 커서 풀 통계 (시스템 상태 API용)"""
+    with CONNECTION_CACHE_LOCK:
+        pools = list(CONNECTION_POOLS.items())
+    return {key: pool.stats() for key, pool in pools}
+
+
+class DatasetHandle:
+    """데이터셋 버전별 검색 계획 캐시
+
+    스키마, search/display 필드, 대소문자 구분 판단, n-gram 색인 컬럼처럼 요청마다
+    동일하게 다시 계산되던 정보를 데이터셋 버전당 한 번만 계산해 보관하고,
+    검색 조건 형태별로 완성된 SQL 템플릿(LIMIT/OFFSET 포함 파라미터 바인딩)을 재사용한다.
+    """
+
+    def __init__(self, key: str, version: str):
+        self.key = key
+        self.version = version
+        self.available_fields: Optional[List[str]] = None
+        self.search_fields: Optional[List[str]] = None
+        self.display_fields: Optional[List[str]] = None
+        self.ngram_columns: Optional[frozenset] = None
+        # 변환 시 기록된 저장 순서 [(컬럼, asc/desc), ...] - 빈 tuple이면 클러스터링 없음
+        self.clustering_key: Optional[tuple] = None
+        self.case_insensitive: Dict[str, bool] = {}
+        self._templates: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = Lock()
+        self._template_hits = 0
+        self._template_misses = 0
+
+    def get_template(self, plan_key: str) -> Optional[str]:
+        with self._lock:
+            template = self._templates.get(plan_key)
+            if template is None:
+                self._template_misses += 1
+                return None
+            self._templates.move_to_end(plan_key)
+            self._template_hits += 1
+            return template
+
+    def put_template(self, plan_key: str, template: str) -> None:
+        with self._lock:
+            self._templates[plan_key] = template
+            self._templates.move_to_end(plan_key)
+            while len(self._templates) > DATASET_HANDLE_MAX_TEMPLATES:
+                self._templates.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "version": self.version,
+                "templates": len(self._templates),
+                "template_hits": self._template_hits,
+                "template_misses": self._template_misses
+            }
+
+
+def _get_dataset_handle(handle_key: str, version: str) -> DatasetHandle:
+    """데이터셋 핸들을 생성 또는 재사용 (버전이 바뀌면 새로 컴파일)"""
+    with DATASET_HANDLES_LOCK:
+        handle = DATASET_HANDLES.get(handle_key)
+        if handle is None or handle.version != version:
+            if handle is not None:
+                logger.info(f"🔄 데이터셋 버전 변경 - 검색 계획 재컴파일: {handle_key}")
+            handle = DatasetHandle(handle_key, version)
+            DATASET_HANDLES[handle_key] = handle
+    return handle
+
+
+def get_dataset_handle_stats() -> Dict[str, Dict[str, Any]]:
+    """데이터셋 핸들별 SQL 템플릿 재사용 통계 (시스템 상태 API용)"""
+    with DATASET_HANDLES_LOCK:
+        handles = list(DATASET_HANDLES.items())
+    return {key: handle.stats() for key, handle in handles}
 
 @lru_cache(maxsize=1)
 def load_case_sensitivity_config():
@@ -250,7 +792,10 @@ class DuckDBProcessor:
         self._duckdb_alias: Optional[str] = None
         self._duckdb_view_name: Optional[str] = None
         self._duckdb_attached = False
+        self._duckdb_source_table: Optional[str] = None
         self._local_duckdb_path: Optional[str] = None
+        # 이 처리기가 사용 중인 /tmp 로컬 사본 (close() 전까지 tmp_quota 제거 대상에서 제외)
+        self._pinned_paths: set = set()
         
         # 파일 경로가 URL인지 로컬 경로인지 확인
         self.is_url = self.file_path_str.startswith('https://') or self.file_path_str.startswith('http://')
@@ -267,6 +812,11 @@ class DuckDBProcessor:
             
         logger.info(f"DuckDBProcessor 초기화: {self.file_path} (URL: {self.is_url})")
 
+        # 데이터셋 버전 (원격 파일은 URL 자체가 버전) - 파일이 교체되면 핸들/ATTACH alias가 새로 만들어짐
+        self.dataset_version = "url" if self.is_url else _get_dataset_fingerprint(self.connection_key)
+        handle_key = f"{self.connection_key}|{category}|{result_type}|{subcategory}"
+        self._handle = _get_dataset_handle(handle_key, self.dataset_version)
+
         # DuckDB 파일일 경우 메타데이터 설정
         suffix_target: Optional[Path] = None
         if self.is_url:
@@ -282,7 +832,7 @@ class DuckDBProcessor:
         if suffix_target is not None and suffix_target.suffix.lower() == '.duckdb':
             self.is_duckdb_storage = True
             self.duckdb_table_name = suffix_target.stem
-            digest_source = str(self.connection_key)
+            digest_source = f"{self.connection_key}:{self.dataset_version}"
             digest = hashlib.md5(digest_source.encode('utf-8', errors='ignore')).hexdigest()
             identifier = digest[:12]
             self._duckdb_alias = f"db_{identifier}"
@@ -291,12 +841,13 @@ class DuckDBProcessor:
                 "DuckDB 스토리지 감지: table=%s, alias=%s", self.duckdb_table_name, self._duckdb_alias
             )
 
-        # 🚀 성능 최적화: R2 파일 스키마 캐시 (첫 번째 네트워크 통신 제거)
-        global SCHEMA_CACHE_BY_URL, SCHEMA_CACHE_BY_FILENAME
 
+    def _get_pool(self) -> DuckDBCursorPool:
+        return _get_or_create_pool(self.connection_key)
 
-    def _get_connection(self) -> tuple[duckdb.DuckDBPyConnection, Lock]:
-        return _get_or_create_connection(self.connection_key)
+    def _acquire_cursor(self):
+        """데이터셋 커서 풀에서 읽기 커서를 빌림 (with 문으로 사용)"""
+        return self._get_pool().acquire()
 
     @staticmethod
     def _escape_path(path: str) -> str:
@@ -306,31 +857,38 @@ class DuckDBProcessor:
         with DUCKDB_REMOTE_CACHE_LOCK:
             cached = DUCKDB_REMOTE_CACHE.get(source_url)
             if cached and cached.exists():
+                self._pin_local_copy(cached)
                 return cached
 
             parsed = urlparse(source_url)
             filename = Path(parsed.path).name or f"duckdb_{hashlib.md5(source_url.encode('utf-8', errors='ignore')).hexdigest()}.duckdb"
-            cache_path = DUCKDB_CACHE_ROOT / filename
+        cache_path = DUCKDB_CACHE_ROOT / filename
 
-            temp_path = cache_path.with_suffix('.download')
-            try:
-                logger.info(f"DuckDB 원격 파일 다운로드: {source_url} → {cache_path}")
-                with urllib.request.urlopen(source_url) as response, open(temp_path, 'wb') as out_file:
-                    shutil.copyfileobj(response, out_file)
-                os.replace(temp_path, cache_path)
-            except Exception as download_error:
-                if temp_path.exists():
-                    try:
-                        temp_path.unlink()
-                    except Exception:
-                        pass
-                raise RuntimeError(f"DuckDB 파일 다운로드 실패: {source_url} ({download_error})") from download_error
+        # 전역 lock 밖에서 다운로드 - 같은 URL은 download_manager가 single-flight로 합침
+        try:
+            logger.info(f"DuckDB 원격 파일 다운로드: {source_url} → {cache_path}")
+            cache_path = download_manager.fetch(source_url, cache_path, quota_owner="duckdb_cache")
+        except Exception as download_error:
+            raise RuntimeError(f"DuckDB 파일 다운로드 실패: {source_url} ({download_error})") from download_error
 
+        with DUCKDB_REMOTE_CACHE_LOCK:
             DUCKDB_REMOTE_CACHE[source_url] = cache_path
-            return cache_path
+        self._pin_local_copy(cache_path)
+        return cache_path
+
+    def _pin_local_copy(self, path: Path) -> None:
+        """로컬 사본 사용 기록 - 처리기당 한 번만 pin (close()에서 해제)"""
+        key = str(path)
+        if key in self._pinned_paths:
+            return
+        if tmp_quota.acquire_pin(path):
+            self._pinned_paths.add(key)
+
+    def _ensure_duckdb_view(self, conn: duckdb.DuckDBPyConnection, path: str, shared: bool = True) -> str:
+        """DuckDB 파일을 현재 연결에서 뷰로 노출시키고 뷰 이름을 반환
 
-    def _ensure_duckdb_view(self, conn: duckdb.DuckDBPyConnection, path: str) -> str:
-        """DuckDB 파일을 현재 연결에서 뷰로 노출시키고 뷰 이름을 반환"""
+        shared=True는 커서 풀 연결을 의미하며, 풀에서 이미 준비된 alias면 카탈로그 조회를 생략한다.
+        """
         if not self.is_duckdb_storage and not path.lower().endswith('.duckdb'):
             raise ValueError("DuckDB 뷰 준비는 DuckDB 파일에서만 호출 가능합니다")
 
@@ -345,31 +903,47 @@ class DuckDBProcessor:
         alias = self._duckdb_alias
         view_name = self._duckdb_view_name
         escaped_path = self._escape_path(path)
+        pool = self._get_pool()
 
-        try:
-            conn.execute(f"ATTACH '{escaped_path}' AS {alias} (READ_ONLY)")
-        except (duckdb.CatalogException, duckdb.BinderException):
-            # 이미 ATTACH 된 경우 무시
-            pass
-
-        table_name = self.duckdb_table_name
-        if not table_name:
-            table_result = conn.execute(f"PRAGMA show_tables FROM {alias}").fetchall()
-            if table_result:
-                # fetchall() 결과에서 첫 번째 행의 첫 번째 컬럼 값 추출
-                table_name = table_result[0][0] if table_result[0] else None
-                self.duckdb_table_name = table_name
-            else:
-                raise RuntimeError(f"DuckDB 파일에서 테이블을 찾을 수 없습니다: {path}")
+        if shared and self.duckdb_table_name and alias in pool.prepared_aliases:
+            self._duckdb_source_table = f'{alias}."{self.duckdb_table_name}"'
+            self._duckdb_attached = True
+            return view_name
 
-        table_identifier = f'"{table_name}"'
-        conn.execute(
-            f"CREATE OR REPLACE VIEW {view_name} AS SELECT * FROM {alias}.{table_identifier}"
-        )
+        # 같은 풀의 커서들은 카탈로그를 공유하므로 ATTACH/VIEW 생성은 한 번에 하나씩
+        with pool.setup_lock:
+            try:
+                conn.execute(f"ATTACH '{escaped_path}' AS {alias} (READ_ONLY)")
+            except (duckdb.CatalogException, duckdb.BinderException):
+                # 이미 ATTACH 된 경우 무시
+                pass
+
+            table_name = self.duckdb_table_name
+            if not table_name:
+                table_result = conn.execute(f"PRAGMA show_tables FROM {alias}").fetchall()
+                if table_result:
+                    # fetchall() 결과에서 첫 번째 행의 첫 번째 컬럼 값 추출
+                    table_name = table_result[0][0] if table_result[0] else None
+                    self.duckdb_table_name = table_name
+                else:
+                    raise RuntimeError(f"DuckDB 파일에서 테이블을 찾을 수 없습니다: {path}")
+
+            table_identifier = f'"{table_name}"'
+            view_exists = conn.execute(
+                "SELECT 1 FROM duckdb_views() WHERE view_name = ? LIMIT 1", [view_name]
+            ).fetchone()
+            if not view_exists:
+                conn.execute(
+                    f"CREATE OR REPLACE VIEW {view_name} AS SELECT * FROM {alias}.{table_identifier}"
+                )
+            if shared:
+                pool.prepared_aliases.add(alias)
+        # rowid는 뷰를 통해 노출되지 않으므로 원본 테이블 경로를 별도로 보관
+        self._duckdb_source_table = f"{alias}.{table_identifier}"
         self._duckdb_attached = True
         return view_name
 
-    def _get_table_expression(self, conn: duckdb.DuckDBPyConnection, path: str) -> str:
+    def _get_table_expression(self, conn: duckdb.DuckDBPyConnection, path: str, shared: bool = True) -> str:
         """주어진 경로를 DuckDB SQL FROM 절에서 사용할 수 있는 표현식으로 변환"""
         if path.lower().endswith('.duckdb'):
             if path.startswith(('http://', 'https://')):
@@ -377,10 +951,87 @@ class DuckDBProcessor:
                 if self._local_duckdb_path is None:
                     self._local_duckdb_path = str(local_path)
                 path = str(local_path)
-            return self._ensure_duckdb_view(conn, path)
+            return self._ensure_duckdb_view(conn, path, shared)
         escaped_path = self._escape_path(path)
         return f"read_parquet('{escaped_path}')"
 
+    def _build_tabular_base_query(self, conn: duckdb.DuckDBPyConnection, path: str) -> str:
+        """DuckDB/Parquet 기본 쿼리 생성 (keyset 페이지네이션용 행 식별자 포함)
+
+        DuckDB 파일은 원본 테이블의 rowid, Parquet 파일은 file_row_number를
+        ROW_ID_COLUMN으로 노출하여 저장 순서 기준 커서 페이지네이션에 사용한다.
+        """
+        essential_cols = self._get_essential_columns()
+        table_expr = self._get_table_expression(conn, path)
+
+        if path.lower().endswith('.duckdb') and self._duckdb_source_table:
+            return f'SELECT {essential_cols}, rowid AS "{ROW_ID_COLUMN}" FROM {self._duckdb_source_table}'
+
+        if table_expr.startswith("read_parquet("):
+            escaped_path = self._escape_path(path)
+            select_cols = "* EXCLUDE (file_row_number)" if essential_cols == "*" else essential_cols
+            return (
+                f'SELECT {select_cols}, file_row_number AS "{ROW_ID_COLUMN}" '
+                f"FROM read_parquet('{escaped_path}', file_row_number=true)"
+            )
+
+        return f"SELECT {essential_cols} FROM {table_expr}"
+
+    def _get_ngram_index_columns(self, conn: Optional[duckdb.DuckDBPyConnection]) -> frozenset:
+        """n-gram postings 테이블에 색인된 컬럼 목록 (없으면 빈 집합)"""
+        if conn is None or not self.is_duckdb_storage:
+            return frozenset()
+        if self._handle.ngram_columns is not None:
+            return self._handle.ngram_columns
+
+        try:
+            tabular_path = self._resolve_tabular_path()
+            if not tabular_path:
+                return frozenset()
+            # ATTACH 보장 (이미 연결된 경우 재사용)
+            self._get_table_expression(conn, tabular_path)
+
+            cache_key = f"{tabular_path}:{os.stat(tabular_path).st_mtime_ns}"
+            with NGRAM_INDEX_CACHE_LOCK:
+                cached = NGRAM_INDEX_CACHE.get(cache_key)
+            if cached is not None:
+                self._handle.ngram_columns = cached
+                return cached
+
+            postings_table = f"{self.duckdb_table_name}{NGRAM_TABLE_SUFFIX}"
+            exists = conn.execute(
+                "SELECT COUNT(*) FROM duckdb_tables() WHERE database_name = ? AND table_name = ?",
+                [self._duckdb_alias, postings_table]
+            ).fetchone()[0]
+
+            columns = frozenset()
+            if exists:
+                rows = conn.execute(
+                    f'SELECT DISTINCT column_name FROM {self._duckdb_alias}."{postings_table}"'
+                ).fetchall()
+                columns = frozenset(row[0] for row in rows)
+                logger.info(f"🔎 n-gram 인덱스 감지: {sorted(columns)}")
+
+            with NGRAM_INDEX_CACHE_LOCK:
+                NGRAM_INDEX_CACHE[cache_key] = columns
+            self._handle.ngram_columns = columns
+            return columns
+        except Exception as e:
+            logger.debug(f"n-gram 인덱스 확인 실패: {e}")
+            return frozenset()
+
+    def _build_ngram_candidate_subquery(self, field: str, grams: List[str]) -> tuple[str, list]:
+        """postings 테이블에서 모든 gram을 포함하는 행 식별자 조회 서브쿼리 생성"""
+        postings = f'{self._duckdb_alias}."{self.duckdb_table_name}{NGRAM_TABLE_SUFFIX}"'
+        # gram 단위 등호 조회는 정렬된 postings의 zonemap을 활용 (IN 목록은 pruning 불가)
+        subquery = " INTERSECT ".join(
+            f"SELECT row_id FROM {postings} WHERE column_name = ? AND gram = ?" for _ in grams
+        )
+        parameters: list = []
+        for gram in grams:
+            parameters.extend([field, gram])
+        return subquery, parameters
+
     def _resolve_tabular_path(self) -> Optional[str]:
         """현재 파일 경로 중 DuckDB/Parquet 형태를 우선 반환"""
         if self.is_url:
@@ -412,172 +1063,6 @@ class DuckDBProcessor:
 
         return target_path
 
-    def _cache_schema(self, columns: List[str]) -> List[str]:
-        """계산된 스키마 정보를 URL/파일명 캐시에 동시 저장 (동적 스키마 대상은 캐시 제외)"""
-        if columns is None:
-            return columns
-
-        cache_key = self.file_path_str if self.is_url else str(self.file_path)
-        file_name = _extract_file_name(cache_key)
-
-        # 동적 스키마 로드 대상은 캐시에 저장하지 않음
-        if self._should_use_dynamic_schema(cache_key, file_name):
-            logger.debug(f"🔄 동적 스키마 대상: 캐시 저장 건너뛰기 - {file_name or cache_key}")
-            return columns
-
-        # 일반 데이터셋은 캐시에 저장
-        if cache_key:
-            SCHEMA_CACHE_BY_URL[cache_key] = columns
-
-        if file_name:
-            SCHEMA_CACHE_BY_FILENAME[file_name] = columns
-
-        return columns
-
-    def _should_use_dynamic_schema(self, cache_key: str, file_name: Optional[str]) -> bool:
-        """동적 스키마 로드 대상인지 판단 (3,4,5번 데이터셋: 효율등급, 고효율, 대기전력)"""
-        # 파일명 기반 판단
-        if file_name:
-            # 3_efficiency, 4_high_efficiency, 5_standby_power 및 success/failed 버전 포함
-            dynamic_targets = [
-                "3_efficiency_flattened.parquet",
-                "3_efficiency_flattened_success.parquet",
-                "3_efficiency_flattened_failed.parquet",
-                "4_high_efficiency_flattened.parquet",
-                "4_high_efficiency_flattened_success.parquet",
-                "4_high_efficiency_flattened_failed.parquet",
-                "5_standby_power_flattened.parquet",
-                "5_standby_power_flattened_success.parquet",
-                "5_standby_power_flattened_failed.parquet"
-            ]
-            if file_name in dynamic_targets:
-                return True
-
-        # URL 기반 판단 (R2 URLs)
-        dynamic_url_patterns = [
-            "/3_efficiency_flattened.parquet",
-            "/3_efficiency_flattened_success.parquet",
-            "/3_efficiency_flattened_failed.parquet",
-            "/4_high_efficiency_flattened.parquet",
-            "/4_high_efficiency_flattened_success.parquet",
-            "/4_high_efficiency_flattened_failed.parquet",
-            "/5_standby_power_flattened.parquet",
-            "/5_standby_power_flattened_success.parquet",
-            "/5_standby_power_flattened_failed.parquet"
-        ]
-
-        for pattern in dynamic_url_patterns:
-            if pattern in cache_key:
-                return True
-
-        return False
-
-    def _try_duckdb_blob_schema_mapping(self, cache_key: str, file_name: Optional[str]) -> Optional[List[str]]:
-        """DuckDB BLOB URL을 위한 스키마 매핑 (2025모드 DuckDB 파일 지원)"""
-        if not cache_key or not file_name:
-            return None
-
-        # DuckDB BLOB URL 감지
-        is_duckdb_blob = (cache_key.endswith('.duckdb') and
-                         ('blob.vercel-storage.com' in cache_key or 'blob' in cache_key.lower()))
-
-        if not is_duckdb_blob:
-            return None
-
-        logger.info(f"🔥 DuckDB BLOB URL 감지, 스키마 매핑 시도: {file_name}")
-
-        # 파일명에서 데이터셋 패턴 추출하여 R2 스키마와 매핑
-        dataset_patterns = {
-            'safetykorea': ['safetykorea', 'safety_korea'],
-            'wadiz': ['wadiz', 'makers'],
-            'efficiency': ['efficiency', 'energy'],
-            'high_efficiency': ['high_efficiency', 'high-efficiency'],
-            'standby_power': ['standby_power', 'standby-power'],
-            'approval': ['approval', 'approve'],
-            'declare': ['declare', 'declaration'],
-            'kwtc': ['kwtc'],
-            'recall': ['recall'],
-            'safetykoreachild': ['safetykoreachild', 'safety_korea_child', 'child'],
-            'rra_cert': ['rra_cert', 'rra-cert'],
-            'rra_self_cert': ['rra_self_cert', 'rra-self-cert'],
-            'safetykoreahome': ['safetykoreahome', 'safety_korea_home', 'home']
-        }
-
-        # 파일명을 소문자로 변환하여 패턴 매칭
-        file_name_lower = file_name.lower()
-
-        matched_dataset = None
-        for dataset, patterns in dataset_patterns.items():
-            for pattern in patterns:
-                if pattern in file_name_lower:
-                    matched_dataset = dataset
-                    break
-            if matched_dataset:
-                break
-
-        if not matched_dataset:
-            logger.warning(f"DuckDB BLOB URL 데이터셋 패턴 매핑 실패: {file_name}")
-            return None
-
-        # DataC (enhanced) 여부 확인
-        is_enhanced = 'enhanced' in file_name_lower or 'success' in file_name_lower or 'failed' in file_name_lower
-        is_success = 'success' in file_name_lower
-
-        # 매핑된 R2 스키마 찾기
-        target_r2_patterns = []
-
-        if is_enhanced:
-            # DataC enhanced 스키마 우선
-            if is_success:
-                target_r2_patterns.append(f"{matched_dataset}_flattened_success.parquet")
-            else:
-                target_r2_patterns.append(f"{matched_dataset}_flattened_failed.parquet")
-
-        # 기본 DataA 스키마
-        if matched_dataset == 'wadiz':
-            target_r2_patterns.append('2_wadiz_flattened.parquet')
-        elif matched_dataset == 'safetykorea':
-            target_r2_patterns.append('1_safetykorea_flattened.parquet')
-        elif matched_dataset == 'efficiency':
-            target_r2_patterns.append('3_efficiency_flattened.parquet')
-        elif matched_dataset == 'high_efficiency':
-            target_r2_patterns.append('4_high_efficiency_flattened.parquet')
-        elif matched_dataset == 'standby_power':
-            target_r2_patterns.append('5_standby_power_flattened.parquet')
-        elif matched_dataset == 'approval':
-            target_r2_patterns.append('6_approval_flattened.parquet')
-        elif matched_dataset == 'declare':
-            target_r2_patterns.append('7_declare_flattened.parquet')
-        elif matched_dataset == 'kwtc':
-            target_r2_patterns.append('8_kwtc_flattened.parquet')
-        elif matched_dataset == 'recall':
-            target_r2_patterns.append('9_recall_flattened.parquet')
-        elif matched_dataset == 'safetykoreachild':
-            target_r2_patterns.append('10_safetykoreachild_flattened.parquet')
-        elif matched_dataset == 'rra_cert':
-            target_r2_patterns.append('11_rra_cert_flattened.parquet')
-        elif matched_dataset == 'rra_self_cert':
-            target_r2_patterns.append('12_rra_self_cert_flattened.parquet')
-        elif matched_dataset == 'safetykoreahome':
-            target_r2_patterns.append('13_safetykoreahome_flattened.parquet')
-
-        # SCHEMA_CACHE_BY_FILENAME에서 스키마 찾기
-        for target_pattern in target_r2_patterns:
-            if target_pattern in SCHEMA_CACHE_BY_FILENAME:
-                schema = SCHEMA_CACHE_BY_FILENAME[target_pattern]
-                logger.info(f"✅ DuckDB BLOB 스키마 매핑 성공: {file_name} → {target_pattern} ({len(schema)}개 컬럼)")
-
-                # DuckDB BLOB URL 캐시에 저장
-                SCHEMA_CACHE_BY_URL[cache_key] = schema
-                if file_name not in SCHEMA_CACHE_BY_FILENAME:
-                    SCHEMA_CACHE_BY_FILENAME[file_name] = schema
-
-                return schema
-
-        logger.warning(f"DuckDB BLOB URL 매핑 대상 스키마를 찾을 수 없음: {matched_dataset} → {target_r2_patterns}")
-        return None
-
-
     def _detect_json_structure(self) -> str:
         """JSON 파일의 구조를 감지합니다"""
         if self.json_structure:
@@ -617,7 +1102,10 @@ class DuckDBProcessor:
         return self.json_structure
 
     def _get_search_fields_from_config(self) -> list:
-        """field_settings.json에서 search_fields 추출"""
+        """field_settings.json에서 search_fields 추출 (데이터셋 핸들에 1회 캐시)"""
+        if self._handle.search_fields is not None:
+            return self._handle.search_fields
+
         try:
             if not self.category or not self.subcategory:
                 logger.info("카테고리 정보 없음 - 전체 컬럼 사용")
@@ -635,13 +1123,17 @@ class DuckDBProcessor:
             field_names = [field.get("field") for field in search_fields if field.get("field")]
 
             logger.info(f"🔍 검색 필드 로드: {len(field_names)}개 - {field_names[:3]}...")
+            self._handle.search_fields = field_names
             return field_names
         except Exception as e:
             logger.warning(f"search_fields 로드 실패: {e}")
             return []
 
     def _get_display_fields_from_config(self) -> list:
-        """field_settings.json에서 display_fields 추출"""
+        """field_settings.json에서 display_fields 추출 (데이터셋 핸들에 1회 캐시)"""
+        if self._handle.display_fields is not None:
+            return self._handle.display_fields
+
         try:
             if not self.category or not self.subcategory:
                 return []
@@ -658,13 +1150,17 @@ class DuckDBProcessor:
             field_names = [field.get("field") for field in display_fields if field.get("field")]
 
             logger.info(f"📊 표시 필드 로드: {len(field_names)}개")
+            self._handle.display_fields = field_names
             return field_names
         except Exception as e:
             logger.warning(f"display_fields 로드 실패: {e}")
             return []
 
-    def _get_essential_columns(self) -> str:
-        """⚡ 성능 최적화: field_settings.json 기반 동적 컬럼 선택 (실제 존재하는 컬럼만)"""
+    def _get_essential_columns(self, include_internal: bool = True) -> str:
+        """⚡ 성능 최적화: field_settings.json 기반 동적 컬럼 선택 (실제 존재하는 컬럼만)
+
+        include_internal=False면 검색 전용 shadow 컬럼(__norm)을 제외한 결과용 컬럼만 반환
+        """
         if not self.category or not self.subcategory:
             logger.info("카테고리 정보 없음 - SELECT * 사용")
             return "*"
@@ -711,6 +1207,8 @@ class DuckDBProcessor:
 
             # 7. 실제 존재하는 컬럼만 필터링
             existing_cols = [col for col in essential_cols if col in available_fields]
+            if not include_internal:
+                existing_cols = [col for col in existing_cols if not self._is_internal_column(col)]
 
             if not existing_cols:
                 logger.warning("필수 컬럼 중 실제 존재하는 컬럼이 없음 - SELECT * 사용")
@@ -746,9 +1244,7 @@ class DuckDBProcessor:
 
             if abs_file_path.endswith(('.parquet', '.duckdb')):
                 logger.info(f"🚀 Blob Tabular 파일 사용: {abs_file_path.split('/')[-1]}")
-                essential_cols = self._get_essential_columns()
-                table_expr = self._get_table_expression(conn, abs_file_path)
-                return f"SELECT {essential_cols} FROM {table_expr}"
+                return self._build_tabular_base_query(conn, abs_file_path)
             else:
                 logger.info(f"📄 Blob JSON 파일 사용 (Fallback): {abs_file_path.split('/')[-1]}")
                 read_options = ""
@@ -762,9 +1258,7 @@ class DuckDBProcessor:
             tabular_path = self._resolve_tabular_path()
             if tabular_path:
                 logger.info(f"Tabular 파일 사용: {Path(tabular_path).name}")
-                essential_cols = self._get_essential_columns()
-                table_expr = self._get_table_expression(conn, tabular_path)
-                return f"SELECT {essential_cols} FROM {table_expr}"
+                return self._build_tabular_base_query(conn, tabular_path)
             
             # Parquet이 없으면 기존 JSON 방식 사용 (Fallback)
             logger.info(f"JSON 파일 사용 (Fallback): {Path(abs_file_path).name}")
@@ -800,98 +1294,124 @@ class DuckDBProcessor:
                 return f"SELECT {essential_cols} FROM read_json_auto('{abs_file_path}'{read_options})"
     
     def _get_available_fields(self) -> list:
-        """파일에서 실제 사용 가능한 필드명을 가져옵니다 (스키마 캐시 우선)"""
-
-        # 🚀 성능 최적화: 캐시된 스키마가 있으면 즉시 반환 (R2 통신 제거)
-        cached_fields: Optional[List[str]] = None
-        cache_key = self.file_path_str if self.is_url else str(self.file_path)
-        file_name = _extract_file_name(cache_key)
+        """파일에서 실제 사용 가능한 필드명 (데이터셋 핸들에 버전당 1회 캐시)"""
+        if self._handle.available_fields is not None:
+            return self._handle.available_fields
+
+        fields = self._load_available_fields()
+        if fields:
+            self._handle.available_fields = fields
+        return fields
+
+    def _get_schema_fingerprint(self, tabular_path: Optional[str]) -> str:
+        """스키마 캐시 키 - 로컬 데이터 파일은 내용 sha256, 원격 Parquet는 URL 기준"""
+        if tabular_path and not tabular_path.startswith(('http://', 'https://')):
+            fingerprint = _compute_file_fingerprint(tabular_path)
+            if fingerprint:
+                return fingerprint
+        if tabular_path:
+            return f"url:{tabular_path}"
+        return f"json:{self.connection_key}:{self.dataset_version}"
+
+    def _cache_schema(self, fingerprint: str, columns: List[str]) -> List[str]:
+        """조회한 스키마를 fingerprint 기준으로 캐시"""
+        if columns:
+            with SCHEMA_CACHE_LOCK:
+                SCHEMA_CACHE_BY_FINGERPRINT[fingerprint] = columns
+        return columns
 
-        # 🔥 동적 스키마 로드 대상 체크 (3,4,5번 데이터셋)
-        is_dynamic_schema_target = self._should_use_dynamic_schema(cache_key, file_name)
+    def _get_clustering_key(self, conn: duckdb.DuckDBPyConnection) -> tuple:
+        """변환 스크립트가 기록한 저장 순서(대표 날짜 DESC → 제품명 ASC) 조회 (manifest → 테이블 comment)"""
+        if self._handle.clustering_key is not None:
+            return self._handle.clustering_key
 
-        if is_dynamic_schema_target:
-            # 동적 스키마 로드 대상은 캐시를 건너뛰고 직접 스키마 조회
-            logger.info(f"🔄 동적 스키마 로드 (캐시 건너뛰기): {file_name or cache_key}")
-            cached_fields = None
-        else:
-            # 기존 캐시 로직 사용
-            if cache_key in SCHEMA_CACHE_BY_URL:
-                cached_fields = SCHEMA_CACHE_BY_URL[cache_key]
-                logger.info(f"⚡ 스키마 캐시 사용: {len(cached_fields)}개 컬럼 (캐시 키: {cache_key})")
-            elif file_name and file_name in SCHEMA_CACHE_BY_FILENAME:
-                cached_fields = SCHEMA_CACHE_BY_FILENAME[file_name]
-                logger.info(f"⚡ 스키마 캐시 사용 (파일명): {file_name} → {len(cached_fields)}개 컬럼")
+        clustering_key: list = []
+        tabular_path = self._resolve_tabular_path()
+        if self.is_duckdb_storage and tabular_path:
+            manifest_entry = _find_manifest_entry(tabular_path, self._get_schema_fingerprint(tabular_path))
+            if manifest_entry is not None:
+                clustering_key = manifest_entry.get("clustering_key") or []
             else:
-                # 🔥 2025모드 BLOB URL 지원: DuckDB 파일 스키마 추론
-                cached_fields = self._try_duckdb_blob_schema_mapping(cache_key, file_name)
-                if cached_fields:
-                    logger.info(f"⚡ DuckDB BLOB URL 스키마 매핑: {file_name} → {len(cached_fields)}개 컬럼")
+                # manifest가 없는 원격 복사본 등은 파일에 함께 저장된 테이블 comment 사용
+                try:
+                    self._get_table_expression(conn, tabular_path)
+                    row = conn.execute(
+                        "SELECT comment FROM duckdb_tables() WHERE database_name = ? AND table_name = ? LIMIT 1",
+                        [self._duckdb_alias, self.duckdb_table_name]
+                    ).fetchone()
+                    if row and row[0]:
+                        clustering_key = json.loads(row[0]).get("clustering_key") or []
+                except Exception as e:
+                    logger.debug(f"클러스터링 키 조회 실패: {e}")
+
+        self._handle.clustering_key = tuple(
+            (part["column"], part.get("order", "asc")) for part in clustering_key if part.get("column")
+        )
+        return self._handle.clustering_key
+
+    def _load_available_fields(self) -> list:
+        """파일에서 실제 사용 가능한 필드명을 가져옵니다 (fingerprint 캐시 → manifest → 직접 조회)"""
+        tabular_path = self._resolve_tabular_path()
+        fingerprint = self._get_schema_fingerprint(tabular_path)
 
-        if cached_fields is not None and not is_dynamic_schema_target:
+        with SCHEMA_CACHE_LOCK:
+            cached_fields = SCHEMA_CACHE_BY_FINGERPRINT.get(fingerprint)
+        if cached_fields is not None:
+            logger.info(f"⚡ 스키마 캐시 사용: {len(cached_fields)}개 컬럼 (fingerprint: {fingerprint[:16]})")
             return cached_fields
 
-        # 캐시에 없는 경우에만 원래 로직 수행 (fallback)
-        logger.debug(f"스키마 캐시 미스, 원격 스키마 조회 수행: {cache_key}")
+        # 🚀 변환 스크립트가 생성한 manifest가 있으면 DB 조회 없이 스키마 확보
+        if tabular_path and not tabular_path.startswith(('http://', 'https://')):
+            manifest_entry = _find_manifest_entry(tabular_path, fingerprint)
+            if manifest_entry:
+                columns = [column["name"] for column in manifest_entry["columns"]]
+                logger.info(f"📘 manifest 스키마 사용: {manifest_entry.get('path')} → {len(columns)}개 컬럼")
+                return self._cache_schema(fingerprint, columns)
+
+        # manifest가 없는 경우에만 데이터 파일에서 직접 조회 (fallback)
+        logger.debug(f"스키마 캐시 미스, 스키마 직접 조회 수행: {fingerprint[:16]}")
 
         try:
             # **성능 최적화: 최적화된 DuckDB 연결 사용**
             conn = _create_optimized_connection()
             try:
+                if tabular_path:
+                    logger.info(f"Tabular 필드 조회: {_extract_file_name(tabular_path)}")
+                    table_expr = self._get_table_expression(conn, tabular_path, shared=False)
+                    result = conn.execute(f"SELECT * FROM {table_expr} LIMIT 0")
+                    columns = [desc[0] for desc in result.description]
+                    return self._cache_schema(fingerprint, columns)
+
                 if self.is_url:
-                    # URL인 경우 (R2 URL은 이미 parquet)
-                    if self.file_path_str.endswith(('.parquet', '.duckdb')):
-                        logger.info(f"Blob 필드 조회: {self.file_path_str.split('/')[-1]}")
-                        table_expr = self._get_table_expression(conn, self.file_path_str)
-                        base_query = f"SELECT * FROM {table_expr} LIMIT 1"
-                        result = conn.execute(base_query)
-                        columns = [desc[0] for desc in result.description]
-                        return self._cache_schema(columns)
+                    logger.info(f"Blob JSON 필드 조회: {self.file_path_str.split('/')[-1]}")
+                    # JSON URL의 경우 기본 필드 반환 (실제로는 parquet만 사용)
+                    return self._cache_schema(fingerprint, ["id", "name", "company", "date"])
+
+                # JSON 파일의 경우 기존 로직 사용
+                base_query = self._build_base_query(conn, 1.0)  # 작은 크기로 테스트
+
+                # 첫 번째 레코드로 필드 확인
+                result = conn.execute(f"{base_query} LIMIT 1")
+                records = result.fetchall()
+
+                if not records:
+                    return []
+
+                structure = self._detect_json_structure()
+                record = records[0]
+
+                if structure in ['nested_safetykorea', 'nested_data']:
+                    # item 필드 분석
+                    item = record[0]
+                    if hasattr(item, '_asdict'):
+                        return self._cache_schema(fingerprint, list(item._asdict().keys()))
+                    elif isinstance(item, dict):
+                        return self._cache_schema(fingerprint, list(item.keys()))
                     else:
-                        logger.info(f"Blob JSON 필드 조회: {self.file_path_str.split('/')[-1]}")
-                        # JSON URL의 경우 기본 필드 반환 (실제로는 parquet만 사용)
-                        return self._cache_schema(["id", "name", "company", "date"])
+                        return []
                 else:
-                    # 로컬 파일인 경우 (self.file_path가 Path 객체여야 함)
-                    if hasattr(self.file_path, 'resolve'):
-                        abs_file_path = str(self.file_path.resolve())
-                    else:
-                        # 문자열인 경우 Path 객체로 변환
-                        abs_file_path = str(Path(self.file_path).resolve())
-                    tabular_path = self._resolve_tabular_path()
-
-                    if tabular_path:
-                        table_expr = self._get_table_expression(conn, tabular_path)
-                        base_query = f"SELECT * FROM {table_expr} LIMIT 1"
-                        result = conn.execute(base_query)
-                        columns = [desc[0] for desc in result.description]
-                        return self._cache_schema(columns)
-                    else:
-                        # JSON 파일의 경우 기존 로직 사용
-                        base_query = self._build_base_query(conn, 1.0)  # 작은 크기로 테스트
-
-                    # 첫 번째 레코드로 필드 확인
-                    result = conn.execute(f"{base_query} LIMIT 1")
-                    records = result.fetchall()
-
-                    if not records:
-                        return self._cache_schema([])
-
-                    structure = self._detect_json_structure()
-                    record = records[0]
-
-                    if structure in ['nested_safetykorea', 'nested_data']:
-                        # item 필드 분석
-                        item = record[0]
-                        if hasattr(item, '_asdict'):
-                            return self._cache_schema(list(item._asdict().keys()))
-                        elif isinstance(item, dict):
-                            return self._cache_schema(list(item.keys()))
-                        else:
-                            return self._cache_schema([])
-                    else:
-                        # 일반 배열 구조
-                        return self._cache_schema([desc[0] for desc in result.description])
+                    # 일반 배열 구조
+                    return self._cache_schema(fingerprint, [desc[0] for desc in result.description])
             finally:
                 conn.close()
 
@@ -899,8 +1419,31 @@ class DuckDBProcessor:
             logger.warning(f"필드 분석 실패: {e}")
             return []
     
+    @staticmethod
+    def _is_internal_column(column_name: str) -> bool:
+        """검색 전용 shadow 컬럼 여부 (결과/다운로드에는 노출하지 않음)"""
+        return column_name.endswith(INTERNAL_COLUMN_SUFFIXES)
+
+    def _get_normalized_column(self, field_name: str, available_fields: List[str]) -> Optional[str]:
+        """변환 시점에 생성된 정규화 shadow 컬럼명 (없으면 None)"""
+        shadow = f"{field_name}{NORMALIZED_COLUMN_SUFFIX}"
+        return shadow if shadow in available_fields else None
+
+    def _get_date_column(self, field_name: str, available_fields: List[str]) -> Optional[str]:
+        """변환 시점에 DATE로 파싱된 shadow 컬럼명 (없으면 None)"""
+        shadow = f"{field_name}{DATE_COLUMN_SUFFIX}"
+        return shadow if shadow in available_fields else None
+
     def _is_field_case_insensitive(self, field_name: str) -> bool:
-        """필드가 대소문자 구분 안함인지 확인"""
+        """필드가 대소문자 구분 안함인지 확인 (데이터셋 핸들에 필드별 캐시)"""
+        cached = self._handle.case_insensitive.get(field_name)
+        if cached is None:
+            cached = self._resolve_case_insensitive(field_name)
+            self._handle.case_insensitive[field_name] = cached
+        return cached
+
+    def _resolve_case_insensitive(self, field_name: str) -> bool:
+        """case_sensitivity_config.json 기준 대소문자 구분 여부 판단"""
         # case_insensitive_fields에 명시적으로 설정된 경우
         if field_name in self.case_config.get("case_insensitive_fields", {}):
             return self.case_config["case_insensitive_fields"][field_name]
@@ -928,13 +1471,19 @@ class DuckDBProcessor:
             "END"
         )
     
-    def _build_where_clause(self, keyword: str, search_field: str) -> tuple[str, list]:
-        """검색 조건 SQL WHERE 절 생성 (파라미터 바인딩 사용)"""
+    def _build_where_clause(self,
+                            keyword: str,
+                            search_field: str,
+                            conn: Optional[duckdb.DuckDBPyConnection] = None) -> tuple[str, list]:
+        """검색 조건 SQL WHERE 절 생성 (파라미터 바인딩 사용)
+
+        conn이 주어지고 DuckDB 파일에 n-gram postings 테이블이 있으면 부분 문자열 검색은
+        후보 행 식별자로 먼저 좁힌 뒤 LIKE로 재검증한다.
+        """
         if not keyword:
             return "1=1", []  # 모든 결과 반환, 파라미터 없음
 
-        exact_match_fields = {"business_number", "사업자등록번호", "ftc_business_number"}
-        if search_field in exact_match_fields:
+        if search_field in IDENTIFIER_FIELDS:
             cleaned_keyword = keyword.replace('-', '').replace(' ', '')
             field_aliases = [search_field]
             if search_field == "business_number":
@@ -944,14 +1493,26 @@ class DuckDBProcessor:
 
             conditions = []
             parameters = []
+            matched_columns = []
             available_fields = self._get_available_fields()
 
             for field in field_aliases:
                 if field in available_fields:
-                    conditions.append(f"REPLACE(REPLACE(CAST(\"{field}\" AS VARCHAR), '-', ''), ' ', '') = ?")
-                    parameters.append(cleaned_keyword)
+                    normalized_column = self._get_normalized_column(field, available_fields)
+                    if normalized_column:
+                        # 변환 시점에 정규화된 컬럼 사용 - 행마다 REPLACE 수행 불필요
+                        conditions.append(f"\"{normalized_column}\" = ?")
+                        parameters.append(_normalize_identifier(keyword))
+                        matched_columns.extend([field, normalized_column])
+                    else:
+                        conditions.append(f"REPLACE(REPLACE(CAST(\"{field}\" AS VARCHAR), '-', ''), ' ', '') = ?")
+                        parameters.append(cleaned_keyword)
+                        matched_columns.append(field)
 
             if conditions:
+                for col in matched_columns:
+                    if col not in self.dynamic_required_fields:
+                        self.dynamic_required_fields.append(col)
                 where_clause = " OR ".join(conditions)
                 return where_clause, parameters
             else:
@@ -988,14 +1549,7 @@ class DuckDBProcessor:
                 table_alias = ""
             
         
-        # **새로운 검색 필드 매핑: 업체명, 모델명, 제품명만 지원**
-        field_mappings = {
-            "company_name": ["업체명", "maker_name", "entrprsNm", "상호/법인명", "사업자명"],
-            "model_name": ["모델명", "model_name"],
-            "product_name": ["제품명", "product_name", "prductNm", "품목명"]
-        }
-        
-        target_fields = field_mappings.get(search_field, [search_field])
+        target_fields = list(SEARCH_FIELD_MAPPINGS.get(search_field, [search_field]))
 
         # **검색 필드 수집 - 모든 매칭 필드에서 검색**
         existing_fields = []
@@ -1009,8 +1563,28 @@ class DuckDBProcessor:
         
         conditions = []
         parameters = []
+        ngram_columns = self._get_ngram_index_columns(conn) if using_parquet else frozenset()
+        ngram_grams = _build_ngram_lookup_grams(keyword) if ngram_columns else []
+        search_columns = []
+        # 초성으로만 된 검색어는 초성 shadow 컬럼이 있는 필드에서 그 컬럼으로 검색
+        choseong_keyword = _to_choseong_keyword(keyword) if using_parquet else None
+        choseong_grams = _build_ngram_lookup_grams(choseong_keyword, normalize=False) if choseong_keyword and ngram_columns else []
         
         for field in existing_fields:
+            choseong_column = f"{field}{CHOSEONG_COLUMN_SUFFIX}"
+            if choseong_keyword and choseong_column in available_fields:
+                condition = f'"{choseong_column}" LIKE ?'
+                if choseong_grams and choseong_column in ngram_columns:
+                    # 초성 컬럼도 n-gram postings에 색인됨 - 후보 행만 LIKE로 재검증
+                    candidate_query, candidate_parameters = self._build_ngram_candidate_subquery(choseong_column, choseong_grams)
+                    condition = f'("{ROW_ID_COLUMN}" IN ({candidate_query}) AND {condition})'
+                    parameters.extend(candidate_parameters)
+                conditions.append(condition)
+                parameters.append(f"%{choseong_keyword}%")
+                search_columns.append(choseong_column)
+                logger.info(f"필드 '{field}': 초성 검색 - 초성 컬럼 '{choseong_column}' 사용")
+                continue
+
             # 필드별 대소문자 구분 설정 확인
             is_case_insensitive = self._is_field_case_insensitive(field)
 
@@ -1022,15 +1596,36 @@ class DuckDBProcessor:
                 search_pattern = f"%{keyword.lower()}%"
 
             if using_parquet:
+                normalized_column = self._get_normalized_column(field, available_fields)
                 # Parquet: VARCHAR 필드는 CAST 불필요 (성능 최적화)
-                if is_case_insensitive and operator == 'LIKE':
+                if is_case_insensitive and operator == 'LIKE' and normalized_column:
+                    # 변환 시점에 정규화된 shadow 컬럼 사용 - 행마다 LOWER 수행 불필요
+                    search_pattern = f"%{_normalize_search_text(keyword)}%"
+                    condition = f"\"{normalized_column}\" {operator} ?"
+                    search_columns.append(normalized_column)
+                    logger.info(f"필드 '{field}': 정규화 컬럼 '{normalized_column}' 사용, 연산자: {operator}")
+                elif operator == '=' and normalized_column:
+                    # 번호 필드 정확 매칭도 정규화 컬럼으로 비교 (yl10008-25003 == YL10008-25003)
+                    search_pattern = _normalize_search_text(keyword.strip())
+                    condition = f"\"{normalized_column}\" = ?"
+                    search_columns.append(normalized_column)
+                    logger.info(f"필드 '{field}': 정규화 컬럼 '{normalized_column}' 정확매칭")
+                elif is_case_insensitive and operator == 'LIKE':
                     # **성능 최적화: 컬럼만 LOWER, 검색어는 이미 Python에서 변환됨**
-                    conditions.append(f"LOWER({table_alias}\"{field}\") {operator} ?")
+                    condition = f"LOWER({table_alias}\"{field}\") {operator} ?"
                     logger.info(f"필드 '{field}': 대소문자 구분 안함 (컬럼만 LOWER 적용), 연산자: {operator}")
                 else:
                     # 대소문자 구분함 또는 정확 매칭: CAST, LOWER 함수 모두 사용 안함
-                    conditions.append(f"{table_alias}\"{field}\" {operator} ?")
+                    condition = f"{table_alias}\"{field}\" {operator} ?"
                     logger.info(f"필드 '{field}': 대소문자 구분함 또는 정확매칭, 연산자: {operator}")
+
+                if operator == 'LIKE' and ngram_grams and field in ngram_columns:
+                    # n-gram postings로 후보 행만 추린 뒤 LIKE로 재검증 (전체 컬럼 스캔 회피)
+                    candidate_query, candidate_parameters = self._build_ngram_candidate_subquery(field, ngram_grams)
+                    condition = f'("{ROW_ID_COLUMN}" IN ({candidate_query}) AND {condition})'
+                    parameters.extend(candidate_parameters)
+                    logger.info(f"필드 '{field}': n-gram 후보 조회 적용 ({len(ngram_grams)}개 gram)")
+                conditions.append(condition)
             else:
                 # JSON: 복합 타입은 문자열로 변환하여 검색
                 if is_case_insensitive and operator == 'LIKE':
@@ -1055,7 +1650,7 @@ class DuckDBProcessor:
         }
 
         current_required = getattr(self, "dynamic_required_fields", [])
-        for col in existing_fields:
+        for col in existing_fields + search_columns:
             if col and col not in current_required:
                 current_required.append(col)
         self.dynamic_required_fields = current_required
@@ -1095,12 +1690,25 @@ class DuckDBProcessor:
                     break
 
             if existing_date_column:
-                logger.info(f"날짜 필터 적용: {existing_date_column} 컬럼 사용")
+                date_column = self._get_date_column(existing_date_column, available_fields)
+                if date_column:
+                    # DATE shadow 컬럼과 상수를 비교 - 행마다 CAST 불필요, zonemap으로 row group 스킵
+                    logger.info(f"날짜 필터 적용: {date_column} (DATE) 컬럼 사용")
+                    column_expr = f"{table_alias}\"{date_column}\""
+                    if date_column not in self.dynamic_required_fields:
+                        self.dynamic_required_fields.append(date_column)
+                else:
+                    # 변환 전 파일: YYYYMMDD 등 혼합 형식을 행마다 파싱 (fallback)
+                    logger.info(f"날짜 필터 적용: {existing_date_column} 컬럼 사용")
+                    # 14자리(YYYYMMDDHHMMSS)는 TIMESTAMP로 파싱되므로 DATE로 잘라야 종료일 당일 행이 포함됨
+                    column_expr = f"CAST({self._build_date_order_expression(existing_date_column, table_alias)} AS DATE)"
+                    if existing_date_column not in self.dynamic_required_fields:
+                        self.dynamic_required_fields.append(existing_date_column)
                 if 'start' in date_range:
-                    conditions.append(f"CAST({table_alias}\"{existing_date_column}\" AS DATE) >= ?")
+                    conditions.append(f"{column_expr} >= CAST(? AS DATE)")
                     parameters.append(date_range['start'])
                 if 'end' in date_range:
-                    conditions.append(f"CAST({table_alias}\"{existing_date_column}\" AS DATE) <= ?")
+                    conditions.append(f"{column_expr} <= CAST(? AS DATE)")
                     parameters.append(date_range['end'])
             else:
                 logger.warning("날짜 필터 스킵: 해당 데이터셋에 날짜 컬럼이 없습니다")
@@ -1172,12 +1780,19 @@ class DuckDBProcessor:
 
             for keyword in exclude_keywords:
                 exclude_conditions = []
-                if existing_product_column:
-                    exclude_conditions.append(f"LOWER(CAST({table_alias}\"{existing_product_column}\" AS VARCHAR)) LIKE ?")
-                    parameters.append(f"%{keyword.lower()}%")
-                if existing_company_column:
-                    exclude_conditions.append(f"LOWER(CAST({table_alias}\"{existing_company_column}\" AS VARCHAR)) LIKE ?")
-                    parameters.append(f"%{keyword.lower()}%")
+                for column in [existing_product_column, existing_company_column]:
+                    if not column:
+                        continue
+                    normalized_column = self._get_normalized_column(column, available_fields)
+                    if normalized_column:
+                        # 정규화 shadow 컬럼 사용 - 행마다 CAST/LOWER 수행 불필요
+                        exclude_conditions.append(f"{table_alias}\"{normalized_column}\" LIKE ?")
+                        parameters.append(f"%{_normalize_search_text(keyword)}%")
+                        if normalized_column not in self.dynamic_required_fields:
+                            self.dynamic_required_fields.append(normalized_column)
+                    else:
+                        exclude_conditions.append(f"LOWER(CAST({table_alias}\"{column}\" AS VARCHAR)) LIKE ?")
+                        parameters.append(f"%{keyword.lower()}%")
 
                 if exclude_conditions:
                     conditions.append(f"NOT ({' OR '.join(exclude_conditions)})")
@@ -1202,21 +1817,586 @@ class DuckDBProcessor:
         else:
             return "1=1", []
 
-    def get_distinct_values(self, field_name: str, limit: int = 100) -> List[Any]:
-        """구조화된 데이터 파일에서 특정 필드의 DISTINCT 값을 조회"""
+    def _build_query_signature(self,
+                               keyword: Optional[str],
+                               search_field: str,
+                               filters: Optional[Dict[str, Any]],
+                               limit: Optional[int]) -> str:
+        """커서가 발급된 검색 조건과 동일한지 확인하기 위한 서명"""
+        signature_source = json.dumps(
+            [self.connection_key, keyword, search_field, filters or {}, limit],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.md5(signature_source.encode('utf-8', errors='ignore')).hexdigest()[:16]
+
+    def _build_plan_key(self,
+                        conditions: List[str],
+                        keyset_mode: bool,
+                        streaming_mode: bool,
+                        unlimited: bool) -> str:
+        """SQL 템플릿 재사용 키 - 조건 SQL 형태와 선택 컬럼 구성이 같으면 동일 템플릿"""
+        plan_source = json.dumps(
+            [
+                conditions,
+                keyset_mode,
+                streaming_mode,
+                unlimited,
+                sorted(self.required_fields),
+                self.dynamic_required_fields
+            ],
+            ensure_ascii=False
+        )
+        return hashlib.md5(plan_source.encode('utf-8', errors='ignore')).hexdigest()
+
+    def get_value_dictionary(self, field_name: str) -> Tuple[FieldValueDictionary, bool]:
+        """필드 값 사전과 캐시 적중 여부 반환
+
+        데이터셋 버전별로 `GROUP BY` 한 번으로 값/건수를 집계해 메모리에 보관하고,
+        이후 요청은 테이블을 읽지 않고 사전에서 응답한다.
+        """
         tabular_path = self._resolve_tabular_path()
         if not tabular_path:
             raise ValueError("Distinct 조회는 Parquet/DuckDB 파일에서만 지원됩니다")
+        if field_name not in self._get_available_fields():
+            raise ValueError(f"데이터셋에 없는 필드입니다: {field_name}")
+
+        def build() -> FieldValueDictionary:
+            with self._acquire_cursor() as conn:
+                table_expr = self._get_table_expression(conn, tabular_path)
+                rows = conn.execute(
+                    f'SELECT "{field_name}", COUNT(*) AS cnt FROM {table_expr} '
+                    f'WHERE "{field_name}" IS NOT NULL GROUP BY 1 ORDER BY cnt DESC LIMIT ?',
+                    [VALUE_DICTIONARY_MAX_VALUES + 1]
+                ).fetchall()
+            truncated = len(rows) > VALUE_DICTIONARY_MAX_VALUES
+            return FieldValueDictionary(field_name, rows[:VALUE_DICTIONARY_MAX_VALUES], truncated)
+
+        dataset_key = str(self.file_path_str)
+        return value_dictionaries.get_or_build(
+            dataset_key, _get_dataset_fingerprint(dataset_key), field_name, build
+        )
+
+    def get_suggest_index(self, search_field: str) -> SuggestIndex:
+        """검색 필드(company_name/model_name/product_name)의 자동완성 인덱스
+
+        매핑된 컬럼들의 필드 값 사전을 합쳐 한 번 생성하며, 이후에는 mmap된 인덱스 파일에서 조회한다.
+        """
+        if search_field not in SEARCH_FIELD_MAPPINGS:
+            raise ValueError(f"자동완성을 지원하지 않는 검색 필드입니다: {search_field} ({', '.join(SEARCH_FIELD_MAPPINGS)})")
+        if not self._resolve_tabular_path():
+            raise ValueError("자동완성은 Parquet/DuckDB 파일에서만 지원됩니다")
+
+        available_fields = self._get_available_fields()
+        columns = [column for column in SEARCH_FIELD_MAPPINGS[search_field] if column in available_fields]
+        if not columns:
+            raise ValueError(f"데이터셋에 {search_field}에 해당하는 컬럼이 없습니다")
+
+        def source() -> List[Tuple[Any, int]]:
+            entries: List[Tuple[Any, int]] = []
+            for column in columns:
+                dictionary, _ = self.get_value_dictionary(column)
+                entries.extend(zip(dictionary.values, dictionary.counts))
+            return entries
+
+        dataset_key = str(self.file_path_str)
+        return suggest_indexes.get_or_build(
+            dataset_key, _get_dataset_fingerprint(dataset_key), search_field, source
+        )
+
+    def get_distinct_values(self, field_name: str, limit: int = 100, order: str = "value") -> List[Any]:
+        """구조화된 데이터 파일에서 특정 필드의 DISTINCT 값을 조회 (필드 값 사전 사용)"""
+        dictionary, _ = self.get_value_dictionary(field_name)
+        return dictionary.samples(limit, order)
 
-        conn, conn_lock = self._get_connection()
-        with conn_lock:
+    def lookup_identifiers(self, identifiers: List[str], field: Optional[str] = None) -> Dict[str, Any]:
+        """인증번호/신고번호/사업자등록번호로 레코드 단건 조회 (ART 인덱스 point query)
+
+        IN 목록은 인덱스를 사용하지 못하므로 식별자마다 `컬럼 = ?` 조회를 만들어 UNION ALL로 묶는다.
+        field를 생략하면 데이터셋에 존재하는 첫 번째 식별자 필드를 사용한다.
+        """
+        tabular_path = self._resolve_tabular_path()
+        if not tabular_path:
+            raise ValueError("식별자 조회는 Parquet/DuckDB 파일에서만 지원됩니다")
+
+        lookup_fields = EXACT_MATCH_FIELDS + IDENTIFIER_FIELDS
+        if field and field not in lookup_fields:
+            raise ValueError(f"식별자 조회를 지원하지 않는 필드입니다: {field}")
+
+        available_fields = self._get_available_fields()
+        candidates = [field] if field else list(lookup_fields)
+        lookup_field = next((candidate for candidate in candidates if candidate in available_fields), None)
+        if lookup_field is None:
+            raise ValueError(f"데이터셋에 식별자 필드가 없습니다: {', '.join(candidates)}")
+
+        if lookup_field in IDENTIFIER_FIELDS:
+            normalized_column = self._get_normalized_column(lookup_field, available_fields)
+            column_expr = (
+                f'"{normalized_column}"' if normalized_column
+                else f"REPLACE(REPLACE(CAST(\"{lookup_field}\" AS VARCHAR), '-', ''), ' ', '')"
+            )
+            normalize = _normalize_identifier if normalized_column else (
+                lambda value: value.replace('-', '').replace(' ', '')
+            )
+        else:
+            normalized_column = self._get_normalized_column(lookup_field, available_fields)
+            column_expr = f'"{normalized_column or lookup_field}"'
+            normalize = (lambda value: _normalize_search_text(value.strip())) if normalized_column else str.strip
+
+        # 입력 순서를 유지하며 정규화 값 기준 중복 제거
+        keys: List[str] = []
+        requested: Dict[str, str] = {}
+        for identifier in identifiers:
+            key = normalize(str(identifier))
+            if key and key not in requested:
+                requested[key] = str(identifier)
+                keys.append(key)
+        if not keys:
+            return {"field": lookup_field, "results": [], "found_count": 0}
+
+        internal_cols = [f'"{col}"' for col in available_fields if self._is_internal_column(col)]
+        select_clause = f"* EXCLUDE ({', '.join(internal_cols)})" if internal_cols else "*"
+
+        with self._acquire_cursor() as conn:
             table_expr = self._get_table_expression(conn, tabular_path)
-            query = (
-                f'SELECT DISTINCT "{field_name}" FROM {table_expr} '
-                f'WHERE "{field_name}" IS NOT NULL LIMIT {limit}'
+            query = " UNION ALL ".join(
+                f'SELECT {index} AS "__lookup_index", {select_clause} FROM {table_expr} WHERE {column_expr} = ?'
+                for index in range(len(keys))
+            )
+            result = conn.execute(query, keys)
+            columns = [desc[0] for desc in result.description]
+            rows = result.fetchall()
+
+        records_by_key: Dict[int, List[Dict[str, Any]]] = {}
+        for row in rows:
+            record = dict(zip(columns[1:], row[1:]))
+            records_by_key.setdefault(row[0], []).append(record)
+
+        results = [
+            {
+                "identifier": requested[key],
+                "found": index in records_by_key,
+                "records": records_by_key.get(index, [])
+            }
+            for index, key in enumerate(keys)
+        ]
+        return {
+            "field": lookup_field,
+            "results": results,
+            "found_count": sum(1 for item in results if item["found"])
+        }
+
+    def export_to_file(self,
+                       dest_path: str,
+                       file_format: str = "csv",
+                       keyword: Optional[str] = None,
+                       search_field: str = "all",
+                       filters: Optional[Dict[str, Any]] = None,
+                       columns: Optional[List[str]] = None,
+                       column_aliases: Optional[Dict[str, str]] = None,
+                       limit: Optional[int] = None,
+                       cancel_event: Optional[Event] = None) -> Dict[str, Any]:
+        """검색 결과 전체를 DuckDB COPY로 파일에 직접 기록 (CSV/Parquet)
+
+        검색 조건(WHERE), 한글 헤더 alias, 배열 평탄화를 하나의 `COPY (SELECT ...) TO` 문으로
+        컴파일하여 DuckDB 병렬 writer가 처리한다. Python으로 행을 옮기지 않으므로 결과 크기와
+        무관하게 메모리 사용량이 일정하다.
+
+        CSV는 배열을 ', '로 이어 붙이고 중첩 구조는 JSON 문자열로 기록하며, 파일 앞에 UTF-8 BOM을
+        붙여 엑셀에서 한글이 깨지지 않게 한다. Parquet은 배열/구조 타입을 그대로 유지한다.
+        정렬 없이 저장(스캔) 순서대로 기록한다 - 클러스터링된 데이터셋은 저장 순서가 곧 기본 정렬.
+        cancel_event가 설정되면 실행 중인 COPY를 interrupt하여 중단한다 (duckdb.InterruptException).
+        """
+        file_format = file_format.lower()
+        if file_format not in ("csv", "parquet"):
+            raise ValueError(f"COPY 내보내기를 지원하지 않는 형식입니다: {file_format}")
+        if not self._resolve_tabular_path():
+            raise ValueError("COPY 내보내기는 Parquet/DuckDB 파일에서만 지원됩니다")
+
+        start_time = time.time()
+        aliases = column_aliases or {}
+        with self._acquire_cursor() as conn:
+            where_clause, where_parameters = self._build_where_clause(keyword, search_field, conn)
+            filter_clause, filter_parameters = self._build_filter_conditions(filters)
+            conditions = [clause for clause in (where_clause, filter_clause) if clause != "1=1"]
+            parameters = list(where_parameters) + list(filter_parameters)
+            base_query = self._build_base_query(conn, self._get_file_size_mb())
+
+            # 결과 컬럼 타입 확인 (배열/구조 타입 평탄화 여부 판단)
+            column_types = {
+                row[0]: row[1]
+                for row in conn.execute(f"DESCRIBE SELECT * FROM ({base_query})").fetchall()
+            }
+            selected = [column for column in (columns or []) if column in column_types] or [
+                column for column in column_types
+                if column != ROW_ID_COLUMN and not self._is_internal_column(column)
+            ]
+
+            projections = []
+            for column in selected:
+                header = aliases.get(column, column)
+                column_type = column_types[column].upper()
+                expression = f'"{column}"'
+                if file_format == "csv":
+                    if column_type.startswith(("STRUCT", "MAP")) or (column_type.endswith("[]") and "STRUCT" in column_type):
+                        expression = f'CAST(to_json("{column}") AS VARCHAR)'
+                    elif column_type.endswith("[]"):
+                        expression = f"array_to_string(\"{column}\", ', ')"
+                projections.append(f'{expression} AS "{header.replace(chr(34), chr(34) * 2)}"')
+
+            # ORDER BY 없이 저장 순서대로 기록 - 전체 정렬 후 쓰기를 시작하지 않도록 함
+            self._get_pool().preserve_insertion_order()
+
+            where_sql = f"WHERE {' AND '.join(f'({clause})' for clause in conditions)}" if conditions else ""
+            limit_sql = ""
+            if limit is not None and limit > 0:
+                limit_sql = "LIMIT ?"
+                parameters.append(limit)
+
+            copy_options = "FORMAT PARQUET, COMPRESSION ZSTD" if file_format == "parquet" else "HEADER, DELIMITER ','"
+            # COPY는 파일 앞에 바이트를 덧붙일 수 없으므로 CSV는 본문 파일에 쓴 뒤 BOM과 합침
+            copy_path = f"{dest_path}.body" if file_format == "csv" else str(dest_path)
+            copy_query = f"""
+            COPY (
+                SELECT {', '.join(projections)}
+                FROM ({base_query})
+                {where_sql}
+                {limit_sql}
+            ) TO '{self._escape_path(str(copy_path))}' ({copy_options})
+            """
+            logger.info(f"📤 DuckDB COPY 내보내기 시작: {Path(str(dest_path)).name} ({file_format}, {len(selected)}개 컬럼)")
+            if cancel_event is not None and cancel_event.is_set():
+                raise duckdb.InterruptException("내보내기가 취소되었습니다")
+            try:
+                with _interrupt_on_cancel(conn, cancel_event):
+                    row = conn.execute(copy_query, parameters).fetchone()
+                if copy_path != str(dest_path):
+                    _write_with_utf8_bom(copy_path, str(dest_path))
+            finally:
+                if copy_path != str(dest_path) and os.path.exists(copy_path):
+                    os.remove(copy_path)
+
+        row_count = int(row[0]) if row else 0
+        processing_time = time.time() - start_time
+        logger.info(f"✅ DuckDB COPY 내보내기 완료: {row_count:,}행, {processing_time:.2f}초")
+        return {
+            "row_count": row_count,
+            "columns": [aliases.get(column, column) for column in selected],
+            "file_size": os.path.getsize(dest_path) if os.path.exists(dest_path) else 0,
+            "processing_time": round(processing_time, 2)
+        }
+
+    def _resolve_facets(self, available_fields: List[str],
+                        facet_fields: Optional[Dict[str, Any]] = None) -> List[Tuple[str, str, str, str]]:
+        """facet 정의를 (이름, 라벨, 컬럼, SQL 식) 목록으로 변환 - 데이터셋에 없는 facet은 제외"""
+        definitions = facet_fields or FACET_DEFINITIONS
+        available = set(available_fields)
+        resolved = []
+        for name, definition in definitions.items():
+            if isinstance(definition, str):
+                definition = {"columns": (definition,)}
+            column = next((column for column in definition.get("columns", ()) if column in available), None)
+            if column is None:
+                continue
+
+            if definition.get("kind") == "year":
+                date_column = f"{column}{DATE_COLUMN_SUFFIX}"
+                if date_column in available:
+                    expression = f'year("{date_column}")'
+                else:
+                    # 'YYYYMMDD', 'YYYY-MM-DD', 'YYYY.MM.DD' 등 문자열 날짜의 앞 4자리
+                    expression = (
+                        f"TRY_CAST(substr(regexp_replace(CAST(\"{column}\" AS VARCHAR), '[^0-9]', '', 'g'), 1, 4) AS INTEGER)"
+                    )
+            else:
+                expression = f'NULLIF(TRIM(CAST("{column}" AS VARCHAR)), \'\')'
+            resolved.append((name, definition.get("label", name), column, expression))
+        return resolved
+
+    def get_facets(self,
+                   keyword: Optional[str] = None,
+                   search_field: str = "all",
+                   filters: Optional[Dict[str, Any]] = None,
+                   facet_fields: Optional[Dict[str, Any]] = None,
+                   top_n: int = FACET_TOP_N) -> Dict[str, Any]:
+        """검색 조건에 해당하는 전체 결과의 facet별 건수를 GROUPING SETS 한 번의 스캔으로 집계
+
+        facet마다 건수 상위 top_n개 값과 나머지 값 수(other_count)를 반환하며,
+        빈 grouping set으로 전체 결과 수도 함께 계산한다.
+        """
+        if not self._resolve_tabular_path():
+            raise ValueError("facet 집계는 Parquet/DuckDB 파일에서만 지원됩니다")
+
+        start_time = time.time()
+        with self._acquire_cursor() as conn:
+            facets = self._resolve_facets(self._get_available_fields(), facet_fields)
+            where_clause, where_parameters = self._build_where_clause(keyword, search_field, conn)
+            filter_clause, filter_parameters = self._build_filter_conditions(filters)
+            conditions = [clause for clause in (where_clause, filter_clause) if clause != "1=1"]
+            parameters = list(where_parameters) + list(filter_parameters)
+
+            # facet 컬럼도 기본 쿼리에 포함 (표시/검색 설정에 없는 컬럼일 수 있음)
+            for _, _, column, expression in facets:
+                for required in (column, f"{column}{DATE_COLUMN_SUFFIX}"):
+                    if f'"{required}"' in expression and required not in self.dynamic_required_fields:
+                        self.dynamic_required_fields.append(required)
+            base_query = self._build_base_query(conn, self._get_file_size_mb())
+            where_sql = f"WHERE {' AND '.join(f'({clause})' for clause in conditions)}" if conditions else ""
+
+            if not facets:
+                row = conn.execute(f"SELECT COUNT(*) FROM ({base_query}) {where_sql}", parameters).fetchone()
+                return {"total_count": int(row[0]) if row else 0, "facets": {}, "processing_time": round(time.time() - start_time, 3)}
+
+            aliases = [f"f{index}" for index in range(len(facets))]
+            projections = ", ".join(f"{facet[3]} AS {alias}" for facet, alias in zip(facets, aliases))
+            grouping_sets = ", ".join(f"({alias})" for alias in aliases) + ", ()"
+            # GROUPING_ID 비트: 집계에서 제외된 컬럼이 1 (첫 컬럼이 최상위 비트)
+            query = f"""
+            WITH matched AS (
+                SELECT {projections}
+                FROM ({base_query})
+                {where_sql}
+            ),
+            grouped AS (
+                SELECT GROUPING_ID({', '.join(aliases)}) AS gid,
+                       {', '.join(aliases)},
+                       COUNT(*) AS cnt
+                FROM matched
+                GROUP BY GROUPING SETS ({grouping_sets})
+            )
+            SELECT gid, {', '.join(aliases)}, cnt,
+                   COUNT(*) OVER (PARTITION BY gid) AS value_count,
+                   SUM(cnt) OVER (PARTITION BY gid) AS group_total
+            FROM grouped
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY gid ORDER BY cnt DESC, {', '.join(aliases)}) <= ?
+            ORDER BY gid, cnt DESC
+            """
+            rows = conn.execute(query, parameters + [top_n + 1]).fetchall()
+
+        all_bits = (1 << len(facets)) - 1
+        gid_to_index = {all_bits ^ (1 << (len(facets) - 1 - index)): index for index in range(len(facets))}
+        total_count = 0
+        buckets: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            gid, values, count, value_count, group_total = row[0], row[1:-3], row[-3], row[-2], row[-1]
+            if gid == all_bits:
+                total_count = int(count)
+                continue
+            index = gid_to_index.get(gid)
+            if index is None:
+                continue
+            bucket = buckets.setdefault(index, {"values": [], "value_count": int(value_count), "shown": 0})
+            if len(bucket["values"]) < top_n:
+                bucket["values"].append({"value": values[index], "count": int(count)})
+                bucket["shown"] += int(count)
+            bucket["group_total"] = int(group_total)
+
+        result_facets: Dict[str, Any] = {}
+        for index, (name, label, column, _) in enumerate(facets):
+            bucket = buckets.get(index, {"values": [], "value_count": 0, "shown": 0, "group_total": 0})
+            result_facets[name] = {
+                "label": label,
+                "field": column,
+                "values": bucket["values"],
+                "distinct_count": bucket["value_count"],
+                "other_count": bucket["group_total"] - bucket["shown"],
+            }
+
+        processing_time = time.time() - start_time
+        logger.info(f"📊 facet 집계 완료: {len(facets)}개 facet, {total_count:,}건, {processing_time:.3f}초")
+        return {
+            "total_count": total_count,
+            "facets": result_facets,
+            "processing_time": round(processing_time, 3)
+        }
+
+    def search_fuzzy(self,
+                     keyword: str,
+                     search_field: str = "company_name",
+                     limit: Optional[int] = 20,
+                     page: int = 1,
+                     filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """오타/띄어쓰기 허용 검색 (match_mode=fuzzy)
+
+        n-gram postings에서 검색어 gram과 많이 겹치는 행을 최대 FUZZY_MAX_CANDIDATES개 후보로 뽑고,
+        후보에 대해서만 Jaro-Winkler + bigram Jaccard 유사도를 계산해 FUZZY_MIN_SCORE 이상을 유사도순으로 반환한다.
+        postings가 없는 데이터셋은 한 번의 스캔에서 Jaro-Winkler 상위 후보를 고른 뒤 같은 방식으로 순위를 매긴다.
+        """
+        if not self._resolve_tabular_path():
+            raise ValueError("퍼지 검색은 Parquet/DuckDB 파일에서만 지원됩니다")
+        if search_field in IDENTIFIER_FIELDS or search_field in EXACT_MATCH_FIELDS:
+            raise ValueError(f"'{search_field}' 필드는 정확 매칭 필드라 퍼지 검색을 지원하지 않습니다")
+
+        compact_keyword, lookup_grams, keyword_bigrams = _build_fuzzy_lookup_grams(keyword)
+        if not lookup_grams:
+            raise ValueError("퍼지 검색어는 공백을 제외하고 2자 이상이어야 합니다")
+
+        start_time = time.time()
+        effective_limit = None if limit is None or limit <= 0 else limit
+        offset = (page - 1) * effective_limit if effective_limit else 0
+
+        with self._acquire_cursor() as conn:
+            available_fields = self._get_available_fields()
+            fields = [
+                field for field in SEARCH_FIELD_MAPPINGS.get(search_field, (search_field,))
+                if field in available_fields
+            ]
+            if not fields:
+                raise ValueError(f"'{search_field}'에 해당하는 검색 필드가 없습니다")
+
+            value_expressions = []
+            for field in fields:
+                normalized_column = self._get_normalized_column(field, available_fields)
+                source = f'"{normalized_column}"' if normalized_column else f'lower(CAST("{field}" AS VARCHAR))'
+                value_expressions.append(f"regexp_replace({source}, '{FUZZY_NOISE_PATTERN}', '', 'g')")
+                for required in (field, normalized_column):
+                    if required and required not in self.dynamic_required_fields:
+                        self.dynamic_required_fields.append(required)
+
+            filter_clause, filter_parameters = self._build_filter_conditions(filters)
+            base_query = self._build_base_query(conn, self._get_file_size_mb())
+            parameters: list = [compact_keyword, keyword_bigrams]
+
+            ngram_columns = self._get_ngram_index_columns(conn)
+            indexed_fields = [field for field in fields if field in ngram_columns]
+            filter_sql = f" AND ({filter_clause})" if filter_clause != "1=1" else ""
+
+            if indexed_fields:
+                # 컬럼별 겹치는 gram 수가 많은 행부터 후보 상한까지 (gram 단위 등호 조회로 zonemap 활용)
+                postings = f'{self._duckdb_alias}."{self.duckdb_table_name}{NGRAM_TABLE_SUFFIX}"'
+                lookups = []
+                for field in indexed_fields:
+                    for gram in lookup_grams:
+                        lookups.append(f"SELECT row_id, column_name FROM {postings} WHERE column_name = ? AND gram = ?")
+                        parameters.extend([field, gram])
+                min_shared = max(1, len(lookup_grams) // 4)
+                candidate_sql = f"""
+                hits AS (
+                    SELECT row_id, MAX(shared) AS shared
+                    FROM (
+                        SELECT row_id, column_name, COUNT(*) AS shared
+                        FROM ({' UNION ALL '.join(lookups)})
+                        GROUP BY row_id, column_name
+                        HAVING COUNT(*) >= ?
+                    )
+                    GROUP BY row_id
+                    ORDER BY shared DESC, row_id
+                    LIMIT ?
+                ),
+                pool AS (
+                    SELECT * FROM ({base_query})
+                    WHERE "{ROW_ID_COLUMN}" IN (SELECT row_id FROM hits){filter_sql}
+                )"""
+                parameters.extend([min_shared, FUZZY_MAX_CANDIDATES, *filter_parameters])
+                candidate_source = "ngram"
+            else:
+                # 색인이 없으면 LIKE 검색과 같은 한 번의 스캔에서 검색어 포함 행과 Jaro-Winkler 상위 후보만 유지 (top-N)
+                prefilter = ", ".join(
+                    f"CASE WHEN contains({expression}, __fuzzy_keyword) THEN 1.0 "
+                    f"ELSE COALESCE(jaro_winkler_similarity({expression}, __fuzzy_keyword), 0) END"
+                    for expression in value_expressions
+                )
+                candidate_sql = f"""
+                pool AS (
+                    SELECT base.* FROM ({base_query}) AS base CROSS JOIN fuzzy_keyword
+                    WHERE TRUE{filter_sql}
+                    ORDER BY GREATEST({prefilter}) DESC
+                    LIMIT ?
+                )"""
+                parameters.extend([*filter_parameters, FUZZY_MAX_CANDIDATES])
+                candidate_source = "scan"
+
+            essential_cols = self._get_essential_columns(include_internal=False)
+            if essential_cols != "*":
+                select_clause = essential_cols
+            else:
+                internal_cols = [f'"{col}"' for col in available_fields if self._is_internal_column(col)]
+                internal_cols.append(f'"{ROW_ID_COLUMN}"')
+                select_clause = f"* EXCLUDE ({', '.join(internal_cols)}, match_score)"
+
+            scores = ", ".join(_build_fuzzy_score_expression(expression) for expression in value_expressions)
+            pagination_clause = "" if effective_limit is None else "LIMIT ? OFFSET ?"
+            query = f"""
+            WITH fuzzy_keyword AS (
+                SELECT ?::VARCHAR AS __fuzzy_keyword, ?::VARCHAR[] AS __fuzzy_grams
+            ),
+            {candidate_sql.strip()},
+            scored AS (
+                SELECT pool.*, GREATEST({scores}) AS match_score
+                FROM pool CROSS JOIN fuzzy_keyword
             )
-            rows = conn.execute(query).fetchall()
-            return [row[0] for row in rows if row and row[0] is not None]
+            SELECT {select_clause}, match_score, COUNT(*) OVER() AS total_count
+            FROM scored
+            WHERE match_score >= ?
+            ORDER BY match_score DESC, "{ROW_ID_COLUMN}"
+            {pagination_clause}
+            """
+            parameters.append(FUZZY_MIN_SCORE)
+            if effective_limit is not None:
+                parameters.extend([effective_limit, offset])
+
+            result = conn.execute(query, parameters)
+            column_names = [desc[0] for desc in result.description]
+            rows = result.fetchall()
+
+        results = []
+        total_count = 0
+        for row in rows:
+            record = dict(zip(column_names, row))
+            total_count = int(record.pop("total_count"))
+            record["match_score"] = round(float(record["match_score"]), 4)
+            results.append(record)
+        if not results and offset:
+            # 범위를 벗어난 페이지는 건수를 알 수 없으므로 0건으로 응답
+            total_count = 0
+
+        processing_time = time.time() - start_time
+        if effective_limit:
+            total_pages = max(1, (total_count + effective_limit - 1) // effective_limit)
+            current_page = page
+        else:
+            total_pages, current_page = 1, 1
+        logger.info(
+            f"🔤 퍼지 검색 완료: '{keyword}' ({candidate_source} 후보, {len(lookup_grams)}개 gram) "
+            f"{total_count:,}건, {processing_time:.3f}초"
+        )
+        return {
+            "results": results,
+            "pagination": {
+                "total_count": total_count,
+                "total_pages": total_pages,
+                "current_page": current_page,
+                "items_per_page": effective_limit or total_count,
+                "has_next": current_page < total_pages,
+                "has_prev": current_page > 1,
+                "next_cursor": None
+            },
+            "stats": {
+                "processed_records": len(results),
+                "processing_time": round(processing_time, 2),
+                "file_size_mb": round(self._get_file_size_mb(), 1)
+            },
+            "debug_info": {
+                "search_field": search_field,
+                "existing_fields": fields,
+                "field_count": len(fields),
+                "match_mode": "fuzzy",
+                "candidate_source": candidate_source,
+                "candidate_limit": FUZZY_MAX_CANDIDATES,
+                "lookup_grams": lookup_grams,
+                "min_score": FUZZY_MIN_SCORE
+            },
+            "query_info": {
+                "keyword": keyword,
+                "search_field": search_field,
+                "page": current_page,
+                "limit": limit,
+                "offset": offset,
+                "pagination_mode": "offset",
+                "match_mode": "fuzzy"
+            }
+        }
 
     def _get_file_size_mb(self) -> float:
         """파일 크기 (MB) 반환"""
@@ -1243,7 +2423,9 @@ class DuckDBProcessor:
                              filters: Optional[Dict[str, Any]] = None,
                              collect_results: bool = True,
                              chunk_callback: Optional[Callable[[List[Dict[str, Any]], int], None]] = None,
-                             chunk_size: int = 1000) -> Dict[str, Any]:
+                             chunk_size: int = 1000,
+                             cursor: Optional[str] = None,
+                             batch_callback: Optional[Callable[["pa.RecordBatch", int], None]] = None) -> Dict[str, Any]:
         """스트리밍 방식으로 SafetyKorea 데이터 검색
 
         Args:
@@ -1255,90 +2437,61 @@ class DuckDBProcessor:
             collect_results: 결과 리스트 수집 여부 (False 면 chunk_callback으로 전달)
             chunk_callback: collect_results=False일 때 결과 청크를 처리할 콜백
             chunk_size: chunk_callback으로 전달할 배치 크기
+            cursor: 이전 응답의 pagination.next_cursor (있으면 OFFSET 대신 keyset 페이지네이션)
+            batch_callback: collect_results=False일 때 pyarrow.RecordBatch 청크를 그대로 받는 콜백
+                (Parquet/DuckDB 전용, 행 단위 dict 생성 없음 - 대용량 다운로드/내보내기용)
 
         Returns:
             Dict: 검색 결과 및 통계 정보
         """
+        if batch_callback is not None:
+            if not PYARROW_AVAILABLE:
+                return {
+                    "error": "arrow_unavailable",
+                    "message": "pyarrow가 설치되지 않아 RecordBatch 스트리밍을 사용할 수 없습니다"
+                }
+            if collect_results or not self._resolve_tabular_path():
+                return {
+                    "error": "arrow_unsupported",
+                    "message": "RecordBatch 스트리밍은 collect_results=False인 Parquet/DuckDB 검색에서만 지원됩니다"
+                }
         
+        # 호출 측이 취소되면(통합 검색 시간 초과 등) 워커 스레드의 쿼리도 중단
+        cancel_event = Event()
+
         def _execute_query():
             start_time = time.time()
-            conn, conn_lock = self._get_connection()
-
-            with conn_lock:
-                # 서버사이드 페이지네이션: page와 limit으로 offset 계산
+            # 데이터셋 커서 풀에서 커서를 빌려 동시 검색을 병렬 처리
+            with self._acquire_cursor() as conn, _interrupt_on_cancel(conn, cancel_event):
+                # 서버사이드 페이지네이션: cursor가 유효하면 keyset, 아니면 page와 limit으로 offset 계산
                 effective_limit = None if limit is None or limit <= 0 else limit
-                offset = (page - 1) * effective_limit if effective_limit else 0
-                streaming_mode = not collect_results and chunk_callback is not None
-                logger.info(f"📄 페이지네이션: page={page}, limit={limit}, offset={offset}, streaming={streaming_mode}")
+                query_signature = self._build_query_signature(keyword, search_field, filters, effective_limit)
+                cursor_state = _decode_cursor(cursor) if cursor and effective_limit else None
+                if cursor and (cursor_state is None or cursor_state.get("q") != query_signature):
+                    logger.warning("커서가 현재 검색 조건과 일치하지 않음 - page 기반 페이지네이션으로 처리")
+                    cursor_state = None
+                current_page = cursor_state.get("p", 0) + 1 if cursor_state else page
+                arrow_mode = not collect_results and batch_callback is not None
+                streaming_mode = arrow_mode or (not collect_results and chunk_callback is not None)
 
                 file_size_mb = self._get_file_size_mb()
                 logger.info(f"파일 크기: {file_size_mb:.1f}MB")
 
-                where_clause, where_parameters = self._build_where_clause(keyword, search_field)
+                where_clause, where_parameters = self._build_where_clause(keyword, search_field, conn)
                 filter_clause, filter_parameters = self._build_filter_conditions(filters)
 
                 try:
                     if file_size_mb > 1000:
                         logger.warning(f"대용량 파일 ({file_size_mb:.1f}MB) 감지. 외부 파일 분할 또는 스트리밍 처리 권장")
 
-                    base_query = self._build_base_query(conn, file_size_mb)
-
                     tabular_path = self._resolve_tabular_path()
                     using_parquet = tabular_path is not None
-
-                    if using_parquet:
-                        # 🎯 download_fields 등 required_fields 적용
-                        essential_cols = self._get_essential_columns()
-                        select_clause = essential_cols if essential_cols != "*" else "*"
-                        available_fields = self._get_available_fields()
-                        order_by = None
-                        logger.info(f"📊 성능 최적화: {len(essential_cols.split(',')) if essential_cols != '*' else '전체'}개 컬럼 선택 (dataA/{self.subcategory})")
-                        logger.info("⚙️ Parquet 결과는 파일 저장 순서를 그대로 사용합니다")
-
-                    else:
-                        structure = self._detect_json_structure()
-                        available_fields = self._get_available_fields()
-
-                        if structure in ['nested_safetykorea', 'nested_data']:
-                            select_clause = "item"
-                            sort_candidates = ["productName", "제품명", "업체명", "모델명"]
-                            order_field = next((f for f in sort_candidates if f in available_fields), None)
-                            order_by = f"item.\"{order_field}\"" if order_field else "item"
-                        else:
-                            select_clause = "*"
-                            date_candidates = [
-                                "완료일", "인증일자", "인증변경일자", "서명일자", "인증만료일자",
-                                "완료일자", "발급일", "만료일", "설립일",
-                                "cert_date", "sign_date", "cert_chg_date",
-                                "registration_date", "approval_date", "declaration_date", "recall_date",
-                                "등록일", "승인일", "신고일", "리콜일", "생성일", "수정일"
-                            ]
-                            date_candidates.extend([
-                                "신고증명서 발급일", "시험성적서 만료일", "유통기한"
-                            ])
-                            product_candidates = ["품목", "제품명", "product_name", "업체명", "company_name", "상호", "기자재명칭", "모델명", "model_name"]
-
-                            date_field = next((f for f in date_candidates if f in available_fields), None)
-                            product_field = next((f for f in product_candidates if f in available_fields), None)
-
-                            order_parts = []
-                            if date_field:
-                                date_expr = self._build_date_order_expression(date_field)
-                                order_parts.append(f'{date_expr} DESC NULLS LAST')
-                            if product_field:
-                                order_parts.append(f'"{product_field}" ASC')
-
-                            if order_parts:
-                                order_by = ', '.join(order_parts)
-                                logger.info(f"🎯 ORDER BY 적용됨: {order_by}")
-                                logger.info(f"📅 선택된 date_field: {date_field}")
-                                for col in [date_field, product_field]:
-                                    if col and col not in self.dynamic_required_fields:
-                                        self.dynamic_required_fields.append(col)
-                            else:
-                                first_field = available_fields[0] if available_fields else "1"
-                                order_by = f'"{first_field}"' if first_field != "1" else "1"
-                                logger.warning(f"❌ ORDER BY 기본값 사용: {order_by} (날짜 필드 없음)")
+                    keyset_mode = using_parquet and cursor_state is not None
+                    offset = 0 if keyset_mode else ((page - 1) * effective_limit if effective_limit else 0)
+                    logger.info(
+                        f"📄 페이지네이션: page={current_page}, limit={limit}, offset={offset}, "
+                        f"keyset={keyset_mode}, streaming={streaming_mode}"
+                    )
 
                     combined_conditions = []
                     combined_parameters = []
@@ -1351,29 +2504,127 @@ class DuckDBProcessor:
                         combined_conditions.append(f"({filter_clause})")
                         combined_parameters.extend(filter_parameters)
 
-                    limit_clause = "" if effective_limit is None else f"LIMIT {effective_limit}"
+                    if keyset_mode:
+                        # 마지막 행 식별자 이후부터 조회 - OFFSET 스킵 및 전체 재집계 불필요
+                        combined_conditions.append(f'"{ROW_ID_COLUMN}" > ?')
+                        combined_parameters.append(cursor_state["r"])
+
+                    # 총 개수는 첫 페이지에서만 윈도우 함수로 계산하고 커서에 실어 전달
+                    # (스트리밍은 전달한 행 수를 그대로 사용 - 윈도우 집계로 인한 전체 materialize 방지)
+                    count_column = "" if keyset_mode or streaming_mode else ", COUNT(*) OVER() as total_count"
+                    count_query = None
+
+                    # 검색 조건 형태가 같으면 컴파일된 SQL 템플릿을 재사용하고 파라미터만 바인딩
+                    plan_key = (
+                        self._build_plan_key(combined_conditions, keyset_mode, streaming_mode, effective_limit is None)
+                        if using_parquet else None
+                    )
+                    filtered_query = self._handle.get_template(plan_key) if plan_key else None
+
+                    # 최신순으로 클러스터링되어 저장된 DuckDB 파일은 저장 순서가 곧 기본 정렬
+                    # (n-gram 후보 조인은 출력 순서를 보존하지 않으므로 이때는 rowid 정렬 유지)
+                    candidate_join = f'"{ROW_ID_COLUMN}" IN (' in where_clause
+                    storage_ordered = using_parquet and not candidate_join and bool(self._get_clustering_key(conn))
+                    # 행 식별자 정렬은 페이지/커서 요청에만 필요 - 전체 조회는 정렬 없이 스캔 순서대로 반환
+                    # (스트리밍 내보내기는 limit이 있어도 정렬하면 첫 배치가 전체 정렬을 기다리므로 커서 요청만 정렬)
+                    row_ordered = keyset_mode or (effective_limit is not None and not streaming_mode)
+                    if storage_ordered or (using_parquet and not row_ordered):
+                        self._get_pool().preserve_insertion_order()
+
+                    if filtered_query is None:
+                        base_query = self._build_base_query(conn, file_size_mb)
+
+                        if using_parquet:
+                            # 🎯 download_fields 등 required_fields 적용
+                            # 검색 전용 shadow 컬럼은 결과에서 제외
+                            essential_cols = self._get_essential_columns(include_internal=False)
+                            available_fields = self._get_available_fields()
+                            if essential_cols != "*":
+                                select_clause = f'{essential_cols}, "{ROW_ID_COLUMN}"'
+                            else:
+                                internal_cols = [f'"{col}"' for col in available_fields if self._is_internal_column(col)]
+                                select_clause = f"* EXCLUDE ({', '.join(internal_cols)})" if internal_cols else "*"
+                            logger.info(f"📊 성능 최적화: {len(essential_cols.split(',')) if essential_cols != '*' else '전체'}개 컬럼 선택 (dataA/{self.subcategory})")
+                            if storage_ordered:
+                                # rowid 순서 = 클러스터링 키 순서이므로 정렬 없이 저장 순서 그대로 반환
+                                order_by = ""
+                                key_description = ", ".join(f"{column} {order}" for column, order in self._handle.clustering_key)
+                                logger.info(f"⚡ 저장 순서({key_description})가 기본 정렬과 일치 - ORDER BY 생략")
+                            elif not row_ordered:
+                                order_by = ""
+                                logger.info("⚡ 페이지 없는 전체 조회 - ORDER BY 없이 저장 순서대로 반환")
+                            else:
+                                order_by = f'"{ROW_ID_COLUMN}"'
+                                logger.info("⚙️ Parquet 결과는 파일 저장 순서(행 식별자)를 기준으로 정렬합니다")
 
-                    order_clause = f"ORDER BY {order_by}" if order_by else ""
+                        else:
+                            structure = self._detect_json_structure()
+                            available_fields = self._get_available_fields()
+
+                            if structure in ['nested_safetykorea', 'nested_data']:
+                                select_clause = "item"
+                                sort_candidates = ["productName", "제품명", "업체명", "모델명"]
+                                order_field = next((f for f in sort_candidates if f in available_fields), None)
+                                order_by = f"item.\"{order_field}\"" if order_field else "item"
+                            else:
+                                select_clause = "*"
+                                date_candidates = [
+                                    "완료일", "인증일자", "인증변경일자", "서명일자", "인증만료일자",
+                                    "완료일자", "발급일", "만료일", "설립일",
+                                    "cert_date", "sign_date", "cert_chg_date",
+                                    "registration_date", "approval_date", "declaration_date", "recall_date",
+                                    "등록일", "승인일", "신고일", "리콜일", "생성일", "수정일"
+                                ]
+                                date_candidates.extend([
+                                    "신고증명서 발급일", "시험성적서 만료일", "유통기한"
+                                ])
+                                product_candidates = ["품목", "제품명", "product_name", "업체명", "company_name", "상호", "기자재명칭", "모델명", "model_name"]
+
+                                date_field = next((f for f in date_candidates if f in available_fields), None)
+                                product_field = next((f for f in product_candidates if f in available_fields), None)
+
+                                order_parts = []
+                                if date_field:
+                                    date_column = self._get_date_column(date_field, available_fields)
+                                    date_expr = (
+                                        f'"{date_column}"' if date_column
+                                        else self._build_date_order_expression(date_field)
+                                    )
+                                    order_parts.append(f'{date_expr} DESC NULLS LAST')
+                                if product_field:
+                                    order_parts.append(f'"{product_field}" ASC')
+
+                                if order_parts:
+                                    order_by = ', '.join(order_parts)
+                                    logger.info(f"🎯 ORDER BY 적용됨: {order_by}")
+                                    logger.info(f"📅 선택된 date_field: {date_field}")
+                                    for col in [date_field, product_field]:
+                                        if col and col not in self.dynamic_required_fields:
+                                            self.dynamic_required_fields.append(col)
+                                else:
+                                    first_field = available_fields[0] if available_fields else "1"
+                                    order_by = f'"{first_field}"' if first_field != "1" else "1"
+                                    logger.warning(f"❌ ORDER BY 기본값 사용: {order_by} (날짜 필드 없음)")
+
+                        order_clause = f"ORDER BY {order_by}" if order_by else ""
+                        where_sql = f"WHERE {' AND '.join(combined_conditions)}" if combined_conditions else ""
+                        pagination_clause = "OFFSET ?" if effective_limit is None else "LIMIT ? OFFSET ?"
 
-                    if combined_conditions:
-                        final_where_clause = " AND ".join(combined_conditions)
                         filtered_query = f"""
-                        SELECT {select_clause}, COUNT(*) OVER() as total_count
+                        SELECT {select_clause}{count_column}
                         FROM ({base_query})
-                        WHERE {final_where_clause}
+                        {where_sql}
                         {order_clause}
-                        {limit_clause} OFFSET {offset}
+                        {pagination_clause}
                         """
-                        count_query = None
+                        if plan_key:
+                            self._handle.put_template(plan_key, filtered_query)
                     else:
-                        filtered_query = f"""
-                        SELECT {select_clause}, COUNT(*) OVER() as total_count
-                        FROM ({base_query})
-                        {order_clause}
-                        {limit_clause} OFFSET {offset}
-                        """
-                        count_query = None
-                        combined_parameters = []
+                        logger.info("⚡ 컴파일된 검색 계획 재사용 (파라미터 바인딩만 수행)")
+
+                    if effective_limit is not None:
+                        combined_parameters.append(effective_limit)
+                    combined_parameters.append(offset)
 
                     logger.info("DuckDB 쿼리 실행 시작...")
 
@@ -1382,6 +2633,7 @@ class DuckDBProcessor:
                     results = []
                     total_processed = 0
                     total_count_window = None
+                    last_row_id = None
                     batch_fetch_size = chunk_size if streaming_mode else 1000
                     chunk_buffer: List[Dict[str, Any]] = [] if streaming_mode else []
 
@@ -1390,16 +2642,31 @@ class DuckDBProcessor:
                     else:
                         structure = self._detect_json_structure()
 
+                    # 컬럼명은 결과 스키마 기준으로 한 번만 계산
+                    column_names = [desc[0] for desc in result.description] if result.description else []
+
                     try:
+                        if arrow_mode:
+                            # Arrow 경로: RecordBatch를 그대로 콜백에 전달 (행 단위 Python 객체 생성 없음)
+                            reader = result.fetch_record_batch(batch_fetch_size)
+                            for record_batch in reader:
+                                if record_batch.num_rows == 0:
+                                    continue
+                                row_id_index = record_batch.schema.get_field_index(ROW_ID_COLUMN)
+                                if row_id_index >= 0:
+                                    last_row_id = record_batch.column(row_id_index)[-1].as_py()
+                                    record_batch = record_batch.remove_column(row_id_index)
+                                total_processed += record_batch.num_rows
+                                batch_callback(record_batch, total_processed)
+
                         # fetchall을 사용한 안전한 데이터 처리 (배치 로직 유지)
-                        while True:
+                        while not arrow_mode:
                             batch = result.fetchmany(batch_fetch_size)
                             if not batch:
                                 break
 
                             for row in batch:
                                 if using_parquet:
-                                    column_names = [desc[0] for desc in result.description]
                                     record = dict(zip(column_names, row)) if row else None
                                 elif structure in ['nested_safetykorea', 'nested_data']:
                                     raw_record = row[0] if row else None
@@ -1413,13 +2680,14 @@ class DuckDBProcessor:
                                     else:
                                         record = None
                                 else:
-                                    column_names = [desc[0] for desc in result.description]
                                     record = dict(zip(column_names, row)) if row else None
 
                                 if record:
                                     if isinstance(record, dict) and 'total_count' in record:
                                         total_count_window = record['total_count']
                                         del record['total_count']
+                                    if isinstance(record, dict) and ROW_ID_COLUMN in record:
+                                        last_row_id = record.pop(ROW_ID_COLUMN)
 
                                     total_processed += 1
 
@@ -1444,10 +2712,17 @@ class DuckDBProcessor:
                             chunk_buffer.clear()
 
                     except Exception as batch_error:
+                        if streaming_mode:
+                            # 이미 전달된 청크만으로는 결과가 잘린 것 - 성공으로 보고하지 않고 오류 반환
+                            raise
                         logger.warning(f"배치 처리 중 오류: {batch_error}")
 
-                    if count_query is None:
-                        if results:
+                    if keyset_mode:
+                        total_count = cursor_state.get("t", total_processed)
+                    elif streaming_mode:
+                        total_count = total_processed
+                    elif count_query is None:
+                        if total_processed:
                             if total_count_window is not None:
                                 total_count = total_count_window
                             else:
@@ -1466,23 +2741,33 @@ class DuckDBProcessor:
 
                     if effective_limit:
                         total_pages = (total_count + effective_limit - 1) // effective_limit if effective_limit > 0 else 1
-                        has_next = page < total_pages
+                        has_next = current_page < total_pages
                         items_per_page = effective_limit
                     else:
                         total_pages = 1
                         has_next = False
                         items_per_page = total_count
-                    has_prev = page > 1
+                    has_prev = current_page > 1
+
+                    next_cursor = None
+                    if has_next and last_row_id is not None:
+                        next_cursor = _encode_cursor({
+                            "r": last_row_id,
+                            "p": current_page,
+                            "t": total_count,
+                            "q": query_signature
+                        })
 
                     return {
                         "results": results if not streaming_mode else [],
                         "pagination": {
                             "total_count": total_count,
                             "total_pages": total_pages,
-                            "current_page": page,
+                            "current_page": current_page,
                             "items_per_page": items_per_page,
                             "has_next": has_next,
-                            "has_prev": has_prev
+                            "has_prev": has_prev,
+                            "next_cursor": next_cursor
                         },
                         "stats": {
                             "processed_records": total_processed,
@@ -1495,9 +2780,10 @@ class DuckDBProcessor:
                         "query_info": {
                             "keyword": keyword,
                             "search_field": search_field,
-                            "page": page,
+                            "page": current_page,
                             "limit": limit,
-                            "offset": offset
+                            "offset": offset,
+                            "pagination_mode": "keyset" if keyset_mode else "offset"
                         }
                     }
 
@@ -1525,15 +2811,84 @@ class DuckDBProcessor:
                         }
 
         # 비동기 실행
-        result = await asyncio.to_thread(_execute_query)
+        worker = asyncio.ensure_future(asyncio.to_thread(_execute_query))
+        try:
+            result = await asyncio.shield(worker)
+        except asyncio.CancelledError:
+            # 쿼리를 interrupt하고 스레드가 커서를 풀에 반납할 때까지 기다린 뒤 취소 전파
+            # (호출 측 동시 실행 제한 슬롯이 실제 작업이 끝나기 전에 풀리지 않도록)
+            cancel_event.set()
+            await asyncio.wait({worker})
+            if not worker.cancelled():
+                worker.exception()
+            raise
+        except TimeoutError as pool_timeout:
+            logger.warning(f"DuckDB 커서 풀 대기 시간 초과: {pool_timeout}")
+            return {
+                "error": "connection_pool_timeout",
+                "message": str(pool_timeout),
+                "suggestion": "동시 요청이 많습니다. 잠시 후 다시 시도하거나 DUCKDB_CURSOR_POOL_SIZE를 늘리세요"
+            }
         return result
     
     def close(self):
-        """연결 종료 - Connection Pool 사용으로 개별 연결 관리 불필요"""
+        """연결 종료 - 커서 풀 사용으로 개별 연결 관리 불필요"""
         # **성능 최적화: Connection Pool 사용으로 개별 연결 관리 제거**
         # Connection Pool이 자동으로 연결을 관리하므로 별도 처리 불필요
         logger.info("DuckDB Connection Pool 사용 중 - 개별 연결 종료 불필요")
 
+        # 사용이 끝난 로컬 사본은 다시 /tmp 용량 확보 시 제거 후보가 됨
+        for path in self._pinned_paths:
+            tmp_quota.release_pin(path)
+        self._pinned_paths.clear()
+
+
+def _on_duckdb_copy_evicted(path: Path) -> None:
+    """tmp_quota가 원격 DuckDB 사본을 제거하면 해당 URL의 캐시 경로와 커서 풀도 폐기
+
+    풀의 루트 연결이 파일을 열고 있으면 삭제된 파일 공간이 반환되지 않으므로,
+    풀과 데이터셋 핸들을 목록에서 빼서 다음 요청이 새로 받은 사본으로 다시 만들도록 한다.
+    (빌려 간 커서가 남아 있을 수 있어 명시적으로 닫지 않고 참조가 사라질 때 정리되도록 둔다)
+    """
+    with DUCKDB_REMOTE_CACHE_LOCK:
+        urls = [url for url, cached in DUCKDB_REMOTE_CACHE.items() if str(cached) == str(path)]
+        for url in urls:
+            del DUCKDB_REMOTE_CACHE[url]
+
+    with CONNECTION_CACHE_LOCK:
+        for url in urls:
+            CONNECTION_POOLS.pop(url, None)
+    # 핸들의 SQL 템플릿은 폐기된 풀에서 만든 뷰를 참조하므로 함께 제거
+    with DATASET_HANDLES_LOCK:
+        stale_handles = [key for key in DATASET_HANDLES if key.split("|", 1)[0] in urls]
+        for key in stale_handles:
+            del DATASET_HANDLES[key]
+    if urls:
+        logger.info(f"🧹 원격 DuckDB 로컬 사본 제거로 캐시/커서 풀 폐기: {path.name}")
+
+
+tmp_quota.register_owner("duckdb_cache", _on_duckdb_copy_evicted)
+
+def _get_dataset_fingerprint(file_path: str) -> str:
+    """데이터셋 버전 fingerprint (파일 크기 + 수정 시각)
+
+    원격 DuckDB 파일은 로컬 캐시 사본 기준, 그 외 원격 파일은 URL 자체를 버전으로 사용한다.
+    """
+    path_str = str(file_path)
+    if path_str.startswith(('http://', 'https://')):
+        with DUCKDB_REMOTE_CACHE_LOCK:
+            local_copy = DUCKDB_REMOTE_CACHE.get(path_str)
+        if local_copy is None:
+            return f"url:{path_str}"
+        path_str = str(local_copy)
+
+    try:
+        stat = os.stat(path_str)
+    except OSError:
+        return "missing"
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
 # 편의 함수
 async def duckdb_search_large_file(file_path: str,
                                   keyword: Optional[str] = None,
@@ -1547,7 +2902,10 @@ async def duckdb_search_large_file(file_path: str,
                                   collect_results: bool = True,
                                   chunk_callback: Optional[Callable[[List[Dict[str, Any]], int], None]] = None,
                                   chunk_size: int = 1000,
-                                  required_fields: Optional[List[str]] = None) -> Dict[str, Any]:
+                                  required_fields: Optional[List[str]] = None,
+                                  cursor: Optional[str] = None,
+                                  batch_callback: Optional[Callable[["pa.RecordBatch", int], None]] = None,
+                                  match_mode: str = "exact") -> Dict[str, Any]:
     """DuckDB를 사용한 대용량 파일 검색 (편의 함수)
     
     Args:
@@ -1557,27 +2915,171 @@ async def duckdb_search_large_file(file_path: str,
         limit: 최대 결과 개수  
         offset: 결과 시작 위치
         filters: 추가 필터 조건
+        cursor: keyset 페이지네이션 커서 (이전 응답의 pagination.next_cursor)
+        batch_callback: collect_results=False일 때 pyarrow.RecordBatch 청크를 받는 콜백
+        match_mode: "exact"(부분 문자열 일치) 또는 "fuzzy"(오타/띄어쓰기 허용, 유사도순)
         
     Returns:
         Dict: 검색 결과
     """
+    fuzzy = match_mode == "fuzzy"
+    if fuzzy and not (collect_results and chunk_callback is None and batch_callback is None):
+        return {
+            "error": "fuzzy_streaming_unsupported",
+            "message": "퍼지 검색은 결과 수집(collect_results=True) 검색에서만 지원됩니다"
+        }
+
+    # 스트리밍(청크 콜백) 요청은 결과를 모으지 않으므로 캐시 대상에서 제외
+    cacheable = collect_results and chunk_callback is None
+    if cacheable:
+        dataset_key = str(file_path)
+        fingerprint = _get_dataset_fingerprint(dataset_key)
+        cache_key = query_result_cache.build_key(dataset_key, {
+            "keyword": keyword.strip() if isinstance(keyword, str) else keyword,
+            "search_field": search_field,
+            "limit": limit,
+            "page": page,
+            "filters": filters or {},
+            "category": category,
+            "subcategory": subcategory,
+            "result_type": result_type,
+            "required_fields": sorted(required_fields) if required_fields else None,
+            "cursor": cursor,
+            "match_mode": match_mode
+        })
+        cached = query_result_cache.get(cache_key, dataset_key, fingerprint)
+        if cached is not None:
+            logger.info(f"⚡ 검색 결과 캐시 적중: {Path(dataset_key).name} (keyword={keyword})")
+            response = dict(cached)
+            response["stats"] = {**cached.get("stats", {}), "cache_hit": True}
+            return response
+
+    async def _run_search() -> Dict[str, Any]:
+        processor = DuckDBProcessor(
+            file_path,
+            category=category,
+            subcategory=subcategory,
+            result_type=result_type,
+            required_fields=required_fields,
+        )
+        try:
+            if fuzzy:
+                try:
+                    result = await asyncio.to_thread(
+                        processor.search_fuzzy, keyword, search_field, limit, page, filters
+                    )
+                except ValueError as e:
+                    return {"error": "invalid_fuzzy_search", "message": str(e)}
+            else:
+                result = await processor.search_streaming(
+                    keyword,
+                    search_field,
+                    limit,
+                    page,
+                    filters,
+                    collect_results,
+                    chunk_callback,
+                    chunk_size,
+                    cursor,
+                    batch_callback
+                )
+        finally:
+            processor.close()
+
+        if cacheable and "error" not in result:
+            # 원격 DuckDB는 첫 검색에서 로컬 사본이 생기므로 실행 후 fingerprint로 저장
+            query_result_cache.put(cache_key, dataset_key, _get_dataset_fingerprint(dataset_key), result)
+        return result
+
+    if not cacheable:
+        return await _run_search()
+
+    # 같은 검색이 이미 실행 중이면 중복 스캔 없이 그 결과를 공유
+    result, coalesced = await inflight_searches.run(cache_key, _run_search)
+    if coalesced:
+        logger.info(f"🔗 실행 중인 동일 검색 결과 공유: {Path(dataset_key).name} (keyword={keyword})")
+        response = dict(result)
+        response["stats"] = {**result.get("stats", {}), "coalesced": True}
+        return response
+    return result
+
+
+async def duckdb_export_to_file(file_path: str,
+                                dest_path: str,
+                                file_format: str = "csv",
+                                keyword: Optional[str] = None,
+                                search_field: str = "all",
+                                filters: Optional[Dict[str, Any]] = None,
+                                category: str = None,
+                                subcategory: str = None,
+                                result_type: str = None,
+                                columns: Optional[List[str]] = None,
+                                column_aliases: Optional[Dict[str, str]] = None,
+                                limit: Optional[int] = None,
+                                cancel_event: Optional[Event] = None) -> Dict[str, Any]:
+    """검색 결과를 DuckDB COPY로 dest_path에 기록 (편의 함수)
+
+    Returns:
+        Dict: row_count, columns(헤더), file_size, processing_time
+    """
     processor = DuckDBProcessor(
         file_path,
         category=category,
         subcategory=subcategory,
         result_type=result_type,
-        required_fields=required_fields,
+        required_fields=columns,
     )
     try:
-        return await processor.search_streaming(
+        return await asyncio.to_thread(
+            processor.export_to_file,
+            dest_path,
+            file_format,
             keyword,
             search_field,
-            limit,
-            page,
             filters,
-            collect_results,
-            chunk_callback,
-            chunk_size
+            columns,
+            column_aliases,
+            limit,
+            cancel_event
         )
     finally:
         processor.close()
+
+
+async def duckdb_get_facets(file_path: str,
+                            keyword: Optional[str] = None,
+                            search_field: str = "all",
+                            filters: Optional[Dict[str, Any]] = None,
+                            category: str = None,
+                            subcategory: str = None,
+                            facet_fields: Optional[Dict[str, Any]] = None,
+                            top_n: int = FACET_TOP_N) -> Dict[str, Any]:
+    """검색 조건별 facet 건수 (편의 함수) - 검색 결과 캐시에 데이터셋 버전별로 저장"""
+    dataset_key = str(file_path)
+    cache_key = query_result_cache.build_key(dataset_key, {
+        "facets": True,
+        "keyword": keyword.strip() if isinstance(keyword, str) else keyword,
+        "search_field": search_field,
+        "filters": filters or {},
+        "category": category,
+        "subcategory": subcategory,
+        "facet_fields": facet_fields,
+        "top_n": top_n
+    })
+    cached = query_result_cache.get(cache_key, dataset_key, _get_dataset_fingerprint(dataset_key))
+    if cached is not None:
+        return {**cached, "cache_hit": True}
+
+    async def _run_facets() -> Dict[str, Any]:
+        processor = DuckDBProcessor(file_path, category=category, subcategory=subcategory)
+        try:
+            result = await asyncio.to_thread(
+                processor.get_facets, keyword, search_field, filters, facet_fields, top_n
+            )
+        finally:
+            processor.close()
+        query_result_cache.put(cache_key, dataset_key, _get_dataset_fingerprint(dataset_key), result)
+        return result
+
+    result, _ = await inflight_searches.run(cache_key, _run_facets)
+    return result
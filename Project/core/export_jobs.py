@@ -0,0 +1,317 @@
+"""
+백그라운드 내보내기 작업 큐
+대용량 다운로드가 API 요청을 붙잡지 않도록 작업을 접수만 하고 제한된 워커 풀에서 파일을 생성
+
+- 워커 수 제한 (EXPORT_JOB_WORKERS) - 쿼리/파일 기록은 각 생성 함수가 스레드에서 실행
+- 예상 행 수가 적은 작업 우선 처리 (같은 등급 안에서는 접수 순서)
+- 작업별 취소: 대기 중이면 바로 제거, 실행 중이면 DuckDB interrupt 또는 다음 배치에서 중단
+- 진행률/상태는 TempFileManager.update_file_status 필드로 기록 (job_id = temp_id)
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .duckdb_processor import duckdb_search_large_file
+from .file_generator import file_generator
+from .temp_file_manager import temp_file_manager
+from .tmp_quota import tmp_quota
+
+logger = logging.getLogger(__name__)
+
+EXPORT_JOB_FORMATS = ("xlsx", "csv", "parquet")
+
+# 작은 작업 기준 행 수 - 이하이면 큰 작업보다 먼저 처리
+EXPORT_JOB_SMALL_ROWS = max(1, int(os.getenv("EXPORT_JOB_SMALL_ROWS", "50000") or 50000))
+
+PRIORITY_SMALL = 0
+PRIORITY_LARGE = 1
+
+
+@dataclass
+class ExportJob:
+    """내보내기 작업"""
+    job_id: str
+    dataset_path: str
+    file_type: str
+    conditions: Dict[str, Any]
+    metadata: Dict[str, Any]
+    estimated_rows: Optional[int]
+    priority: int
+    seq: int
+    status: str = "queued"  # queued | processing | completed | failed | cancelled
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+
+class ExportJobQueue:
+    """우선순위 내보내기 작업 큐 + 제한된 워커 풀"""
+
+    def __init__(self, max_workers: int, small_job_rows: int = EXPORT_JOB_SMALL_ROWS):
+        self.max_workers = max_workers
+        self.small_job_rows = small_job_rows
+        self._jobs: Dict[str, ExportJob] = {}
+        self._seq = itertools.count()
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+
+    def _ensure_workers(self) -> None:
+        """첫 접수 시 현재 이벤트 루프에 워커 시작 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.PriorityQueue()
+            self._workers = []
+            for job in self._jobs.values():
+                if job.status == "queued":
+                    self._queue.put_nowait((job.priority, job.seq, job.job_id))
+
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.max_workers:
+            self._workers.append(
+                loop.create_task(self._worker(), name=f"export-worker-{len(self._workers)}")
+            )
+
+    async def _estimate_rows(self, dataset_path: str, conditions: Dict[str, Any]) -> Dict[str, Any]:
+        """결과 1건만 조회하여 전체 건수와 크기 추정용 샘플 확보"""
+        result = await duckdb_search_large_file(
+            file_path=dataset_path,
+            keyword=conditions.get("keyword"),
+            search_field=conditions.get("search_field") or "all",
+            limit=1,
+            filters=conditions.get("filters"),
+            category=conditions.get("category"),
+            subcategory=conditions.get("subcategory")
+        )
+        if result.get("error"):
+            raise RuntimeError(result.get("message") or "검색 실패")
+        return result
+
+    async def submit(self,
+                     dataset_path: str,
+                     file_type: str,
+                     conditions: Dict[str, Any],
+                     metadata: Optional[Dict[str, Any]] = None) -> ExportJob:
+        """작업 접수 - 임시 파일 공간을 예약하고 큐에 추가
+
+        conditions: category, subcategory, keyword, search_field, filters, limit
+        metadata: korean_field_mapping, download_fields
+        """
+        file_type = file_type.lower()
+        if file_type not in EXPORT_JOB_FORMATS:
+            raise ValueError(f"지원하지 않는 내보내기 형식입니다: {file_type} ({', '.join(EXPORT_JOB_FORMATS)})")
+
+        self._prune_finished()
+
+        sample = await self._estimate_rows(dataset_path, conditions)
+        estimated_rows = sample.get("pagination", {}).get("total_count")
+        limit = conditions.get("limit")
+        if estimated_rows is not None and limit:
+            estimated_rows = min(estimated_rows, limit)
+
+        # Parquet은 압축되므로 CSV 기준 추정치를 상한으로 사용
+        expected_size = file_generator.estimate_file_size(
+            sample.get("results") or [],
+            "csv" if file_type == "parquet" else file_type,
+            total_records=estimated_rows
+        )
+        expected_size = min(expected_size, tmp_quota.file_budget // 2) or None
+
+        job_id = temp_file_manager.generate_temp_id()
+        temp_file_manager.create_temp_file(job_id, file_type, expected_size=expected_size)
+
+        priority = PRIORITY_LARGE
+        if estimated_rows is not None and estimated_rows <= self.small_job_rows:
+            priority = PRIORITY_SMALL
+
+        job = ExportJob(
+            job_id=job_id,
+            dataset_path=dataset_path,
+            file_type=file_type,
+            conditions=conditions,
+            metadata=dict(metadata or {}, total_count=estimated_rows),
+            estimated_rows=estimated_rows,
+            priority=priority,
+            seq=next(self._seq)
+        )
+        self._jobs[job_id] = job
+        temp_file_manager.update_file_status(
+            job_id, "queued", progress=0, message="대기 중", total_count=estimated_rows
+        )
+
+        self._ensure_workers()
+        self._queue.put_nowait((job.priority, job.seq, job_id))
+        logger.info(
+            f"📥 내보내기 작업 접수: {job_id} ({file_type}, 예상 {estimated_rows if estimated_rows is not None else '?'}행, "
+            f"{'소형' if priority == PRIORITY_SMALL else '대형'})"
+        )
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            _, _, job_id = await self._queue.get()
+            try:
+                job = self._jobs.get(job_id)
+                if job is not None and job.status == "queued":
+                    await self._run(job)
+            except Exception as e:
+                logger.error(f"❌ 내보내기 워커 오류 ({job_id}): {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: ExportJob) -> None:
+        job.status = "processing"
+        job.started_at = time.time()
+        temp_file_manager.update_file_status(job.job_id, "processing", progress=0, message="파일 생성 시작")
+
+        def on_progress(progress: int, message: str = "", processed_count: Optional[int] = None) -> None:
+            if progress < 0:
+                return  # 실패는 아래에서 기록
+            temp_file_manager.update_file_status(
+                job.job_id, "processing",
+                progress=progress,
+                message=message,
+                processed_count=processed_count,
+                total_count=job.estimated_rows
+            )
+
+        file_generator.set_progress_callback(job.job_id, on_progress)
+        file_path = Path(temp_file_manager.get_file_info(job.job_id)["file_path"])
+        try:
+            if job.file_type == "xlsx":
+                result = await file_generator.generate_excel_streaming(
+                    job.dataset_path, job.job_id, file_path,
+                    job.conditions, job.metadata, cancel_event=job.cancel_event
+                )
+            else:
+                result = await file_generator.generate_with_copy(
+                    job.dataset_path, job.job_id, file_path, job.file_type,
+                    job.conditions, job.metadata, cancel_event=job.cancel_event
+                )
+        except Exception as e:
+            job.finished_at = time.time()
+            temp_file_manager.delete_temp_file(job.job_id)
+            if job.cancel_event.is_set():
+                job.status = "cancelled"
+                self._cancelled += 1
+                logger.info(f"🛑 내보내기 작업 취소됨: {job.job_id}")
+            else:
+                job.status = "failed"
+                job.error = str(e)
+                self._failed += 1
+                logger.error(f"❌ 내보내기 작업 실패: {job.job_id} - {e}")
+            return
+        finally:
+            file_generator.clear_progress_callback(job.job_id)
+
+        job.status = "completed"
+        job.result = result
+        job.finished_at = time.time()
+        self._completed += 1
+        row_count = result.get("row_count", 0)
+        temp_file_manager.update_file_status(
+            job.job_id, "completed",
+            size=os.path.getsize(file_path),
+            progress=100,
+            message=f"생성 완료 ({row_count:,}행)",
+            processed_count=row_count,
+            total_count=row_count
+        )
+        logger.info(f"✅ 내보내기 작업 완료: {job.job_id} ({row_count:,}행, {job.finished_at - job.started_at:.1f}초)")
+
+    def cancel(self, job_id: str) -> Optional[ExportJob]:
+        """작업 취소 - 대기 중이면 바로 취소, 실행 중이면 중단 요청 (작업이 없으면 None)"""
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+
+        job.cancel_event.set()
+        if job.status == "queued":
+            job.status = "cancelled"
+            job.finished_at = time.time()
+            self._cancelled += 1
+            temp_file_manager.delete_temp_file(job_id)
+            logger.info(f"🛑 대기 중인 내보내기 작업 취소: {job_id}")
+        return job
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        return self._jobs.get(job_id)
+
+    def queue_position(self, job: ExportJob) -> Optional[int]:
+        """대기 순번 (1부터, 대기 중이 아니면 None)"""
+        if job.status != "queued":
+            return None
+        key = (job.priority, job.seq)
+        return 1 + sum(
+            1 for other in self._jobs.values()
+            if other.status == "queued" and (other.priority, other.seq) < key
+        )
+
+    def describe(self, job: ExportJob) -> Dict[str, Any]:
+        """상태 조회 응답 (진행률 필드는 TempFileManager 기록 사용)"""
+        info = temp_file_manager.get_file_info(job.job_id) or {}
+        status = job.status
+        if status == "processing" and job.cancel_event.is_set():
+            status = "cancelling"
+        return {
+            "job_id": job.job_id,
+            "status": status,
+            "format": job.file_type,
+            "queue_position": self.queue_position(job),
+            "estimated_rows": job.estimated_rows,
+            "progress": info.get("progress", 100 if job.status == "completed" else 0),
+            "message": job.error or info.get("message"),
+            "processed_count": info.get("processed_count"),
+            "total_count": info.get("total_count"),
+            "estimated_time_remaining": info.get("estimated_time_remaining") if job.status == "processing" else None,
+            "size": info.get("size"),
+            "submitted_at": job.submitted_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at
+        }
+
+    def _prune_finished(self) -> None:
+        """임시 파일 보관 시간이 지난 완료 작업 기록 제거"""
+        cutoff = time.time() - temp_file_manager.max_file_age
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and (job.finished_at or 0) < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def stats(self) -> Dict[str, Any]:
+        statuses = [job.status for job in self._jobs.values()]
+        return {
+            "workers": self.max_workers,
+            "queued": statuses.count("queued"),
+            "processing": statuses.count("processing"),
+            "completed": self._completed,
+            "failed": self._failed,
+            "cancelled": self._cancelled,
+            "small_job_rows": self.small_job_rows
+        }
+
+
+# 전역 내보내기 작업 큐 (워커 수는 환경변수로 조정)
+export_job_queue = ExportJobQueue(
+    max_workers=max(1, int(os.getenv("EXPORT_JOB_WORKERS", "2") or 2))
+)
@@ -1,5 +1,5 @@
 """
-파일 생성 모듈 (Excel/CSV)
+파일 생성 모듈 (Excel/CSV/Parquet)
 검색 결과를 기반으로 다운로드 파일 생성
 """
 
@@ -9,11 +9,169 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 import asyncio
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.utils import get_column_letter
 # dataframe_to_rows removed with pandas
 from datetime import datetime
 import io
 import csv
+import threading
+
+from .duckdb_processor import duckdb_export_to_file, duckdb_search_large_file
+
+# DuckDB COPY로 직접 생성하는 형식 (검색 결과를 Python으로 옮기지 않음)
+COPY_EXPORT_FORMATS = ("csv", "parquet")
+
+# 스트리밍 XLSX 설정
+EXCEL_MAX_ROWS = 1048576  # 엑셀 시트당 최대 행 수 (헤더 포함)
+EXCEL_STREAM_BATCH_SIZE = 2000  # 검색 엔진에서 받는 행 배치 크기
+EXCEL_WIDTH_SAMPLE_ROWS = 200  # 열 너비 계산에 사용할 첫 배치 표본 행 수
+EXCEL_MAX_COLUMN_WIDTH = 50
+
+
+class StreamingExcelWriter:
+    """write-only 모드 XLSX 작성기
+
+    행 배치를 받는 즉시 시트 XML로 기록하므로 행 수와 무관하게 메모리 사용량이 일정하다.
+    - 헤더 스타일은 NamedStyle 하나를 공유 (셀마다 스타일 객체를 만들지 않음)
+    - 열 너비는 첫 배치의 표본 행으로 한 번만 계산
+    - 시트당 최대 행 수에 도달하면 새 시트("검색 결과 (2)" …)로 이어서 기록
+    """
+
+    def __init__(self,
+                 file_path: Path,
+                 columns: Optional[List[str]] = None,
+                 korean_field_mapping: Optional[Dict[str, str]] = None,
+                 metadata: Optional[Dict] = None,
+                 sheet_title: str = "검색 결과"):
+        self.file_path = file_path
+        self.columns = list(columns) if columns else None
+        self.korean_field_mapping = korean_field_mapping or {}
+        self.metadata = metadata
+        self.sheet_title = sheet_title
+        self.row_count = 0
+        self.sheet_count = 0
+
+        self.workbook = Workbook(write_only=True)
+        # 요약 시트는 맨 앞에 만들고 행 수가 확정되는 close()에서 기록
+        self._summary_ws = self.workbook.create_sheet("검색 요약") if metadata else None
+        self._header_style = NamedStyle(
+            name="datapage_header",
+            font=Font(bold=True, color="FFFFFF"),
+            fill=PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
+            alignment=Alignment(horizontal="center", vertical="center"),
+            border=Border(bottom=Side(style='thin'))
+        )
+        self.workbook.add_named_style(self._header_style)
+        self._ws = None
+        self._sheet_rows = 0
+        self._widths: Optional[List[float]] = None
+
+    @staticmethod
+    def _cell_value(value: Any) -> Any:
+        """엑셀 셀 값 변환 (배열 → 쉼표 문자열, 구조 → JSON, 엑셀 금지 제어문자 제거)"""
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value)
+        elif isinstance(value, dict):
+            value = json.dumps(value, ensure_ascii=False)
+        if isinstance(value, str):
+            return ILLEGAL_CHARACTERS_RE.sub("", value)
+        return value
+
+    def _compute_widths(self, sample: List[List[Any]]) -> None:
+        headers = [self.korean_field_mapping.get(column, column) for column in self.columns]
+        widths = [len(str(header)) for header in headers]
+        for row in sample[:EXCEL_WIDTH_SAMPLE_ROWS]:
+            for index, value in enumerate(row):
+                if value is not None:
+                    widths[index] = max(widths[index], len(str(value)))
+        self._widths = [min(width + 2, EXCEL_MAX_COLUMN_WIDTH) for width in widths]
+
+    def _finish_sheet(self) -> None:
+        if self._ws is not None and self._sheet_rows > 0:
+            last_cell = f"{get_column_letter(len(self.columns))}{self._sheet_rows + 1}"
+            self._ws.auto_filter.ref = f"A1:{last_cell}"
+
+    def _open_sheet(self) -> None:
+        """새 데이터 시트 생성 - 열 너비/틀 고정은 행 기록 전에 설정해야 함"""
+        self._finish_sheet()
+        self.sheet_count += 1
+        title = self.sheet_title if self.sheet_count == 1 else f"{self.sheet_title} ({self.sheet_count})"
+        self._ws = self.workbook.create_sheet(title)
+        for index, width in enumerate(self._widths, 1):
+            self._ws.column_dimensions[get_column_letter(index)].width = width
+        self._ws.freeze_panes = "A2"
+
+        header_cells = []
+        for column in self.columns:
+            cell = WriteOnlyCell(self._ws, value=self.korean_field_mapping.get(column, column))
+            cell.style = self._header_style.name
+            header_cells.append(cell)
+        self._ws.append(header_cells)
+        self._sheet_rows = 0
+
+    def write_batch(self, records: List[Dict[str, Any]]) -> None:
+        """행 배치 기록 (검색 엔진 chunk_callback에서 호출)"""
+        if not records:
+            return
+        if self._widths is None:
+            # 지정 컬럼 중 실제 결과에 있는 것만 사용 (없으면 결과 컬럼 순서)
+            first = records[0]
+            self.columns = [column for column in (self.columns or []) if column in first] or list(first.keys())
+
+        rows = [[self._cell_value(record.get(column)) for column in self.columns] for record in records]
+        if self._widths is None:
+            self._compute_widths(rows)
+        if self._ws is None:
+            self._open_sheet()
+
+        for row in rows:
+            if self._sheet_rows >= EXCEL_MAX_ROWS - 1:
+                self._open_sheet()
+            self._ws.append(row)
+            self._sheet_rows += 1
+        self.row_count += len(rows)
+
+    def close(self) -> int:
+        """요약 시트/자동 필터 마무리 후 저장하고 기록한 행 수 반환"""
+        if self._ws is None:
+            # 결과가 없어도 헤더만 있는 시트는 생성
+            self.columns = self.columns or []
+            self._widths = [len(str(self.korean_field_mapping.get(column, column))) + 2 for column in self.columns]
+            self._open_sheet()
+        self._finish_sheet()
+
+        if self._summary_ws is not None:
+            self._summary_ws.append(["DataPage 검색 결과 요약"])
+            self._summary_ws.append([])
+            self._summary_ws.append(["생성 일시:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
+            self._summary_ws.append(["총 데이터 수:", self.row_count])
+            if self.sheet_count > 1:
+                self._summary_ws.append(["시트 수:", self.sheet_count])
+            conditions = self.metadata.get("search_conditions") or {}
+            if conditions:
+                self._summary_ws.append([])
+                self._summary_ws.append(["검색 조건:"])
+                for key, value in conditions.items():
+                    if value:
+                        self._summary_ws.append([f"  {key}:", str(value)])
+
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.workbook.save(self.file_path)
+        return self.row_count
+
+    def discard(self) -> None:
+        """생성 중단 - 시트별 임시 XML 파일 정리 (저장하지 않음)"""
+        for ws in self.workbook.worksheets:
+            if ws._writer is None or ws.closed:
+                continue
+            try:
+                ws.close()
+                ws._writer.cleanup()
+            except Exception as e:
+                print(f"Excel 임시 시트 정리 실패: {e}")
 
 class FileGenerator:
     """파일 생성기"""
@@ -25,11 +183,18 @@ class FileGenerator:
         """진행률 콜백 설정"""
         self.progress_callbacks[temp_id] = callback
     
-    def _update_progress(self, temp_id: str, progress: int, message: str = ""):
-        """진행률 업데이트"""
+    def clear_progress_callback(self, temp_id: str):
+        """진행률 콜백 해제"""
+        self.progress_callbacks.pop(temp_id, None)
+    
+    def _update_progress(self, temp_id: str, progress: int, message: str = "", processed_count: int = None):
+        """진행률 업데이트 (처리 행 수를 아는 경우 processed_count도 전달)"""
         callback = self.progress_callbacks.get(temp_id)
         if callback:
-            callback(progress, message)
+            if processed_count is None:
+                callback(progress, message)
+            else:
+                callback(progress, message, processed_count=processed_count)
     
     async def generate_excel(self, 
                            data: List[Dict[str, Any]], 
@@ -283,6 +448,130 @@ class FileGenerator:
             self._update_progress(temp_id, -1, f"JSON 생성 실패: {str(e)}")
             return False
     
+    async def generate_with_copy(self,
+                                 dataset_path: str,
+                                 temp_id: str,
+                                 file_path: Path,
+                                 file_type: str,
+                                 conditions: Dict[str, Any],
+                                 metadata: Optional[Dict] = None,
+                                 cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """CSV/Parquet 파일을 DuckDB COPY로 생성 (TempFileManager 경로에 바로 기록)
+
+        conditions: category, subcategory, keyword, search_field, filters, limit
+        metadata: korean_field_mapping(헤더 alias), download_fields(출력 컬럼 순서)
+        """
+        file_type = file_type.lower()
+        if file_type not in COPY_EXPORT_FORMATS:
+            raise ValueError(f"COPY 생성을 지원하지 않는 형식입니다: {file_type}")
+
+        metadata = metadata or {}
+        self._update_progress(temp_id, 0, f"{file_type.upper()} 파일 생성 시작 (DuckDB COPY)")
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            result = await duckdb_export_to_file(
+                dataset_path,
+                str(file_path),
+                file_type,
+                keyword=conditions.get("keyword"),
+                search_field=conditions.get("search_field") or "all",
+                filters=conditions.get("filters"),
+                category=conditions.get("category"),
+                subcategory=conditions.get("subcategory"),
+                columns=metadata.get("download_fields") or None,
+                column_aliases=metadata.get("korean_field_mapping") or {},
+                limit=conditions.get("limit"),
+                cancel_event=cancel_event
+            )
+        except Exception as e:
+            self._update_progress(temp_id, -1, f"{file_type.upper()} 생성 실패: {str(e)}")
+            raise
+
+        self._update_progress(
+            temp_id, 100, f"{file_type.upper()} 파일 생성 완료 ({result['row_count']:,}행)",
+            processed_count=result["row_count"]
+        )
+        return result
+
+    async def generate_excel_streaming(self,
+                                       dataset_path: str,
+                                       temp_id: str,
+                                       file_path: Path,
+                                       conditions: Dict[str, Any],
+                                       metadata: Optional[Dict] = None,
+                                       cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """대용량 Excel 파일을 write-only 모드로 생성 (검색 엔진 행 배치를 받는 즉시 기록)
+
+        cancel_event가 설정되면 다음 배치에서 중단하고 예외를 발생시킨다.
+
+        conditions: category, subcategory, keyword, search_field, filters, limit
+        metadata: korean_field_mapping(헤더), download_fields(출력 컬럼 순서), search_conditions, total_count(진행률 계산용)
+        """
+        metadata = metadata or {}
+        total_count = metadata.get("total_count")
+        writer = StreamingExcelWriter(
+            file_path,
+            columns=metadata.get("download_fields") or None,
+            korean_field_mapping=metadata.get("korean_field_mapping") or {},
+            metadata=metadata
+        )
+        write_errors: List[Exception] = []
+
+        def on_chunk(records: List[Dict[str, Any]], total_processed: int) -> None:
+            # 쓰기 오류를 따로 보관해 검색 오류 메시지보다 원래 예외를 우선해 보고
+            try:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise RuntimeError("내보내기가 취소되었습니다")
+                writer.write_batch(records)
+            except Exception as e:
+                write_errors.append(e)
+                raise
+            if total_count:
+                progress = min(95, int(total_processed / total_count * 95))
+                message = f"Excel 행 기록 중 ({total_processed:,}/{total_count:,})"
+            else:
+                progress = 50
+                message = f"Excel 행 기록 중 ({total_processed:,}행)"
+            self._update_progress(temp_id, progress, message, processed_count=total_processed)
+
+        self._update_progress(temp_id, 0, "Excel 파일 생성 시작 (스트리밍)")
+        try:
+            search_result = await duckdb_search_large_file(
+                dataset_path,
+                keyword=conditions.get("keyword"),
+                search_field=conditions.get("search_field") or "all",
+                limit=conditions.get("limit") or None,
+                filters=conditions.get("filters"),
+                category=conditions.get("category"),
+                subcategory=conditions.get("subcategory"),
+                collect_results=False,
+                chunk_callback=on_chunk,
+                chunk_size=EXCEL_STREAM_BATCH_SIZE,
+                required_fields=metadata.get("download_fields") or None
+            )
+            if search_result.get("error"):
+                raise RuntimeError(search_result.get("message") or search_result["error"])
+            if write_errors:
+                raise write_errors[0]
+
+            self._update_progress(temp_id, 96, "Excel 파일 저장 중")
+            row_count = await asyncio.to_thread(writer.close)
+        except Exception as e:
+            print(f"Excel 스트리밍 생성 중 예외 발생 {temp_id}: {e}")
+            writer.discard()
+            self._update_progress(temp_id, -1, f"Excel 생성 실패: {str(e)}")
+            raise
+
+        file_size = file_path.stat().st_size if file_path.exists() else 0
+        print(f"Excel 스트리밍 저장 성공 {temp_id}: {row_count}행, 시트 {writer.sheet_count}개, 크기={file_size} bytes")
+        self._update_progress(temp_id, 100, "Excel 파일 생성 완료", processed_count=row_count)
+        return {
+            "row_count": row_count,
+            "sheet_count": writer.sheet_count,
+            "file_size": file_size
+        }
+
     def _process_data_for_excel(self, data: List[Dict[str, Any]], korean_field_mapping: Dict[str, str] = None) -> List[Dict[str, Any]]:
         """Excel 출력을 위한 데이터 전처리 (한글 필드명 적용)"""
         processed_data = []
@@ -0,0 +1,243 @@
+"""
+임시 파일/내보내기 작업 상태 저장소
+메모리 상태 테이블 + append-only 저널(NDJSON)로 진행률 갱신 비용을 작업 수와 무관하게 유지
+
+- 갱신은 메모리 레코드 한 건만 수정하고 변경 필드만 저널 대기열에 병합 (O(1))
+- 진행률 갱신은 flush_interval 단위로 모아서 한 번에 기록, 상태 전환은 즉시 기록
+- 다른 프로세스가 기록한 저널 끝부분을 조회 시 이어 읽어 반영 (파일 잠금으로 쓰기 직렬화)
+- 저널이 커지면 현재 상태 스냅샷으로 다시 써서 압축
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows 로컬 개발 환경 - 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+# 이 크기를 넘으면 저널 압축
+DEFAULT_COMPACT_BYTES = 1024 * 1024
+
+
+class JobStateStore:
+    """작업 상태 테이블 (temp_id -> 레코드)"""
+
+    def __init__(self, journal_path: Path, flush_interval: float = 1.0,
+                 compact_bytes: int = DEFAULT_COMPACT_BYTES):
+        self.journal_path = Path(journal_path)
+        self.lock_path = self.journal_path.with_suffix(".lock")
+        self.flush_interval = flush_interval
+        self.compact_bytes = compact_bytes
+
+        self._records: Dict[str, Dict[str, Any]] = {}
+        # 아직 기록하지 않은 변경 (temp_id -> 변경 필드, None이면 삭제)
+        self._pending: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._last_flush = 0.0
+        self._flushes = 0
+        self._lines_written = 0
+        self._compactions = 0
+
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._refresh()
+
+    # ---- 저널 읽기 ----
+
+    def _apply_line(self, line: str) -> None:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return  # 기록 중 중단된 마지막 줄
+        temp_id = entry.get("id")
+        if not temp_id:
+            return
+        if entry.get("del"):
+            self._records.pop(temp_id, None)
+        else:
+            self._records.setdefault(temp_id, {}).update(entry.get("set") or {})
+
+    def _refresh(self) -> None:
+        """다른 프로세스가 추가한 저널 끝부분 반영 (lock 보유 상태에서 호출)"""
+        try:
+            stat = os.stat(self.journal_path)
+        except FileNotFoundError:
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # 압축으로 파일이 교체됨 - 처음부터 다시 읽음
+            self._records = {}
+            self._offset = 0
+            self._inode = stat.st_ino
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.journal_path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        # 아직 줄바꿈이 기록되지 않은 마지막 줄은 다음 조회에서 읽음
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].decode("utf-8", errors="ignore").splitlines():
+            if line:
+                self._apply_line(line)
+        self._offset += complete
+
+        # 아직 기록하지 않은 이 프로세스의 변경이 우선
+        for temp_id, fields in self._pending.items():
+            if fields is None:
+                self._records.pop(temp_id, None)
+            else:
+                self._records.setdefault(temp_id, {}).update(fields)
+
+    # ---- 조회 ----
+
+    def get(self, temp_id: str) -> Optional[Dict[str, Any]]:
+        """레코드 사본 조회 (없으면 None)"""
+        with self._lock:
+            self._refresh()
+            record = self._records.get(temp_id)
+            return dict(record) if record is not None else None
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """전체 레코드 사본 목록"""
+        with self._lock:
+            self._refresh()
+            return [(temp_id, dict(record)) for temp_id, record in self._records.items()]
+
+    def __contains__(self, temp_id: str) -> bool:
+        with self._lock:
+            self._refresh()
+            return temp_id in self._records
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    # ---- 갱신 ----
+
+    def put(self, temp_id: str, record: Dict[str, Any]) -> None:
+        """새 레코드 등록 (즉시 기록)"""
+        with self._lock:
+            self._records[temp_id] = dict(record)
+            self._pending[temp_id] = dict(record)
+            self._flush_locked()
+
+    def update(self, temp_id: str, fields: Dict[str, Any], flush: bool = False) -> bool:
+        """레코드 필드 갱신 - flush=False면 flush_interval마다 모아서 기록"""
+        with self._lock:
+            record = self._records.get(temp_id)
+            if record is None:
+                self._refresh()
+                record = self._records.get(temp_id)
+                if record is None:
+                    return False
+            record.update(fields)
+            pending = self._pending.get(temp_id)
+            if pending is None:
+                self._pending[temp_id] = dict(fields)
+            else:
+                pending.update(fields)
+
+            if flush or time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_locked()
+            return True
+
+    def delete(self, temp_id: str) -> bool:
+        """레코드 삭제 (즉시 기록)"""
+        with self._lock:
+            existed = self._records.pop(temp_id, None) is not None
+            self._pending[temp_id] = None
+            self._flush_locked()
+            return existed
+
+    def flush(self) -> None:
+        """대기 중인 변경 기록"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+
+        lines = []
+        for temp_id, fields in self._pending.items():
+            entry = {"id": temp_id, "del": True} if fields is None else {"id": temp_id, "set": fields}
+            lines.append(json.dumps(entry, ensure_ascii=False, default=str))
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+        try:
+            with self._file_lock():
+                # 먼저 다른 프로세스의 기록을 반영한 뒤 이어서 기록
+                self._refresh()
+                with open(self.journal_path, "ab") as f:
+                    if f.tell() > self._offset:
+                        # 잠금 중인데 줄바꿈 없는 끝부분이 남음 - 기록 도중 종료된 프로세스의 줄을 끝내고 이어 씀
+                        payload = b"\n" + payload
+                    f.write(payload)
+                    end = f.tell()
+                    self._inode = os.fstat(f.fileno()).st_ino
+                self._offset = end
+                self._pending.clear()
+                self._flushes += 1
+                self._lines_written += len(lines)
+
+                if end > self.compact_bytes:
+                    self._compact_locked()
+        except OSError as e:
+            print(f"작업 상태 저널 기록 실패: {e}")
+
+    def _compact_locked(self) -> None:
+        """현재 상태 스냅샷으로 저널 교체 (파일 잠금 보유 상태에서 호출)"""
+        tmp_path = self.journal_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            for temp_id, record in self._records.items():
+                line = json.dumps({"id": temp_id, "set": record}, ensure_ascii=False, default=str)
+                f.write((line + "\n").encode("utf-8"))
+            end = f.tell()
+        os.replace(tmp_path, self.journal_path)
+        self._inode = os.stat(self.journal_path).st_ino
+        self._offset = end
+        self._compactions += 1
+
+    def _file_lock(self):
+        return _FileLock(self.lock_path)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "records": len(self._records),
+                "pending": len(self._pending),
+                "journal_bytes": self._offset,
+                "flushes": self._flushes,
+                "lines_written": self._lines_written,
+                "compactions": self._compactions
+            }
+
+
+class _FileLock:
+    """프로세스 간 저널 쓰기 잠금 (fcntl이 없으면 생략)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+        return False
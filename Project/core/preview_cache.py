@@ -16,6 +16,8 @@ import hashlib
 import gzip
 import pickle
 
+from .tmp_quota import tmp_quota
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -88,6 +90,7 @@ class PreviewCacheManager:
             if datetime.now() - cache.updated_at > self.cache_ttl:
                 logger.info(f"캐시 만료: {file_path.name}")
                 cache_path.unlink()  # 만료된 캐시 삭제
+                tmp_quota.discard(cache_path)
                 return None
             
             # 파일 변경 검사
@@ -95,8 +98,10 @@ class PreviewCacheManager:
             if cache.file_hash != current_hash:
                 logger.info(f"파일 변경 감지: {file_path.name}")
                 cache_path.unlink()  # 변경된 파일 캐시 삭제
+                tmp_quota.discard(cache_path)
                 return None
             
+            tmp_quota.touch(cache_path)
             logger.info(f"캐시 적중: {file_path.name} ({cache.total_records:,}개 레코드)")
             return cache
             
@@ -104,6 +109,7 @@ class PreviewCacheManager:
             logger.warning(f"캐시 로드 실패: {e}")
             if cache_path.exists():
                 cache_path.unlink()
+            tmp_quota.discard(cache_path)
             return None
     
     async def create_preview_cache(self, file_path: Path, 
@@ -206,6 +212,8 @@ class PreviewCacheManager:
             pickled_data = pickle.dumps(cache_data)
             compressed_data = gzip.compress(pickled_data)
             
+            # cache_dir가 /tmp 하위일 때만 공용 예산에서 공간 예약 (그 외 경로는 무시됨)
+            tmp_quota.reserve(cache_path, len(compressed_data), "preview")
             async with aiofiles.open(cache_path, 'wb') as f:
                 await f.write(compressed_data)
             
@@ -248,6 +256,7 @@ class PreviewCacheManager:
                 decompressed = gzip.decompress(content)
                 search_index = pickle.loads(decompressed)
                 
+                tmp_quota.touch(index_path)
                 logger.info(f"검색 인덱스 로드: {index_path.name}")
                 return search_index
                 
@@ -292,6 +301,7 @@ class PreviewCacheManager:
             pickled_data = pickle.dumps(search_index)
             compressed_data = gzip.compress(pickled_data)
             
+            tmp_quota.reserve(index_path, len(compressed_data), "preview")
             async with aiofiles.open(index_path, 'wb') as f:
                 await f.write(compressed_data)
             
@@ -336,11 +346,13 @@ class PreviewCacheManager:
             for cache_file in self.cache_dir.glob("*.cache"):
                 if cache_file.stat().st_mtime < cutoff_time.timestamp():
                     cache_file.unlink()
+                    tmp_quota.discard(cache_file)
                     cleaned_count += 1
             
             for index_file in self.index_dir.glob("*.idx"):
                 if index_file.stat().st_mtime < cutoff_time.timestamp():
                     index_file.unlink()
+                    tmp_quota.discard(index_file)
                     cleaned_count += 1
             
             if cleaned_count > 0:
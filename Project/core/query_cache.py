@@ -0,0 +1,239 @@
+"""
+검색 결과 캐시
+동일한 검색 요청(데이터셋 + 검색 조건)의 DuckDB 결과를 메모리에 보관하여 재사용
+
+- 키: 정규화된 요청 + 데이터셋 버전 fingerprint (파일 크기/수정 시각)
+- 메모리 바이트 예산 기반 LRU 제거 + TTL 만료
+- 데이터셋 파일이 교체되면 fingerprint가 바뀌어 해당 데이터셋 항목 자동 무효화
+- 캐시에 아직 없는 동일 요청이 실행 중이면 새로 실행하지 않고 그 결과를 공유 (single-flight)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목"""
+    dataset_key: str
+    fingerprint: str
+    value: Dict[str, Any]
+    size_bytes: int
+    expires_at: float
+
+
+class QueryResultCache:
+    """바이트 예산 LRU + TTL 검색 결과 캐시"""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float, max_entry_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # 단일 항목이 예산 대부분을 차지하지 않도록 항목당 상한 설정
+        self.max_entry_bytes = max_entry_bytes or max(1, max_bytes // 8)
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._dataset_versions: Dict[str, str] = {}
+        self._lock = Lock()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def build_key(dataset_key: str, request: Dict[str, Any]) -> str:
+        """요청 파라미터를 정규화하여 캐시 키 생성 (버전은 항목의 fingerprint로 검증)"""
+        canonical = json.dumps(
+            [dataset_key, request],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha1(canonical.encode('utf-8', errors='ignore')).hexdigest()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+
+    def _check_version(self, dataset_key: str, fingerprint: str) -> None:
+        """데이터셋 버전이 바뀌었으면 해당 데이터셋 항목 전체 제거 (lock 보유 상태에서 호출)"""
+        previous = self._dataset_versions.get(dataset_key)
+        if previous == fingerprint:
+            return
+
+        self._dataset_versions[dataset_key] = fingerprint
+        if previous is None:
+            return
+
+        stale_keys = [key for key, entry in self._entries.items() if entry.dataset_key == dataset_key]
+        for key in stale_keys:
+            self._remove(key)
+        self._invalidations += 1
+        logger.info(f"🔄 데이터셋 변경 감지 - 검색 캐시 {len(stale_keys)}건 무효화: {dataset_key}")
+
+    def get(self, key: str, dataset_key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (만료/버전 불일치 시 None)"""
+        now = time.monotonic()
+        with self._lock:
+            self._check_version(dataset_key, fingerprint)
+            entry = self._entries.get(key)
+            if entry is None or entry.fingerprint != fingerprint:
+                self._misses += 1
+                return None
+            if entry.expires_at <= now:
+                self._remove(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(self, key: str, dataset_key: str, fingerprint: str, value: Dict[str, Any]) -> bool:
+        """캐시 저장 - 항목 크기가 상한을 넘으면 저장하지 않음"""
+        try:
+            size_bytes = len(json.dumps(value, ensure_ascii=False, default=str).encode('utf-8'))
+        except (TypeError, ValueError) as e:
+            logger.debug(f"검색 캐시 크기 계산 실패: {e}")
+            return False
+
+        if size_bytes > self.max_entry_bytes:
+            return False
+
+        with self._lock:
+            self._check_version(dataset_key, fingerprint)
+            self._remove(key)
+            self._entries[key] = CacheEntry(
+                dataset_key=dataset_key,
+                fingerprint=fingerprint,
+                value=value,
+                size_bytes=size_bytes,
+                expires_at=time.monotonic() + self.ttl_seconds
+            )
+            self._total_bytes += size_bytes
+
+            # 바이트 예산 초과 시 가장 오래 사용하지 않은 항목부터 제거
+            while self._total_bytes > self.max_bytes and self._entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+        return True
+
+    def invalidate(self, dataset_key: Optional[str] = None) -> int:
+        """특정 데이터셋(또는 전체) 캐시 제거"""
+        with self._lock:
+            if dataset_key is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._dataset_versions.clear()
+                self._total_bytes = 0
+                return removed
+
+            stale_keys = [key for key, entry in self._entries.items() if entry.dataset_key == dataset_key]
+            for key in stale_keys:
+                self._remove(key)
+            self._dataset_versions.pop(dataset_key, None)
+            return len(stale_keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률 및 메모리 사용량 통계"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations
+            }
+
+
+class _LeaderCancelled(Exception):
+    """선행 요청이 취소됨 - 대기 중이던 요청은 직접 다시 실행"""
+
+
+class InflightSearches:
+    """동일 검색 요청 single-flight
+
+    같은 키의 검색이 이미 실행 중이면 중복 스캔 대신 실행 중인 요청의 future를 기다려
+    결과를 공유한다. 선행 요청이 취소되면 대기 요청 중 하나가 다시 실행한다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._lock = Lock()
+        self._leaders = 0
+        self._coalesced = 0
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """factory 실행 결과와 공유 여부(True면 다른 요청의 결과를 받음) 반환"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                future = self._inflight.get(key)
+                # 다른 이벤트 루프의 future는 await할 수 없으므로 공유하지 않음
+                leader = future is None or future.done() or future.get_loop() is not loop
+                if leader:
+                    future = loop.create_future()
+                    self._inflight[key] = future
+                    self._leaders += 1
+                else:
+                    self._coalesced += 1
+
+            if leader:
+                break
+            try:
+                return await asyncio.shield(future), True
+            except _LeaderCancelled:
+                continue
+
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()  # 대기자가 없을 때 'exception was never retrieved' 경고 방지
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "inflight": len(self._inflight),
+                "executed": self._leaders,
+                "coalesced": self._coalesced
+            }
+
+
+# 전역 검색 결과 캐시 (환경변수로 예산/TTL 조정)
+query_result_cache = QueryResultCache(
+    max_bytes=int(os.getenv("QUERY_CACHE_MAX_MB", "64") or 64) * 1024 * 1024,
+    ttl_seconds=float(os.getenv("QUERY_CACHE_TTL_SECONDS", "300") or 300)
+)
+
+# 실행 중인 동일 검색 공유 (캐시 키와 같은 키 사용)
+inflight_searches = InflightSearches()
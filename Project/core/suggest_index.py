@@ -0,0 +1,324 @@
+"""
+검색어 자동완성(typeahead) 인덱스
+업체명/모델명/제품명의 정규화된 distinct 값을 정렬된 배열로 파일에 기록하고 mmap으로 조회
+
+- 키: NFKC + 소문자화 후 공백 제거 (띄어쓰기 차이 무시), 단어 시작 위치와 법인 표기 제거 변형도 키로 추가
+- 접두어 조회: 정렬된 UTF-8 키 배열에서 이진 탐색으로 [lo, hi) 범위 계산
+- 순위: 값별 건수(빈도) 내림차순 - 범위가 넓으면 빈도순 순열을 따라가며 범위 안의 키만 선택
+- 파일은 데이터셋 fingerprint별로 /tmp에 생성되어 재시작/다른 워커 프로세스에서도 재사용 (tmp_quota 관리)
+
+파일 구조 (native uint32, 헤더 뒤 배열은 모두 4바이트 정렬):
+    header      magic(8) n_keys n_values keys_bytes values_bytes
+    key_offsets[n_keys + 1], key_value_ids[n_keys], key_counts[n_keys], key_by_frequency[n_keys]
+    value_offsets[n_values + 1], value_counts[n_values]
+    keys_blob, values_blob
+"""
+
+import hashlib
+import heapq
+import logging
+import mmap
+import os
+import re
+import struct
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .tmp_quota import TmpQuotaExceeded, tmp_quota
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_INDEX_ROOT = Path("/tmp/datapage_suggest")
+SUGGEST_INDEX_MAGIC = b"DPSUGG01"
+_HEADER = struct.Struct("=8sIIII")
+
+# 접두어 범위가 이 수 이하이면 범위를 직접 훑고, 넘으면 빈도순 순열을 따라감
+SUGGEST_SCAN_LIMIT = 20000
+# 값 하나에서 만드는 단어 시작 키 최대 수
+SUGGEST_MAX_TOKEN_KEYS = 4
+
+_TOKEN_SEPARATORS = re.compile(r"[\s()\[\],/·\-_.]+")
+# NFKC 후 '㈜'는 '(주)'가 됨
+_CORPORATE_MARKERS = ("주식회사", "(주)", "(유)", "유한회사", "(사)", "사단법인")
+
+
+def normalize_suggest_key(text: str) -> str:
+    """자동완성 키 정규화 - 검색어 정규화(NFKC + 소문자화)와 같고 공백만 추가로 제거"""
+    return "".join(ch for ch in unicodedata.normalize("NFKC", text).lower() if not ch.isspace())
+
+
+def _keys_for_value(display: str) -> List[str]:
+    """값 하나에서 접두어 조회용 키 목록 생성 (전체, 법인 표기 제거, 단어 시작 위치)"""
+    normalized = unicodedata.normalize("NFKC", display).lower()
+    stripped = normalized
+    for marker in _CORPORATE_MARKERS:
+        stripped = stripped.replace(marker, " ")
+
+    variants = [normalized, stripped]
+    starts = [match.end() for match in _TOKEN_SEPARATORS.finditer(stripped)]
+    variants.extend(stripped[start:] for start in starts[:SUGGEST_MAX_TOKEN_KEYS])
+
+    keys: List[str] = []
+    for variant in variants:
+        key = "".join(ch for ch in variant if not ch.isspace())
+        if variant is not normalized:
+            key = key.strip("()[],/·-_.")
+        if key and key not in keys:
+            keys.append(key)
+    return keys
+
+
+class SuggestIndex:
+    """정렬된 접두어 인덱스 (mmap 또는 메모리 버퍼)"""
+
+    def __init__(self, buffer, path: Optional[Path] = None):
+        self.path = path
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, n_keys, n_values, keys_bytes, values_bytes = _HEADER.unpack_from(view, 0)
+        if magic != SUGGEST_INDEX_MAGIC:
+            raise ValueError("자동완성 인덱스 형식이 올바르지 않습니다")
+
+        position = _HEADER.size
+
+        def take(count: int) -> memoryview:
+            nonlocal position
+            section = view[position:position + count * 4].cast("I")
+            position += count * 4
+            return section
+
+        self.key_offsets = take(n_keys + 1)
+        self.key_value_ids = take(n_keys)
+        self.key_counts = take(n_keys)
+        self.key_by_frequency = take(n_keys)
+        self.value_offsets = take(n_values + 1)
+        self.value_counts = take(n_values)
+        self.keys_blob = view[position:position + keys_bytes]
+        position += keys_bytes
+        self.values_blob = view[position:position + values_bytes]
+        self.n_keys = n_keys
+        self.n_values = n_values
+
+    @classmethod
+    def open(cls, path: Path) -> "SuggestIndex":
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, path)
+
+    @staticmethod
+    def encode(entries: Iterable[Tuple[str, int]]) -> bytes:
+        """(표시 값, 건수) 목록을 인덱스 바이트로 직렬화"""
+        merged: Dict[str, int] = {}
+        for display, count in entries:
+            if isinstance(display, str) and display.strip():
+                merged[display] = merged.get(display, 0) + int(count)
+        values = sorted(merged.items(), key=lambda item: (-item[1], item[0]))
+
+        pairs: List[Tuple[bytes, int]] = []
+        for value_id, (display, _) in enumerate(values):
+            for key in _keys_for_value(display):
+                pairs.append((key.encode("utf-8"), value_id))
+        pairs.sort()
+
+        key_offsets = array("I", [0])
+        key_value_ids = array("I")
+        key_counts = array("I")
+        keys_blob = bytearray()
+        for key, value_id in pairs:
+            keys_blob += key
+            key_offsets.append(len(keys_blob))
+            key_value_ids.append(value_id)
+            key_counts.append(min(values[value_id][1], 0xFFFFFFFF))
+        key_by_frequency = array("I", sorted(range(len(pairs)), key=lambda index: -key_counts[index]))
+
+        value_offsets = array("I", [0])
+        value_counts = array("I")
+        values_blob = bytearray()
+        for display, count in values:
+            values_blob += display.encode("utf-8")
+            value_offsets.append(len(values_blob))
+            value_counts.append(min(count, 0xFFFFFFFF))
+
+        header = _HEADER.pack(SUGGEST_INDEX_MAGIC, len(pairs), len(values), len(keys_blob), len(values_blob))
+        return b"".join([
+            header,
+            key_offsets.tobytes(), key_value_ids.tobytes(), key_counts.tobytes(), key_by_frequency.tobytes(),
+            value_offsets.tobytes(), value_counts.tobytes(),
+            bytes(keys_blob), bytes(values_blob)
+        ])
+
+    def _key(self, index: int) -> bytes:
+        return self.keys_blob[self.key_offsets[index]:self.key_offsets[index + 1]].tobytes()
+
+    def _lower_bound(self, target: bytes) -> int:
+        lo, hi = 0, self.n_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """정규화된 접두어로 시작하는 키 범위 [lo, hi)"""
+        encoded = normalize_suggest_key(prefix).encode("utf-8")
+        # 0xFF는 UTF-8에 나타나지 않으므로 접두어 다음 위치의 상한으로 사용
+        return self._lower_bound(encoded), self._lower_bound(encoded + b"\xff")
+
+    def value(self, value_id: int) -> str:
+        return self.values_blob[self.value_offsets[value_id]:self.value_offsets[value_id + 1]].tobytes().decode("utf-8")
+
+    def suggest(self, prefix: str, limit: int = 10) -> Tuple[List[Dict[str, Any]], int]:
+        """접두어 자동완성 (빈도순 상위 limit개, 범위 내 키 수)"""
+        lo, hi = self.prefix_range(prefix)
+        if lo >= hi:
+            return [], 0
+
+        chosen: Dict[int, int] = {}
+        if hi - lo <= SUGGEST_SCAN_LIMIT:
+            for index in range(lo, hi):
+                chosen[self.key_value_ids[index]] = self.key_counts[index]
+            ranked = heapq.nlargest(limit, chosen.items(), key=lambda item: (item[1], -item[0]))
+        else:
+            # 넓은 범위 - 빈도순으로 훑다가 범위 안의 값이 limit개 모이면 중단
+            for index in self.key_by_frequency:
+                if lo <= index < hi:
+                    value_id = self.key_value_ids[index]
+                    if value_id not in chosen:
+                        chosen[value_id] = self.key_counts[index]
+                        if len(chosen) >= limit:
+                            break
+            ranked = list(chosen.items())
+
+        return [{"value": self.value(value_id), "count": count} for value_id, count in ranked], hi - lo
+
+
+class SuggestIndexCache:
+    """(데이터셋, 검색 필드)별 열린 인덱스 캐시"""
+
+    def __init__(self, max_entries: int, root: Path = SUGGEST_INDEX_ROOT):
+        self.max_entries = max_entries
+        self.root = root
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, SuggestIndex]]" = OrderedDict()
+        self._build_locks: Dict[Tuple[str, str], Lock] = {}
+        self._lock = Lock()
+        self._hits = 0
+        self._builds = 0
+        self._reused_files = 0
+        tmp_quota.register_owner("suggest", self._on_evicted)
+
+    def _index_path(self, dataset_key: str, fingerprint: str, search_field: str) -> Path:
+        digest = hashlib.sha1(f"{dataset_key}|{fingerprint}|{search_field}".encode("utf-8")).hexdigest()[:20]
+        return self.root / f"{digest}.sidx"
+
+    def _lookup(self, key: Tuple[str, str], fingerprint: str) -> Optional[SuggestIndex]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None or cached[0] != fingerprint:
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return cached[1]
+
+    def get_or_build(self, dataset_key: str, fingerprint: str, search_field: str,
+                     source: Callable[[], Iterable[Tuple[str, int]]]) -> SuggestIndex:
+        """인덱스 조회 - 없으면 같은 버전의 파일을 열고, 파일도 없으면 source 값으로 생성"""
+        key = (dataset_key, search_field)
+        index = self._lookup(key, fingerprint)
+        if index is not None:
+            return index
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, Lock())
+        with build_lock:
+            index = self._lookup(key, fingerprint)
+            if index is not None:
+                return index
+
+            path = self._index_path(dataset_key, fingerprint, search_field)
+            index = self._open_existing(path)
+            if index is None:
+                index = self._build(path, search_field, source)
+
+            with self._lock:
+                self._entries[key] = (fingerprint, index)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    evicted_key, _ = self._entries.popitem(last=False)
+                    self._build_locks.pop(evicted_key, None)
+        if index.path is not None:
+            tmp_quota.touch(index.path)
+        return index
+
+    def _open_existing(self, path: Path) -> Optional[SuggestIndex]:
+        if not path.exists():
+            return None
+        try:
+            index = SuggestIndex.open(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"자동완성 인덱스 파일 재사용 실패 ({path.name}): {e}")
+            return None
+        tmp_quota.commit(path, owner="suggest")
+        self._reused_files += 1
+        return index
+
+    def _build(self, path: Path, search_field: str, source: Callable[[], Iterable[Tuple[str, int]]]) -> SuggestIndex:
+        start_time = time.time()
+        payload = SuggestIndex.encode(source())
+        self._builds += 1
+
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_quota.reserve(path, len(payload), "suggest")
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            tmp_quota.commit(path)
+            index = SuggestIndex.open(path)
+        except (OSError, TmpQuotaExceeded) as e:
+            # /tmp 여유가 없으면 메모리 버퍼로만 사용
+            tmp_quota.discard(path)
+            logger.warning(f"자동완성 인덱스 파일 저장 실패 - 메모리에서 사용: {e}")
+            index = SuggestIndex(payload)
+
+        logger.info(
+            f"🔤 자동완성 인덱스 생성: {search_field} ({index.n_values:,}개 값, {index.n_keys:,}개 키, "
+            f"{len(payload) / 1024:.0f}KB, {time.time() - start_time:.3f}초)"
+        )
+        return index
+
+    def _on_evicted(self, path: Path) -> None:
+        """tmp_quota가 인덱스 파일을 제거하면 캐시에서도 제외 (열린 mmap은 참조가 사라질 때 해제)"""
+        with self._lock:
+            stale = [key for key, (_, index) in self._entries.items() if index.path == path]
+            for key in stale:
+                del self._entries[key]
+
+    def invalidate(self) -> int:
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "indexes": len(self._entries),
+                "max_indexes": self.max_entries,
+                "hits": self._hits,
+                "builds": self._builds,
+                "reused_files": self._reused_files
+            }
+
+
+# 전역 자동완성 인덱스 캐시
+suggest_indexes = SuggestIndexCache(
+    max_entries=max(1, int(os.getenv("SUGGEST_INDEX_MAX_OPEN", "32") or 32))
+)
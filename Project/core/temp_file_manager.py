@@ -1,6 +1,7 @@
 """
 Vercel 서버리스 환경의 임시 파일 관리 모듈
-512MB /tmp 제한 대응
+512MB /tmp 제한 대응 (공간 확보는 /tmp 공용 예산 tmp_quota를 통해 수행)
+파일 상태/진행률은 JobStateStore(메모리 + append-only 저널)에 기록
 """
 
 import os
@@ -13,6 +14,15 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import shutil
 
+from .job_state import JobStateStore
+from .tmp_quota import TmpQuotaExceeded, tmp_quota
+
+# 크기를 미리 알 수 없는 내보내기 파일의 기본 예약 크기
+DEFAULT_RESERVATION_BYTES = 50 * 1024 * 1024
+
+# 진행률 갱신을 모아서 기록하는 간격 (상태 전환은 즉시 기록)
+JOB_STATE_FLUSH_SECONDS = float(os.getenv("JOB_STATE_FLUSH_SECONDS", "1.0") or 1.0)
+
 class TempFileManager:
     """임시 파일 관리자"""
     
@@ -20,32 +30,42 @@ class TempFileManager:
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
         
-        # 활성 파일 추적
-        self.active_files: Dict[str, Dict] = {}
         self.max_file_age = 3600  # 1시간
         self.max_total_size = 400 * 1024 * 1024  # 400MB (여유분 확보)
         
-        # 메타데이터 파일
+        # 활성 파일 상태 (같은 /tmp를 쓰는 다른 워커 프로세스와 저널로 공유)
+        self.state = JobStateStore(self.base_dir / "metadata.journal", flush_interval=JOB_STATE_FLUSH_SECONDS)
         self.metadata_file = self.base_dir / "metadata.json"
-        self._load_metadata()
+        self._migrate_metadata()
+
+        # 생성 중인 파일은 tmp_quota 제거 대상에서 제외 (완료/실패 시 해제)
+        self._pinned: set = set()
+        tmp_quota.register_owner("export", self._on_quota_evicted)
+        for temp_id, file_info in self.state.items():
+            if Path(file_info["file_path"]).exists():
+                tmp_quota.commit(file_info["file_path"], owner="export")
+            elif file_info.get("status") == "completed":
+                # 프로세스가 내려가 있는 동안 삭제된 완료 파일 - 다운로드할 수 없으므로 레코드 정리
+                self.state.delete(temp_id)
     
-    def _load_metadata(self):
-        """메타데이터 로드"""
-        try:
-            if self.metadata_file.exists():
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    self.active_files = json.load(f)
-        except Exception as e:
-            print(f"메타데이터 로드 실패: {e}")
-            self.active_files = {}
+    @property
+    def active_files(self) -> Dict[str, Dict]:
+        """활성 파일 상태 스냅샷 (사본)"""
+        return dict(self.state.items())
     
-    def _save_metadata(self):
-        """메타데이터 저장"""
+    def _migrate_metadata(self):
+        """이전 버전의 metadata.json을 저널로 옮긴 뒤 삭제"""
+        if not self.metadata_file.exists():
+            return
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(self.active_files, f, ensure_ascii=False, indent=2)
+            with open(self.metadata_file, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+            for temp_id, file_info in legacy.items():
+                if temp_id not in self.state:
+                    self.state.put(temp_id, file_info)
+            self.metadata_file.unlink()
         except Exception as e:
-            print(f"메타데이터 저장 실패: {e}")
+            print(f"메타데이터 이전 실패: {e}")
     
     def generate_temp_id(self, user_session: str = None) -> str:
         """임시 파일 ID 생성"""
@@ -57,61 +77,75 @@ class TempFileManager:
         
         return temp_id
     
-    def create_temp_file(self, temp_id: str, file_type: str = "xlsx") -> Path:
-        """임시 파일 생성"""
+    def create_temp_file(self, temp_id: str, file_type: str = "xlsx", expected_size: int = None) -> Path:
+        """임시 파일 생성 - /tmp 공용 예산에서 예상 크기만큼 공간 예약"""
         # 기존 파일 정리
         self.cleanup_old_files()
         
-        # 용량 체크
-        if not self._check_space_available():
-            self.emergency_cleanup()
-        
         # 파일 경로 생성
         filename = f"{temp_id}.{file_type}"
         file_path = self.base_dir / filename
         
+        # 용량 예약 (부족하면 다른 모듈의 덜 쓰인 파일부터 제거, 그래도 부족하면 긴급 정리 후 재시도)
+        reservation = expected_size or DEFAULT_RESERVATION_BYTES
+        try:
+            tmp_quota.reserve(file_path, reservation, "export", pin=True)
+        except TmpQuotaExceeded:
+            self.emergency_cleanup()
+            tmp_quota.reserve(file_path, reservation, "export", pin=True)
+        self._pinned.add(temp_id)
+        
         # 메타데이터 추가
-        self.active_files[temp_id] = {
+        self.state.put(temp_id, {
             "file_path": str(file_path),
             "created_at": datetime.now().isoformat(),
             "file_type": file_type,
             "status": "creating",
             "size": 0
-        }
-        
-        self._save_metadata()
+        })
         return file_path
     
     def update_file_status(self, temp_id: str, status: str, size: int = None, progress: int = None, message: str = None, processed_count: int = None, total_count: int = None):
-        """파일 상태 및 진행률 업데이트"""
-        if temp_id in self.active_files:
-            self.active_files[temp_id]["status"] = status
+        """파일 상태 및 진행률 업데이트
+
+        진행률만 바뀌면 JOB_STATE_FLUSH_SECONDS마다 모아서 기록하고, 상태가 바뀌면 즉시 기록
+        """
+        file_info = self.state.get(temp_id)
+        if file_info is not None:
+            fields = {"status": status}
             if size is not None:
-                self.active_files[temp_id]["size"] = size
+                fields["size"] = size
             if progress is not None:
-                self.active_files[temp_id]["progress"] = progress
+                fields["progress"] = progress
             if message is not None:
-                self.active_files[temp_id]["message"] = message
+                fields["message"] = message
             if processed_count is not None:
-                self.active_files[temp_id]["processed_count"] = processed_count
+                fields["processed_count"] = processed_count
             if total_count is not None:
-                self.active_files[temp_id]["total_count"] = total_count
+                fields["total_count"] = total_count
                 
             # 예상 남은 시간 계산 (처리 속도 기반)
             if processed_count is not None and total_count is not None and processed_count > 0:
-                elapsed_time = (datetime.now() - datetime.fromisoformat(self.active_files[temp_id]["created_at"])).total_seconds()
+                elapsed_time = (datetime.now() - datetime.fromisoformat(file_info["created_at"])).total_seconds()
                 processing_rate = processed_count / elapsed_time if elapsed_time > 0 else 0
                 if processing_rate > 0 and processed_count < total_count:
                     remaining_records = total_count - processed_count
                     estimated_time_remaining = int(remaining_records / processing_rate)
-                    self.active_files[temp_id]["estimated_time_remaining"] = estimated_time_remaining
+                    fields["estimated_time_remaining"] = estimated_time_remaining
                     
-            self.active_files[temp_id]["updated_at"] = datetime.now().isoformat()
-            self._save_metadata()
+            fields["updated_at"] = datetime.now().isoformat()
+            self.state.update(temp_id, fields, flush=status != file_info.get("status"))
+
+            # 생성이 끝난 파일은 실제 크기로 기록하고 제거 후보로 전환
+            if status in ("completed", "failed") and temp_id in self._pinned:
+                self._pinned.discard(temp_id)
+                file_path = file_info["file_path"]
+                tmp_quota.commit(file_path)
+                tmp_quota.release_pin(file_path)
     
     def get_file_info(self, temp_id: str) -> Optional[Dict]:
-        """파일 정보 조회"""
-        return self.active_files.get(temp_id)
+        """파일 정보 조회 (사본)"""
+        return self.state.get(temp_id)
     
     def get_file_path(self, temp_id: str) -> Optional[Path]:
         """파일 경로 조회"""
@@ -125,15 +159,16 @@ class TempFileManager:
     def delete_temp_file(self, temp_id: str) -> bool:
         """임시 파일 삭제"""
         try:
-            file_info = self.active_files.get(temp_id)
+            file_info = self.state.get(temp_id)
             if file_info:
                 file_path = Path(file_info["file_path"])
                 if file_path.exists():
                     file_path.unlink()
+                tmp_quota.discard(file_path)
+                self._pinned.discard(temp_id)
                 
                 # 메타데이터에서 제거
-                del self.active_files[temp_id]
-                self._save_metadata()
+                self.state.delete(temp_id)
                 
                 print(f"임시 파일 삭제됨: {temp_id}")
                 return True
@@ -142,12 +177,23 @@ class TempFileManager:
         
         return False
     
+    def _on_quota_evicted(self, path: Path):
+        """tmp_quota가 내보내기 파일을 제거하면 메타데이터에서도 제거"""
+        evicted = [
+            temp_id for temp_id, info in self.state.items()
+            if os.path.realpath(info.get("file_path", "")) == str(path)
+        ]
+        for temp_id in evicted:
+            self.state.delete(temp_id)
+        if evicted:
+            print(f"/tmp 용량 확보로 임시 파일 제거됨: {', '.join(evicted)}")
+    
     def cleanup_old_files(self):
         """오래된 파일 정리"""
         current_time = datetime.now()
         expired_files = []
         
-        for temp_id, file_info in self.active_files.items():
+        for temp_id, file_info in self.state.items():
             try:
                 created_at = datetime.fromisoformat(file_info["created_at"])
                 age = (current_time - created_at).total_seconds()
@@ -172,7 +218,7 @@ class TempFileManager:
         # 상태별 우선순위로 정리
         # 1. 실패한 파일들
         failed_files = [
-            temp_id for temp_id, info in self.active_files.items()
+            temp_id for temp_id, info in self.state.items()
             if info.get("status") == "failed"
         ]
         
@@ -181,7 +227,7 @@ class TempFileManager:
         
         # 2. 오래된 파일부터 정리
         sorted_files = sorted(
-            self.active_files.items(),
+            self.state.items(),
             key=lambda x: x[1].get("created_at", "")
         )
         
@@ -207,7 +253,7 @@ class TempFileManager:
         """현재 총 사용량 계산"""
         total_size = 0
         
-        for file_info in self.active_files.values():
+        for _, file_info in self.state.items():
             file_path = Path(file_info["file_path"])
             if file_path.exists():
                 total_size += file_path.stat().st_size
@@ -217,10 +263,11 @@ class TempFileManager:
     def get_statistics(self) -> Dict:
         """사용량 통계"""
         total_size = self._get_total_size()
-        file_count = len(self.active_files)
+        files = self.state.items()
+        file_count = len(files)
         
         status_count = {}
-        for file_info in self.active_files.values():
+        for _, file_info in files:
             status = file_info.get("status", "unknown")
             status_count[status] = status_count.get(status, 0) + 1
         
@@ -230,7 +277,8 @@ class TempFileManager:
             "usage_percent": round((total_size / self.max_total_size) * 100, 1),
             "max_size_mb": round(self.max_total_size / 1024 / 1024, 2),
             "status_distribution": status_count,
-            "space_available": self._check_space_available()
+            "space_available": self._check_space_available(),
+            "state_store": self.state.stats()
         }
     
     async def scheduled_cleanup(self):
@@ -238,6 +286,7 @@ class TempFileManager:
         while True:
             try:
                 self.cleanup_old_files()
+                self.state.flush()
                 
                 # 5분마다 실행
                 await asyncio.sleep(300)
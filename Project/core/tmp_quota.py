@@ -0,0 +1,357 @@
+"""
+/tmp 공용 용량 관리자
+서버리스 512MB /tmp를 쓰는 모든 모듈(원격 DuckDB 사본, Blob 프리페치, 임시 내보내기 파일,
+프리뷰 캐시, DuckDB spill)이 하나의 예산을 공유하도록 관리
+
+- 파일을 쓰기 전에 reserve()로 예상 크기만큼 공간 확보 (부족하면 다른 파일 제거)
+- 제거 순서: 마지막 사용 시각 + 소유자 우선순위 + 사용 횟수(인기도) 가중치가 낮은 파일부터
+- 사용 중인 파일은 pin()으로 보호하여 제거 대상에서 제외
+- DuckDB spill은 고정 여유분으로 예산에서 미리 제외 (DuckDB max_temp_directory_size와 연동)
+"""
+
+import logging
+import math
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 소유자별 기본 우선순위 (높을수록 오래 보존)
+OWNER_PRIORITIES = {
+    "duckdb_cache": 3,   # 원격 DuckDB 로컬 사본 (다시 받으려면 수백 MB 다운로드)
+    "prefetch": 3,       # Blob 사전 다운로드 파일
+    "export": 2,         # 사용자가 아직 내려받지 않았을 수 있는 내보내기 파일
+    "preview": 1,        # 다시 만들 수 있는 프리뷰/인덱스 캐시
+    "suggest": 1,        # 다시 만들 수 있는 자동완성 인덱스
+}
+DEFAULT_PRIORITY = 1
+
+
+class TmpQuotaExceeded(OSError):
+    """사용 중(pin)인 파일을 제외하면 요청한 공간을 확보할 수 없음"""
+
+
+@dataclass
+class QuotaEntry:
+    """/tmp 파일 하나의 사용량 기록"""
+    path: str
+    owner: str
+    size: int
+    priority: int
+    companions: Tuple[str, ...] = ()
+    hits: int = 0
+    pins: int = 0
+    last_access: float = 0.0
+
+    def score(self, priority_weight: float, popularity_weight: float) -> float:
+        """제거 점수 - 작을수록 먼저 제거 (최근 사용 시각에 우선순위/인기도 보정 시간을 더함)"""
+        return (self.last_access
+                + self.priority * priority_weight
+                + math.log2(1 + self.hits) * popularity_weight)
+
+
+class TmpQuotaManager:
+    """우선순위/인기도 가중 LRU 기반 /tmp 용량 관리자"""
+
+    def __init__(self,
+                 quota_bytes: int,
+                 spill_reserve_bytes: int = 0,
+                 root: str = "/tmp",
+                 priority_weight_seconds: float = 600.0,
+                 popularity_weight_seconds: float = 300.0):
+        self.quota_bytes = quota_bytes
+        self.spill_reserve_bytes = min(spill_reserve_bytes, quota_bytes)
+        self.root = os.path.realpath(root)
+        self.priority_weight = priority_weight_seconds
+        self.popularity_weight = popularity_weight_seconds
+        self._entries: Dict[str, QuotaEntry] = {}
+        self._on_evict: Dict[str, Callable[[Path], None]] = {}
+        self._lock = Lock()
+        self._used = 0
+        self._reservations = 0
+        self._evictions = 0
+        self._evicted_bytes = 0
+        self._rejections = 0
+
+    @property
+    def file_budget(self) -> int:
+        """파일에 쓸 수 있는 예산 (DuckDB spill 여유분 제외)"""
+        return self.quota_bytes - self.spill_reserve_bytes
+
+    def _key(self, path) -> Optional[str]:
+        """관리 대상(/tmp 하위) 경로면 정규화된 키, 아니면 None"""
+        resolved = os.path.realpath(str(path))
+        if resolved == self.root or not resolved.startswith(self.root + os.sep):
+            return None
+        return resolved
+
+    def register_owner(self, owner: str, on_evict: Callable[[Path], None]) -> None:
+        """소유자 모듈의 제거 콜백 등록 (파일 삭제 후 메모리상의 참조 정리용)"""
+        with self._lock:
+            self._on_evict[owner] = on_evict
+
+    # ------------------------------------------------------------------
+    # 예약 / 기록
+    # ------------------------------------------------------------------
+    def reserve(self, path, size: int, owner: str,
+                companions: Iterable = (), pin: bool = False) -> None:
+        """path에 size 바이트를 쓸 공간 확보 (이미 기록된 파일이면 크기만 갱신)
+
+        companions는 같은 항목으로 함께 제거할 부속 파일(부분 다운로드 등)이다.
+        확보할 수 없으면 TmpQuotaExceeded를 발생시킨다.
+        """
+        key = self._key(path)
+        if key is None:
+            return
+        size = max(0, int(size or 0))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            current = entry.size if entry else 0
+            victims = self._select_victims(size - current, exclude=key)
+            if victims is None:
+                self._rejections += 1
+                raise TmpQuotaExceeded(
+                    f"/tmp 용량 부족: {size:,} bytes 확보 불가 "
+                    f"(사용 {self._used:,} / 예산 {self.file_budget:,} bytes, 나머지는 사용 중)"
+                )
+
+            if entry is None:
+                entry = QuotaEntry(
+                    path=key,
+                    owner=owner,
+                    size=0,
+                    priority=OWNER_PRIORITIES.get(owner, DEFAULT_PRIORITY)
+                )
+                self._entries[key] = entry
+            entry.companions = tuple(str(companion) for companion in companions) or entry.companions
+            self._used += size - entry.size
+            entry.size = size
+            entry.last_access = time.time()
+            if pin:
+                entry.pins += 1
+            self._reservations += 1
+
+        self._evict(victims)
+
+    def commit(self, path, size: Optional[int] = None, owner: Optional[str] = None) -> None:
+        """쓰기가 끝난 파일의 실제 크기 기록 (예약 없이 생긴 파일은 owner로 새로 등록)"""
+        key = self._key(path)
+        if key is None:
+            return
+        if size is None:
+            try:
+                size = os.path.getsize(key)
+            except OSError:
+                size = 0
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if owner is None:
+                    return
+                entry = QuotaEntry(
+                    path=key,
+                    owner=owner,
+                    size=0,
+                    priority=OWNER_PRIORITIES.get(owner, DEFAULT_PRIORITY),
+                    last_access=time.time()
+                )
+                self._entries[key] = entry
+            self._used += size - entry.size
+            entry.size = size
+
+        # 예약보다 커진 경우 초과분만큼 다른 파일 정리
+        self._enforce()
+
+    def discard(self, path) -> None:
+        """소유자가 직접 삭제한 파일의 기록 제거"""
+        key = self._key(path)
+        if key is None:
+            return
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._used -= entry.size
+
+    def adopt(self, directory, owner: str) -> int:
+        """이전 실행(웜 인스턴스)에서 남은 파일을 기록에 편입 - 지우지 않고 재사용 후보로 유지"""
+        directory = Path(directory)
+        if not directory.exists():
+            return 0
+        adopted = 0
+        for file_path in directory.iterdir():
+            if not file_path.is_file():
+                continue
+            key = self._key(file_path)
+            if key is None:
+                continue
+            stat = file_path.stat()
+            with self._lock:
+                if key in self._entries:
+                    continue
+                self._entries[key] = QuotaEntry(
+                    path=key,
+                    owner=owner,
+                    size=stat.st_size,
+                    priority=OWNER_PRIORITIES.get(owner, DEFAULT_PRIORITY),
+                    last_access=stat.st_mtime
+                )
+                self._used += stat.st_size
+            adopted += 1
+
+        if adopted:
+            logger.info(f"♻️ 기존 /tmp 파일 {adopted}개 편입: {directory} ({owner})")
+            self._enforce()
+        return adopted
+
+    # ------------------------------------------------------------------
+    # 사용 기록 / 보호
+    # ------------------------------------------------------------------
+    def touch(self, path) -> None:
+        """파일 사용 기록 (최근 사용 시각 갱신 + 인기도 증가)"""
+        key = self._key(path)
+        if key is None:
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.hits += 1
+                entry.last_access = time.time()
+
+    def acquire_pin(self, path) -> bool:
+        """파일을 제거 대상에서 제외 (기록된 파일이면 True) - release_pin과 짝으로 호출"""
+        key = self._key(path)
+        if key is None:
+            return False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            entry.pins += 1
+            entry.hits += 1
+            entry.last_access = time.time()
+            return True
+
+    def release_pin(self, path) -> None:
+        key = self._key(path)
+        if key is None:
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.pins > 0:
+                entry.pins -= 1
+                entry.last_access = time.time()
+
+    @contextmanager
+    def pin(self, path):
+        """with 블록 동안 파일 보호"""
+        pinned = self.acquire_pin(path)
+        try:
+            yield
+        finally:
+            if pinned:
+                self.release_pin(path)
+
+    # ------------------------------------------------------------------
+    # 제거
+    # ------------------------------------------------------------------
+    def _select_victims(self, required: int, exclude: Optional[str] = None,
+                        partial: bool = False) -> Optional[List[QuotaEntry]]:
+        """required 바이트를 추가로 쓸 수 있도록 제거할 항목 선택 (lock 보유 상태에서 호출)
+
+        확보할 수 없으면 None (partial=True면 확보 가능한 만큼만 선택).
+        선택된 항목은 기록에서 바로 빠지고 사용량에서도 차감된다.
+        """
+        overflow = self._used + required - self.file_budget
+        if overflow <= 0:
+            return []
+
+        candidates = sorted(
+            (entry for key, entry in self._entries.items() if entry.pins == 0 and key != exclude),
+            key=lambda entry: entry.score(self.priority_weight, self.popularity_weight)
+        )
+        victims: List[QuotaEntry] = []
+        freed = 0
+        for entry in candidates:
+            if freed >= overflow:
+                break
+            victims.append(entry)
+            freed += entry.size
+        if freed < overflow and not partial:
+            return None
+
+        for entry in victims:
+            del self._entries[entry.path]
+            self._used -= entry.size
+        return victims
+
+    def _enforce(self) -> None:
+        """예산을 넘었으면 가능한 만큼 제거 (pin된 파일 때문에 부족해도 예외 없이 진행)"""
+        with self._lock:
+            victims = self._select_victims(0, partial=True)
+        self._evict(victims)
+
+    def _evict(self, victims: List[QuotaEntry]) -> None:
+        """선택된 항목의 파일 삭제 + 소유자 콜백 호출 (lock 밖에서 실행)"""
+        for entry in victims:
+            for file_path in (entry.path,) + entry.companions:
+                try:
+                    os.unlink(file_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"/tmp 파일 제거 실패: {file_path} ({e})")
+
+            callback = self._on_evict.get(entry.owner)
+            if callback is not None:
+                try:
+                    callback(Path(entry.path))
+                except Exception as e:
+                    logger.warning(f"/tmp 제거 콜백 실패 ({entry.owner}): {e}")
+
+            with self._lock:
+                self._evictions += 1
+                self._evicted_bytes += entry.size
+            logger.info(
+                f"🧹 /tmp 용량 확보를 위해 제거: {Path(entry.path).name} "
+                f"({entry.owner}, {entry.size / 1024 / 1024:.1f}MB, 사용 {entry.hits}회)"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """소유자별 사용량 및 제거 통계 (시스템 상태 API용)"""
+        with self._lock:
+            owners: Dict[str, Dict[str, int]] = {}
+            pinned = 0
+            for entry in self._entries.values():
+                owner_stats = owners.setdefault(entry.owner, {"files": 0, "bytes": 0})
+                owner_stats["files"] += 1
+                owner_stats["bytes"] += entry.size
+                if entry.pins:
+                    pinned += 1
+            return {
+                "quota_bytes": self.quota_bytes,
+                "spill_reserve_bytes": self.spill_reserve_bytes,
+                "file_budget_bytes": self.file_budget,
+                "used_bytes": self._used,
+                "usage_percent": round(self._used / self.file_budget * 100, 1) if self.file_budget else 0.0,
+                "files": len(self._entries),
+                "pinned": pinned,
+                "owners": owners,
+                "reservations": self._reservations,
+                "evictions": self._evictions,
+                "evicted_bytes": self._evicted_bytes,
+                "rejections": self._rejections
+            }
+
+
+# 전역 /tmp 용량 관리자 (환경변수로 전체 예산/DuckDB spill 여유분 조정)
+tmp_quota = TmpQuotaManager(
+    quota_bytes=int(os.getenv("TMP_QUOTA_MB", "448") or 448) * 1024 * 1024,
+    spill_reserve_bytes=int(os.getenv("TMP_DUCKDB_SPILL_MB", "64") or 64) * 1024 * 1024
+)
@@ -0,0 +1,196 @@
+"""
+필드 값 사전 (distinct 값 + 빈도)
+필터 드롭다운/필드 샘플 요청마다 SELECT DISTINCT로 전체 테이블을 읽지 않도록
+데이터셋 버전별로 필드 값과 건수를 한 번만 집계해 메모리에 보관
+
+- 값은 정렬된 튜플, 건수는 array로 저장 (값마다 dict 항목을 만들지 않음)
+- 빈도순 위치 인덱스를 함께 보관하여 상위 N개 조회는 O(N)
+- 데이터셋 fingerprint가 바뀌면 다시 집계, 필드 수 기준 LRU 제거
+"""
+
+import logging
+import os
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 필드당 보관하는 최대 값 수 - 초과하면 빈도 상위 값만 보관 (truncated)
+VALUE_DICTIONARY_MAX_VALUES = max(1, int(os.getenv("VALUE_DICTIONARY_MAX_VALUES", "200000") or 200000))
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    """JSON 원본처럼 타입이 섞인 값도 정렬 가능하도록 (숫자 < 문자열 < 기타)"""
+    if isinstance(value, bool):
+        return (2, str(value))
+    if isinstance(value, (int, float)):
+        return (0, value)
+    if isinstance(value, str):
+        return (1, value)
+    return (2, str(value))
+
+
+class FieldValueDictionary:
+    """필드 하나의 값 사전 (값 정렬 순서 + 빈도순 인덱스)"""
+
+    __slots__ = ("field_name", "values", "counts", "by_frequency", "total_count", "truncated", "built_at", "approx_bytes")
+
+    def __init__(self, field_name: str, pairs: Iterable[Tuple[Any, int]], truncated: bool = False):
+        ordered = sorted(pairs, key=lambda pair: _sort_key(pair[0]))
+        self.field_name = field_name
+        self.values: Tuple[Any, ...] = tuple(value for value, _ in ordered)
+        self.counts = array("Q", (int(count) for _, count in ordered))
+        # 빈도 내림차순 (같으면 값 순서) 위치 목록
+        self.by_frequency = array("I", sorted(range(len(self.values)), key=lambda index: -self.counts[index]))
+        self.total_count = sum(self.counts)
+        self.truncated = truncated
+        self.built_at = time.time()
+        self.approx_bytes = (
+            sum(len(value) * 2 + 50 if isinstance(value, str) else 32 for value in self.values)
+            + self.counts.itemsize * len(self.counts)
+            + self.by_frequency.itemsize * len(self.by_frequency)
+        )
+
+    @classmethod
+    def from_records(cls, field_name: str, records: Iterable[Dict[str, Any]]) -> "FieldValueDictionary":
+        """레코드 목록(JSON 원본)에서 사전 생성 - 배열 값은 항목별로 집계"""
+        counts: Dict[Any, int] = {}
+        for record in records:
+            value = record.get(field_name) if isinstance(record, dict) else None
+            items = value if isinstance(value, list) else [value]
+            for item in items:
+                if isinstance(item, (str, int, float)):
+                    counts[item] = counts.get(item, 0) + 1
+
+        truncated = len(counts) > VALUE_DICTIONARY_MAX_VALUES
+        pairs = counts.items()
+        if truncated:
+            pairs = sorted(pairs, key=lambda pair: -pair[1])[:VALUE_DICTIONARY_MAX_VALUES]
+        return cls(field_name, pairs, truncated)
+
+    @property
+    def distinct_count(self) -> int:
+        return len(self.values)
+
+    def _positions(self, limit: int, order: str) -> Iterable[int]:
+        if order == "frequency":
+            return self.by_frequency[:limit]
+        return range(min(limit, len(self.values)))
+
+    def samples(self, limit: int, order: str = "value") -> List[Any]:
+        """값 목록 (order: value=값 순서, frequency=빈도 내림차순)"""
+        return [self.values[index] for index in self._positions(limit, order)]
+
+    def entries(self, limit: int, order: str = "value") -> List[Dict[str, Any]]:
+        """값과 건수 목록"""
+        return [
+            {"value": self.values[index], "count": self.counts[index]}
+            for index in self._positions(limit, order)
+        ]
+
+    def count_of(self, value: Any) -> int:
+        """특정 값의 건수 (이진 탐색, 없으면 0)"""
+        keys = _KeyView(self.values)
+        index = bisect_left(keys, _sort_key(value))
+        if index < len(self.values) and self.values[index] == value:
+            return self.counts[index]
+        return 0
+
+
+class _KeyView:
+    """bisect용 정렬 키 시퀀스 (키 목록을 따로 만들지 않음)"""
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: Tuple[Any, ...]):
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Tuple[int, Any]:
+        return _sort_key(self.values[index])
+
+
+class ValueDictionaryCache:
+    """(데이터셋, 필드)별 값 사전 캐시 - 같은 필드의 동시 생성은 한 번만 실행"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, FieldValueDictionary]]" = OrderedDict()
+        self._build_locks: Dict[Tuple[str, str], Lock] = {}
+        self._lock = Lock()
+        self._hits = 0
+        self._builds = 0
+        self._evictions = 0
+
+    def _lookup(self, key: Tuple[str, str], fingerprint: str) -> Optional[FieldValueDictionary]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None or cached[0] != fingerprint:
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return cached[1]
+
+    def get_or_build(self, dataset_key: str, fingerprint: str, field_name: str,
+                     builder: Callable[[], FieldValueDictionary]) -> Tuple[FieldValueDictionary, bool]:
+        """사전과 캐시 적중 여부 반환 (없거나 데이터셋 버전이 바뀌었으면 builder로 생성)"""
+        key = (dataset_key, field_name)
+        dictionary = self._lookup(key, fingerprint)
+        if dictionary is not None:
+            return dictionary, True
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, Lock())
+        with build_lock:
+            # 대기하는 동안 다른 요청이 생성했으면 재사용
+            dictionary = self._lookup(key, fingerprint)
+            if dictionary is not None:
+                return dictionary, True
+
+            start_time = time.time()
+            dictionary = builder()
+            with self._lock:
+                self._entries[key] = (fingerprint, dictionary)
+                self._entries.move_to_end(key)
+                self._builds += 1
+                while len(self._entries) > self.max_entries:
+                    evicted_key, _ = self._entries.popitem(last=False)
+                    self._build_locks.pop(evicted_key, None)
+                    self._evictions += 1
+
+        logger.info(
+            f"📚 필드 값 사전 생성: {field_name} ({dictionary.distinct_count:,}개 값"
+            f"{', 상위 값만 보관' if dictionary.truncated else ''}, {time.time() - start_time:.3f}초)"
+        )
+        return dictionary, False
+
+    def invalidate(self, dataset_key: Optional[str] = None) -> int:
+        """특정 데이터셋(또는 전체) 사전 제거"""
+        with self._lock:
+            keys = [key for key in self._entries if dataset_key is None or key[0] == dataset_key]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "fields": len(self._entries),
+                "max_fields": self.max_entries,
+                "approx_bytes": sum(dictionary.approx_bytes for _, dictionary in self._entries.values()),
+                "hits": self._hits,
+                "builds": self._builds,
+                "evictions": self._evictions
+            }
+
+
+# 전역 필드 값 사전 캐시
+value_dictionaries = ValueDictionaryCache(
+    max_entries=max(1, int(os.getenv("VALUE_DICTIONARY_MAX_FIELDS", "64") or 64))
+)
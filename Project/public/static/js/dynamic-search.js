@@ -389,6 +389,11 @@ class DynamicSearchEngine {
                 searchUrl = `/api/search/${this.currentCategory}/${this.currentSubcategory}`;
             }
             
+            // 바로 다음 페이지 요청이면 keyset 커서 사용 (깊은 페이지도 첫 페이지와 동일 비용)
+            const nextCursor = this.paginationInfo?.next_cursor;
+            const useCursor = keywordParam && nextCursor &&
+                this.currentPage === (this.paginationInfo?.current_page || 0) + 1;
+
             // 성능 측정 시작
             const startTime = performance.now();
             const startDate = new Date();
@@ -402,7 +407,8 @@ class DynamicSearchEngine {
                     keyword: keyword,
                     search_field: searchField,
                     page: this.currentPage || 1,  // 현재 페이지 (서버사이드 페이지네이션)
-                    limit: this.itemsPerPage || 20  // 설정 기반 페이지당 항목 수
+                    limit: this.itemsPerPage || 20,  // 설정 기반 페이지당 항목 수
+                    cursor: useCursor ? nextCursor : undefined
                 })
             });
 
@@ -224,7 +224,7 @@ class SmartPrefetch {
             '로컬 경로': stats.local_path,
             '다운로드 시간': `${stats.duration_seconds}초`,
             '전체 소요 시간': `${totalDuration.toFixed(2)}초`,
-            '캐시 정리': stats.cache_cleared ? '✅' : '❌'
+            '/tmp 정리': `${stats.evicted_files}개 제거 (사용률 ${stats.tmp_usage_percent}%)`
         });
 
         // 성능 분석
@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# api/main.py와 같이 `core.*`로 import 하도록 Project 디렉토리를 경로에 추가
+sys.path.insert(0, str(PROJECT_ROOT))
+# 변환 스크립트(automation/convert_parquet_to_duckdb.py)로 테스트 데이터셋 생성
+sys.path.insert(0, str(PROJECT_ROOT.parent / "automation"))
+
+COMPANIES = ["삼성전자(주)", "엘지전자", "현대모비스", "에스케이하이닉스", "카카오"]
+PRODUCTS = ["전기밥솥", "무선청소기", "공기청정기", "블루투스 스피커", "전동칫솔"]
+
+
+def sample_rows(count: int, with_dates: bool = True):
+    """업체명/제품명/모델명/인증번호(/인증일자) 컬럼의 검색용 샘플 행"""
+    rows = []
+    for index in range(count):
+        row = {
+            "업체명": COMPANIES[index % len(COMPANIES)],
+            "제품명": f"{PRODUCTS[index % len(PRODUCTS)]} {index:05d}",
+            "모델명": f"MD-{index:05d}",
+            "cert_num": f"YU{index:05d}-25001",
+        }
+        if with_dates:
+            row["인증일자"] = f"2024{(index % 12) + 1:02d}{(index % 28) + 1:02d}"
+        rows.append(row)
+    return rows
+
+
+def write_parquet(path: Path, rows, row_group_size: int = 122880) -> Path:
+    """dict 행 목록을 VARCHAR 컬럼 Parquet 파일로 저장"""
+    columns = list(rows[0])
+    table = pa.table({column: pa.array([row.get(column) for row in rows], pa.string()) for column in columns})
+    pq.write_table(table, path, row_group_size=row_group_size)
+    return path
+
+
+@pytest.fixture
+def make_dataset(tmp_path):
+    """변환 스크립트로 만든 DuckDB 데이터셋 파일 경로를 반환하는 팩토리"""
+    from convert_parquet_to_duckdb import materialize_duckdb
+
+    def _make(rows, name: str = "1_safetykorea_flattened") -> Path:
+        parquet_path = write_parquet(tmp_path / f"{name}.parquet", rows)
+        duckdb_path = tmp_path / "duckdb" / f"{name}.duckdb"
+        materialize_duckdb(parquet_path, duckdb_path)
+        return duckdb_path
+
+    return _make
@@ -0,0 +1,73 @@
+"""
+search_streaming Arrow RecordBatch 경로 테스트
+"""
+
+import asyncio
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import ROW_ID_COLUMN, DuckDBProcessor
+
+
+def _stream_batches(path, **kwargs):
+    batches = []
+    processor = DuckDBProcessor(str(path))
+    try:
+        result = asyncio.run(processor.search_streaming(
+            collect_results=False,
+            batch_callback=lambda batch, total: batches.append((batch, total)),
+            **kwargs
+        ))
+    finally:
+        processor.close()
+    return result, batches
+
+
+def _corrupt_last_row_group(path):
+    """마지막 row group의 압축 페이지 본문만 덮어써서 그 구간을 읽을 때 디코딩 오류가 나도록 함"""
+    row_group = pq.ParquetFile(path).metadata
+    row_group = row_group.row_group(row_group.num_row_groups - 1)
+    data = bytearray(path.read_bytes())
+    for index in range(row_group.num_columns):
+        column = row_group.column(index)
+        start = column.dictionary_page_offset or column.data_page_offset
+        for position in range(start + 40, start + column.total_compressed_size - 1):
+            data[position] = 0x5A
+    path.write_bytes(bytes(data))
+
+
+def test_batches_cover_all_rows_without_row_id(make_dataset):
+    path = make_dataset(sample_rows(2500))
+    result, batches = _stream_batches(path, limit=None, chunk_size=1000)
+
+    assert "error" not in result
+    assert all(isinstance(batch, pa.RecordBatch) for batch, _ in batches)
+    assert sum(batch.num_rows for batch, _ in batches) == 2500
+    assert batches[-1][1] == 2500
+    assert ROW_ID_COLUMN not in batches[0][0].schema.names
+
+
+def test_unpaged_batches_arrive_before_scan_finishes(tmp_path):
+    # 앞쪽 row group은 정상, 마지막 row group만 손상 - 전체 정렬을 거치면 첫 배치 전에 오류가 남
+    path = write_parquet(tmp_path / "streamed.parquet", sample_rows(40000, with_dates=False), row_group_size=2000)
+    _corrupt_last_row_group(path)
+
+    result, batches = _stream_batches(path, limit=None, chunk_size=1000)
+
+    assert result.get("error") == "query_execution_failed"
+    assert len(batches) > 0
+    assert batches[0][0].column("제품명")[0].as_py() == sample_rows(1, with_dates=False)[0]["제품명"]
+
+
+def test_batch_callback_requires_streaming_search(make_dataset):
+    path = make_dataset(sample_rows(10))
+    processor = DuckDBProcessor(str(path))
+    try:
+        result = asyncio.run(processor.search_streaming(
+            collect_results=True, batch_callback=lambda batch, total: None
+        ))
+    finally:
+        processor.close()
+    assert result["error"] == "arrow_unsupported"
@@ -0,0 +1,79 @@
+"""
+초성 검색(`__choseong` shadow 컬럼) 테스트
+"""
+
+import asyncio
+
+import duckdb
+import pytest
+from convert_parquet_to_duckdb import to_choseong
+
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import DuckDBProcessor, _to_choseong_keyword
+
+TABLE = "1_safetykorea_flattened"
+
+
+def test_to_choseong_keeps_non_hangul_characters():
+    assert to_choseong("삼성 전자(주)") == "ㅅㅅㅈㅈ(ㅈ)"
+    assert to_choseong("ＬＧ전자") == "lgㅈㅈ"
+    assert to_choseong("ㅋㅋ 카카오") == "ㅋㅋㅋㅋㅇ"
+
+
+def test_choseong_keyword_detection():
+    assert _to_choseong_keyword("ㅅㅅ ㅈㅈ") == "ㅅㅅㅈㅈ"
+    # 첫가끝 자모(NFKC 결과)도 호환 자모로 맞춤
+    assert _to_choseong_keyword("ᄉᄉ") == "ㅅㅅ"
+    assert _to_choseong_keyword("삼성") is None
+    assert _to_choseong_keyword("ㅅa") is None
+    assert _to_choseong_keyword("  ") is None
+
+
+@pytest.fixture
+def dataset(make_dataset):
+    return make_dataset(sample_rows(100, with_dates=False))
+
+
+def _search(path, keyword, search_field):
+    processor = DuckDBProcessor(str(path))
+    try:
+        return asyncio.run(processor.search_streaming(keyword=keyword, search_field=search_field, limit=None))
+    finally:
+        processor.close()
+
+
+def test_converter_stores_choseong_columns(dataset):
+    conn = duckdb.connect(str(dataset), read_only=True)
+    try:
+        row = conn.execute(
+            f'SELECT "업체명__choseong", "제품명__choseong" FROM "{TABLE}" WHERE "모델명" = ?', ["MD-00000"]
+        ).fetchone()
+    finally:
+        conn.close()
+
+    assert row == ("ㅅㅅㅈㅈ(ㅈ)", "ㅈㄱㅂㅅ00000")
+
+
+@pytest.mark.parametrize("keyword, search_field, expected_field, expected_value", [
+    ("ㅋㅋㅇ", "company_name", "업체명", "카카오"),
+    ("ㅅㅅ ㅈㅈ", "company_name", "업체명", "삼성전자(주)"),
+    ("ㄱㄱㅊㅈㄱ", "product_name", "제품명", "공기청정기"),
+])
+def test_choseong_keyword_matches_names(dataset, keyword, search_field, expected_field, expected_value):
+    result = _search(dataset, keyword, search_field)
+
+    assert result["pagination"]["total_count"] == 20
+    assert all(expected_value in record[expected_field] for record in result["results"])
+    # shadow 컬럼은 응답에 노출하지 않음
+    assert not any(column.endswith("__choseong") for column in result["results"][0])
+
+
+def test_choseong_keyword_matches_middle_of_name(dataset):
+    # "에스케이하이닉스" 중간의 "하이닉스"
+    result = _search(dataset, "ㅎㅇㄴㅅ", "company_name")
+    assert {record["업체명"] for record in result["results"]} == {"에스케이하이닉스"}
+
+
+def test_files_without_choseong_columns_use_plain_search(tmp_path):
+    path = write_parquet(tmp_path / "dataset.parquet", sample_rows(20, with_dates=False))
+    assert _search(path, "ㅋㅋㅇ", "company_name")["pagination"]["total_count"] == 0
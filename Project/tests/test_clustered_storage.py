@@ -0,0 +1,74 @@
+"""
+변환 시 날짜 클러스터링 저장 순서 테스트
+"""
+
+import asyncio
+import json
+
+import duckdb
+from convert_parquet_to_duckdb import select_clustering_key
+
+from conftest import sample_rows
+from core.duckdb_processor import DuckDBProcessor
+
+TABLE = "1_safetykorea_flattened"
+# 혼합 형식 날짜 - 최신순: 2024-12-01 > 2024-06-15(3건) > 2023-01-02 > 빈 값/NULL
+DATES = ["20230102", "2024-06-15", "", "20241201", "2024.06.15", "20240615093000", None]
+SAME_DAY = {"2024-06-15", "2024.06.15", "20240615093000"}
+
+
+def _rows():
+    rows = sample_rows(len(DATES), with_dates=False)
+    for row, date in zip(rows, DATES):
+        row["인증일자"] = date
+    return rows
+
+
+def test_clustering_key_prefers_date_then_name():
+    columns = [("업체명", "VARCHAR"), ("제품명", "VARCHAR"), ("인증일자", "VARCHAR")]
+    assert select_clustering_key(columns) == [
+        {"column": "인증일자", "order": "desc", "parse": "date"},
+        {"column": "제품명", "order": "asc"},
+    ]
+    assert select_clustering_key(columns[:2]) == [{"column": "제품명", "order": "asc"}]
+    assert select_clustering_key([("비고", "VARCHAR")]) == []
+
+
+def test_converter_stores_rows_newest_first(make_dataset):
+    rows = _rows()
+    path = make_dataset(rows)
+    same_day = sorted(row["제품명"] for row in rows if row["인증일자"] in SAME_DAY)
+
+    conn = duckdb.connect(str(path), read_only=True)
+    try:
+        stored = conn.execute(f'SELECT "인증일자", "제품명" FROM "{TABLE}" ORDER BY rowid').fetchall()
+        comment = conn.execute("SELECT comment FROM duckdb_tables() WHERE table_name = ?", [TABLE]).fetchone()[0]
+    finally:
+        conn.close()
+
+    assert stored[0][0] == "20241201"
+    # 형식이 달라도 같은 날짜로 묶이고, 그 안에서는 제품명 오름차순
+    assert {date for date, _ in stored[1:4]} == SAME_DAY
+    assert [name for _, name in stored[1:4]] == same_day
+    assert stored[4][0] == "20230102"
+    # 날짜가 비었거나 NULL인 행은 맨 뒤
+    assert {date for date, _ in stored[5:]} == {"", None}
+    assert json.loads(comment)["clustering_key"][0] == {"column": "인증일자", "order": "desc", "parse": "date"}
+
+
+def test_default_order_is_storage_order_without_sort(make_dataset):
+    path = make_dataset(_rows())
+    processor = DuckDBProcessor(str(path))
+    try:
+        first = asyncio.run(processor.search_streaming(limit=3))
+        second = asyncio.run(processor.search_streaming(limit=3, page=2))
+        templates = list(processor._handle._templates.values())
+    finally:
+        processor.close()
+
+    dates = [record["인증일자"] for record in first["results"] + second["results"]]
+    assert dates[0] == "20241201"
+    assert set(dates[1:4]) == SAME_DAY
+    assert dates[4] == "20230102" and not dates[5]
+    assert processor._handle.clustering_key == (("인증일자", "desc"), ("제품명", "asc"))
+    assert templates and all("ORDER BY" not in template for template in templates)
@@ -0,0 +1,76 @@
+"""
+DuckDB COPY 기반 CSV/Parquet 내보내기 테스트
+"""
+
+import csv
+import io
+import threading
+
+import duckdb
+import pyarrow.parquet as pq
+import pytest
+
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import DuckDBProcessor
+
+ALIASES = {"업체명": "업체명, 상호", "제품명": '제품 "명칭"', "모델명": "모델명", "cert_num": "인증번호"}
+COLUMNS = ["업체명", "제품명", "모델명", "cert_num"]
+
+
+def _export(path, dest, file_format, **kwargs):
+    processor = DuckDBProcessor(str(path))
+    try:
+        return processor.export_to_file(
+            str(dest), file_format, columns=COLUMNS, column_aliases=ALIASES, **kwargs
+        )
+    finally:
+        processor.close()
+
+
+def test_csv_starts_with_bom_and_quotes_headers(make_dataset, tmp_path):
+    path = make_dataset(sample_rows(300))
+    dest = tmp_path / "export.csv"
+
+    result = _export(path, dest, "csv", keyword="카카오", search_field="company_name")
+
+    data = dest.read_bytes()
+    assert data.startswith(b"\xef\xbb\xbf") and not data[3:].startswith(b"\xef\xbb\xbf")
+    rows = list(csv.reader(io.StringIO(data.decode("utf-8-sig"))))
+    assert rows[0] == [ALIASES[column] for column in COLUMNS]
+    assert len(rows) - 1 == result["row_count"] == 60
+    assert all(row[0] == "카카오" for row in rows[1:])
+    assert result["file_size"] == len(data)
+    assert not (tmp_path / "export.csv.body").exists()
+
+
+def test_parquet_keeps_plain_column_names(make_dataset, tmp_path):
+    path = make_dataset(sample_rows(100))
+    dest = tmp_path / "export.parquet"
+
+    result = _export(path, dest, "parquet", limit=40)
+
+    table = pq.read_table(dest)
+    assert table.column_names == [ALIASES[column] for column in COLUMNS]
+    assert table.num_rows == result["row_count"] == 40
+
+
+def test_export_keeps_scan_order_without_sorting(tmp_path):
+    rows = sample_rows(500, with_dates=False)
+    source = write_parquet(tmp_path / "unclustered.parquet", rows)
+    dest = tmp_path / "export.csv"
+
+    _export(source, dest, "csv", limit=200)
+
+    exported = list(csv.reader(io.StringIO(dest.read_text(encoding="utf-8-sig"))))[1:]
+    assert [row[1] for row in exported] == [row["제품명"] for row in rows[:200]]
+
+
+def test_cancelled_export_leaves_no_files(make_dataset, tmp_path):
+    path = make_dataset(sample_rows(50))
+    dest = tmp_path / "cancelled.csv"
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    with pytest.raises(duckdb.InterruptException):
+        _export(path, dest, "csv", cancel_event=cancel_event)
+    assert list(tmp_path.glob("cancelled.csv*")) == []
@@ -0,0 +1,94 @@
+"""
+데이터셋별 DuckDB 읽기 커서 풀 테스트
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pytest
+
+from conftest import sample_rows
+from core.duckdb_processor import DuckDBCursorPool, DuckDBProcessor
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_cursors_are_reused_up_to_pool_size():
+    pool = DuckDBCursorPool("test:reuse", size=2)
+
+    with pool.acquire() as first, pool.acquire() as second:
+        assert first is not second
+        assert pool.stats()["in_use"] == 2
+        with pytest.raises(TimeoutError):
+            with pool.acquire(timeout=0.05):
+                pass
+
+    with pool.acquire() as again:
+        assert again in (first, second)
+        assert again.execute("SELECT 42").fetchone() == (42,)
+
+    stats = pool.stats()
+    assert (stats["created"], stats["in_use"], stats["idle"], stats["timeouts"]) == (2, 0, 2, 1)
+
+
+def test_waiters_are_served_in_arrival_order():
+    pool = DuckDBCursorPool("test:fifo", size=1)
+    served = []
+
+    def waiter(name):
+        with pool.acquire(timeout=5):
+            served.append(name)
+
+    with pool.acquire():
+        threads = []
+        for index, name in enumerate(["first", "second", "third"]):
+            thread = threading.Thread(target=waiter, args=(name,))
+            thread.start()
+            threads.append(thread)
+            _wait_for(lambda: pool.stats()["waiting"] == index + 1)
+    for thread in threads:
+        thread.join(5)
+
+    assert served == ["first", "second", "third"]
+    assert pool.stats()["acquisitions"] == 4
+
+
+def test_broken_cursor_is_replaced():
+    pool = DuckDBCursorPool("test:broken", size=1)
+
+    with pytest.raises(duckdb.ConnectionException):
+        with pool.acquire() as cursor:
+            broken = cursor
+            raise duckdb.ConnectionException("connection lost")
+    assert pool.stats()["created"] == 0
+
+    with pool.acquire() as cursor:
+        assert cursor is not broken
+        assert cursor.execute("SELECT 1").fetchone() == (1,)
+
+
+def test_concurrent_searches_share_one_pool(make_dataset):
+    path = make_dataset(sample_rows(500, with_dates=False))
+    keywords = ["카카오", "엘지", "현대", "삼성", "에스케이"] * 4
+
+    def search(keyword):
+        processor = DuckDBProcessor(str(path))
+        result = asyncio.run(processor.search_streaming(keyword=keyword, search_field="company_name", limit=None))
+        return keyword, result["pagination"]["total_count"], processor._get_pool()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outcomes = list(executor.map(search, keywords))
+
+    assert {keyword: count for keyword, count, _ in outcomes} == {keyword: 100 for keyword in keywords}
+    pools = {id(pool) for _, _, pool in outcomes}
+    assert len(pools) == 1
+    stats = outcomes[0][2].stats()
+    assert stats["created"] <= stats["size"] and stats["in_use"] == 0
@@ -0,0 +1,73 @@
+"""
+데이터셋별 검색 계획 캐시(DatasetHandle) 테스트
+"""
+
+import asyncio
+
+import core.duckdb_processor as duckdb_processor
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import DatasetHandle, DuckDBProcessor
+
+
+def _search(path, keyword, **kwargs):
+    processor = DuckDBProcessor(str(path), **kwargs)
+    try:
+        result = asyncio.run(processor.search_streaming(keyword=keyword, search_field="company_name", limit=10))
+    finally:
+        processor.close()
+    return processor._handle, result
+
+
+def test_same_shape_searches_reuse_one_template(tmp_path):
+    path = write_parquet(tmp_path / "dataset.parquet", sample_rows(100, with_dates=False))
+
+    handle, kakao = _search(path, "카카오")
+    again, lg = _search(path, "엘지")
+    _, repeated = _search(path, "카카오")
+
+    assert again is handle
+    assert handle.available_fields is not None
+    stats = handle.stats()
+    assert stats["templates"] == 1
+    assert stats["template_hits"] == 2
+    # 템플릿은 파라미터 바인딩 - 검색어마다 결과는 다름
+    assert {record["업체명"] for record in kakao["results"]} == {"카카오"}
+    assert {record["업체명"] for record in lg["results"]} == {"엘지전자"}
+    assert repeated["results"] == kakao["results"]
+
+
+def test_new_dataset_version_recompiles(tmp_path):
+    path = write_parquet(tmp_path / "dataset.parquet", sample_rows(100, with_dates=False))
+    handle, before = _search(path, "카카오")
+
+    write_parquet(path, sample_rows(40, with_dates=False))
+    replaced, after = _search(path, "카카오")
+
+    assert replaced is not handle
+    assert replaced.version != handle.version
+    assert replaced.stats()["template_hits"] == 0
+    assert before["pagination"]["total_count"] == 20
+    assert after["pagination"]["total_count"] == 8
+
+
+def test_dataset_context_gets_its_own_handle(tmp_path):
+    path = write_parquet(tmp_path / "dataset.parquet", sample_rows(20, with_dates=False))
+    default_handle, _ = _search(path, "카카오")
+    scoped_handle, _ = _search(path, "카카오", category="dataA", subcategory="safetykorea")
+
+    assert scoped_handle is not default_handle
+    assert scoped_handle.key.endswith("|dataA|None|safetykorea")
+
+
+def test_templates_are_bounded_lru(monkeypatch):
+    monkeypatch.setattr(duckdb_processor, "DATASET_HANDLE_MAX_TEMPLATES", 2)
+    handle = DatasetHandle("key", "v1")
+    handle.put_template("a", "SELECT 1")
+    handle.put_template("b", "SELECT 2")
+    assert handle.get_template("a") == "SELECT 1"
+    handle.put_template("c", "SELECT 3")
+
+    assert handle.get_template("b") is None
+    assert handle.get_template("a") == "SELECT 1"
+    assert handle.get_template("c") == "SELECT 3"
+    assert handle.stats()["templates"] == 2
@@ -0,0 +1,50 @@
+"""
+날짜 범위 필터 테스트
+"""
+
+import asyncio
+
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import DuckDBProcessor
+
+# 같은 날 14자리(YYYYMMDDHHMMSS)/8자리 값과 범위 밖 값이 섞인 인증일자
+DATES = [
+    "20240305000000", "20240305235959", "20240305",
+    "20240304235959", "20240306000000", "20240301093000", "",
+]
+
+
+def _rows():
+    rows = sample_rows(len(DATES), with_dates=False)
+    for row, date in zip(rows, DATES):
+        row["인증일자"] = date
+    return rows
+
+
+def _filter(path, date_range):
+    processor = DuckDBProcessor(str(path))
+    try:
+        result = asyncio.run(processor.search_streaming(limit=None, filters={"date_range": date_range}))
+    finally:
+        processor.close()
+    return sorted(record["인증일자"] for record in result["results"])
+
+
+def test_end_bound_includes_timestamps_on_same_day(tmp_path):
+    # 변환 전 Parquet - 날짜 shadow 컬럼 없이 문자열을 행마다 파싱하는 경로
+    path = write_parquet(tmp_path / "raw_dates.parquet", _rows())
+
+    assert _filter(path, {"start": "2024-03-05", "end": "2024-03-05"}) == [
+        "20240305", "20240305000000", "20240305235959"
+    ]
+    assert _filter(path, {"end": "2024-03-04"}) == ["20240301093000", "20240304235959"]
+    assert _filter(path, {"start": "2024-03-06"}) == ["20240306000000"]
+
+
+def test_raw_and_converted_files_agree(make_dataset, tmp_path):
+    rows = _rows()
+    raw = write_parquet(tmp_path / "raw_dates.parquet", rows)
+    converted = make_dataset(rows)
+
+    for date_range in ({"start": "2024-03-05", "end": "2024-03-05"}, {"start": "2024-03-02", "end": "2024-03-05"}):
+        assert _filter(raw, date_range) == _filter(converted, date_range)
@@ -0,0 +1,217 @@
+"""
+download_manager 테스트 - 로컬 Range 지원 HTTP 서버를 원격 저장소 대신 사용
+"""
+
+import hashlib
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.download_manager import (
+    DOWNLOAD_SUFFIX,
+    PROGRESS_SUFFIX,
+    READ_BLOCK_SIZE,
+    DownloadError,
+    DownloadManager,
+)
+
+SEGMENT_SIZE = READ_BLOCK_SIZE
+
+
+def _payload(seed: bytes, size: int) -> bytes:
+    block = hashlib.sha256(seed).digest()
+    return (block * (size // len(block) + 1))[:size]
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send_empty(self, status: int) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _headers_for(self, data: bytes) -> None:
+        server = self.server
+        self.send_header("ETag", server.etags.get(self.path) or f'"{hashlib.md5(data).hexdigest()}"')
+        self.send_header("Accept-Ranges", "bytes")
+
+    def do_HEAD(self):
+        data = self.server.files.get(self.path)
+        if data is None:
+            return self._send_empty(404)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self._headers_for(data)
+        self.end_headers()
+
+    def do_GET(self):
+        server = self.server
+        data = server.files.get(self.path)
+        if data is None:
+            return self._send_empty(404)
+
+        range_header = self.headers.get("Range")
+        with server.lock:
+            server.gets.append((self.path, range_header))
+        time.sleep(server.delay)
+
+        match = re.match(r"bytes=(\d+)-(\d+)", range_header or "")
+        if match is None:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self._headers_for(data)
+            self.end_headers()
+            self.wfile.write(data)
+            return
+
+        start, end = int(match[1]), min(int(match[2]), len(data) - 1)
+        with server.lock:
+            if start in server.fail_starts:
+                server.fail_starts.discard(start)
+                return self._send_empty(500)
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self._headers_for(data)
+        self.end_headers()
+        self.wfile.write(data[start:end + 1])
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    httpd.daemon_threads = True
+    httpd.files = {}
+    httpd.etags = {}
+    httpd.gets = []
+    httpd.fail_starts = set()
+    httpd.delay = 0.0
+    httpd.lock = threading.Lock()
+    httpd.base_url = f"http://127.0.0.1:{httpd.server_port}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def manager():
+    return DownloadManager(max_segments=4, segment_size=SEGMENT_SIZE, timeout=10)
+
+
+def test_segmented_download(server, manager, tmp_path):
+    data = _payload(b"segmented", SEGMENT_SIZE * 4 + 12345)
+    server.files["/data.duckdb"] = data
+    dest = tmp_path / "data.duckdb"
+
+    assert manager.fetch(f"{server.base_url}/data.duckdb", dest) == dest
+
+    assert dest.read_bytes() == data
+    assert not dest.with_name(dest.name + DOWNLOAD_SUFFIX).exists()
+    ranges = sorted(header for _, header in server.gets)
+    assert len(ranges) == 5 and all(header.startswith("bytes=") for header in ranges)
+    assert manager.get_fingerprint(dest) == hashlib.sha256(data).hexdigest()
+
+
+def test_single_flight_shares_one_download(server, manager, tmp_path):
+    data = _payload(b"single-flight", SEGMENT_SIZE * 2)
+    server.files["/shared.duckdb"] = data
+    server.delay = 0.2
+    dest = tmp_path / "shared.duckdb"
+    url = f"{server.base_url}/shared.duckdb"
+
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(manager.fetch(url, dest))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert results == [dest] * 4
+    assert len(server.gets) == 2
+    stats = manager.stats()
+    assert stats["downloads"] == 1 and stats["coalesced"] == 3
+
+
+def test_resume_after_failed_segment(server, manager, tmp_path):
+    data = _payload(b"resume", SEGMENT_SIZE * 3 + 100)
+    server.files["/resume.duckdb"] = data
+    server.fail_starts.add(SEGMENT_SIZE * 2)
+    dest = tmp_path / "resume.duckdb"
+    url = f"{server.base_url}/resume.duckdb"
+
+    with pytest.raises(DownloadError):
+        manager.fetch(url, dest)
+    assert not dest.exists()
+    assert dest.with_name(dest.name + PROGRESS_SUFFIX).exists()
+
+    server.gets.clear()
+    manager.fetch(url, dest)
+
+    assert dest.read_bytes() == data
+    # 실패한 구간만 다시 요청
+    assert [header for _, header in server.gets] == [f"bytes={SEGMENT_SIZE * 2}-{SEGMENT_SIZE * 3 - 1}"]
+    assert manager.stats()["resumed"] == 1
+
+
+def test_rejects_md5_etag_mismatch(server, manager, tmp_path):
+    data = _payload(b"corrupt", SEGMENT_SIZE + 10)
+    server.files["/corrupt.duckdb"] = data
+    server.etags["/corrupt.duckdb"] = f'"{hashlib.md5(b"other content").hexdigest()}"'
+    dest = tmp_path / "corrupt.duckdb"
+
+    with pytest.raises(DownloadError, match="MD5"):
+        manager.fetch(f"{server.base_url}/corrupt.duckdb", dest)
+
+    # 손상된 부분 파일은 이어받지 않도록 제거
+    assert not dest.exists()
+    assert not dest.with_name(dest.name + DOWNLOAD_SUFFIX).exists()
+    assert not dest.with_name(dest.name + PROGRESS_SUFFIX).exists()
+
+
+def test_same_size_different_content_is_not_reused(server, manager, tmp_path):
+    size = SEGMENT_SIZE + 2048
+    first, second = _payload(b"child", size), _payload(b"rra-cert", size)
+    server.files["/10_safetykoreachild.duckdb"] = first
+    server.files["/11_rra_cert.duckdb"] = second
+    dest = tmp_path / "dataset.duckdb"
+
+    manager.fetch(f"{server.base_url}/10_safetykoreachild.duckdb", dest)
+    manager.fetch(f"{server.base_url}/10_safetykoreachild.duckdb", dest)
+    assert manager.stats()["reused"] == 1
+
+    manager.fetch(f"{server.base_url}/11_rra_cert.duckdb", dest)
+    assert dest.read_bytes() == second
+    assert manager.stats()["reused"] == 1
+
+
+def test_unrecorded_local_copy_is_downloaded_again(server, manager, tmp_path):
+    data = _payload(b"remote", SEGMENT_SIZE)
+    server.files["/plain.duckdb"] = data
+    dest = tmp_path / "plain.duckdb"
+    dest.write_bytes(_payload(b"stale", SEGMENT_SIZE))
+
+    manager.fetch(f"{server.base_url}/plain.duckdb", dest)
+    assert dest.read_bytes() == data
+
+    # sha256을 지정하면 기록이 없어도 내용 확인 후 재사용
+    dest.with_name(dest.name + PROGRESS_SUFFIX).unlink()
+    server.gets.clear()
+    manager.fetch(f"{server.base_url}/plain.duckdb", dest, expected_sha256=hashlib.sha256(data).hexdigest())
+    assert server.gets == []
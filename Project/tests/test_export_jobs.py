@@ -0,0 +1,164 @@
+"""
+백그라운드 내보내기 작업 큐 / /api/export/jobs 엔드포인트 테스트
+"""
+
+import asyncio
+import csv
+import io
+import threading
+
+import httpx
+import openpyxl
+import pytest
+
+import api.main as main
+from conftest import sample_rows
+from core import export_jobs
+from core import file_generator as file_generator_module
+from core import temp_file_manager as temp_file_module
+from core.tmp_quota import tmp_quota
+
+SUBMIT_URL = "/api/export/dataA/safetykorea/jobs"
+
+
+@pytest.fixture
+def export_env(make_dataset, monkeypatch, tmp_path):
+    monkeypatch.setenv("R2_URL_DATAA_SAFETYKOREA", str(make_dataset(sample_rows(1000))))
+    manager = temp_file_module.TempFileManager(base_dir=str(tmp_path / "exports"))
+    monkeypatch.setattr(export_jobs, "temp_file_manager", manager)
+    monkeypatch.setattr(main, "temp_file_manager", manager)
+    monkeypatch.setattr(main, "export_job_queue", export_jobs.ExportJobQueue(max_workers=1))
+    monkeypatch.setattr(file_generator_module, "EXCEL_STREAM_BATCH_SIZE", 100)
+    quota_before = tmp_quota.stats()
+    yield manager
+    tmp_quota.register_owner("export", temp_file_module.temp_file_manager._on_quota_evicted)
+    for temp_id, _ in manager.state.items():
+        manager.delete_temp_file(temp_id)
+    quota_after = tmp_quota.stats()
+    assert (quota_after["used_bytes"], quota_after["pinned"]) == (quota_before["used_bytes"], quota_before["pinned"])
+
+
+@pytest.fixture
+def blocked_writer(monkeypatch):
+    """첫 Excel 배치 기록 후 release가 설정될 때까지 작업 스레드를 멈춤"""
+    first_batch = threading.Event()
+    release = threading.Event()
+    original = file_generator_module.StreamingExcelWriter.write_batch
+
+    def write_batch(self, records):
+        original(self, records)
+        first_batch.set()
+        release.wait(timeout=10)
+
+    monkeypatch.setattr(file_generator_module.StreamingExcelWriter, "write_batch", write_batch)
+    yield first_batch, release
+    release.set()
+
+
+def _run(scenario):
+    async def run():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await scenario(client)
+    return asyncio.run(run())
+
+
+async def _wait_finished(client, job_id):
+    for _ in range(400):
+        status = (await client.get(f"/api/export/jobs/{job_id}")).json()
+        if status["status"] in ("completed", "failed", "cancelled"):
+            return status
+        await asyncio.sleep(0.025)
+    raise AssertionError(f"내보내기 작업이 끝나지 않음: {status}")
+
+
+def _assert_released(manager, job_id):
+    assert manager.get_file_info(job_id) is None
+    assert list(manager.base_dir.glob(f"{job_id}*")) == []
+
+
+@pytest.mark.parametrize("export_format", ["csv", "xlsx"])
+def test_submit_poll_and_download(export_env, export_format):
+    async def scenario(client):
+        submitted = await client.post(SUBMIT_URL, json={
+            "format": export_format, "keyword": "카카오", "search_field": "company_name"
+        })
+        assert submitted.status_code == 200
+        job = submitted.json()
+        assert job["status"] == "queued" and job["estimated_rows"] == 200
+
+        status = await _wait_finished(client, job["job_id"])
+        download = await client.get(f"/api/export/jobs/{job['job_id']}/download")
+        return status, download
+
+    status, download = _run(scenario)
+    assert status["status"] == "completed"
+    assert status["progress"] == 100 and status["processed_count"] == 200
+    assert download.status_code == 200
+    assert download.headers["content-type"].startswith(main.EXPORT_JOB_MEDIA_TYPES[export_format].split(";")[0])
+
+    if export_format == "csv":
+        rows = list(csv.reader(io.StringIO(download.content.decode("utf-8-sig"))))
+        data_rows = rows[1:]
+    else:
+        workbook = openpyxl.load_workbook(io.BytesIO(download.content), read_only=True)
+        sheet = next(sheet for sheet in workbook.worksheets if sheet.title != "검색 요약")
+        data_rows = list(sheet.iter_rows(min_row=2, values_only=True))
+    assert len(data_rows) == 200
+
+
+def test_cancel_running_and_queued_jobs_release_files(export_env, blocked_writer):
+    first_batch, release = blocked_writer
+
+    async def scenario(client):
+        running = (await client.post(SUBMIT_URL, json={"format": "xlsx"})).json()
+        queued = (await client.post(SUBMIT_URL, json={"format": "csv"})).json()
+        await asyncio.to_thread(first_batch.wait, 10)
+
+        queued_status = (await client.get(f"/api/export/jobs/{queued['job_id']}")).json()
+        assert queued_status["status"] == "queued" and queued_status["queue_position"] == 1
+        cancelled_queued = (await client.delete(f"/api/export/jobs/{queued['job_id']}")).json()
+        assert cancelled_queued["status"] == "cancelled"
+        _assert_released(export_env, queued["job_id"])
+
+        cancelling = (await client.delete(f"/api/export/jobs/{running['job_id']}")).json()
+        assert cancelling["status"] == "cancelling"
+        release.set()
+        status = await _wait_finished(client, running["job_id"])
+        download = await client.get(f"/api/export/jobs/{running['job_id']}/download")
+        return running["job_id"], status, download
+
+    job_id, status, download = _run(scenario)
+    assert status["status"] == "cancelled"
+    assert download.status_code == 409
+    _assert_released(export_env, job_id)
+    assert main.export_job_queue.stats()["cancelled"] == 2
+
+
+def test_failed_job_releases_temp_file(export_env, monkeypatch):
+    def failing_write_batch(self, records):
+        raise OSError("디스크 기록 실패")
+
+    monkeypatch.setattr(file_generator_module.StreamingExcelWriter, "write_batch", failing_write_batch)
+
+    async def scenario(client):
+        job = (await client.post(SUBMIT_URL, json={"format": "xlsx"})).json()
+        return job["job_id"], await _wait_finished(client, job["job_id"])
+
+    job_id, status = _run(scenario)
+    assert status["status"] == "failed"
+    assert "디스크 기록 실패" in status["message"]
+    _assert_released(export_env, job_id)
+
+
+def test_unknown_job_and_format_are_rejected(export_env):
+    async def scenario(client):
+        return (
+            await client.get("/api/export/jobs/missing"),
+            await client.delete("/api/export/jobs/missing"),
+            await client.post(SUBMIT_URL, json={"format": "pdf"}),
+        )
+
+    missing_status, missing_cancel, bad_format = _run(scenario)
+    assert missing_status.status_code == missing_cancel.status_code == 404
+    assert bad_format.status_code == 400
@@ -0,0 +1,104 @@
+"""
+검색 결과 facet 집계(GROUPING SETS) 테스트
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import api.main as main
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import DuckDBProcessor
+
+
+def _rows():
+    rows = sample_rows(100)
+    for index, row in enumerate(rows):
+        row["cert_div"] = "자율안전확인" if index % 4 == 0 else "안전인증"
+        row["국산/수입"] = "" if index == 1 else ("수입" if index % 2 else "제조")
+        if index < 10:
+            row["인증일자"] = "2023-05-01"
+    return rows
+
+
+@pytest.fixture(params=["duckdb", "parquet"])
+def dataset(request, make_dataset, tmp_path):
+    # 변환 파일은 날짜 shadow 컬럼으로, Parquet는 문자열 앞 4자리로 연도 계산
+    if request.param == "duckdb":
+        return make_dataset(_rows())
+    return write_parquet(tmp_path / "dataset.parquet", _rows())
+
+
+def _facets(path, **kwargs):
+    processor = DuckDBProcessor(str(path))
+    try:
+        return processor.get_facets(**kwargs)
+    finally:
+        processor.close()
+
+
+def test_facets_count_every_dimension_in_one_pass(dataset):
+    result = _facets(dataset, top_n=3)
+
+    assert result["total_count"] == 100
+    facets = result["facets"]
+    assert list(facets) == ["maker", "cert_div", "year", "import_div"]
+
+    maker = facets["maker"]
+    assert (maker["label"], maker["field"]) == ("제조사", "업체명")
+    assert [value["count"] for value in maker["values"]] == [20, 20, 20]
+    # 상위 top_n 외 나머지 값의 건수
+    assert (maker["distinct_count"], maker["other_count"]) == (5, 40)
+
+    assert facets["cert_div"]["values"] == [
+        {"value": "안전인증", "count": 75}, {"value": "자율안전확인", "count": 25}
+    ]
+    assert facets["year"]["values"] == [{"value": 2024, "count": 90}, {"value": 2023, "count": 10}]
+
+    import_values = {value["value"]: value["count"] for value in facets["import_div"]["values"]}
+    assert facets["import_div"]["field"] == "국산/수입"
+    assert (import_values["수입"], import_values["제조"]) == (49, 50)
+    # 빈 문자열은 값으로 세지 않음
+    assert "" not in import_values
+
+
+def test_facets_follow_search_conditions(dataset):
+    result = _facets(dataset, keyword="카카오", search_field="company_name")
+
+    assert result["total_count"] == 20
+    assert result["facets"]["maker"]["values"] == [{"value": "카카오", "count": 20}]
+    assert result["facets"]["maker"]["other_count"] == 0
+
+
+def test_custom_facet_fields_skip_missing_columns(dataset):
+    result = _facets(dataset, facet_fields={"model": "모델명", "missing": {"columns": ("없는컬럼",)}}, top_n=2)
+
+    assert list(result["facets"]) == ["model"]
+    model = result["facets"]["model"]
+    assert (model["distinct_count"], model["other_count"], len(model["values"])) == (100, 98, 2)
+
+
+def test_facets_endpoint_uses_field_settings_and_cache(tmp_path, monkeypatch):
+    path = write_parquet(tmp_path / "dataset.parquet", _rows())
+    monkeypatch.setattr(main, "get_data_file_path", lambda category, subcategory: str(path))
+    monkeypatch.setattr(main, "load_field_settings", lambda: {
+        "dataA": {"safetykorea": {"facet_fields": {"maker": {"label": "업체", "columns": ["업체명"]}}}}
+    })
+
+    async def run():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            body = {"keyword": "엘지", "search_field": "company_name", "top_n": 1000}
+            first = await client.post("/api/facets/dataA/safetykorea", json=body)
+            second = await client.post("/api/facets/dataA/safetykorea", json=body)
+            return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first.status_code == 200
+    body = first.json()
+    assert list(body["facets"]) == ["maker"]
+    assert body["facets"]["maker"]["label"] == "업체"
+    assert body["total_count"] == 20
+    assert "cache_hit" not in body and second.json()["cache_hit"] is True
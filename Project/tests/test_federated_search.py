@@ -0,0 +1,96 @@
+"""
+통합(다중 데이터셋) 검색 테스트
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import api.main as main
+from conftest import sample_rows
+
+# dataC field_settings는 최상위 키가 결과 유형이고 그 아래에 서브카테고리가 있음
+DATAC_SETTINGS = {
+    "dataC": {
+        "success": {"safetykorea": {}, "approval": {}},
+        "failed": {"safetykorea": {}},
+    }
+}
+
+
+@pytest.fixture
+def datac_env(make_dataset, monkeypatch):
+    datasets = {
+        ("success", "safetykorea"): make_dataset(sample_rows(50), name="success_safetykorea"),
+        ("success", "approval"): make_dataset(sample_rows(25), name="success_approval"),
+        ("failed", "safetykorea"): make_dataset(sample_rows(20), name="failed_safetykorea"),
+    }
+    monkeypatch.setattr(main, "load_field_settings", lambda: DATAC_SETTINGS)
+    for (result_type, subcategory), path in datasets.items():
+        monkeypatch.setitem(main.PREFETCHED_BLOB_FILES, ("dataC", result_type, subcategory), str(path))
+
+    calls = []
+    original = main.duckdb_search_large_file
+
+    async def recording_search(**kwargs):
+        calls.append((kwargs["result_type"], kwargs["subcategory"], kwargs["file_path"]))
+        return await original(**kwargs)
+
+    monkeypatch.setattr(main, "duckdb_search_large_file", recording_search)
+    return datasets, calls
+
+
+def _federated(**kwargs):
+    request = main.FederatedSearchRequest(keyword="카카오", search_field="company_name", category="dataC", **kwargs)
+    return asyncio.run(main.search_federated(request))
+
+
+def test_datac_searches_every_result_type(datac_env):
+    datasets, calls = datac_env
+    result = _federated(limit=6)
+
+    assert sorted(calls) == sorted(
+        (result_type, subcategory, str(path)) for (result_type, subcategory), path in datasets.items()
+    )
+    counts = {entry["dataset"]: entry["total_count"] for entry in result["datasets"]}
+    assert counts == {"success/safetykorea": 10, "success/approval": 5, "failed/safetykorea": 4}
+    assert all(entry["status"] == "ok" for entry in result["datasets"])
+    assert result["summary"]["total_count"] == 19
+    assert result["summary"]["datasets_requested"] == 3
+
+    # 통합 첫 페이지는 데이터셋을 번갈아 채우고 결과 유형까지 표시
+    assert [row["_dataset"] for row in result["results"]][:3] == [
+        "success/safetykorea", "success/approval", "failed/safetykorea"
+    ]
+    assert len(result["results"]) == 6
+
+
+def test_datac_result_type_and_dataset_selection(datac_env):
+    _, calls = datac_env
+
+    failed_only = _federated(result_type="failed")
+    assert [entry["dataset"] for entry in failed_only["datasets"]] == ["failed/safetykorea"]
+
+    calls.clear()
+    explicit = _federated(datasets=["success/approval", "safetykorea"])
+    assert [entry["dataset"] for entry in explicit["datasets"]] == [
+        "success/approval", "success/safetykorea", "failed/safetykorea"
+    ]
+    assert len(calls) == 3
+
+
+def test_datac_missing_file_is_reported_per_dataset(datac_env, monkeypatch):
+    monkeypatch.delitem(main.PREFETCHED_BLOB_FILES, ("dataC", "failed", "safetykorea"))
+    monkeypatch.delenv("BLOB_URL_DATAC_FAILED_1_SAFETYKOREA", raising=False)
+
+    result = _federated()
+    statuses = {entry["dataset"]: entry["status"] for entry in result["datasets"]}
+    assert statuses == {"success/safetykorea": "ok", "success/approval": "ok", "failed/safetykorea": "unavailable"}
+    assert result["summary"]["datasets_failed"] == 1
+
+
+def test_unknown_result_type_is_rejected(datac_env):
+    with pytest.raises(HTTPException) as error:
+        _federated(result_type="pending")
+    assert error.value.status_code == 400
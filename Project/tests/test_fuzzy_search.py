@@ -0,0 +1,87 @@
+"""
+퍼지(오타/띄어쓰기 허용) 검색 테스트 - n-gram postings 후보 / 전체 스캔 후보
+"""
+
+from collections import Counter
+
+import pytest
+
+import core.duckdb_processor as duckdb_processor
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import DuckDBProcessor
+
+
+def _rows():
+    rows = sample_rows(100, with_dates=False)
+    for index in range(9, 100, 10):
+        rows[index]["업체명"] = "Samsung Electronics"
+    return rows
+
+
+@pytest.fixture(params=["ngram", "scan"])
+def fuzzy_path(request, make_dataset, tmp_path):
+    """변환된 DuckDB(n-gram postings)와 색인 없는 원본 Parquet 모두 같은 결과여야 함"""
+    if request.param == "ngram":
+        return make_dataset(_rows())
+    return write_parquet(tmp_path / "raw.parquet", _rows())
+
+
+def _fuzzy(path, keyword, **kwargs):
+    processor = DuckDBProcessor(str(path))
+    try:
+        return processor.search_fuzzy(keyword, limit=100, **kwargs)
+    finally:
+        processor.close()
+
+
+def _companies(result):
+    return Counter(record["업체명"] for record in result["results"])
+
+
+def test_one_edit_typo_finds_company(fuzzy_path):
+    result = _fuzzy(fuzzy_path, "samsng electronics")
+
+    assert _companies(result) == {"Samsung Electronics": 10}
+    assert result["debug_info"]["candidate_source"] == ("ngram" if fuzzy_path.suffix == ".duckdb" else "scan")
+    assert all(record["match_score"] >= duckdb_processor.FUZZY_MIN_SCORE for record in result["results"])
+
+
+def test_korean_typo_and_spacing(fuzzy_path):
+    # 한 글자 오타 / 띄어쓰기 / 법인 표기 차이
+    assert _companies(_fuzzy(fuzzy_path, "삼송전자")) == {"삼성전자(주)": 20}
+    assert _companies(_fuzzy(fuzzy_path, "엘지전지")) == {"엘지전자": 20}
+
+    spaced = _fuzzy(fuzzy_path, "삼성 전자")
+    assert _companies(spaced) == {"삼성전자(주)": 20}
+    assert {record["match_score"] for record in spaced["results"]} == {1.0}
+
+
+def test_min_score_threshold(fuzzy_path, monkeypatch):
+    assert _fuzzy(fuzzy_path, "현대자동차")["pagination"]["total_count"] == 0
+
+    # 기본 임계값에서는 포함되는 한 글자 오타도 임계값을 올리면 제외
+    monkeypatch.setattr(duckdb_processor, "FUZZY_MIN_SCORE", 0.7)
+    assert _fuzzy(fuzzy_path, "삼송전자")["pagination"]["total_count"] == 0
+    assert _companies(_fuzzy(fuzzy_path, "엘지전지")) == {"엘지전자": 20}
+
+
+def test_results_are_ranked_and_paged(fuzzy_path):
+    processor = DuckDBProcessor(str(fuzzy_path))
+    try:
+        first = processor.search_fuzzy("삼성전자", limit=15)
+        second = processor.search_fuzzy("삼성전자", limit=15, page=2)
+    finally:
+        processor.close()
+
+    assert first["pagination"]["total_count"] == 20
+    assert [len(first["results"]), len(second["results"])] == [15, 5]
+    assert first["pagination"]["has_next"] and not second["pagination"]["has_next"]
+    names = [record["제품명"] for record in first["results"] + second["results"]]
+    assert len(set(names)) == 20
+
+
+def test_short_or_exact_field_keyword_is_rejected(fuzzy_path):
+    with pytest.raises(ValueError):
+        _fuzzy(fuzzy_path, "삼")
+    with pytest.raises(ValueError):
+        _fuzzy(fuzzy_path, "YU00001", search_field="cert_num")
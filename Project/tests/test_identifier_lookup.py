@@ -0,0 +1,102 @@
+"""
+식별자 ART 인덱스와 /api/lookup 단건 조회 테스트
+"""
+
+import asyncio
+
+import duckdb
+import httpx
+import pytest
+
+import api.main as main
+from conftest import sample_rows
+from core.duckdb_processor import DuckDBProcessor
+
+
+def _rows(count):
+    rows = sample_rows(count, with_dates=False)
+    for index, row in enumerate(rows):
+        row["사업자등록번호"] = f"{100 + index:03d}-81-{index:05d}"
+    return rows
+
+
+@pytest.fixture
+def dataset(make_dataset):
+    return make_dataset(_rows(200))
+
+
+def _lookup(path, identifiers, field=None):
+    processor = DuckDBProcessor(str(path))
+    try:
+        return processor.lookup_identifiers(identifiers, field)
+    finally:
+        processor.close()
+
+
+def test_converter_indexes_normalized_identifier_columns(dataset):
+    conn = duckdb.connect(str(dataset), read_only=True)
+    try:
+        indexed = [row[0].strip('[]"') for row in conn.execute("SELECT expressions FROM duckdb_indexes()").fetchall()]
+    finally:
+        conn.close()
+
+    # 검색 시 비교하는 정규화 컬럼과 같은 컬럼에 인덱스가 있어야 index scan 적용
+    assert sorted(indexed) == ["cert_num__norm", "사업자등록번호__norm"]
+
+
+def test_lookup_returns_records_in_request_order(dataset):
+    result = _lookup(dataset, ["YU00150-25001", "없는번호", "yu00007-25001", "YU00150-25001"])
+
+    assert result["field"] == "cert_num"
+    assert result["found_count"] == 2
+    # 정규화 값 기준 중복 제거, 입력 순서 유지
+    assert [item["identifier"] for item in result["results"]] == ["YU00150-25001", "없는번호", "yu00007-25001"]
+    assert [item["found"] for item in result["results"]] == [True, False, True]
+    found = result["results"][0]["records"]
+    assert len(found) == 1 and found[0]["모델명"] == "MD-00150"
+    # 내부 shadow 컬럼은 응답에서 제외
+    assert not any(column.startswith("cert_num__") or column.startswith("__") for column in found[0])
+
+
+def test_business_number_lookup_ignores_hyphens(dataset):
+    result = _lookup(dataset, ["142 81 00042", "1428100042"], field="사업자등록번호")
+
+    assert result["field"] == "사업자등록번호"
+    assert len(result["results"]) == 1
+    assert result["results"][0]["records"][0]["사업자등록번호"] == "142-81-00042"
+
+
+def test_lookup_rejects_unsupported_field(dataset):
+    with pytest.raises(ValueError):
+        _lookup(dataset, ["MD-00001"], field="모델명")
+    with pytest.raises(ValueError):
+        _lookup(dataset, ["123"], field="declare_no")
+
+
+def _get(path, monkeypatch, params):
+    monkeypatch.setattr(main, "get_data_file_path", lambda category, subcategory: str(path))
+
+    async def run():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/lookup/dataA/safetykorea", params=params)
+    return asyncio.run(run())
+
+
+def test_lookup_endpoint(dataset, monkeypatch):
+    response = _get(dataset, monkeypatch, [("ids", "YU00001-25001,YU00002-25001"), ("ids", "YU99999-25001")])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["requested_count"] == 3
+    assert body["found_count"] == 2
+    assert [item["found"] for item in body["results"]] == [True, True, False]
+
+
+def test_lookup_endpoint_limits_identifier_count(dataset, monkeypatch):
+    monkeypatch.setattr(main, "LOOKUP_MAX_IDENTIFIERS", 2)
+    too_many = _get(dataset, monkeypatch, {"ids": "a,b,c"})
+    unknown_field = _get(dataset, monkeypatch, {"ids": "a", "field": "업체명"})
+
+    assert too_many.status_code == 400
+    assert unknown_field.status_code == 400
@@ -0,0 +1,119 @@
+"""
+동일 검색 single-flight(InflightSearches) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import DuckDBProcessor, duckdb_search_large_file
+from core.query_cache import InflightSearches, query_result_cache
+
+
+def test_concurrent_same_key_runs_once():
+    inflight = InflightSearches()
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"value": len(calls)}
+
+    async def scenario():
+        return await asyncio.gather(*(inflight.run("same", factory) for _ in range(5)))
+
+    outcomes = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert [result for result, _ in outcomes] == [{"value": 1}] * 5
+    assert sorted(shared for _, shared in outcomes) == [False, True, True, True, True]
+    assert inflight.stats() == {"inflight": 0, "executed": 1, "coalesced": 4}
+
+
+def test_different_keys_and_sequential_runs_are_not_shared():
+    inflight = InflightSearches()
+
+    async def factory():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def scenario():
+        await asyncio.gather(inflight.run("a", factory), inflight.run("b", factory))
+        await inflight.run("a", factory)
+
+    asyncio.run(scenario())
+    assert inflight.stats() == {"inflight": 0, "executed": 3, "coalesced": 0}
+
+
+def test_leader_error_is_shared_with_waiters():
+    inflight = InflightSearches()
+
+    async def factory():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("scan failed")
+
+    async def scenario():
+        return await asyncio.gather(*(inflight.run("key", factory) for _ in range(3)), return_exceptions=True)
+
+    outcomes = asyncio.run(scenario())
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert inflight.stats()["executed"] == 1
+
+
+def test_waiter_takes_over_when_leader_is_cancelled():
+    inflight = InflightSearches()
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def scenario():
+        leader = asyncio.create_task(inflight.run("key", factory))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(inflight.run("key", factory))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter
+
+    result, shared = asyncio.run(scenario())
+    # 취소된 선행 요청 대신 대기 요청이 직접 다시 실행
+    assert (result, shared) == (2, False)
+    assert len(calls) == 2
+
+
+@pytest.fixture
+def clean_cache():
+    query_result_cache.invalidate()
+    yield
+    query_result_cache.invalidate()
+
+
+def test_concurrent_identical_searches_scan_once(clean_cache, tmp_path, monkeypatch):
+    path = write_parquet(tmp_path / "dataset.parquet", sample_rows(200, with_dates=False))
+    scans = []
+    original = DuckDBProcessor.search_streaming
+
+    async def counting_search(self, *args, **kwargs):
+        scans.append(args)
+        await asyncio.sleep(0.05)
+        return await original(self, *args, **kwargs)
+
+    monkeypatch.setattr(DuckDBProcessor, "search_streaming", counting_search)
+
+    async def scenario():
+        return await asyncio.gather(*(
+            duckdb_search_large_file(str(path), keyword="카카오", search_field="company_name", limit=10)
+            for _ in range(4)
+        ))
+
+    results = asyncio.run(scenario())
+
+    assert len(scans) == 1
+    assert sum(1 for result in results if result["stats"].get("coalesced")) == 3
+    assert all(result["results"] == results[0]["results"] for result in results)
+    assert results[0]["pagination"]["total_count"] == 40
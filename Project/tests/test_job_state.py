@@ -0,0 +1,106 @@
+"""
+작업 상태 저널(JobStateStore) / TempFileManager 재시작 복원 테스트
+"""
+
+import json
+
+import pytest
+
+from core import temp_file_manager as temp_file_module
+from core.job_state import JobStateStore
+from core.tmp_quota import tmp_quota
+
+
+def _journal_lines(path):
+    return [line for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+def test_updates_are_journaled_and_replayed(tmp_path):
+    journal = tmp_path / "metadata.journal"
+    store = JobStateStore(journal, flush_interval=3600)
+    store.put("job-1", {"status": "creating", "progress": 0})
+    store.put("job-2", {"status": "creating"})
+
+    # 진행률 갱신은 flush 전까지 저널에 쓰지 않고 하나로 병합
+    for progress in range(1, 50):
+        store.update("job-1", {"progress": progress})
+    assert len(_journal_lines(journal)) == 2
+    store.update("job-1", {"status": "completed"}, flush=True)
+    store.delete("job-2")
+
+    lines = [json.loads(line) for line in _journal_lines(journal)]
+    assert lines[2] == {"id": "job-1", "set": {"progress": 49, "status": "completed"}}
+    assert lines[3] == {"id": "job-2", "del": True}
+
+    replayed = JobStateStore(journal)
+    assert replayed.items() == [("job-1", {"status": "completed", "progress": 49})]
+
+
+def test_torn_last_line_is_skipped_and_not_merged_with_next_write(tmp_path):
+    journal = tmp_path / "metadata.journal"
+    store = JobStateStore(journal)
+    store.put("job-1", {"status": "completed"})
+
+    # 기록 도중 프로세스가 종료되어 마지막 줄이 잘린 상태
+    with open(journal, "ab") as f:
+        f.write(b'{"id": "job-2", "set": {"sta')
+
+    restarted = JobStateStore(journal)
+    assert restarted.items() == [("job-1", {"status": "completed"})]
+
+    restarted.put("job-3", {"status": "creating"})
+    assert dict(JobStateStore(journal).items()) == {
+        "job-1": {"status": "completed"},
+        "job-3": {"status": "creating"},
+    }
+
+
+def test_compaction_rewrites_snapshot_and_readers_follow(tmp_path):
+    journal = tmp_path / "metadata.journal"
+    writer = JobStateStore(journal, flush_interval=0, compact_bytes=2048)
+    reader = JobStateStore(journal)
+
+    for index in range(40):
+        writer.put(f"job-{index}", {"status": "creating", "progress": 0})
+        writer.update(f"job-{index}", {"progress": 100, "status": "completed"})
+        if index % 2:
+            writer.delete(f"job-{index}")
+
+    assert writer.stats()["compactions"] >= 1
+    assert journal.stat().st_size <= 2048
+    assert not journal.with_suffix(".tmp").exists()
+
+    expected = {f"job-{index}": {"status": "completed", "progress": 100} for index in range(0, 40, 2)}
+    # 교체된 저널을 다른 인스턴스(다른 워커)와 새 프로세스 모두 같은 상태로 읽음
+    assert dict(reader.items()) == expected
+    assert dict(JobStateStore(journal).items()) == expected
+
+
+@pytest.fixture
+def restore_quota_owner():
+    yield
+    tmp_quota.register_owner("export", temp_file_module.temp_file_manager._on_quota_evicted)
+
+
+def test_restart_drops_completed_files_deleted_while_down(tmp_path, restore_quota_owner):
+    manager = temp_file_module.TempFileManager(base_dir=str(tmp_path / "exports"))
+    kept = manager.create_temp_file("kept", "csv", expected_size=1024)
+    kept.write_bytes(b"a,b\n")
+    manager.update_file_status("kept", "completed", size=4)
+    removed = manager.create_temp_file("removed", "csv", expected_size=1024)
+    removed.write_bytes(b"a,b\n")
+    manager.update_file_status("removed", "completed", size=4)
+    manager.create_temp_file("failed", "csv", expected_size=1024)
+    manager.update_file_status("failed", "failed", message="검색 실패")
+    for temp_id in ("kept", "removed", "failed"):
+        tmp_quota.discard(manager.get_file_info(temp_id)["file_path"])
+
+    # 프로세스가 내려가 있는 동안 파일이 삭제됨
+    removed.unlink()
+
+    restarted = temp_file_module.TempFileManager(base_dir=str(tmp_path / "exports"))
+    assert restarted.get_file_path("kept") == kept
+    assert restarted.get_file_info("removed") is None
+    assert restarted.get_file_info("failed")["message"] == "검색 실패"
+    assert "removed" not in dict(JobStateStore(tmp_path / "exports" / "metadata.journal").items())
+    tmp_quota.discard(kept)
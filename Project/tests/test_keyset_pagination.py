@@ -0,0 +1,105 @@
+"""
+search_streaming keyset(커서) 페이지네이션 테스트
+"""
+
+import asyncio
+
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import DuckDBProcessor, _decode_cursor, _encode_cursor
+
+
+def _search(path, **kwargs):
+    processor = DuckDBProcessor(str(path))
+    try:
+        return asyncio.run(processor.search_streaming(**kwargs))
+    finally:
+        processor.close()
+
+
+def _names(result):
+    return [record["제품명"] for record in result["results"]]
+
+
+def test_cursor_round_trip_matches_offset_pages(make_dataset):
+    path = make_dataset(sample_rows(25, with_dates=False))
+
+    first = _search(path, limit=10)
+    assert first["pagination"]["total_count"] == 25
+    assert first["query_info"]["pagination_mode"] == "offset"
+    cursor = first["pagination"]["next_cursor"]
+    assert cursor
+
+    pages = [_names(first)]
+    while cursor:
+        page = _search(path, limit=10, cursor=cursor)
+        assert page["query_info"]["pagination_mode"] == "keyset"
+        assert page["pagination"]["total_count"] == 25
+        pages.append(_names(page))
+        cursor = page["pagination"]["next_cursor"]
+
+    # 마지막 페이지에는 다음 커서가 없음
+    assert [len(names) for names in pages] == [10, 10, 5]
+    assert page["pagination"]["has_next"] is False
+    assert page["pagination"]["current_page"] == 3
+
+    # 커서 페이지는 같은 번호의 offset 페이지와 동일하고 누락/중복이 없음
+    offset_pages = [_names(_search(path, limit=10, page=number)) for number in (1, 2, 3)]
+    assert pages == offset_pages
+    assert sorted(sum(pages, [])) == sorted(row["제품명"] for row in sample_rows(25, with_dates=False))
+
+
+def test_cursor_round_trip_with_keyword(make_dataset):
+    path = make_dataset(sample_rows(40, with_dates=False))
+
+    first = _search(path, keyword="전자", search_field="company_name", limit=5)
+    expected_total = first["pagination"]["total_count"]
+    assert expected_total == 16
+
+    collected = _names(first)
+    cursor = first["pagination"]["next_cursor"]
+    while cursor:
+        page = _search(path, keyword="전자", search_field="company_name", limit=5, cursor=cursor)
+        collected.extend(_names(page))
+        cursor = page["pagination"]["next_cursor"]
+
+    assert len(collected) == len(set(collected)) == expected_total
+
+
+def test_tampered_cursor_falls_back_to_page(make_dataset):
+    path = make_dataset(sample_rows(25, with_dates=False))
+    first = _search(path, limit=10)
+    cursor = first["pagination"]["next_cursor"]
+
+    garbage = _search(path, limit=10, cursor="not-a-cursor!")
+    assert garbage["query_info"]["pagination_mode"] == "offset"
+    assert _names(garbage) == _names(first)
+
+    # 다른 검색 조건에서 발급된 커서는 사용하지 않음
+    payload = _decode_cursor(cursor)
+    forged = _encode_cursor({**payload, "q": "other-query"})
+    result = _search(path, limit=10, cursor=forged)
+    assert result["query_info"]["pagination_mode"] == "offset"
+    assert _names(result) == _names(first)
+
+    # 커서는 현재 검색어와 다른 검색에 재사용할 수 없음
+    other = _search(path, keyword="카카오", search_field="company_name", limit=10, cursor=cursor)
+    assert other["query_info"]["pagination_mode"] == "offset"
+    assert all(record["업체명"] == "카카오" for record in other["results"])
+
+
+def test_unpaged_query_is_not_sorted(tmp_path):
+    # 클러스터링 키가 없는 원본 Parquet - 예전에는 전체 결과를 행 식별자로 정렬함
+    rows = sample_rows(30, with_dates=False)
+    path = write_parquet(tmp_path / "unclustered.parquet", rows)
+    processor = DuckDBProcessor(str(path))
+    try:
+        result = asyncio.run(processor.search_streaming(limit=None))
+        assert _names(result) == [row["제품명"] for row in rows]
+
+        templates = list(processor._handle._templates.values())
+        assert len(templates) == 1 and "ORDER BY" not in templates[0]
+        with processor._acquire_cursor() as conn:
+            plan = "\n".join(row[1] for row in conn.execute(f"EXPLAIN {templates[0]}", [0]).fetchall())
+        assert "ORDER_BY" not in plan
+    finally:
+        processor.close()
@@ -0,0 +1,85 @@
+"""
+변환 스크립트 스키마/통계 manifest 테스트
+"""
+
+import hashlib
+import json
+import uuid
+
+import pytest
+from convert_parquet_to_duckdb import MANIFEST_FILENAME, write_manifest
+
+from conftest import sample_rows
+from core.duckdb_processor import DuckDBProcessor
+
+
+def _unique_rows(count):
+    # 다른 테스트와 파일 내용(fingerprint)이 겹치지 않도록 고유 값 포함
+    token = uuid.uuid4().hex
+    rows = sample_rows(count)
+    for row in rows:
+        row["비고"] = token
+    return rows
+
+
+@pytest.fixture
+def converted(make_dataset):
+    first = make_dataset(_unique_rows(30))
+    second = make_dataset(_unique_rows(10), name="2_approval_flattened")
+    return first.parent, first, second
+
+
+def test_manifest_describes_converted_files(converted):
+    root, first, second = converted
+    manifest = json.loads(write_manifest(root, [first, second]).read_text(encoding="utf-8"))
+
+    assert manifest["version"] == 1
+    assert sorted(manifest["datasets"]) == [first.name, second.name]
+    entry = manifest["datasets"][first.name]
+    assert entry["fingerprint"] == hashlib.sha256(first.read_bytes()).hexdigest()
+    assert entry["size"] == first.stat().st_size
+    assert entry["table"] == "1_safetykorea_flattened"
+    assert entry["row_count"] == 30
+    assert {"업체명", "업체명__norm", "인증일자__date", "제품명__choseong"} <= {column["name"] for column in entry["columns"]}
+    assert "cert_num__norm" in entry["normalized_columns"]
+    assert entry["date_columns"] == ["인증일자__date"]
+    assert {"업체명", "제품명", "모델명"} <= set(entry["ngram_columns"])
+    assert entry["index_columns"] == ["cert_num__norm"]
+    assert entry["clustering_key"][0]["column"] == "인증일자"
+
+
+def test_manifest_merges_and_drops_missing_datasets(converted):
+    root, first, second = converted
+    write_manifest(root, [first])
+    write_manifest(root, [second])
+    assert sorted(json.loads((root / MANIFEST_FILENAME).read_text(encoding="utf-8"))["datasets"]) == [
+        first.name, second.name
+    ]
+
+    second.unlink()
+    manifest = json.loads(write_manifest(root, [first]).read_text(encoding="utf-8"))
+    assert list(manifest["datasets"]) == [first.name]
+
+
+def _available_fields(path):
+    processor = DuckDBProcessor(str(path))
+    try:
+        return processor._get_available_fields()
+    finally:
+        processor.close()
+
+
+def test_processor_reads_schema_from_manifest(converted):
+    root, first, second = converted
+    manifest_path = write_manifest(root, [first, second])
+
+    # manifest에만 있는 컬럼이 보이면 파일을 조회하지 않고 manifest를 사용한 것
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["datasets"][first.name]["columns"].append({"name": "manifest_only", "type": "VARCHAR"})
+    manifest["datasets"][second.name]["fingerprint"] = "stale"
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+
+    assert "manifest_only" in _available_fields(first)
+    # fingerprint가 다른(파일이 바뀐) 데이터셋은 파일에서 직접 조회
+    fields = _available_fields(second)
+    assert "manifest_only" not in fields and "업체명" in fields
@@ -0,0 +1,74 @@
+"""
+n-gram postings 부분 문자열 검색 테스트
+"""
+
+import asyncio
+
+import duckdb
+import pytest
+
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import NGRAM_TABLE_SUFFIX, DuckDBProcessor, _build_ngram_lookup_grams
+
+TABLE = "1_safetykorea_flattened"
+
+
+def _search(path, keyword, search_field):
+    processor = DuckDBProcessor(str(path))
+    try:
+        result = asyncio.run(processor.search_streaming(keyword=keyword, search_field=search_field, limit=None))
+        return sorted(record["제품명"] for record in result["results"]), processor.debug_info["where_clause"]
+    finally:
+        processor.close()
+
+
+@pytest.fixture
+def paths(make_dataset, tmp_path):
+    rows = sample_rows(300, with_dates=False)
+    rows[7]["제품명"] = "Wireless 청소기 PRO"
+    return make_dataset(rows), write_parquet(tmp_path / "raw.parquet", rows)
+
+
+def test_postings_cover_bigrams_and_trigrams(paths):
+    converted, _ = paths
+    conn = duckdb.connect(str(converted), read_only=True)
+    try:
+        grams = {
+            gram for (gram,) in conn.execute(
+                f'SELECT gram FROM "{TABLE}{NGRAM_TABLE_SUFFIX}" WHERE column_name = ? '
+                f'AND row_id = (SELECT rowid FROM "{TABLE}" WHERE "제품명" = ?)',
+                ["제품명", "Wireless 청소기 PRO"]
+            ).fetchall()
+        }
+    finally:
+        conn.close()
+    # 정규화(소문자) 값 기준, 한글은 음절 단위
+    assert {"wi", "wir", "청소", "청소기", " p", "pro"} <= grams
+    assert "Wi" not in grams
+
+
+@pytest.mark.parametrize("keyword, search_field", [
+    ("전자", "company_name"),
+    ("밥솥 000", "product_name"),
+    ("WIRELESS 청소", "product_name"),
+    ("md-0012", "model_name"),
+    ("카", "company_name"),
+    ("없는검색어", "product_name"),
+])
+def test_postings_search_matches_full_scan(paths, keyword, search_field):
+    converted, raw = paths
+    indexed_names, indexed_where = _search(converted, keyword, search_field)
+    scanned_names, scanned_where = _search(raw, keyword, search_field)
+
+    assert indexed_names == scanned_names
+    assert NGRAM_TABLE_SUFFIX not in scanned_where
+    # 2자 이상이면 postings 후보 조회 후 LIKE로 재검증
+    assert (NGRAM_TABLE_SUFFIX in indexed_where) == bool(_build_ngram_lookup_grams(keyword))
+
+
+def test_lookup_grams_skip_wildcards_and_short_keywords():
+    assert _build_ngram_lookup_grams("카") == []
+    assert _build_ngram_lookup_grams("50%") == []
+    assert _build_ngram_lookup_grams("a_b") == []
+    assert _build_ngram_lookup_grams("전자") == ["전자"]
+    assert _build_ngram_lookup_grams("ABCDEFGH") == ["abc", "cde", "def", "fgh"]
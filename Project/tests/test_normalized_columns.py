@@ -0,0 +1,76 @@
+"""
+정규화(`__norm`) shadow 컬럼 테스트
+"""
+
+import asyncio
+import unicodedata
+
+import duckdb
+import pytest
+
+from conftest import sample_rows
+from core.duckdb_processor import DuckDBProcessor, NORMALIZED_COLUMN_SUFFIX
+
+TABLE = "1_safetykorea_flattened"
+FULLWIDTH_NAME = "ＳＡＭＳＵＮＧ Ｅｌｅｃｔｒｏｎｉｃｓ"
+DECOMPOSED_NAME = unicodedata.normalize("NFD", "한글상사")
+
+
+@pytest.fixture
+def dataset(make_dataset):
+    rows = sample_rows(50, with_dates=False)
+    rows[3]["업체명"] = FULLWIDTH_NAME
+    rows[4]["업체명"] = DECOMPOSED_NAME
+    for index, row in enumerate(rows):
+        row["사업자등록번호"] = f"123-45-{index:05d}"
+    return make_dataset(rows)
+
+
+def _search(path, keyword, search_field):
+    processor = DuckDBProcessor(str(path))
+    try:
+        result = asyncio.run(processor.search_streaming(keyword=keyword, search_field=search_field, limit=None))
+        return result["results"], processor.debug_info["where_clause"]
+    finally:
+        processor.close()
+
+
+def test_converter_stores_normalized_values(dataset):
+    conn = duckdb.connect(str(dataset), read_only=True)
+    try:
+        columns = {name for (name,) in conn.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = ?", [TABLE]
+        ).fetchall()}
+        row = conn.execute(
+            f'SELECT "업체명__norm", "사업자등록번호__norm" FROM "{TABLE}" WHERE "업체명" = ?', [FULLWIDTH_NAME]
+        ).fetchone()
+    finally:
+        conn.close()
+
+    assert {f"{name}{NORMALIZED_COLUMN_SUFFIX}" for name in ("업체명", "제품명", "모델명", "cert_num", "사업자등록번호")} <= columns
+    assert row[0] == "samsung electronics"
+    assert row[1] == "1234500003"
+
+
+@pytest.mark.parametrize("keyword", ["samsung elec", "SAMSUNG", "Ｓａｍｓｕｎｇ"])
+def test_case_and_width_insensitive_search(dataset, keyword):
+    results, where_clause = _search(dataset, keyword, "company_name")
+
+    assert [record["업체명"] for record in results] == [FULLWIDTH_NAME]
+    assert f'"업체명{NORMALIZED_COLUMN_SUFFIX}" LIKE' in where_clause
+    assert "LOWER(" not in where_clause
+    # shadow 컬럼은 응답에 노출하지 않음
+    assert not any(key.endswith(NORMALIZED_COLUMN_SUFFIX) for key in results[0])
+
+
+def test_decomposed_hangul_matches_composed_keyword(dataset):
+    results, _ = _search(dataset, "한글상사", "company_name")
+    assert [record["업체명"] for record in results] == [DECOMPOSED_NAME]
+
+
+def test_exact_number_fields_match_normalized_value(dataset):
+    results, where_clause = _search(dataset, "yu00003-25001", "cert_num")
+
+    assert [record["cert_num"] for record in results] == ["YU00003-25001"]
+    assert f'"cert_num{NORMALIZED_COLUMN_SUFFIX}" = ?' in where_clause
+    assert _search(dataset, "yu00003", "cert_num")[0] == []
@@ -0,0 +1,95 @@
+"""
+검색 결과 캐시(QueryResultCache) 테스트
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import duckdb_search_large_file
+from core.query_cache import QueryResultCache, query_result_cache
+
+
+def _value(size):
+    return {"results": ["x" * size]}
+
+
+def test_byte_budget_evicts_least_recently_used():
+    cache = QueryResultCache(max_bytes=300, ttl_seconds=60, max_entry_bytes=200)
+    for key in ("a", "b", "c"):
+        assert cache.put(key, "dataset", "v1", _value(80))
+    assert cache.get("a", "dataset", "v1") is not None  # a를 최근 사용으로 갱신
+
+    cache.put("d", "dataset", "v1", _value(80))
+
+    assert cache.get("b", "dataset", "v1") is None
+    assert all(cache.get(key, "dataset", "v1") is not None for key in ("a", "c", "d"))
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["bytes"] <= 300
+
+
+def test_oversized_entry_is_not_stored():
+    cache = QueryResultCache(max_bytes=1000, ttl_seconds=60, max_entry_bytes=100)
+    assert not cache.put("big", "dataset", "v1", _value(200))
+    assert cache.stats()["entries"] == 0
+
+
+def test_entries_expire_after_ttl():
+    cache = QueryResultCache(max_bytes=1000, ttl_seconds=0.05)
+    cache.put("a", "dataset", "v1", _value(10))
+    assert cache.get("a", "dataset", "v1") is not None
+    time.sleep(0.06)
+    assert cache.get("a", "dataset", "v1") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_new_dataset_version_invalidates_only_that_dataset():
+    cache = QueryResultCache(max_bytes=10000, ttl_seconds=60)
+    cache.put("a1", "dataset-a", "v1", _value(10))
+    cache.put("a2", "dataset-a", "v1", _value(10))
+    cache.put("b1", "dataset-b", "v1", _value(10))
+
+    assert cache.get("a1", "dataset-a", "v2") is None
+    assert cache.get("a2", "dataset-a", "v2") is None
+    assert cache.get("b1", "dataset-b", "v1") is not None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_build_key_ignores_parameter_order():
+    first = QueryResultCache.build_key("dataset", {"keyword": "카카오", "filters": {"a": 1, "b": 2}})
+    second = QueryResultCache.build_key("dataset", {"filters": {"b": 2, "a": 1}, "keyword": "카카오"})
+    assert first == second
+    assert first != QueryResultCache.build_key("other", {"keyword": "카카오", "filters": {"a": 1, "b": 2}})
+
+
+@pytest.fixture
+def clean_cache():
+    query_result_cache.invalidate()
+    yield query_result_cache
+    query_result_cache.invalidate()
+
+
+def _search(path, keyword):
+    return asyncio.run(duckdb_search_large_file(str(path), keyword=keyword, search_field="company_name", limit=10))
+
+
+def test_search_results_are_cached_per_dataset_version(clean_cache, tmp_path):
+    path = write_parquet(tmp_path / "dataset.parquet", sample_rows(100, with_dates=False))
+
+    first = _search(path, "카카오")
+    cached = _search(path, " 카카오 ")
+    other = _search(path, "엘지")
+
+    assert "cache_hit" not in first["stats"]
+    assert cached["stats"]["cache_hit"] is True
+    assert cached["results"] == first["results"]
+    assert "cache_hit" not in other["stats"]
+
+    # 파일이 교체되면 (크기/수정 시각 변경) 이전 결과를 재사용하지 않음
+    write_parquet(path, sample_rows(250, with_dates=False))
+    refreshed = _search(path, "카카오")
+    assert "cache_hit" not in refreshed["stats"]
+    assert refreshed["pagination"]["total_count"] == 50
+    assert first["pagination"]["total_count"] == 20
@@ -0,0 +1,93 @@
+"""
+스트리밍 내보내기(CSV / NDJSON) 테스트
+"""
+
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+
+import api.main as main
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import DuckDBProcessor
+
+
+@pytest.fixture
+def dataset_env(make_dataset, monkeypatch):
+    rows = sample_rows(1000)
+    path = make_dataset(rows)
+    monkeypatch.setenv("R2_URL_DATAA_SAFETYKOREA", str(path))
+    monkeypatch.setattr(main, "EXPORT_STREAM_CHUNK_SIZE", 100)
+    return rows
+
+
+async def _collect(request):
+    response = await main.stream_export("dataA", "safetykorea", request)
+    chunks = [chunk async for chunk in response.body_iterator]
+    return response, chunks
+
+
+def test_csv_stream_writes_every_row_in_chunks(dataset_env):
+    response, chunks = asyncio.run(_collect(main.ExportRequest(format="csv")))
+
+    assert response.media_type.startswith("text/csv")
+    assert len(chunks) >= 10
+    body = b"".join(chunks)
+    assert body.startswith("\ufeff".encode("utf-8"))
+    records = list(csv.reader(io.StringIO(body.decode("utf-8-sig"))))
+    assert len(records) == len(dataset_env) + 1
+
+
+def test_ndjson_stream_applies_keyword_and_limit(dataset_env):
+    _, chunks = asyncio.run(_collect(
+        main.ExportRequest(format="ndjson", keyword="카카오", search_field="company_name", limit=150)
+    ))
+    records = [json.loads(line) for line in b"".join(chunks).decode("utf-8").splitlines()]
+    assert len(records) == 150
+    assert all(record["업체명"] == "카카오" for record in records)
+
+
+def test_failure_mid_stream_aborts_response(dataset_env, monkeypatch):
+    original = main._ExportEncoder.encode
+    calls = {"count": 0}
+
+    def failing_encode(self, records):
+        calls["count"] += 1
+        if calls["count"] == 3:
+            raise ValueError("encoder failure")
+        return original(self, records)
+
+    monkeypatch.setattr(main._ExportEncoder, "encode", failing_encode)
+
+    async def run():
+        response = await main.stream_export("dataA", "safetykorea", main.ExportRequest(format="csv"))
+        received = []
+        with pytest.raises(RuntimeError, match="encoder failure"):
+            async for chunk in response.body_iterator:
+                received.append(chunk)
+        return received
+
+    # 실패 전까지 받은 청크만 전달되고 완료 대신 예외로 연결이 끊김
+    assert len(asyncio.run(run())) == 2
+
+
+def test_streaming_with_limit_is_not_sorted(tmp_path):
+    rows = sample_rows(500, with_dates=False)
+    path = write_parquet(tmp_path / "unclustered.parquet", rows)
+    processor = DuckDBProcessor(str(path))
+    chunks = []
+    try:
+        result = asyncio.run(processor.search_streaming(
+            limit=250, collect_results=False, chunk_size=100,
+            chunk_callback=lambda records, total: chunks.append(records)
+        ))
+        templates = list(processor._handle._templates.values())
+    finally:
+        processor.close()
+
+    assert "error" not in result
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+    assert [record["제품명"] for chunk in chunks for record in chunk] == [row["제품명"] for row in rows[:250]]
+    assert len(templates) == 1 and "ORDER BY" not in templates[0]
@@ -0,0 +1,115 @@
+"""
+write-only 스트리밍 XLSX 생성(StreamingExcelWriter) 테스트
+"""
+
+import asyncio
+import threading
+
+import pytest
+from openpyxl import load_workbook
+
+import core.file_generator as file_generator
+from conftest import sample_rows, write_parquet
+from core.file_generator import FileGenerator, StreamingExcelWriter
+
+MAPPING = {"업체명": "회사", "모델명": "모델", "tags": "태그", "extra": "기타"}
+
+
+def _data_rows(sheet):
+    return [list(row) for row in sheet.iter_rows(values_only=True)]
+
+
+def test_writer_maps_headers_and_converts_cells(tmp_path):
+    path = tmp_path / "out.xlsx"
+    writer = StreamingExcelWriter(
+        path,
+        columns=["모델명", "없는컬럼", "업체명", "tags", "extra"],
+        korean_field_mapping=MAPPING,
+        metadata={"search_conditions": {"키워드": "카카오", "필터": None}}
+    )
+    writer.write_batch([
+        {"업체명": "카카오", "모델명": "MD-1", "tags": ["a", "b"], "extra": {"k": "값"}},
+        {"업체명": "엘지\x07전자", "모델명": "MD-2", "tags": [], "extra": None},
+    ])
+    writer.write_batch([{"업체명": "현대", "모델명": "MD-3", "tags": ["c"], "extra": 7}])
+    assert writer.close() == 3
+
+    workbook = load_workbook(path)
+    assert workbook.sheetnames == ["검색 요약", "검색 결과"]
+    sheet = workbook["검색 결과"]
+    # 지정 컬럼 순서 유지, 결과에 없는 컬럼은 제외
+    assert _data_rows(sheet) == [
+        ["모델", "회사", "태그", "기타"],
+        ["MD-1", "카카오", "a, b", '{"k": "값"}'],
+        ["MD-2", "엘지전자", None, None],
+        ["MD-3", "현대", "c", 7],
+    ]
+    assert sheet["A1"].font.bold
+    assert sheet.freeze_panes == "A2"
+    assert sheet.auto_filter.ref == "A1:D4"
+
+    summary = _data_rows(workbook["검색 요약"])
+    assert ["총 데이터 수:", 3] in summary
+    assert ["  키워드:", "카카오"] in summary
+    assert not any(row[0] == "  필터:" for row in summary)
+
+
+def test_rows_continue_on_new_sheet_at_row_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_generator, "EXCEL_MAX_ROWS", 4)  # 헤더 + 3행
+    path = tmp_path / "out.xlsx"
+    writer = StreamingExcelWriter(path)
+    writer.write_batch([{"n": index} for index in range(5)])
+    writer.write_batch([{"n": index} for index in range(5, 8)])
+    writer.close()
+
+    workbook = load_workbook(path)
+    assert workbook.sheetnames == ["검색 결과", "검색 결과 (2)", "검색 결과 (3)"]
+    values = [row[0] for name in workbook.sheetnames for row in _data_rows(workbook[name])]
+    assert values == ["n", 0, 1, 2, "n", 3, 4, 5, "n", 6, 7]
+    assert writer.sheet_count == 3
+
+
+def test_empty_result_writes_header_only_sheet(tmp_path):
+    path = tmp_path / "out.xlsx"
+    writer = StreamingExcelWriter(path, columns=["업체명", "모델명"], korean_field_mapping=MAPPING)
+    assert writer.close() == 0
+    assert _data_rows(load_workbook(path)["검색 결과"]) == [["회사", "모델"]]
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    return write_parquet(tmp_path / "dataset.parquet", sample_rows(250, with_dates=False))
+
+
+def test_generate_excel_streaming_writes_search_results(dataset, tmp_path, monkeypatch):
+    monkeypatch.setattr(file_generator, "EXCEL_STREAM_BATCH_SIZE", 20)
+    generator = FileGenerator()
+    progress = []
+    generator.set_progress_callback("job", lambda value, message, **kwargs: progress.append(value))
+    path = tmp_path / "export.xlsx"
+
+    result = asyncio.run(generator.generate_excel_streaming(
+        str(dataset), "job", path,
+        {"keyword": "카카오", "search_field": "company_name"},
+        {"download_fields": ["모델명", "업체명"], "korean_field_mapping": MAPPING, "total_count": 50}
+    ))
+
+    assert result["row_count"] == 50 and result["sheet_count"] == 1
+    rows = _data_rows(load_workbook(path)["검색 결과"])
+    assert rows[0] == ["모델", "회사"]
+    assert {row[1] for row in rows[1:]} == {"카카오"} and len(rows) == 51
+    # 배치마다 진행률 갱신, 마지막은 100
+    assert progress[0] == 0 and progress[-1] == 100 and len(progress) > 3
+
+
+def test_generate_excel_streaming_stops_when_cancelled(dataset, tmp_path):
+    cancel_event = threading.Event()
+    cancel_event.set()
+    path = tmp_path / "export.xlsx"
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(FileGenerator().generate_excel_streaming(
+            str(dataset), "job", path, {"keyword": "카카오", "search_field": "company_name"},
+            cancel_event=cancel_event
+        ))
+    assert not path.exists()
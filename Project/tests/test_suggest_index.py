@@ -0,0 +1,116 @@
+"""
+검색어 자동완성(SuggestIndex) 테스트
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import api.main as main
+import core.suggest_index as suggest_index
+from conftest import sample_rows, write_parquet
+from core.suggest_index import SuggestIndex, SuggestIndexCache, normalize_suggest_key, suggest_indexes
+from core.tmp_quota import TmpQuotaExceeded, tmp_quota
+
+ENTRIES = [
+    ("삼성전자(주)", 50),
+    ("삼성물산", 20),
+    ("주식회사 카카오", 30),
+    ("LG 전자", 40),
+    ("삼성전자(주)", 5),
+    ("  ", 100),
+    (None, 100),
+]
+
+
+def _values(index, prefix, limit=10):
+    suggestions, _ = index.suggest(prefix, limit)
+    return [(item["value"], item["count"]) for item in suggestions]
+
+
+def test_normalize_suggest_key_ignores_case_width_and_spaces():
+    assert normalize_suggest_key("Ｓamsung  Elec") == "samsungelec"
+
+
+@pytest.mark.parametrize("scan_limit", [20000, 1])
+def test_prefix_suggestions_ranked_by_frequency(monkeypatch, scan_limit):
+    # scan_limit=1이면 빈도순 순열을 따라가는 넓은 범위 경로
+    monkeypatch.setattr(suggest_index, "SUGGEST_SCAN_LIMIT", scan_limit)
+    index = SuggestIndex(SuggestIndex.encode(ENTRIES))
+
+    # 같은 표시 값의 건수는 합산, 공백/비문자열 값은 제외
+    assert index.n_values == 4
+    assert _values(index, "삼성") == [("삼성전자(주)", 55), ("삼성물산", 20)]
+    assert _values(index, "삼성 전") == [("삼성전자(주)", 55)]
+    assert _values(index, "삼성", limit=1) == [("삼성전자(주)", 55)]
+    # 단어 시작 위치와 법인 표기를 제거한 이름으로도 조회
+    assert _values(index, "전자") == [("LG 전자", 40)]
+    assert _values(index, "카카") == [("주식회사 카카오", 30)]
+    assert _values(index, "lg") == [("LG 전자", 40)]
+    assert index.suggest("없는값") == ([], 0)
+
+
+def test_cache_writes_index_file_and_reuses_it(tmp_path):
+    builds = []
+
+    def source():
+        builds.append(1)
+        return ENTRIES
+
+    try:
+        cache = SuggestIndexCache(max_entries=4, root=tmp_path / "suggest")
+        index = cache.get_or_build("dataset", "v1", "company_name", source)
+        assert cache.get_or_build("dataset", "v1", "company_name", source) is index
+        assert index.path is not None and index.path.exists()
+
+        # 다른 프로세스/재시작: 같은 버전의 인덱스 파일을 열어 재사용
+        restarted = SuggestIndexCache(max_entries=4, root=tmp_path / "suggest")
+        reopened = restarted.get_or_build("dataset", "v1", "company_name", source)
+        assert _values(reopened, "삼성") == _values(index, "삼성")
+        assert restarted.stats()["reused_files"] == 1
+
+        # 데이터셋 버전이 바뀌면 새로 생성
+        restarted.get_or_build("dataset", "v2", "company_name", source)
+        assert len(builds) == 2
+        assert cache.stats()["hits"] == 1
+    finally:
+        tmp_quota.register_owner("suggest", suggest_indexes._on_evicted)
+
+
+def test_index_stays_in_memory_when_tmp_is_full(tmp_path, monkeypatch):
+    def reject(*args, **kwargs):
+        raise TmpQuotaExceeded("full")
+
+    monkeypatch.setattr(tmp_quota, "reserve", reject)
+    try:
+        cache = SuggestIndexCache(max_entries=4, root=tmp_path / "suggest")
+        index = cache.get_or_build("dataset", "v1", "company_name", lambda: ENTRIES)
+    finally:
+        tmp_quota.register_owner("suggest", suggest_indexes._on_evicted)
+
+    assert index.path is None
+    assert _values(index, "카카") == [("주식회사 카카오", 30)]
+
+
+def test_suggest_endpoint(tmp_path, monkeypatch):
+    path = write_parquet(tmp_path / "dataset.parquet", sample_rows(100, with_dates=False))
+    monkeypatch.setattr(main, "get_data_file_path", lambda category, subcategory: str(path))
+
+    async def run():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            company = await client.get("/api/suggest/dataA/safetykorea", params={"q": "삼성"})
+            product = await client.get(
+                "/api/suggest/dataA/safetykorea", params={"q": "전기밥솥 0001", "search_field": "product_name"}
+            )
+            blank = await client.get("/api/suggest/dataA/safetykorea", params={"q": " "})
+            invalid = await client.get("/api/suggest/dataA/safetykorea", params={"q": "a", "search_field": "cert_num"})
+            return company, product, blank, invalid
+
+    company, product, blank, invalid = asyncio.run(run())
+
+    assert company.json()["suggestions"] == [{"value": "삼성전자(주)", "count": 20}]
+    assert [item["value"] for item in product.json()["suggestions"]] == ["전기밥솥 00010", "전기밥솥 00015"]
+    assert blank.json()["suggestions"] == []
+    assert invalid.status_code == 400
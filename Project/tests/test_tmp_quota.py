@@ -0,0 +1,110 @@
+"""
+/tmp 공용 용량 관리자(TmpQuotaManager) 테스트
+"""
+
+import pytest
+
+from core.tmp_quota import TmpQuotaExceeded, TmpQuotaManager
+
+
+@pytest.fixture
+def quota(tmp_path):
+    return TmpQuotaManager(quota_bytes=1000, spill_reserve_bytes=200, root=str(tmp_path))
+
+
+def _write(quota, path, size, owner="preview", **kwargs):
+    quota.reserve(path, size, owner, **kwargs)
+    path.write_bytes(b"x" * size)
+    quota.commit(path)
+    return path
+
+
+def test_spill_reserve_is_excluded_from_file_budget(quota, tmp_path):
+    assert quota.file_budget == 800
+    _write(quota, tmp_path / "a", 500)
+    _write(quota, tmp_path / "b", 300)
+
+    stats = quota.stats()
+    assert stats["used_bytes"] == 800 and stats["evictions"] == 0
+    assert stats["owners"] == {"preview": {"files": 2, "bytes": 800}}
+
+
+def test_least_recently_used_file_is_evicted(quota, tmp_path):
+    evicted = []
+    quota.register_owner("preview", evicted.append)
+    old = _write(quota, tmp_path / "old", 400)
+    recent = _write(quota, tmp_path / "recent", 400)
+    quota.touch(old)
+
+    new = _write(quota, tmp_path / "new", 300)
+
+    assert not recent.exists() and old.exists() and new.exists()
+    assert evicted == [recent]
+    assert quota.stats()["evicted_bytes"] == 400
+
+
+def test_low_priority_owner_is_evicted_first(quota, tmp_path):
+    export = _write(quota, tmp_path / "export", 400, owner="export")
+    preview = _write(quota, tmp_path / "preview", 400, owner="preview")
+
+    _write(quota, tmp_path / "download", 400, owner="duckdb_cache")
+
+    # 더 최근 파일이라도 다시 만들 수 있는 프리뷰 캐시를 먼저 제거
+    assert export.exists() and not preview.exists()
+
+
+def test_pinned_files_are_never_evicted(quota, tmp_path):
+    first = _write(quota, tmp_path / "first", 500)
+    with quota.pin(first):
+        with pytest.raises(TmpQuotaExceeded):
+            quota.reserve(tmp_path / "second", 400, "preview")
+        assert first.exists()
+        assert quota.stats()["pinned"] == 1
+
+    quota.reserve(tmp_path / "second", 400, "preview")
+    assert not first.exists()
+    stats = quota.stats()
+    assert stats["rejections"] == 1 and stats["pinned"] == 0
+
+
+def test_reserve_with_pin_protects_file_being_written(quota, tmp_path):
+    partial = tmp_path / "download.part"
+    partial.write_bytes(b"x")
+    quota.reserve(tmp_path / "download", 600, "duckdb_cache", companions=[partial], pin=True)
+
+    with pytest.raises(TmpQuotaExceeded):
+        quota.reserve(tmp_path / "other", 300, "preview")
+
+    quota.release_pin(tmp_path / "download")
+    quota.reserve(tmp_path / "other", 300, "preview")
+    # 부속 파일(부분 다운로드)도 함께 제거
+    assert not partial.exists()
+
+
+def test_commit_larger_than_reserved_enforces_budget(quota, tmp_path):
+    first = _write(quota, tmp_path / "first", 300)
+    quota.reserve(tmp_path / "grown", 100, "export")
+    (tmp_path / "grown").write_bytes(b"x" * 700)
+    quota.commit(tmp_path / "grown")
+
+    assert not first.exists()
+    assert quota.stats()["used_bytes"] == 700
+
+
+def test_adopt_and_discard(quota, tmp_path):
+    leftovers = tmp_path / "leftovers"
+    leftovers.mkdir()
+    for name in ("a", "b"):
+        (leftovers / name).write_bytes(b"x" * 100)
+
+    assert quota.adopt(leftovers, "prefetch") == 2
+    assert quota.adopt(leftovers, "prefetch") == 0
+    quota.discard(leftovers / "a")
+
+    assert quota.stats()["owners"] == {"prefetch": {"files": 1, "bytes": 100}}
+
+
+def test_paths_outside_root_are_ignored(quota, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("outside") / "file"
+    quota.reserve(outside, 10_000, "export")
+    assert quota.stats()["files"] == 0
@@ -0,0 +1,141 @@
+"""
+필드 값 사전(FieldValueDictionary / ValueDictionaryCache) 테스트
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+import api.main as main
+import core.value_dictionary as value_dictionary
+from conftest import sample_rows, write_parquet
+from core.duckdb_processor import DuckDBProcessor
+from core.value_dictionary import FieldValueDictionary, ValueDictionaryCache
+
+
+def test_dictionary_orders_values_and_frequencies():
+    dictionary = FieldValueDictionary("field", [("b", 1), (10, 3), ("a", 5), (2, 3)])
+
+    # 숫자 < 문자열 순서, 빈도가 같으면 값 순서
+    assert dictionary.samples(10) == [2, 10, "a", "b"]
+    assert dictionary.samples(3, "frequency") == ["a", 2, 10]
+    assert dictionary.entries(2, "frequency") == [{"value": "a", "count": 5}, {"value": 2, "count": 3}]
+    assert (dictionary.distinct_count, dictionary.total_count) == (4, 12)
+    assert (dictionary.count_of("a"), dictionary.count_of(10), dictionary.count_of("없음")) == (5, 3, 0)
+
+
+def test_from_records_counts_array_items(monkeypatch):
+    records = [{"tags": ["a", "b"]}, {"tags": "a"}, {"tags": None}, {"other": 1}, {"tags": {"nested": 1}}]
+    dictionary = FieldValueDictionary.from_records("tags", records)
+    assert dictionary.entries(10) == [{"value": "a", "count": 2}, {"value": "b", "count": 1}]
+    assert not dictionary.truncated
+
+    monkeypatch.setattr(value_dictionary, "VALUE_DICTIONARY_MAX_VALUES", 1)
+    truncated = FieldValueDictionary.from_records("tags", records)
+    assert truncated.samples(10) == ["a"] and truncated.truncated
+
+
+def test_cache_rebuilds_on_new_version_and_evicts_lru():
+    cache = ValueDictionaryCache(max_entries=2)
+    builds = []
+
+    def builder(name):
+        def build():
+            builds.append(name)
+            return FieldValueDictionary(name, [(name, 1)])
+        return build
+
+    assert cache.get_or_build("dataset", "v1", "a", builder("a"))[1] is False
+    assert cache.get_or_build("dataset", "v1", "a", builder("a"))[1] is True
+    assert cache.get_or_build("dataset", "v2", "a", builder("a"))[1] is False
+    cache.get_or_build("dataset", "v2", "b", builder("b"))
+    cache.get_or_build("dataset", "v2", "a", builder("a"))  # a를 최근 사용으로 갱신
+    cache.get_or_build("dataset", "v2", "c", builder("c"))
+
+    assert cache.get_or_build("dataset", "v2", "a", builder("a"))[1] is True
+    assert cache.get_or_build("dataset", "v2", "b", builder("b"))[1] is False
+    assert builds == ["a", "a", "b", "c", "b"]
+    assert cache.invalidate("dataset") == 2
+    assert cache.stats()["fields"] == 0
+
+
+def test_concurrent_builds_of_one_field_run_once():
+    cache = ValueDictionaryCache(max_entries=4)
+    builds = []
+
+    def build():
+        builds.append(1)
+        time.sleep(0.05)
+        return FieldValueDictionary("field", [("x", 1)])
+
+    threads = [
+        threading.Thread(target=cache.get_or_build, args=("dataset", "v1", "field", build))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(builds) == 1
+    assert cache.stats()["hits"] == 3
+
+
+def _dictionary(path, field_name):
+    processor = DuckDBProcessor(str(path))
+    try:
+        return processor.get_value_dictionary(field_name)
+    finally:
+        processor.close()
+
+
+def test_processor_builds_dictionary_once_per_dataset_version(tmp_path):
+    path = write_parquet(tmp_path / "dataset.parquet", sample_rows(100, with_dates=False))
+
+    dictionary, cache_hit = _dictionary(path, "업체명")
+    again, second_hit = _dictionary(path, "업체명")
+
+    assert (cache_hit, second_hit) == (False, True) and again is dictionary
+    assert dictionary.count_of("카카오") == 20 and dictionary.distinct_count == 5
+
+    write_parquet(path, sample_rows(10, with_dates=False))
+    rebuilt, rebuilt_hit = _dictionary(path, "업체명")
+    assert rebuilt_hit is False and rebuilt.count_of("카카오") == 2
+
+    with pytest.raises(ValueError):
+        _dictionary(path, "없는필드")
+
+
+def test_field_samples_endpoint(tmp_path, monkeypatch):
+    rows = sample_rows(30, with_dates=False)
+    rows[0]["업체명"] = "카카오"  # 카카오 7건으로 빈도 1위
+    parquet_path = write_parquet(tmp_path / "dataset.parquet", rows)
+    json_path = tmp_path / "dataset.json"
+    json_path.write_text(json.dumps({"data": rows}, ensure_ascii=False), encoding="utf-8")
+    paths = {"parquet": str(parquet_path), "json": str(json_path)}
+    monkeypatch.setattr(main, "get_data_file_path", lambda category, subcategory: paths[subcategory])
+
+    async def run():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            params = {"limit": 2, "order": "frequency", "with_counts": "true"}
+            responses = [
+                await client.get(f"/api/field-samples/dataA/{source}/업체명", params=params)
+                for source in ("parquet", "json", "parquet")
+            ]
+            invalid = await client.get("/api/field-samples/dataA/parquet/업체명", params={"order": "random"})
+            return responses, invalid
+
+    (parquet, from_json, cached), invalid = asyncio.run(run())
+
+    for response in (parquet, from_json):
+        body = response.json()
+        assert body["samples"][0] == "카카오" and body["sample_count"] == 2
+        assert body["values"][0] == {"value": "카카오", "count": 7}
+        assert (body["distinct_count"], body["total_count"]) == (5, 30)
+    assert parquet.json()["cache_hit"] is False and cached.json()["cache_hit"] is True
+    assert invalid.status_code == 400
@@ -3,17 +3,39 @@
 
 `Project/parquet` 디렉토리 이하의 모든 `.parquet` 파일을 찾아 동일한
 상대 경로 구조로 `Project/duckdb` 디렉토리에 `.duckdb` 파일로 변환합니다.
-각 DuckDB 파일에는 원본 파일명을 테이블 이름으로 사용한 단일 테이블이 생성됩니다.
+각 DuckDB 파일에는 원본 파일명을 테이블 이름으로 사용한 데이터 테이블과
+부분 문자열 검색용 n-gram postings 테이블(`<테이블명>__ngram`)이 생성됩니다.
+대소문자 무시 필드와 사업자등록번호 필드에는 정규화된 `<컬럼명>__norm`
+컬럼이 함께 저장되어 검색 시 행마다 LOWER/REPLACE를 수행하지 않습니다.
+대소문자 무시 이름 필드(case_insensitive_fields)에는 한글 초성으로 분해한
+`<컬럼명>__choseong` 컬럼이 저장되고 n-gram postings에도 색인되어
+"ㅅㅅㅈㅈ" 같은 초성 검색어가 전체 스캔 없이 처리됩니다.
+날짜 문자열 필드는 한 번만 파싱하여 DATE 타입 `<컬럼명>__date` 컬럼으로 저장하며,
+날짜 정렬/기간 필터는 이 컬럼을 사용해 zonemap pruning이 적용됩니다.
+인증번호/신고번호/승인번호와 사업자등록번호(정규화 컬럼)에는 ART 인덱스를 생성하여
+정확 매칭 검색과 `/api/lookup` 단건 조회가 전체 스캔 없이 처리됩니다.
+데이터 테이블은 대표 날짜 컬럼 내림차순 → 제품명 오름차순으로 정렬해 저장하며
+(zonemap min/max 범위 확보 + 최신순 기본 정렬), 사용한 클러스터링 키는 테이블 comment와
+manifest에 기록되어 DuckDBProcessor가 ORDER BY 없이 저장 순서를 그대로 사용합니다.
+변환이 끝나면 출력 루트에 `manifest.json`(컬럼/타입/행 수/파일 fingerprint)을
+기록하며, DuckDBProcessor는 이 manifest를 fingerprint 기준으로 읽어 스키마를 확보합니다.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
+import re
 import sys
+import unicodedata
+from datetime import datetime, timezone
 from pathlib import Path
 
 try:
     import duckdb
+    from duckdb.typing import VARCHAR
 except ModuleNotFoundError as exc:
     print("[오류] duckdb 파이썬 모듈을 찾을 수 없습니다. `pip install duckdb`로 설치해주세요.")
     raise SystemExit(1) from exc
@@ -26,6 +48,59 @@ def escape_identifier(identifier: str) -> str:
 REPO_ROOT = Path(__file__).resolve().parents[1]
 PARQUET_ROOT = REPO_ROOT / "Project" / "parquet"
 DUCKDB_ROOT = REPO_ROOT / "Project" / "duckdb"
+CASE_SENSITIVITY_CONFIG = REPO_ROOT / "Project" / "config" / "case_sensitivity_config.json"
+
+# 정규화 shadow 컬럼 접미사 (DuckDBProcessor.NORMALIZED_COLUMN_SUFFIX와 동일)
+NORMALIZED_COLUMN_SUFFIX = "__norm"
+
+# DATE 타입 shadow 컬럼 접미사 (DuckDBProcessor.DATE_COLUMN_SUFFIX와 동일)
+DATE_COLUMN_SUFFIX = "__date"
+
+# 초성 shadow 컬럼 접미사 (DuckDBProcessor.CHOSEONG_COLUMN_SUFFIX와 동일)
+CHOSEONG_COLUMN_SUFFIX = "__choseong"
+
+# 한글 음절(가~힣)의 초성 순서 (한글 호환 자모)
+CHOSEONG_LETTERS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+# 하이픈/공백을 제거해 정확 매칭하는 식별자 필드 (DuckDBProcessor 정확 매칭 필드와 동일)
+IDENTIFIER_FIELDS = ("business_number", "사업자등록번호", "ftc_business_number")
+
+# ART 인덱스로 정확 매칭하는 번호 필드 (DuckDBProcessor._get_search_pattern_and_operator와 동일)
+LOOKUP_INDEX_FIELDS = ("cert_no", "cert_num", "declare_no", "신고번호", "승인번호")
+
+# DuckDBProcessor가 시작 시 읽는 스키마/통계 manifest (출력 루트 기준 상대 경로로 기록)
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# DuckDBProcessor가 `<테이블명>__ngram` 테이블로 LIKE '%kw%' 후보 행을 좁힌다
+NGRAM_TABLE_SUFFIX = "__ngram"
+
+# 부분 문자열 검색 대상 컬럼 (DuckDBProcessor._build_where_clause 필드 매핑 기준)
+NGRAM_INDEX_COLUMNS = (
+    "업체명", "maker_name", "entrprsNm", "상호/법인명", "사업자명",
+    "모델명", "model_name",
+    "제품명", "product_name", "prductNm", "품목명",
+)
+
+
+# 저장 순서 클러스터링 키 후보 (DuckDBProcessor JSON 경로의 기본 정렬 후보와 동일한 우선순위)
+CLUSTER_DATE_COLUMNS = (
+    "완료일", "인증일자", "인증변경일자", "서명일자", "인증만료일자",
+    "완료일자", "발급일", "만료일", "설립일",
+    "cert_date", "sign_date", "cert_chg_date",
+    "registration_date", "approval_date", "declaration_date", "recall_date",
+    "등록일", "승인일", "신고일", "리콜일", "생성일", "수정일",
+    "신고증명서 발급일", "시험성적서 만료일", "유통기한",
+    "승인일자", "인증/신고일자", "crtfcDe",
+)
+# DATE shadow 컬럼을 생성하는 날짜 필드 (클러스터링 후보 + 날짜 필터 후보)
+DATE_FIELDS = CLUSTER_DATE_COLUMNS + (
+    "인증변경일자", "등록일자", "date", "crawl_date", "frstCrtfcDe", "crtfcDeEnd",
+)
+CLUSTER_NAME_COLUMNS = (
+    "품목", "제품명", "product_name", "prductNm", "품목명",
+    "업체명", "company_name", "상호", "기자재명칭", "material_name", "상호/법인명", "모델명", "model_name",
+)
 
 
 def discover_parquet_files(source_dir: Path) -> list[Path]:
@@ -44,7 +119,259 @@ def to_duckdb_path(parquet_path: Path, source_dir: Path, target_dir: Path) -> Pa
     return target_dir / relative.with_suffix(".duckdb")
 
 
-def materialize_duckdb(parquet_path: Path, duckdb_path: Path) -> None:
+def normalize_text(value: str) -> str:
+    """검색용 텍스트 정규화: NFKC(NFC 결합 + 전각 문자 폴딩) 후 소문자화.
+
+    DuckDBProcessor의 검색어 정규화(_normalize_search_text)와 반드시 동일해야 한다.
+    """
+    return unicodedata.normalize("NFKC", value).lower()
+
+
+def normalize_identifier(value: str) -> str:
+    """식별자 정규화: 텍스트 정규화 후 하이픈과 공백 제거 (예: 123-45-67890 → 1234567890)."""
+    return re.sub(r"[-\s]", "", normalize_text(value))
+
+
+def to_choseong(value: str) -> str:
+    """초성 검색용 분해: 한글 음절은 초성(호환 자모)으로 바꾸고 공백은 제거 (예: 삼성 전자(주) → ㅅㅅㅈㅈ(ㅈ)).
+
+    한글이 아닌 문자는 normalize_text 기준으로 그대로 둔다.
+    DuckDBProcessor의 초성 검색어 판별(_to_choseong_keyword)과 같은 자모를 사용해야 한다.
+    """
+    letters = []
+    for char in unicodedata.normalize("NFC", value):
+        code = ord(char)
+        if 0xAC00 <= code <= 0xD7A3:
+            letters.append(CHOSEONG_LETTERS[(code - 0xAC00) // 588])
+        elif not char.isspace():
+            letters.append(char if 0x3131 <= code <= 0x314E else normalize_text(char))
+    return "".join(letters)
+
+
+def register_normalizers(conn: duckdb.DuckDBPyConnection) -> None:
+    """정규화 함수를 DuckDB 스칼라 UDF로 등록 (NULL은 NULL 유지)."""
+    conn.create_function("normalize_text", normalize_text, [VARCHAR], VARCHAR, side_effects=False)
+    conn.create_function("normalize_identifier", normalize_identifier, [VARCHAR], VARCHAR, side_effects=False)
+    conn.create_function("to_choseong", to_choseong, [VARCHAR], VARCHAR, side_effects=False)
+
+
+def load_case_insensitive_fields(config_path: Path = CASE_SENSITIVITY_CONFIG) -> set[str]:
+    """case_sensitivity_config.json 기준 대소문자 무시 필드 집합.
+
+    DuckDBProcessor._is_field_case_insensitive와 같은 규칙을 사용한다
+    (case_sensitive_fields에 false로 지정된 필드도 대소문자 무시 대상).
+    """
+    try:
+        config = json.loads(config_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        print(f"[경고] 대소문자 설정 로드 실패, 정규화 컬럼 생략: {exc}")
+        return set()
+
+    fields = {name for name, flag in config.get("case_insensitive_fields", {}).items() if flag}
+    fields.update(name for name, flag in config.get("case_sensitive_fields", {}).items() if not flag)
+    return fields
+
+
+def load_choseong_fields(config_path: Path = CASE_SENSITIVITY_CONFIG) -> set[str]:
+    """초성 shadow 컬럼 대상: case_sensitivity_config.json의 case_insensitive_fields (업체명/제품명 등 이름 필드)."""
+    try:
+        config = json.loads(config_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        print(f"[경고] 대소문자 설정 로드 실패, 초성 컬럼 생략: {exc}")
+        return set()
+    return {name for name, flag in config.get("case_insensitive_fields", {}).items() if flag}
+
+
+def build_choseong_columns(columns: list[tuple[str, str]], choseong_fields: set[str]) -> list[tuple[str, str]]:
+    """Return ``(shadow_column, select_expression)`` pairs for the choseong companion columns."""
+    return [
+        (f"{name}{CHOSEONG_COLUMN_SUFFIX}", f"to_choseong({escape_identifier(name)})")
+        for name, column_type in columns
+        if name in choseong_fields and column_type == "VARCHAR"
+    ]
+
+
+def build_normalized_columns(columns: list[tuple[str, str]], case_insensitive_fields: set[str]) -> list[tuple[str, str]]:
+    """Return ``(shadow_column, select_expression)`` pairs for the normalized companion columns."""
+    normalized: list[tuple[str, str]] = []
+    for name, column_type in columns:
+        source = f"CAST({escape_identifier(name)} AS VARCHAR)"
+        if name in IDENTIFIER_FIELDS:
+            normalized.append((f"{name}{NORMALIZED_COLUMN_SUFFIX}", f"normalize_identifier({source})"))
+        elif name in case_insensitive_fields and column_type == "VARCHAR":
+            normalized.append((f"{name}{NORMALIZED_COLUMN_SUFFIX}", f"normalize_text({source})"))
+    return normalized
+
+
+def date_sort_expression(name: str, column_type: str) -> str:
+    """날짜 문자열(YYYYMMDD, YYYYMMDDHHMMSS, YYYY-MM-DD, YYYY.MM.DD, ISO 타임스탬프)을 DATE로 변환하는 표현식."""
+    column = escape_identifier(name)
+    if column_type in ("DATE", "TIMESTAMP", "TIMESTAMP WITH TIME ZONE"):
+        return f"CAST({column} AS DATE)"
+
+    trimmed = f"TRIM(CAST({column} AS VARCHAR))"
+    return (
+        "CASE "
+        f"WHEN {column} IS NULL OR {trimmed} = '' THEN NULL "
+        f"WHEN LENGTH({trimmed}) = 8 THEN CAST(TRY_STRPTIME({trimmed}, '%Y%m%d') AS DATE) "
+        f"WHEN LENGTH({trimmed}) = 14 THEN CAST(TRY_STRPTIME({trimmed}, '%Y%m%d%H%M%S') AS DATE) "
+        f"ELSE TRY_CAST(LEFT(REPLACE(REPLACE({trimmed}, '.', '-'), '/', '-'), 10) AS DATE) "
+        "END"
+    )
+
+
+def build_date_columns(columns: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Return ``(shadow_column, select_expression)`` pairs parsing known date fields into DATE."""
+    date_columns: list[tuple[str, str]] = []
+    for name, column_type in columns:
+        if name in DATE_FIELDS and column_type != "DATE":
+            date_columns.append((f"{name}{DATE_COLUMN_SUFFIX}", date_sort_expression(name, column_type)))
+    return date_columns
+
+
+def select_clustering_key(columns: list[tuple[str, str]]) -> list[dict]:
+    """Pick the storage order: primary date column DESC, then product name ASC.
+
+    반환 형식은 manifest/테이블 comment에 그대로 기록되며, 후보 컬럼이 없으면 빈 목록.
+    """
+    column_names = {name for name, _ in columns}
+    date_column = next((name for name in CLUSTER_DATE_COLUMNS if name in column_names), None)
+    name_column = next((name for name in CLUSTER_NAME_COLUMNS if name in column_names), None)
+
+    key: list[dict] = []
+    if date_column:
+        key.append({"column": date_column, "order": "desc", "parse": "date"})
+    if name_column:
+        key.append({"column": name_column, "order": "asc"})
+    return key
+
+
+def build_order_clause(clustering_key: list[dict], columns: list[tuple[str, str]], date_columns: set[str]) -> str:
+    """Render ``clustering_key`` as an ORDER BY expression list (NULL은 항상 뒤로).
+
+    날짜 컬럼은 이미 파싱된 DATE shadow 컬럼(``date_columns``)이 있으면 그 컬럼으로 정렬한다.
+    """
+    column_types = dict(columns)
+    parts = []
+    for part in clustering_key:
+        name = part["column"]
+        shadow = f"{name}{DATE_COLUMN_SUFFIX}"
+        if part.get("parse") == "date" and shadow in date_columns:
+            expression = escape_identifier(shadow)
+        elif part.get("parse") == "date":
+            expression = date_sort_expression(name, column_types.get(name, "VARCHAR"))
+        else:
+            expression = escape_identifier(name)
+        parts.append(f"{expression} {part['order'].upper()} NULLS LAST")
+    return ", ".join(parts)
+
+
+def read_table_metadata(conn: duckdb.DuckDBPyConnection, table_name: str) -> dict:
+    """변환 시 테이블 comment에 기록한 메타데이터(JSON) 조회 (없으면 빈 dict)."""
+    row = conn.execute(
+        "SELECT comment FROM duckdb_tables() WHERE table_name = ? LIMIT 1", [table_name]
+    ).fetchone()
+    if not row or not row[0]:
+        return {}
+    try:
+        metadata = json.loads(row[0])
+    except ValueError:
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def escape_literal(value: str) -> str:
+    """SQL 문자열 리터럴 이스케이프 (single quote wrapping)."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def get_varchar_columns(conn: duckdb.DuckDBPyConnection, table_identifier: str) -> list[str]:
+    """Return the VARCHAR column names of ``table_identifier`` in table order."""
+    rows = conn.execute(f"DESCRIBE {table_identifier}").fetchall()
+    return [row[0] for row in rows if row[1] == "VARCHAR"]
+
+
+def build_lookup_indexes(conn: duckdb.DuckDBPyConnection, table_name: str) -> list[str]:
+    """Create ART indexes for exact-match identifier columns.
+
+    번호 필드는 정규화 `__norm` 컬럼이 있으면 그 컬럼에(없으면 원본 컬럼에), 사업자등록번호
+    필드는 하이픈/공백을 제거한 `__norm` 컬럼에 인덱스를 만든다 (검색 시 비교하는 컬럼과
+    동일해야 index scan이 적용된다).
+    """
+    table_identifier = escape_identifier(table_name)
+    column_names = {row[0] for row in conn.execute(f"DESCRIBE {table_identifier}").fetchall()}
+    targets = [
+        f"{column}{NORMALIZED_COLUMN_SUFFIX}" if f"{column}{NORMALIZED_COLUMN_SUFFIX}" in column_names else column
+        for column in LOOKUP_INDEX_FIELDS
+        if column in column_names
+    ]
+    targets.extend(
+        f"{column}{NORMALIZED_COLUMN_SUFFIX}"
+        for column in IDENTIFIER_FIELDS
+        if f"{column}{NORMALIZED_COLUMN_SUFFIX}" in column_names
+    )
+
+    for column in targets:
+        index_identifier = escape_identifier(f"{table_name}__{column}__idx")
+        conn.execute(f"CREATE INDEX {index_identifier} ON {table_identifier} ({escape_identifier(column)})")
+    return targets
+
+
+def build_ngram_index(conn: duckdb.DuckDBPyConnection, table_name: str) -> list[str]:
+    """Build a character bigram/trigram postings table for substring search.
+
+    값은 normalize_text(NFKC + 소문자)로 정규화한 뒤 코드포인트 단위로 자르므로
+    한글은 음절 단위 n-gram이 된다. 정규화 shadow 컬럼이 있으면 그 값을 그대로
+    사용한다. 초성 shadow 컬럼(`__choseong`)도 함께 색인한다.
+    postings는 (column_name, gram) 순으로 정렬해 저장하여 zonemap으로
+    gram 단위 조회가 가능하도록 한다.
+    """
+    table_identifier = escape_identifier(table_name)
+    varchar_column_list = get_varchar_columns(conn, table_identifier)
+    varchar_columns = set(varchar_column_list)
+    columns = [column for column in NGRAM_INDEX_COLUMNS if column in varchar_columns]
+    # 초성 컬럼은 이미 분해/정규화된 값이므로 그대로 색인
+    columns.extend(column for column in varchar_column_list if column.endswith(CHOSEONG_COLUMN_SUFFIX))
+    if not columns:
+        return []
+
+    def normalized_source(column: str) -> str:
+        if column.endswith(CHOSEONG_COLUMN_SUFFIX):
+            return escape_identifier(column)
+        shadow = f"{column}{NORMALIZED_COLUMN_SUFFIX}"
+        if shadow in varchar_columns:
+            return escape_identifier(shadow)
+        return f"normalize_text({escape_identifier(column)})"
+
+    sources = " UNION ALL ".join(
+        f"SELECT rowid AS row_id, {escape_literal(column)} AS column_name, "
+        f"{normalized_source(column)} AS v "
+        f"FROM {table_identifier} WHERE {escape_identifier(column)} IS NOT NULL"
+        for column in columns
+    )
+    postings_identifier = escape_identifier(f"{table_name}{NGRAM_TABLE_SUFFIX}")
+
+    conn.execute(
+        f"""
+        CREATE TABLE {postings_identifier} AS
+        WITH src AS ({sources}),
+        grams AS (
+            SELECT column_name, row_id, unnest(list_distinct(
+                list_transform(range(1, length(v)), i -> substr(v, i, 2)) ||
+                list_transform(range(1, length(v) - 1), i -> substr(v, i, 3))
+            )) AS gram
+            FROM src
+            WHERE length(v) >= 2
+        )
+        SELECT column_name, gram, row_id FROM grams
+        ORDER BY column_name, gram, row_id
+        """
+    )
+    return columns
+
+
+def materialize_duckdb(parquet_path: Path, duckdb_path: Path, case_insensitive_fields: set[str] | None = None,
+                       choseong_fields: set[str] | None = None) -> None:
     """Create a DuckDB database containing the parquet contents as a single table."""
     ensure_directory(duckdb_path.parent)
 
@@ -52,13 +379,153 @@ def materialize_duckdb(parquet_path: Path, duckdb_path: Path) -> None:
         duckdb_path.unlink()
 
     table_identifier = escape_identifier(parquet_path.stem)
+    if case_insensitive_fields is None:
+        case_insensitive_fields = load_case_insensitive_fields()
+    if choseong_fields is None:
+        choseong_fields = load_choseong_fields()
 
     with duckdb.connect(str(duckdb_path)) as conn:
+        register_normalizers(conn)
+
+        source_columns = [
+            (row[0], row[1])
+            for row in conn.execute("DESCRIBE SELECT * FROM read_parquet(?)", [str(parquet_path)]).fetchall()
+        ]
+        normalized_columns = build_normalized_columns(source_columns, case_insensitive_fields)
+        date_columns = build_date_columns(source_columns)
+        choseong_columns = build_choseong_columns(source_columns, choseong_fields)
+        select_list = ", ".join(
+            ["*"] + [
+                f"{expression} AS {escape_identifier(name)}"
+                for name, expression in normalized_columns + date_columns + choseong_columns
+            ]
+        )
+
+        # 대표 날짜 DESC → 제품명 ASC 순서로 저장 (rowid 순서 = 최신순 기본 정렬)
+        clustering_key = select_clustering_key(source_columns)
+        order_clause = (
+            f" ORDER BY {build_order_clause(clustering_key, source_columns, {name for name, _ in date_columns})}"
+            if clustering_key else ""
+        )
+
+        conn.execute("SET preserve_insertion_order = true")
         conn.execute(
-            f"CREATE TABLE {table_identifier} AS SELECT * FROM read_parquet(?)",
+            f"CREATE TABLE {table_identifier} AS SELECT {select_list} FROM read_parquet(?){order_clause}",
             [str(parquet_path)],
         )
-
+        if clustering_key:
+            metadata = json.dumps({"clustering_key": clustering_key}, ensure_ascii=False)
+            conn.execute(f"COMMENT ON TABLE {table_identifier} IS {escape_literal(metadata)}")
+            key_description = ", ".join(f"{part['column']} {part['order']}" for part in clustering_key)
+            print(f"  [정렬] 클러스터링 키: {key_description}")
+        if normalized_columns:
+            print(f"  [정규화] shadow 컬럼 생성: {', '.join(name for name, _ in normalized_columns)}")
+        if date_columns:
+            print(f"  [날짜] DATE 컬럼 생성: {', '.join(name for name, _ in date_columns)}")
+        if choseong_columns:
+            print(f"  [초성] 초성 컬럼 생성: {', '.join(name for name, _ in choseong_columns)}")
+
+        lookup_columns = build_lookup_indexes(conn, parquet_path.stem)
+        if lookup_columns:
+            print(f"  [색인] ART 인덱스 생성: {', '.join(lookup_columns)}")
+
+        indexed_columns = build_ngram_index(conn, parquet_path.stem)
+        if indexed_columns:
+            print(f"  [색인] n-gram postings 생성: {', '.join(indexed_columns)}")
+
+
+
+def compute_fingerprint(path: Path) -> str:
+    """파일 내용 sha256 (DuckDBProcessor._compute_file_fingerprint와 동일)."""
+    digest = hashlib.sha256()
+    with path.open("rb") as source:
+        for block in iter(lambda: source.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def describe_duckdb(duckdb_path: Path) -> dict:
+    """Collect the manifest entry (schema, row count, index info) of a converted DuckDB file."""
+    table_name = duckdb_path.stem
+    table_identifier = escape_identifier(table_name)
+    postings_table = f"{table_name}{NGRAM_TABLE_SUFFIX}"
+
+    with duckdb.connect(str(duckdb_path), read_only=True) as conn:
+        columns = [
+            {"name": row[0], "type": row[1]}
+            for row in conn.execute(f"DESCRIBE {table_identifier}").fetchall()
+        ]
+        row_count = conn.execute(f"SELECT COUNT(*) FROM {table_identifier}").fetchone()[0]
+        metadata = read_table_metadata(conn, table_name)
+        # 인덱스 이름 규칙 `<테이블명>__<컬럼명>__idx`에서 컬럼명 복원 (build_lookup_indexes 참고)
+        index_prefix, index_suffix = f"{table_name}__", "__idx"
+        index_columns = [
+            row[0][len(index_prefix):-len(index_suffix)]
+            for row in conn.execute(
+                "SELECT index_name FROM duckdb_indexes() WHERE table_name = ? ORDER BY index_name",
+                [table_name],
+            ).fetchall()
+            if row[0].startswith(index_prefix) and row[0].endswith(index_suffix)
+        ]
+        tables = {row[0] for row in conn.execute("SELECT table_name FROM duckdb_tables()").fetchall()}
+        ngram_columns = []
+        if postings_table in tables:
+            ngram_columns = [
+                row[0]
+                for row in conn.execute(
+                    f"SELECT DISTINCT column_name FROM {escape_identifier(postings_table)} ORDER BY 1"
+                ).fetchall()
+            ]
+
+    stat = duckdb_path.stat()
+    return {
+        "fingerprint": compute_fingerprint(duckdb_path),
+        "size": stat.st_size,
+        "table": table_name,
+        "row_count": row_count,
+        "columns": columns,
+        "normalized_columns": [
+            column["name"] for column in columns if column["name"].endswith(NORMALIZED_COLUMN_SUFFIX)
+        ],
+        "date_columns": [
+            column["name"] for column in columns if column["name"].endswith(DATE_COLUMN_SUFFIX)
+        ],
+        "choseong_columns": [
+            column["name"] for column in columns if column["name"].endswith(CHOSEONG_COLUMN_SUFFIX)
+        ],
+        "ngram_columns": ngram_columns,
+        "index_columns": index_columns,
+        "clustering_key": metadata.get("clustering_key", []),
+    }
+
+
+def write_manifest(duckdb_root: Path, duckdb_paths: list[Path]) -> Path:
+    """Merge entries for ``duckdb_paths`` into ``<duckdb_root>/manifest.json`` (atomic replace)."""
+    manifest_path = duckdb_root / MANIFEST_FILENAME
+    manifest = {"version": MANIFEST_VERSION, "datasets": {}}
+    if manifest_path.exists():
+        try:
+            existing = json.loads(manifest_path.read_text(encoding="utf-8"))
+            manifest["datasets"] = existing.get("datasets", {})
+        except ValueError as exc:
+            print(f"[경고] 기존 manifest를 읽을 수 없어 새로 작성합니다: {exc}")
+
+    for duckdb_path in duckdb_paths:
+        relative = duckdb_path.relative_to(duckdb_root).as_posix()
+        manifest["datasets"][relative] = describe_duckdb(duckdb_path)
+
+    # 더 이상 존재하지 않는 데이터셋 항목 제거
+    manifest["datasets"] = {
+        relative: entry
+        for relative, entry in sorted(manifest["datasets"].items())
+        if (duckdb_root / relative).exists()
+    }
+    manifest["generated_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    temp_path = manifest_path.with_suffix(".json.tmp")
+    temp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(temp_path, manifest_path)
+    return manifest_path
 
 
 def convert_all(parquet_root: Path, duckdb_root: Path) -> None:
@@ -69,12 +536,18 @@ def convert_all(parquet_root: Path, duckdb_root: Path) -> None:
         return
 
     ensure_directory(duckdb_root)
+    case_insensitive_fields = load_case_insensitive_fields()
+    choseong_fields = load_choseong_fields()
 
+    converted: list[Path] = []
     for parquet_path in parquet_files:
         duckdb_path = to_duckdb_path(parquet_path, parquet_root, duckdb_root)
         print(f"[변환] {parquet_path.relative_to(parquet_root)} → {duckdb_path.relative_to(duckdb_root)}")
-        materialize_duckdb(parquet_path, duckdb_path)
+        materialize_duckdb(parquet_path, duckdb_path, case_insensitive_fields, choseong_fields)
+        converted.append(duckdb_path)
 
+    manifest_path = write_manifest(duckdb_root, converted)
+    print(f"[manifest] {manifest_path} 갱신 ({len(converted)}개 데이터셋)")
     print(f"[완료] 총 {len(parquet_files)}개 파일 변환")
 
 
@@ -92,9 +565,22 @@ def main(argv: list[str] | None = None) -> int:
         default=DUCKDB_ROOT,
         help="출력 DuckDB 디렉토리 (기본: Project/duckdb)",
     )
+    parser.add_argument(
+        "--manifest-only",
+        action="store_true",
+        help="변환 없이 기존 DuckDB 파일들의 manifest.json만 다시 생성",
+    )
 
     args = parser.parse_args(argv)
 
+    if args.manifest_only:
+        if not args.duckdb_root.exists():
+            parser.error(f"DuckDB 경로가 존재하지 않습니다: {args.duckdb_root}")
+        duckdb_paths = sorted(args.duckdb_root.rglob("*.duckdb"))
+        manifest_path = write_manifest(args.duckdb_root, duckdb_paths)
+        print(f"[manifest] {manifest_path} 생성 ({len(duckdb_paths)}개 데이터셋)")
+        return 0
+
     if not args.parquet_root.exists():
         parser.error(f"입력 경로가 존재하지 않습니다: {args.parquet_root}")
 